@@ -12,7 +12,7 @@ from apps.activities.domain.reusable_item_choices import (
 from apps.authentication.deps import get_current_user
 from apps.shared.domain.response import Response, ResponseMulti
 from apps.users.domain import User
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 
 
@@ -46,11 +46,12 @@ async def item_choice_retrieve(
     session=Depends(get_session),
 ) -> ResponseMulti[PublicReusableItemChoice]:
     async with atomic(session):
-        item_templates = await ReusableItemChoiceCRUD(
-            session
-        ).get_item_templates(user.id)
-        count = await ReusableItemChoiceCRUD(session).get_item_templates_count(
-            user.id
+        item_templates, count = await gather_reads(
+            session,
+            lambda s: ReusableItemChoiceCRUD(s).get_item_templates(user.id),
+            lambda s: ReusableItemChoiceCRUD(s).get_item_templates_count(
+                user.id
+            ),
         )
 
     return ResponseMulti(result=item_templates, count=count)
@@ -19,6 +19,20 @@ class ActivitiesCRUD(BaseCRUD[ActivitySchema]):
         instances = await self._create_many(activity_schemas)
         return instances
 
+    async def sync_many(
+        self, existing: list[ActivitySchema], values: list[dict]
+    ) -> list[ActivitySchema]:
+        return await self._sync_many(existing, values)
+
+    async def delete_by_applet_id_except(
+        self, applet_id: uuid.UUID, activity_ids: list[uuid.UUID]
+    ):
+        query = delete(ActivitySchema).where(
+            ActivitySchema.applet_id == applet_id
+        )
+        query = query.where(ActivitySchema.id.not_in(activity_ids))
+        await self._execute(query)
+
     async def delete_by_applet_id(self, applet_id: uuid.UUID):
         query = delete(ActivitySchema).where(
             ActivitySchema.applet_id == applet_id
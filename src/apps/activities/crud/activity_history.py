@@ -30,6 +30,18 @@ class ActivityHistoriesCRUD(BaseCRUD[ActivityHistorySchema]):
         result = await self._execute(query)
         return result.scalars().all()
 
+    async def retrieve_by_applet_versions(
+        self, id_versions: list[str]
+    ) -> list[ActivityHistorySchema]:
+        query: Query = select(ActivityHistorySchema)
+        query = query.where(ActivityHistorySchema.applet_id.in_(id_versions))
+        query = query.where(
+            ActivityHistorySchema.is_assessment == False  # noqa: E712
+        )
+        query = query.order_by(ActivityHistorySchema.order.asc())
+        result = await self._execute(query)
+        return result.scalars().all()
+
     async def retrieve_by_applet_ids(
         self, applet_versions: list[str]
     ) -> list[ActivityHistorySchema]:
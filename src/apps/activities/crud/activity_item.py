@@ -19,6 +19,17 @@ class ActivityItemsCRUD(BaseCRUD[ActivityItemSchema]):
         instances = await self._create_many(activity_item_schemas)
         return instances
 
+    async def sync_many(
+        self, existing: list[ActivityItemSchema], values: list[dict]
+    ) -> list[ActivityItemSchema]:
+        return await self._sync_many(existing, values)
+
+    async def delete_by_ids(self, item_ids: list[uuid.UUID]):
+        query = delete(ActivityItemSchema).where(
+            ActivityItemSchema.id.in_(item_ids)
+        )
+        await self._execute(query)
+
     async def delete_by_applet_id(self, applet_id: uuid.UUID):
         activity_id_query: Query = select(ActivitySchema.id).where(
             ActivitySchema.applet_id == applet_id
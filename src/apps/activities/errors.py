@@ -1,11 +1,10 @@
-from gettext import gettext as _
-
 from apps.shared.exception import (
     AccessDeniedError,
     FieldError,
     NotFoundError,
     ValidationError,
 )
+from infrastructure.i18n import gettext as _
 
 
 class ReusableItemChoiceAlreadyExist(ValidationError):
@@ -22,7 +22,6 @@ from apps.activities.errors import (
 )
 from apps.activities.services.activity_item import ActivityItemService
 from apps.applets.crud import AppletsCRUD
-from apps.schedule.crud.events import ActivityEventsCRUD
 from apps.schedule.service.schedule import ScheduleService
 
 
@@ -116,37 +115,32 @@ class ActivityService:
         return activities
 
     async def update_create(
-        self, applet_id: uuid.UUID, activities_create: list[ActivityUpdate]
+        self, applet_id: uuid.UUID, activities_update: list[ActivityUpdate]
     ) -> list[ActivityFull]:
-        schemas = []
-        activity_key_id_map: dict[uuid.UUID, uuid.UUID] = dict()
-        activity_id_key_map: dict[uuid.UUID, uuid.UUID] = dict()
-        prepared_activity_items = list()
-
-        all_activities = await ActivityEventsCRUD(
-            self.session
-        ).get_by_applet_id(applet_id)
+        """Updates the applet activities by the diff with the stored ones.
 
-        all_activity_ids = [
-            activity.activity_id for activity in all_activities
-        ]
+        Only the new, changed and removed activity items are written.
+        The removed activities are kept, they can still be referenced
+        by the flow items, remove them with the remove_deleted_activities.
+        """
+        existing_schemas = await ActivitiesCRUD(self.session).get_by_applet_id(
+            applet_id
+        )
+        existing_ids = {schema.id for schema in existing_schemas}
 
-        # Save new activity ids
+        values = []
+        activity_id_key_map: dict[uuid.UUID, uuid.UUID] = dict()
+        prepared_activity_items = list()
         new_activities = []
-        existing_activities = []
 
-        for index, activity_data in enumerate(activities_create):
+        for index, activity_data in enumerate(activities_update):
             activity_id = activity_data.id or uuid.uuid4()
-            activity_key_id_map[activity_data.key] = activity_id
             activity_id_key_map[activity_id] = activity_data.key
-
-            if activity_data.id:
-                existing_activities.append(activity_id)
-            else:
+            if activity_id not in existing_ids:
                 new_activities.append(activity_id)
 
-            schemas.append(
-                ActivitySchema(
+            values.append(
+                dict(
                     id=activity_id,
                     applet_id=applet_id,
                     name=activity_data.name,
@@ -186,11 +180,11 @@ class ActivityService:
                         allow_edit=item.allow_edit,
                     )
                 )
-        activity_schemas = await ActivitiesCRUD(self.session).create_many(
-            schemas
+        activity_schemas = await ActivitiesCRUD(self.session).sync_many(
+            existing_schemas, values
         )
         activity_items = await ActivityItemService(self.session).update_create(
-            prepared_activity_items
+            list(existing_ids), prepared_activity_items
         )
         activities = list()
 
@@ -208,7 +202,7 @@ class ActivityService:
             )
 
         # Remove events for deleted activities
-        deleted_activity_ids = set(all_activity_ids) - set(existing_activities)
+        deleted_activity_ids = existing_ids - set(activity_id_map.keys())
 
         if deleted_activity_ids:
             await ScheduleService(self.session).delete_by_activity_ids(
@@ -225,11 +219,13 @@ class ActivityService:
 
         return activities
 
-    async def remove_applet_activities(self, applet_id: uuid.UUID):
-        await ActivityItemService(self.session).remove_applet_activity_items(
-            applet_id
+    async def remove_deleted_activities(
+        self, applet_id: uuid.UUID, activity_ids: list[uuid.UUID]
+    ):
+        """Removes the applet activities except the specified ones."""
+        await ActivitiesCRUD(self.session).delete_by_applet_id_except(
+            applet_id, activity_ids
         )
-        await ActivitiesCRUD(self.session).delete_by_applet_id(applet_id)
 
     async def get_single_language_by_applet_id(
         self, applet_id: uuid.UUID, language: str
@@ -12,6 +12,10 @@ from apps.activities.errors import InvalidVersionError
 from apps.activities.services.activity_item_history import (
     ActivityItemHistoryService,
 )
+from apps.activities.services.cache import (
+    AppletActivityHistories,
+    AppletActivityHistoriesCache,
+)
 from apps.shared.changes_generator import ChangeTextGenerator
 from apps.shared.version import get_prev_version
 
@@ -189,11 +193,27 @@ class ActivityHistoryService:
         )
         return [ActivityHistory.from_orm(schema) for schema in schemas]
 
-    async def list(self) -> list[ActivityHistory]:
+    async def _load_by_applet_versions(
+        self, applet_id_versions: list[str]
+    ) -> dict[str, AppletActivityHistories]:
         schemas = await ActivityHistoriesCRUD(
             self.session
-        ).retrieve_by_applet_version(self._applet_id_version)
-        return [ActivityHistory.from_orm(schema) for schema in schemas]
+        ).retrieve_by_applet_versions(applet_id_versions)
+        # NOTE: The missing versions are not cached
+        histories: dict[str, AppletActivityHistories] = {}
+        for schema in schemas:
+            histories.setdefault(
+                schema.applet_id, AppletActivityHistories(activities=[])
+            ).activities.append(ActivityHistory.from_orm(schema))
+        return histories
+
+    async def list(self) -> list[ActivityHistory]:
+        histories = await AppletActivityHistoriesCache().get_or_load_many(
+            [self._applet_id_version], self._load_by_applet_versions
+        )
+        if history := histories.get(self._applet_id_version):
+            return history.activities
+        return []
 
     async def get_by_id(self, activity_id: uuid.UUID) -> ActivityHistory:
         schema = await ActivityHistoriesCRUD(self.session).get_by_id(
@@ -37,23 +37,43 @@ class ActivityItemService:
         return [ActivityItemFull.from_orm(item) for item in item_schemas]
 
     async def update_create(
-        self, activity_items: list[PreparedActivityItemUpdate]
-    ):
-        schemas = list()
+        self,
+        activity_ids: list[uuid.UUID],
+        activity_items: list[PreparedActivityItemUpdate],
+    ) -> list[ActivityItemFull]:
+        """Updates the items of the activities by the diff with the stored
+        ones, the items that are not in the update are removed.
+        """
+        existing_schemas = await ActivityItemsCRUD(
+            self.session
+        ).get_by_activity_ids(activity_ids)
+
+        values = list()
         activity_id_ordering_map: dict[uuid.UUID, int] = defaultdict(int)
 
         for activity_item in activity_items:
-            schemas.append(
-                ActivityItemSchema(
+            values.append(
+                dict(
                     **activity_item.dict(),
                     order=activity_id_ordering_map[activity_item.activity_id]
                     + 1,
                 )
             )
             activity_id_ordering_map[activity_item.activity_id] += 1
-        item_schemas = await ActivityItemsCRUD(self.session).create_many(
-            schemas
+        item_schemas = await ActivityItemsCRUD(self.session).sync_many(
+            existing_schemas, values
         )
+
+        item_ids = {schema.id for schema in item_schemas}
+        deleted_item_ids = [
+            schema.id
+            for schema in existing_schemas
+            if schema.id not in item_ids
+        ]
+        if deleted_item_ids:
+            await ActivityItemsCRUD(self.session).delete_by_ids(
+                deleted_item_ids
+            )
         return [ActivityItemFull.from_orm(item) for item in item_schemas]
 
     async def get_single_language_by_activity_id(
@@ -97,9 +117,6 @@ class ActivityItemService:
         )
         return [ActivityItemDuplicate.from_orm(schema) for schema in schemas]
 
-    async def remove_applet_activity_items(self, applet_id: uuid.UUID):
-        await ActivityItemsCRUD(self.session).delete_by_applet_id(applet_id)
-
     @staticmethod
     def _get_by_language(values: dict, language: str):
         """
@@ -4,6 +4,11 @@ from apps.activities.crud import ActivityItemHistoriesCRUD
 from apps.activities.db.schemas import ActivityItemHistorySchema
 from apps.activities.domain.activity_full import ActivityItemFull
 from apps.activities.domain.activity_item_history import ActivityItemHistory
+from apps.activities.services.cache import (
+    ActivityItemHistories,
+    ActivityItemHistoriesByActivityCache,
+    ActivityItemHistoriesCache,
+)
 
 
 class ActivityItemHistoryService:
@@ -41,10 +46,48 @@ class ActivityItemHistoryService:
         self, activity_id: uuid.UUID
     ) -> list[ActivityItemHistory]:
         activity_id_version = f"{activity_id}_{self.version}"
+        histories = (
+            await ActivityItemHistoriesByActivityCache().get_or_load_many(
+                [activity_id_version], self._load_by_activity_id_versions
+            )
+        )
+        if history := histories.get(activity_id_version):
+            return history.items
+        return []
+
+    async def get_by_id_versions(
+        self, id_versions: list[str]
+    ) -> list[ActivityItemHistory]:
+        """Returns the found items, the missing ones are omitted."""
+        histories = await ActivityItemHistoriesCache().get_or_load_many(
+            id_versions, self._load_by_id_versions
+        )
+        return list(histories.values())
+
+    async def _load_by_id_versions(
+        self, id_versions: list[str]
+    ) -> dict[str, ActivityItemHistory]:
         schemas = await ActivityItemHistoriesCRUD(
             self.session
-        ).get_by_activity_id_version(activity_id_version)
-        return [ActivityItemHistory.from_orm(schema) for schema in schemas]
+        ).get_by_id_versions(id_versions)
+        return {
+            schema.id_version: ActivityItemHistory.from_orm(schema)
+            for schema in schemas
+        }
+
+    async def _load_by_activity_id_versions(
+        self, activity_id_versions: list[str]
+    ) -> dict[str, ActivityItemHistories]:
+        schemas = await ActivityItemHistoriesCRUD(
+            self.session
+        ).get_by_activity_id_versions(activity_id_versions)
+        # NOTE: The missing versions are not cached
+        histories: dict[str, ActivityItemHistories] = {}
+        for schema in schemas:
+            histories.setdefault(
+                schema.activity_id, ActivityItemHistories(items=[])
+            ).items.append(ActivityItemHistory.from_orm(schema))
+        return histories
 
     async def get_by_activity_id_versions(
         self, activity_id_versions: list[str]
@@ -0,0 +1,43 @@
+from apps.activities.domain import ActivityHistory
+from apps.activities.domain.activity_item_history import ActivityItemHistory
+from apps.shared.domain import InternalModel
+from infrastructure.cache import VersionedCacheService
+
+__all__ = [
+    "AppletActivityHistories",
+    "AppletActivityHistoriesCache",
+    "ActivityItemHistoriesCache",
+    "ActivityItemHistories",
+    "ActivityItemHistoriesByActivityCache",
+]
+
+
+class AppletActivityHistories(InternalModel):
+    activities: list[ActivityHistory]
+
+
+class ActivityItemHistories(InternalModel):
+    items: list[ActivityItemHistory]
+
+
+class AppletActivityHistoriesCache(
+    VersionedCacheService[AppletActivityHistories]
+):
+    """Activities of the applet version by the applet id_version."""
+
+    model = AppletActivityHistories
+
+
+class ActivityItemHistoriesCache(VersionedCacheService[ActivityItemHistory]):
+    """Activity items by the item id_version."""
+
+    model = ActivityItemHistory
+    local_max_size = 8192
+
+
+class ActivityItemHistoriesByActivityCache(
+    VersionedCacheService[ActivityItemHistories]
+):
+    """Items of the activity version by the activity id_version."""
+
+    model = ActivityItemHistories
@@ -111,3 +111,27 @@ class TestReusableItem(BaseTest):
 
         res_data = response.json()
         assert response.status_code == 422, res_data
+
+    @rollback
+    async def test_recreate_item_choice_error_is_translated(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        create_data = dict(
+            token_name="Average age 4",
+            token_value="21",
+            input_type="radiobutton",
+        )
+
+        response = await self.client.post(self.create_url, data=create_data)
+        assert response.status_code == 201, response.json()
+
+        response = await self.client.post(
+            self.create_url,
+            data=create_data,
+            headers={"Content-Language": "fr-FR"},
+        )
+
+        res_data = response.json()
+        assert response.status_code == 400, res_data
+        assert res_data["result"][0]["message"] == "qweqwe"
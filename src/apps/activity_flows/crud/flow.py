@@ -18,6 +18,17 @@ class FlowsCRUD(BaseCRUD[ActivityFlowSchema]):
     ) -> list[ActivityFlowSchema]:
         return await self._create_many(flow_schemas)
 
+    async def sync_many(
+        self, existing: list[ActivityFlowSchema], values: list[dict]
+    ) -> list[ActivityFlowSchema]:
+        return await self._sync_many(existing, values)
+
+    async def delete_by_ids(self, flow_ids: list[uuid.UUID]):
+        query = delete(ActivityFlowSchema).where(
+            ActivityFlowSchema.id.in_(flow_ids)
+        )
+        await self._execute(query)
+
     async def delete_by_applet_id(self, applet_id: uuid.UUID):
         query = delete(ActivityFlowSchema).where(
             ActivityFlowSchema.applet_id == applet_id
@@ -20,6 +20,17 @@ class FlowItemsCRUD(BaseCRUD[ActivityFlowItemSchema]):
     ) -> list[ActivityFlowItemSchema]:
         return await self._create_many(flow_items)
 
+    async def sync_many(
+        self, existing: list[ActivityFlowItemSchema], values: list[dict]
+    ) -> list[ActivityFlowItemSchema]:
+        return await self._sync_many(existing, values)
+
+    async def delete_by_ids(self, item_ids: list[uuid.UUID]):
+        query = delete(ActivityFlowItemSchema).where(
+            ActivityFlowItemSchema.id.in_(item_ids)
+        )
+        await self._execute(query)
+
     async def delete_by_applet_id(self, applet_id: uuid.UUID):
         flow_id_query = select(ActivityFlowSchema.id).where(
             ActivityFlowSchema.applet_id == applet_id
@@ -37,13 +37,16 @@ class FlowItemHistoriesCRUD(BaseCRUD[ActivityFlowItemHistorySchema]):
         result = await self._execute(query)
         return result.scalars().all()
 
-    async def get_by_flow_id(
-        self, flow_id: str
+    async def get_by_flow_id_versions(
+        self, flow_id_versions: list[str]
     ) -> list[ActivityFlowItemHistorySchema]:
         query: Query = select(ActivityFlowItemHistorySchema)
         query = query.where(
-            ActivityFlowItemHistorySchema.activity_flow_id == flow_id
+            ActivityFlowItemHistorySchema.activity_flow_id.in_(
+                flow_id_versions
+            )
         )
+        query = query.order_by(ActivityFlowItemHistorySchema.order.asc())
         db_result = await self._execute(query)
         return db_result.scalars().all()
 
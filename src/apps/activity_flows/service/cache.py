@@ -0,0 +1,16 @@
+from apps.shared.domain import InternalModel
+from infrastructure.cache import VersionedCacheService
+
+__all__ = ["FlowActivityHistoryIds", "FlowActivityHistoryIdsCache"]
+
+
+class FlowActivityHistoryIds(InternalModel):
+    activity_ids: list[str]
+
+
+class FlowActivityHistoryIdsCache(
+    VersionedCacheService[FlowActivityHistoryIds]
+):
+    """Activity id_versions of the flow version by the flow id_version."""
+
+    model = FlowActivityHistoryIds
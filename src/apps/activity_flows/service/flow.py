@@ -16,7 +16,6 @@ from apps.activity_flows.domain.flow_update import (
     PreparedFlowItemUpdate,
 )
 from apps.activity_flows.service.flow_item import FlowItemService
-from apps.schedule.crud.events import FlowEventsCRUD
 from apps.schedule.service.schedule import ScheduleService
 
 
@@ -86,30 +85,25 @@ class FlowService:
         flows_update: list[FlowUpdate],
         activity_key_id_map: dict[uuid.UUID, uuid.UUID],
     ) -> list[FlowFull]:
-        schemas = list()
-        prepared_flow_items = list()
-
-        all_flows = [
-            flow.flow_id
-            for flow in await FlowEventsCRUD(self.session).get_by_applet_id(
-                applet_id
-            )
-        ]
+        """Updates the applet flows by the diff with the stored ones,
+        the flows that are not in the update are removed.
+        """
+        existing_schemas = await FlowsCRUD(self.session).get_by_applet_id(
+            applet_id
+        )
+        existing_ids = {schema.id for schema in existing_schemas}
 
-        # Save new flow ids
+        values = list()
+        prepared_flow_items = list()
         new_flows = []
-        existing_flows = []
 
         for index, flow_update in enumerate(flows_update):
             flow_id = flow_update.id or uuid.uuid4()
-
-            if flow_update.id:
-                existing_flows.append(flow_id)
-            else:
+            if flow_id not in existing_ids:
                 new_flows.append(flow_id)
 
-            schemas.append(
-                ActivityFlowSchema(
+            values.append(
+                dict(
                     id=flow_id,
                     applet_id=applet_id,
                     name=flow_update.name,
@@ -130,9 +124,11 @@ class FlowService:
                         ],
                     )
                 )
-        flow_schemas = await FlowsCRUD(self.session).create_many(schemas)
-        flow_items = await FlowItemService(self.session).create_update(
-            prepared_flow_items
+        flow_schemas = await FlowsCRUD(self.session).sync_many(
+            existing_schemas, values
+        )
+        flow_items = await FlowItemService(self.session).update_create(
+            applet_id, prepared_flow_items
         )
         flows = list()
 
@@ -146,12 +142,13 @@ class FlowService:
         for flow_item in flow_items:
             flow_id_map[flow_item.activity_flow_id].items.append(flow_item)
 
-        # Remove events for deleted flows
-        deleted_flow_ids = set(all_flows) - set(existing_flows)
+        # Remove deleted flows with their events
+        deleted_flow_ids = existing_ids - set(flow_id_map.keys())
         if deleted_flow_ids:
             await ScheduleService(self.session).delete_by_flow_ids(
                 applet_id=applet_id, flow_ids=list(deleted_flow_ids)
             )
+            await FlowsCRUD(self.session).delete_by_ids(list(deleted_flow_ids))
 
         # Create default events for new activities
         if new_flows:
@@ -163,10 +160,6 @@ class FlowService:
 
         return flows
 
-    async def remove_applet_flows(self, applet_id: uuid.UUID):
-        await FlowItemService(self.session).remove_applet_flow_items(applet_id)
-        await FlowsCRUD(self.session).delete_by_applet_id(applet_id)
-
     async def get_single_language_by_applet_id(
         self, applet_id: uuid.UUID, language: str
     ) -> list[FlowSingleLanguageDetail]:
@@ -33,15 +33,22 @@ class FlowItemService:
             ActivityFlowItemFull.from_orm(schema) for schema in item_schemas
         ]
 
-    async def create_update(
-        self, items: list[PreparedFlowItemUpdate]
+    async def update_create(
+        self, applet_id: uuid.UUID, items: list[PreparedFlowItemUpdate]
     ) -> list[ActivityFlowItemFull]:
-        schemas = list()
+        """Updates the items of the applet flows by the diff with the stored
+        ones, the items that are not in the update are removed.
+        """
+        existing_schemas = await FlowItemsCRUD(self.session).get_by_applet_id(
+            applet_id
+        )
+
+        values = list()
         flow_id_ordering_map: dict[uuid.UUID, int] = defaultdict(int)
 
         for item in items:
-            schemas.append(
-                ActivityFlowItemSchema(
+            values.append(
+                dict(
                     id=item.id,
                     activity_flow_id=item.activity_flow_id,
                     activity_id=item.activity_id,
@@ -49,15 +56,23 @@ class FlowItemService:
                 )
             )
             flow_id_ordering_map[item.activity_flow_id] += 1
-        item_schemas = await FlowItemsCRUD(self.session).create_many(schemas)
+        item_schemas = await FlowItemsCRUD(self.session).sync_many(
+            existing_schemas, values
+        )
+
+        item_ids = {schema.id for schema in item_schemas}
+        deleted_item_ids = [
+            schema.id
+            for schema in existing_schemas
+            if schema.id not in item_ids
+        ]
+        if deleted_item_ids:
+            await FlowItemsCRUD(self.session).delete_by_ids(deleted_item_ids)
 
         return [
             ActivityFlowItemFull.from_orm(schema) for schema in item_schemas
         ]
 
-    async def remove_applet_flow_items(self, applet_id: uuid.UUID):
-        await FlowItemsCRUD(self.session).delete_by_applet_id(applet_id)
-
     async def get_by_flow_ids(
         self, flow_ids: list[uuid.UUID]
     ) -> list[ActivityFlowItemFull]:
@@ -3,6 +3,10 @@ import uuid
 from apps.activity_flows.crud import FlowItemHistoriesCRUD
 from apps.activity_flows.db.schemas import ActivityFlowItemHistorySchema
 from apps.activity_flows.domain.flow_full import ActivityFlowItemFull
+from apps.activity_flows.service.cache import (
+    FlowActivityHistoryIds,
+    FlowActivityHistoryIdsCache,
+)
 
 
 class FlowItemHistoryService:
@@ -31,8 +35,35 @@ class FlowItemHistoryService:
         self, flow_id: uuid.UUID
     ) -> list[str]:
         flow_id_version = f"{flow_id}_{self.version}"
-        schemas = await FlowItemHistoriesCRUD(self.session).get_by_flow_id(
-            flow_id_version
+        activity_ids = await self.get_activity_ids_by_flow_id_versions(
+            [flow_id_version]
         )
 
-        return [schema.activity_id for schema in schemas]
+        return activity_ids.get(flow_id_version, [])
+
+    async def get_activity_ids_by_flow_id_versions(
+        self, flow_id_versions: list[str]
+    ) -> dict[str, list[str]]:
+        histories = await FlowActivityHistoryIdsCache().get_or_load_many(
+            flow_id_versions, self._load_by_flow_id_versions
+        )
+
+        return {
+            flow_id_version: history.activity_ids
+            for flow_id_version, history in histories.items()
+        }
+
+    async def _load_by_flow_id_versions(
+        self, flow_id_versions: list[str]
+    ) -> dict[str, FlowActivityHistoryIds]:
+        schemas = await FlowItemHistoriesCRUD(
+            self.session
+        ).get_by_flow_id_versions(flow_id_versions)
+        # NOTE: The missing versions are not cached
+        histories: dict[str, FlowActivityHistoryIds] = {}
+        for schema in schemas:
+            histories.setdefault(
+                schema.activity_flow_id,
+                FlowActivityHistoryIds(activity_ids=[]),
+            ).activity_ids.append(schema.activity_id)
+        return histories
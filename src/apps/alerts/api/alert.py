@@ -11,12 +11,12 @@ from apps.alerts.filters import AlertConfigQueryParams
 from apps.alerts.service.alert import AlertService
 from apps.answers.domain import AppletAnswerCreate
 from apps.authentication.deps import get_current_user
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import Response, ResponseMultiCursor
 from apps.shared.query_params import QueryParams, parse_query_params
 from apps.users.domain import User
 from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
 from apps.workspaces.domain.constants import Role
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 
 
@@ -47,7 +47,7 @@ async def alert_get_all_by_applet_id(
         parse_query_params(AlertConfigQueryParams)
     ),
     session=Depends(get_session),
-) -> ResponseMulti[AlertPublic]:
+) -> ResponseMultiCursor[AlertPublic]:
     # Check user permissions.
     # Only manager roles - (admin) can get alert
     async with atomic(session):
@@ -60,19 +60,26 @@ async def alert_get_all_by_applet_id(
             raise AlertViewAccessDenied
 
         # Get all alert for specific applet
-        instances = await AlertCRUD(session).get_by_applet_id(
-            applet_id, deepcopy(query_params)
+        (instances, cursor), count = await gather_reads(
+            session,
+            lambda s: AlertCRUD(s).get_by_applet_id(
+                applet_id, deepcopy(query_params)
+            ),
+            (
+                lambda s: AlertCRUD(s).get_by_applet_id_count(
+                    applet_id, deepcopy(query_params)
+                )
+            )
+            if query_params.with_count
+            else None,
         )
 
-        count = await AlertCRUD(session).get_by_applet_id_count(
-            applet_id, deepcopy(query_params)
-        )
-
-    return ResponseMulti(
+    return ResponseMultiCursor(
         result=[
             AlertPublic.from_orm(alert_config) for alert_config in instances
         ],
         count=count,
+        cursor=cursor,
     )
 
 
@@ -26,7 +26,7 @@ from apps.shared.query_params import QueryParams, parse_query_params
 from apps.users.domain import User
 from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
 from apps.workspaces.domain.constants import Role
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 
 
@@ -141,16 +141,18 @@ async def alert_config_get_all_by_applet_id(
             raise AlertCreateAccessDenied
 
         # Get all alert configs for specific applet
-        instances = await AlertConfigsCRUD(session).get_by_applet_id(
-            applet_id, deepcopy(query_params)
+        instances, count = await gather_reads(
+            session,
+            lambda s: AlertConfigsCRUD(s).get_by_applet_id(
+                applet_id, deepcopy(query_params)
+            ),
+            lambda s: AlertConfigsCRUD(s).get_by_applet_id_count(
+                applet_id, deepcopy(query_params)
+            ),
         )
         if not instances:
             raise AlertConfigNotFoundError
 
-        count = await AlertConfigsCRUD(session).get_by_applet_id_count(
-            applet_id, deepcopy(query_params)
-        )
-
     return ResponseMulti(
         result=[
             AlertsConfigPublic.from_orm(alert_config)
@@ -10,7 +10,7 @@ from apps.alerts.domain.alert import Alert, AlertCreate, AlertPublic
 from apps.alerts.errors import AlertIsDeletedError, AlertNotFoundError
 from apps.applets.db.schemas import AppletSchema
 from apps.shared.ordering import Ordering
-from apps.shared.paging import paging
+from apps.shared.paging import Keyset
 from apps.shared.query_params import QueryParams
 from apps.shared.searching import Searching
 from apps.workspaces.db.schemas import UserAppletAccessSchema
@@ -67,7 +67,7 @@ class AlertCRUD(BaseCRUD[AlertSchema]):
         self,
         applet_id: uuid.UUID,
         query_params: QueryParams,
-    ) -> list[AlertPublic]:
+    ) -> tuple[list[AlertPublic], str | None]:
         """Get alerts by applet_id from the database"""
 
         # Get alert from the database
@@ -96,19 +96,22 @@ class AlertCRUD(BaseCRUD[AlertSchema]):
 
         if query_params.search:
             query = query.where(
-                *_AlertSearching().get_clauses(query_params.search)
-            )
-        if query_params.ordering:
-            query = query.order_by(
-                *_AlertOrdering().get_clauses(*query_params.ordering)
+                _AlertSearching().get_clauses(query_params.search)
             )
         query = query.where(
             self.schema_class.is_deleted == False  # noqa: E712
         )
-        query = paging(query, query_params.page, query_params.limit)
+        keyset = Keyset(
+            _AlertOrdering().get_keyset(
+                *query_params.ordering, unique=self.schema_class.id
+            ),
+            query_params,
+        )
+        query = keyset.paginate(query)
         result: Result = await self._execute(query)
+        rows = result.all()
         results = []
-        for alert, applet_name, meta in result.all():
+        for alert, applet_name, meta, *_ in rows:
             results.append(
                 AlertPublic(
                     id=alert.id,
@@ -125,7 +128,7 @@ class AlertCRUD(BaseCRUD[AlertSchema]):
                     ),
                 )
             )
-        return results
+        return results, keyset.get_next_cursor(rows)
 
     async def get_by_applet_id_count(
         self,
@@ -140,7 +143,7 @@ class AlertCRUD(BaseCRUD[AlertSchema]):
 
         if query_params.search:
             query = query.where(
-                *_AlertSearching().get_clauses(query_params.search)
+                _AlertSearching().get_clauses(query_params.search)
             )
 
         query = query.where(
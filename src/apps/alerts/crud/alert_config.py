@@ -82,7 +82,7 @@ class AlertConfigsCRUD(BaseCRUD[AlertConfigSchema]):
 
         if query_params.search:
             query = query.where(
-                *_AlertConfigSearching().get_clauses(query_params.search)
+                _AlertConfigSearching().get_clauses(query_params.search)
             )
         if query_params.ordering:
             query = query.order_by(
@@ -113,7 +113,7 @@ class AlertConfigsCRUD(BaseCRUD[AlertConfigSchema]):
 
         if query_params.search:
             query = query.where(
-                *_AlertConfigSearching().get_clauses(query_params.search)
+                _AlertConfigSearching().get_clauses(query_params.search)
             )
 
         query = query.where(
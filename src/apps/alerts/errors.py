@@ -1,10 +1,9 @@
-from gettext import gettext as _
-
 from apps.shared.exception import (
     AccessDeniedError,
     NotFoundError,
     ValidationError,
 )
+from infrastructure.i18n import gettext as _
 
 
 class AlertConfigNotFoundError(NotFoundError):
@@ -14,7 +14,7 @@ from apps.alerts.api.alert_config import (
 )
 from apps.alerts.domain.alert import Alert, AlertPublic
 from apps.alerts.domain.alert_config import AlertsConfigPublic
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import Response, ResponseMulti, ResponseMultiCursor
 from apps.shared.domain.response import DEFAULT_OPENAPI_RESPONSE
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
@@ -93,10 +93,10 @@ router.get(
     description="""This endpoint using for get all alerts
                 for specific applet id""",
     response_model_by_alias=True,
-    response_model=ResponseMulti[AlertPublic],
+    response_model=ResponseMultiCursor[AlertPublic],
     status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_200_OK: {"model": ResponseMulti[AlertPublic]},
+        status.HTTP_200_OK: {"model": ResponseMultiCursor[AlertPublic]},
         **DEFAULT_OPENAPI_RESPONSE,
     },
 )(alert_get_all_by_applet_id)
@@ -1,20 +1,25 @@
 import uuid
 
-from fastapi import Body, Depends
+from fastapi import Body, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from apps.answers.domain import (
     ActivityAnswerPublic,
     AnswerExport,
+    AnswerExportFormat,
     AnswerNote,
     AnswerNoteDetailPublic,
     AnswerReviewPublic,
+    AppletAnswerBatchCreate,
     AppletAnswerCreate,
     AssessmentAnswerCreate,
     AssessmentAnswerPublic,
+    PublicAnswerBatchResult,
     PublicAnswerDates,
     PublicAnsweredAppletActivity,
     PublicAnswerExport,
 )
+from apps.answers.export import get_answer_export_writer
 from apps.answers.filters import (
     AnswerExportFilters,
     AppletActivityFilter,
@@ -23,7 +28,7 @@ from apps.answers.filters import (
 from apps.answers.service import AnswerService
 from apps.applets.service import AppletService
 from apps.authentication.deps import get_current_user
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import Response, ResponseMulti, ResponseMultiCursor
 from apps.shared.query_params import (
     BaseQueryParams,
     QueryParams,
@@ -31,7 +36,7 @@ from apps.shared.query_params import (
 )
 from apps.users.domain import User
 from apps.workspaces.service.check_access import CheckAccessService
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 
 
@@ -48,6 +53,23 @@ async def create_answer(
     return
 
 
+async def create_answers_batch(
+    user: User = Depends(get_current_user),
+    schema: AppletAnswerBatchCreate = Body(...),
+    session=Depends(get_session),
+) -> ResponseMulti[PublicAnswerBatchResult]:
+    async with atomic(session):
+        results = await AnswerService(session, user.id).create_answers(
+            schema.answers
+        )
+    return ResponseMulti(
+        result=[
+            PublicAnswerBatchResult.from_orm(result) for result in results
+        ],
+        count=len(results),
+    )
+
+
 async def create_anonymous_answer(
     schema: AppletAnswerCreate = Body(...),
     session=Depends(get_session),
@@ -206,21 +228,29 @@ async def note_list(
     user: User = Depends(get_current_user),
     session=Depends(get_session),
     query_params: QueryParams = Depends(parse_query_params(BaseQueryParams)),
-) -> ResponseMulti[AnswerNoteDetailPublic]:
+) -> ResponseMultiCursor[AnswerNoteDetailPublic]:
     async with atomic(session):
         await AppletService(session, user.id).exist_by_id(applet_id)
         await CheckAccessService(session, user.id).check_note_crud_access(
             applet_id
         )
-        notes = await AnswerService(session, user.id).get_note_list(
-            applet_id, answer_id, activity_id, query_params
-        )
-        count = await AnswerService(session, user.id).get_notes_count(
-            answer_id, activity_id
+        (notes, cursor), count = await gather_reads(
+            session,
+            lambda s: AnswerService(s, user.id).get_note_list(
+                applet_id, answer_id, activity_id, query_params
+            ),
+            (
+                lambda s: AnswerService(s, user.id).get_notes_count(
+                    answer_id, activity_id
+                )
+            )
+            if query_params.with_count
+            else None,
         )
-    return ResponseMulti(
+    return ResponseMultiCursor(
         result=[AnswerNoteDetailPublic.from_orm(note) for note in notes],
         count=count,
+        cursor=cursor,
     )
 
 
@@ -278,9 +308,37 @@ async def applet_answers_export(
         applet_id, query_params
     )
     for answer in data.answers:
-        if answer.is_manager:
-            answer.respondent_secret_id = (
-                f"[admin account]({answer.respondent_email})"
-            )
+        AnswerService.hide_manager_identity(answer)
 
     return Response(result=PublicAnswerExport.from_orm(data))
+
+
+async def applet_answers_export_stream(
+    applet_id: uuid.UUID,
+    export_format: AnswerExportFormat = Query(
+        AnswerExportFormat.NDJSON, alias="format"
+    ),
+    query_params: QueryParams = Depends(
+        parse_query_params(AnswerExportFilters)
+    ),
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+) -> StreamingResponse:
+    await AppletService(session, user.id).exist_by_id(applet_id)
+    await CheckAccessService(session, user.id).check_answers_export_access(
+        applet_id
+    )
+    writer = get_answer_export_writer(export_format)
+    pages = AnswerService(session, user.id).stream_export_data(
+        applet_id, query_params
+    )
+    return StreamingResponse(
+        writer.write(pages),
+        media_type=writer.media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="answers-{applet_id}.'
+                f'{writer.extension}"'
+            )
+        },
+    )
@@ -16,6 +16,9 @@ class AnswerItemsCRUD(BaseCRUD[AnswerItemSchema]):
         schemas = await self._create_many(schemas)
         return schemas
 
+    async def insert_many(self, values: list[dict]) -> list[uuid.UUID]:
+        return await self._insert_many(values)
+
     async def delete_by_applet_user(
         self, applet_id: uuid.UUID, user_id: uuid.UUID | None = None
     ):
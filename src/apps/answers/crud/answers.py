@@ -3,16 +3,19 @@ import uuid
 
 from pydantic import parse_obj_as
 from sqlalchemy import (
+    DateTime,
     and_,
     any_,
     case,
     delete,
     exists,
     func,
+    literal,
     literal_column,
     or_,
     select,
     text,
+    tuple_,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Query
@@ -51,6 +54,9 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
         schemas = await self._create_many(schemas)
         return schemas
 
+    async def insert_many(self, values: list[dict]) -> list[uuid.UUID]:
+        return await self._insert_many(values)
+
     async def get_respondents_answered_activities_by_applet_id(
         self,
         respondent_id: uuid.UUID,
@@ -102,6 +108,53 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
     async def get_applet_answers(
         self, applet_id: uuid.UUID, user_id: uuid.UUID, **filters
     ) -> list[UserAnswerData]:
+        query = self._get_applet_answers_query(applet_id, user_id, **filters)
+
+        res = await self._execute(query)
+        answers = res.all()
+
+        return parse_obj_as(list[UserAnswerData], answers)
+
+    async def get_applet_answers_page(
+        self,
+        applet_id: uuid.UUID,
+        user_id: uuid.UUID,
+        limit: int,
+        cursor: tuple[datetime.datetime, uuid.UUID] | None = None,
+        **filters,
+    ) -> tuple[
+        list[UserAnswerData], tuple[datetime.datetime, uuid.UUID] | None
+    ]:
+        """Returns the page of answers after the cursor
+        and the cursor of the next page.
+
+        NOTE: Keyset pagination by (created_at, id) of the answer item
+              is used instead of offset, so each page costs the same
+              regardless of its depth.
+        """
+        query = self._get_applet_answers_query(applet_id, user_id, **filters)
+        if cursor:
+            query = query.where(
+                tuple_(AnswerItemSchema.created_at, AnswerItemSchema.id)
+                < tuple_(
+                    literal(cursor[0], DateTime()),
+                    literal(cursor[1], UUID(as_uuid=True)),
+                )
+            )
+        query = query.limit(limit)
+
+        res = await self._execute(query)
+        rows = res.all()
+
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = (rows[-1].created_at, rows[-1].answer_item_id)
+
+        return parse_obj_as(list[UserAnswerData], rows), next_cursor
+
+    def _get_applet_answers_query(
+        self, applet_id: uuid.UUID, user_id: uuid.UUID, **filters
+    ) -> Query:
         assigned_respondents = select(
             literal_column("val").cast(UUID)
         ).select_from(
@@ -165,6 +218,7 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
                 AnswerItemSchema.flow_history_id,
                 ActivityFlowHistoriesSchema.name.label("flow_name"),
                 AnswerItemSchema.created_at,
+                AnswerItemSchema.id.label("answer_item_id"),
             )
             .select_from(AnswerSchema)
             .join(
@@ -188,15 +242,13 @@ class AnswersCRUD(BaseCRUD[AnswerSchema]):
             .where(AnswerSchema.applet_id == applet_id, has_access)
             .order_by(
                 AnswerItemSchema.created_at.desc(),
+                AnswerItemSchema.id.desc(),
             )
         )
         if filters:
             query = query.where(*_AnswersExportFilter().get_clauses(**filters))
 
-        res = await self._execute(query)
-        answers = res.all()
-
-        return parse_obj_as(list[UserAnswerData], answers)
+        return query
 
     async def get_activity_history_by_ids(
         self, activity_hist_ids: list[str]
@@ -7,7 +7,7 @@ from sqlalchemy.sql.functions import count
 from apps.answers.db.schemas import AnswerNoteSchema
 from apps.answers.domain import AnswerNoteDetail
 from apps.answers.errors import AnswerNoteNotFoundError
-from apps.shared.paging import paging
+from apps.shared.paging import Keyset
 from apps.shared.query_params import QueryParams
 from apps.users import UserSchema
 from infrastructure.database.crud import BaseCRUD
@@ -24,22 +24,27 @@ class AnswerNotesCRUD(BaseCRUD[AnswerNoteSchema]):
         answer_id: uuid.UUID,
         activity_id: uuid.UUID,
         query_params: QueryParams,
-    ) -> list[AnswerNoteDetail]:
+    ) -> tuple[list[AnswerNoteDetail], str | None]:
         query: Query = select(AnswerNoteSchema, UserSchema)
         query = query.join(
             UserSchema, UserSchema.id == AnswerNoteSchema.user_id
         )
         query = query.where(AnswerNoteSchema.answer_id == answer_id)
         query = query.where(AnswerNoteSchema.activity_id == activity_id)
-        query = query.order_by(AnswerNoteSchema.created_at.desc())
-        query = paging(query, query_params.page, query_params.limit)
+        keyset = Keyset(
+            [(AnswerNoteSchema.created_at, True), (AnswerNoteSchema.id, True)],
+            query_params,
+        )
+        query = keyset.paginate(query)
 
         db_result = await self._execute(query)
+        rows = db_result.all()
         results = []
         for (
             schema,
             user_schema,
-        ) in db_result.all():  # type: AnswerNoteSchema, UserSchema
+            *_,
+        ) in rows:  # type: AnswerNoteSchema, UserSchema
             results.append(
                 AnswerNoteDetail(
                     id=schema.id,
@@ -51,7 +56,7 @@ class AnswerNotesCRUD(BaseCRUD[AnswerNoteSchema]):
                     created_at=schema.created_at,
                 )
             )
-        return results
+        return results, keyset.get_next_cursor(rows)
 
     async def get_count_by_answer_id(
         self, answer_id: uuid.UUID, activity_id: uuid.UUID
@@ -1,5 +1,6 @@
 import datetime
 import uuid
+from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field, validator
@@ -77,6 +78,35 @@ class AppletAnswerCreate(InternalModel):
         return value
 
 
+# NOTE: The max count of the answers that are submitted at once
+ANSWERS_BATCH_MAX_SIZE = 100
+
+
+class AppletAnswerBatchCreate(InternalModel):
+    answers: list[AppletAnswerCreate] = Field(
+        ..., min_items=1, max_items=ANSWERS_BATCH_MAX_SIZE
+    )
+
+
+class AnswerBatchStatus(str, Enum):
+    CREATED = "created"
+    FAILED = "failed"
+
+
+class AnswerBatchResult(InternalModel):
+    index: int
+    status: AnswerBatchStatus
+    answer_id: uuid.UUID | None = None
+    error: str | None = None
+
+
+class PublicAnswerBatchResult(PublicModel):
+    index: int
+    status: AnswerBatchStatus
+    answer_id: uuid.UUID | None = None
+    error: str | None = None
+
+
 class AssessmentAnswerCreate(InternalModel):
     activity_id: uuid.UUID
     answer: str
@@ -247,3 +277,8 @@ class AnswerExport(InternalModel):
 class PublicAnswerExport(PublicModel):
     answers: list[UserAnswerDataPublic] = Field(default_factory=list)
     activities: list[ActivityHistoryExport] = Field(default_factory=list)
+
+
+class AnswerExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
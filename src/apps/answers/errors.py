@@ -1,10 +1,9 @@
-from gettext import gettext as _
-
 from apps.shared.exception import (
     AccessDeniedError,
     NotFoundError,
     ValidationError,
 )
+from infrastructure.i18n import gettext as _
 
 
 class AnswerNotFoundError(NotFoundError):
@@ -49,3 +48,7 @@ class ActivityDoesNotHaveItem(ValidationError):
 
 class ActivityIsNotAssessment(ValidationError):
     message = _("Activity is not assessment.")
+
+
+class ActivityHistoryDoesNotExist(ValidationError):
+    message = _("Activity does not exist in the applet version.")
@@ -0,0 +1,128 @@
+import csv
+import datetime
+import io
+import json
+from typing import AsyncIterator
+
+from apps.activities.domain.activity_history import ActivityHistoryExport
+from apps.answers.domain import (
+    AnswerExport,
+    AnswerExportFormat,
+    UserAnswerDataPublic,
+)
+
+__all__ = [
+    "AnswerExportWriter",
+    "NDJSONAnswerExportWriter",
+    "CSVAnswerExportWriter",
+    "get_answer_export_writer",
+]
+
+
+class AnswerExportWriter:
+    """Converts the pages of the answers export into text chunks
+    suitable for the streaming response.
+    """
+
+    media_type: str
+    extension: str
+
+    async def write(
+        self, pages: AsyncIterator[AnswerExport]
+    ) -> AsyncIterator[str]:
+        raise NotImplementedError
+
+
+class NDJSONAnswerExportWriter(AnswerExportWriter):
+    """Writes one JSON object per line.
+
+    Every line has the form {"type": "activity" | "answer", "data": {...}}.
+    The activity is always written before the first answer referencing it.
+    """
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    async def write(
+        self, pages: AsyncIterator[AnswerExport]
+    ) -> AsyncIterator[str]:
+        async for page in pages:
+            lines = [
+                self._line(
+                    "activity",
+                    ActivityHistoryExport.from_orm(activity).json(
+                        by_alias=True
+                    ),
+                )
+                for activity in page.activities
+            ]
+            lines.extend(
+                self._line(
+                    "answer",
+                    UserAnswerDataPublic.from_orm(answer).json(by_alias=True),
+                )
+                for answer in page.answers
+            )
+            yield "".join(lines)
+
+    @staticmethod
+    def _line(type_: str, data: str) -> str:
+        return f'{{"type": "{type_}", "data": {data}}}\n'
+
+
+class CSVAnswerExportWriter(AnswerExportWriter):
+    """Writes the answers as CSV rows.
+
+    NOTE: Activity definitions are not included, use NDJSON to get them.
+    """
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self):
+        self.columns = [
+            field.alias for field in UserAnswerDataPublic.__fields__.values()
+        ]
+
+    async def write(
+        self, pages: AsyncIterator[AnswerExport]
+    ) -> AsyncIterator[str]:
+        yield self._rows([self.columns])
+        async for page in pages:
+            yield self._rows(
+                [
+                    self._row(
+                        UserAnswerDataPublic.from_orm(answer).dict(
+                            by_alias=True
+                        )
+                    )
+                    for answer in page.answers
+                ]
+            )
+
+    def _row(self, data: dict) -> list[str]:
+        return [self._cell(data.get(column)) for column in self.columns]
+
+    @staticmethod
+    def _cell(value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, default=str)
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    def _rows(rows: list[list[str]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+
+
+def get_answer_export_writer(
+    export_format: AnswerExportFormat,
+) -> AnswerExportWriter:
+    if export_format == AnswerExportFormat.CSV:
+        return CSVAnswerExportWriter()
+    return NDJSONAnswerExportWriter()
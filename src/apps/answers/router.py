@@ -1,3 +1,4 @@
+from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
 from starlette import status
 
@@ -8,9 +9,11 @@ from apps.answers.api import (
     applet_activity_assessment_retrieve,
     applet_answer_reviews_retrieve,
     applet_answers_export,
+    applet_answers_export_stream,
     applet_submit_date_list,
     create_anonymous_answer,
     create_answer,
+    create_answers_batch,
     note_add,
     note_delete,
     note_edit,
@@ -21,6 +24,7 @@ from apps.answers.domain import (
     AnswerNoteDetailPublic,
     AnswerReviewPublic,
     AssessmentAnswerPublic,
+    PublicAnswerBatchResult,
     PublicAnswerDates,
     PublicAnsweredAppletActivity,
     PublicAnswerExport,
@@ -29,6 +33,7 @@ from apps.shared.domain import (
     AUTHENTICATION_ERROR_RESPONSES,
     Response,
     ResponseMulti,
+    ResponseMultiCursor,
 )
 from apps.shared.domain.response import DEFAULT_OPENAPI_RESPONSE
 
@@ -45,6 +50,17 @@ router.post(
     },
 )(create_answer)
 
+# Answers batch create, e.g. the answers synced after being offline
+router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseMulti[PublicAnswerBatchResult],
+    responses={
+        **DEFAULT_OPENAPI_RESPONSE,
+        **AUTHENTICATION_ERROR_RESPONSES,
+    },
+)(create_answers_batch)
+
 # Anonymous Answers for activity item create
 public_router.post(
     "",
@@ -128,7 +144,7 @@ router.post(
 router.get(
     "/applet/{applet_id}/answers/{answer_id}/activities/{activity_id}/notes",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[AnswerNoteDetailPublic],
+    response_model=ResponseMultiCursor[AnswerNoteDetailPublic],
     responses={
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
@@ -162,3 +178,20 @@ router.get(
         **AUTHENTICATION_ERROR_RESPONSES,
     },
 )(applet_answers_export)
+
+router.get(
+    "/applet/{applet_id}/data/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+            },
+            "description": "Answers export as NDJSON lines or CSV rows",
+        },
+        **DEFAULT_OPENAPI_RESPONSE,
+        **AUTHENTICATION_ERROR_RESPONSES,
+    },
+)(applet_answers_export_stream)
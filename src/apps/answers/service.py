@@ -1,17 +1,20 @@
-import asyncio
 import datetime
 import uuid
+from typing import AsyncIterator
 
 from apps.activities.crud import (
     ActivityHistoriesCRUD,
     ActivityItemHistoriesCRUD,
 )
 from apps.activities.domain.activity_history import ActivityHistoryFull
+from apps.activities.domain.activity_item_history import ActivityItemHistory
 from apps.activities.services import ActivityHistoryService
 from apps.activities.services.activity_item_history import (
     ActivityItemHistoryService,
 )
-from apps.activity_flows.crud import FlowItemHistoriesCRUD
+from apps.activity_flows.service.flow_item_history import (
+    FlowItemHistoryService,
+)
 from apps.answers.crud import AnswerItemsCRUD
 from apps.answers.crud.answers import AnswersCRUD
 from apps.answers.crud.assessment_answer_items import AssessmentAnswerItemsCRUD
@@ -24,6 +27,8 @@ from apps.answers.db.schemas import (
 )
 from apps.answers.domain import (
     ActivityAnswer,
+    AnswerBatchResult,
+    AnswerBatchStatus,
     AnswerDate,
     AnsweredAppletActivity,
     AnswerExport,
@@ -32,9 +37,11 @@ from apps.answers.domain import (
     AppletAnswerCreate,
     AssessmentAnswer,
     AssessmentAnswerCreate,
+    UserAnswerData,
 )
 from apps.answers.errors import (
     ActivityDoesNotHaveItem,
+    ActivityHistoryDoesNotExist,
     ActivityIsNotAssessment,
     AnswerAccessDeniedError,
     AnswerNoteAccessDeniedError,
@@ -43,11 +50,17 @@ from apps.answers.errors import (
     UserDoesNotHavePermissionError,
 )
 from apps.applets.crud import AppletsCRUD
+from apps.applets.errors import NotValidAppletHistory
 from apps.applets.service import AppletHistoryService
+from apps.shared.exception import BaseError
 from apps.shared.query_params import QueryParams
 from apps.workspaces.crud.applet_access import AppletAccessCRUD
 from apps.workspaces.domain.constants import Role
 from apps.workspaces.service.user_applet_access import UserAppletAccessService
+from infrastructure.database import gather_reads
+
+# NOTE: The count of answer items fetched per query by the streaming export
+EXPORT_PAGE_SIZE = 1000
 
 
 class AnswerService:
@@ -97,6 +110,28 @@ class AnswerService:
         await self._validate_answer(activity_answer)
 
     async def _validate_answer(self, applet_answer: AppletAnswerCreate):
+        item_activity_map, activity_flow_map = self._map_answer_histories(
+            applet_answer
+        )
+        item_histories, flow_activity_ids = await self._get_answer_histories(
+            applet_answer.applet_id,
+            applet_answer.version,
+            list(item_activity_map.keys()),
+            list(set(activity_flow_map.values())),
+        )
+        self._check_answer_histories(
+            item_activity_map,
+            activity_flow_map,
+            item_histories,
+            flow_activity_ids,
+        )
+
+    def _map_answer_histories(
+        self, applet_answer: AppletAnswerCreate
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Returns the activity id_versions by the answered item
+        id_versions and the flow id_versions by the activity id_versions.
+        """
         activity_flow_map: dict[str, str] = dict()
         item_activity_map: dict[str, str] = dict()
         get_pk = self._generate_history_id(applet_answer.version)
@@ -119,40 +154,53 @@ class AnswerService:
                 item_activity_map[get_pk(activity_item_id)] = get_pk(
                     answer.activity_id
                 )
+        return item_activity_map, activity_flow_map
 
-        activity_item_histories = []
-        flow_item_histories = []
-        if item_activity_map:
-            activity_item_histories = await ActivityItemHistoriesCRUD(
-                self.session
-            ).get_by_id_versions(list(item_activity_map.keys()))
-        if activity_flow_map:
-            flow_item_histories = await FlowItemHistoriesCRUD(
-                self.session
-            ).get_by_map(activity_flow_map)
-
-        for activity_item_history in activity_item_histories:
-            activity_id_version = item_activity_map[
-                activity_item_history.id_version
-            ]
+    async def _get_answer_histories(
+        self,
+        applet_id: uuid.UUID,
+        version: str,
+        item_id_versions: list[str],
+        flow_id_versions: list[str],
+    ) -> tuple[dict[str, ActivityItemHistory], dict[str, list[str]]]:
+        item_histories: dict[str, ActivityItemHistory] = dict()
+        flow_activity_ids: dict[str, list[str]] = dict()
+        if item_id_versions:
+            histories = await ActivityItemHistoryService(
+                self.session, applet_id, version
+            ).get_by_id_versions(item_id_versions)
+            item_histories = {
+                history.id_version: history for history in histories
+            }
+        if flow_id_versions:
+            flow_activity_ids = await FlowItemHistoryService(
+                self.session, applet_id, version
+            ).get_activity_ids_by_flow_id_versions(flow_id_versions)
+        return item_histories, flow_activity_ids
+
+    @staticmethod
+    def _check_answer_histories(
+        item_activity_map: dict[str, str],
+        activity_flow_map: dict[str, str],
+        item_histories: dict[str, ActivityItemHistory],
+        flow_activity_ids: dict[str, list[str]],
+    ):
+        for item_id_version, activity_id_version in item_activity_map.items():
+            activity_item_history = item_histories.get(item_id_version)
+            if not activity_item_history:
+                continue
             if activity_id_version != activity_item_history.activity_id:
                 raise ActivityDoesNotHaveItem()
 
-            item_activity_map.pop(activity_item_history.id_version)
-
-        if len(item_activity_map) != 0:
+        if not item_activity_map.keys() <= item_histories.keys():
             raise ValueError("Does not exists")
 
-        for flow_item_history in flow_item_histories:
-            flow_id_version = activity_flow_map[flow_item_history.activity_id]
-            if flow_id_version != flow_item_history.activity_flow_id:
+        for activity_id_version, flow_id_version in activity_flow_map.items():
+            if flow_id_version not in flow_activity_ids:
+                raise ValueError("Does not exists")
+            if activity_id_version not in flow_activity_ids[flow_id_version]:
                 raise FlowDoesNotHaveActivity()
 
-            activity_flow_map.pop(flow_item_history.activity_id)
-
-        if len(activity_flow_map) != 0:
-            raise ValueError("Does not exists")
-
     async def _validate_applet_for_anonymous_response(
         self, applet_id: uuid.UUID, version: str
     ):
@@ -205,6 +253,162 @@ class AnswerService:
 
         await AnswerItemsCRUD(self.session).create_many(answer_item_schemas)
 
+    async def create_answers(
+        self, applet_answers: list[AppletAnswerCreate]
+    ) -> list[AnswerBatchResult]:
+        """Creates the batch of the respondent answers, e.g. the answers
+        that are synced by the mobile application after it was offline.
+
+        The history lookups are shared by the answers of the same applet
+        version and the valid answers are inserted with the multi-row
+        inserts. The invalid answers do not prevent the rest of the batch
+        from being created, their errors are reported per answer.
+        """
+        assert self.user_id
+
+        errors: dict[int, str] = dict()
+        answer_maps: dict[int, tuple[dict[str, str], dict[str, str]]] = dict()
+        applet_ids = await AppletAccessCRUD(
+            self.session
+        ).get_applet_ids_with_roles(
+            list({answer.applet_id for answer in applet_answers}),
+            self.user_id,
+        )
+        for index, applet_answer in enumerate(applet_answers):
+            # NOTE: Like the single answer, any role in the applet is enough
+            if applet_answer.applet_id not in applet_ids:
+                errors[index] = UserDoesNotHavePermissionError().error
+                continue
+            try:
+                answer_maps[index] = self._map_answer_histories(applet_answer)
+            except ValueError as e:
+                errors[index] = str(e)
+
+        version_indexes: dict[tuple[uuid.UUID, str], list[int]] = dict()
+        for index in answer_maps:
+            applet_answer = applet_answers[index]
+            version_indexes.setdefault(
+                (applet_answer.applet_id, applet_answer.version), []
+            ).append(index)
+
+        for (applet_id, version), indexes in version_indexes.items():
+            activities = await ActivityHistoryService(
+                self.session, applet_id, version
+            ).list()
+            activity_id_versions = {
+                activity.id_version for activity in activities
+            }
+            item_id_versions: set[str] = set()
+            flow_id_versions: set[str] = set()
+            for index in indexes:
+                item_activity_map, activity_flow_map = answer_maps[index]
+                item_id_versions.update(item_activity_map.keys())
+                flow_id_versions.update(activity_flow_map.values())
+            (
+                item_histories,
+                flow_activity_ids,
+            ) = await self._get_answer_histories(
+                applet_id,
+                version,
+                list(item_id_versions),
+                list(flow_id_versions),
+            )
+
+            get_pk = self._generate_history_id(version)
+            for index in indexes:
+                try:
+                    if not activities:
+                        raise NotValidAppletHistory()
+                    for answer in applet_answers[index].answers:
+                        if get_pk(answer.activity_id) in activity_id_versions:
+                            continue
+                        raise ActivityHistoryDoesNotExist()
+                    self._check_answer_histories(
+                        *answer_maps[index], item_histories, flow_activity_ids
+                    )
+                except ValueError as e:
+                    errors[index] = str(e)
+                except BaseError as e:
+                    errors[index] = e.error
+
+        answer_ids = await self._insert_answers(
+            {
+                index: applet_answer
+                for index, applet_answer in enumerate(applet_answers)
+                if index not in errors
+            }
+        )
+
+        results = []
+        for index in range(len(applet_answers)):
+            if index in errors:
+                results.append(
+                    AnswerBatchResult(
+                        index=index,
+                        status=AnswerBatchStatus.FAILED,
+                        error=errors[index],
+                    )
+                )
+            else:
+                results.append(
+                    AnswerBatchResult(
+                        index=index,
+                        status=AnswerBatchStatus.CREATED,
+                        answer_id=answer_ids[index],
+                    )
+                )
+        return results
+
+    async def _insert_answers(
+        self, applet_answers: dict[int, AppletAnswerCreate]
+    ) -> dict[int, uuid.UUID]:
+        """Inserts the answers and their items with two multi-row inserts
+        and returns the answer ids by the batch indexes.
+        """
+        answer_ids: dict[int, uuid.UUID] = dict()
+        answer_values = []
+        answer_item_values = []
+        for index, applet_answer in applet_answers.items():
+            pk = self._generate_history_id(applet_answer.version)
+            created_at = datetime.datetime.now()
+            if applet_answer.created_at:
+                created_at = datetime.datetime.fromtimestamp(
+                    applet_answer.created_at
+                )
+            # NOTE: The ids are generated here to link the items
+            #       without relying on the order of the returned rows
+            answer_ids[index] = uuid.uuid4()
+            answer_values.append(
+                dict(
+                    id=answer_ids[index],
+                    created_at=created_at,
+                    applet_id=applet_answer.applet_id,
+                    version=applet_answer.version,
+                    respondent_id=self.user_id,
+                    user_public_key=applet_answer.user_public_key,
+                )
+            )
+            for answer_item in applet_answer.answers:
+                answer_item_values.append(
+                    dict(
+                        answer_id=answer_ids[index],
+                        answer=answer_item.answer,
+                        events=answer_item.events,
+                        applet_history_id=pk(applet_answer.applet_id),
+                        flow_history_id=pk(answer_item.flow_id)
+                        if answer_item.flow_id
+                        else None,
+                        activity_history_id=pk(answer_item.activity_id),
+                        item_ids=answer_item.item_ids,
+                    )
+                )
+
+        if answer_values:
+            await AnswersCRUD(self.session).insert_many(answer_values)
+        if answer_item_values:
+            await AnswerItemsCRUD(self.session).insert_many(answer_item_values)
+        return answer_ids
+
     async def applet_activities(
         self,
         applet_id: uuid.UUID,
@@ -348,12 +552,11 @@ class AnswerService:
         answer_id: uuid.UUID,
         activity_id: uuid.UUID,
         query_params: QueryParams,
-    ) -> list[AnswerNoteDetail]:
+    ) -> tuple[list[AnswerNoteDetail], str | None]:
         await self._validate_answer_access(applet_id, answer_id)
-        notes = await AnswerNotesCRUD(self.session).get_by_answer_id(
+        return await AnswerNotesCRUD(self.session).get_by_answer_id(
             answer_id, activity_id, query_params
         )
-        return notes
 
     async def get_notes_count(
         self,
@@ -491,11 +694,75 @@ class AnswerService:
             {answer.activity_history_id for answer in answers}
         )
 
-        activities, items = await asyncio.gather(
-            repository.get_activity_history_by_ids(activity_hist_ids),
-            repository.get_item_history_by_activity_history(activity_hist_ids),
+        activities, items = await gather_reads(
+            self.session,
+            lambda s: AnswersCRUD(s).get_activity_history_by_ids(
+                activity_hist_ids
+            ),
+            lambda s: AnswersCRUD(s).get_item_history_by_activity_history(
+                activity_hist_ids
+            ),
         )
 
+        return AnswerExport(
+            answers=answers,
+            activities=self._build_activity_histories(activities, items),
+        )
+
+    async def stream_export_data(
+        self,
+        applet_id: uuid.UUID,
+        query_params: QueryParams,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[AnswerExport]:
+        """Yields the export data page by page.
+        Each page contains only the activities that are referenced by its
+        answers and were not sent with the previous pages.
+        """
+        assert self.user_id is not None
+
+        repository = AnswersCRUD(self.session)
+        exported_activity_ids: set[str] = set()
+        cursor = None
+        while True:
+            answers, cursor = await repository.get_applet_answers_page(
+                applet_id,
+                self.user_id,
+                page_size,
+                cursor,
+                **query_params.filters,
+            )
+            activity_hist_ids = list(
+                {answer.activity_history_id for answer in answers}
+                - exported_activity_ids
+            )
+            activities: list[ActivityHistoryFull] = []
+            if activity_hist_ids:
+                activities = self._build_activity_histories(
+                    await repository.get_activity_history_by_ids(
+                        activity_hist_ids
+                    ),
+                    await repository.get_item_history_by_activity_history(
+                        activity_hist_ids
+                    ),
+                )
+                exported_activity_ids.update(activity_hist_ids)
+
+            if answers:
+                yield AnswerExport(
+                    answers=[
+                        self.hide_manager_identity(answer)
+                        for answer in answers
+                    ],
+                    activities=activities,
+                )
+            if cursor is None:
+                break
+
+    @staticmethod
+    def _build_activity_histories(
+        activities, items
+    ) -> list[ActivityHistoryFull]:
         activity_map = {
             activity.id_version: ActivityHistoryFull.from_orm(activity)
             for activity in activities
@@ -505,6 +772,12 @@ class AnswerService:
             if activity:
                 activity.items.append(item)
 
-        return AnswerExport(
-            answers=answers, activities=list(activity_map.values())
-        )
+        return list(activity_map.values())
+
+    @staticmethod
+    def hide_manager_identity(answer: UserAnswerData) -> UserAnswerData:
+        if answer.is_manager:
+            answer.respondent_secret_id = (
+                f"[admin account]({answer.respondent_email})"
+            )
+        return answer
@@ -1,8 +1,14 @@
 import datetime
 import json
+from unittest import mock
 
+import aioredis
+
+from apps.activities.services.cache import ActivityItemHistoriesCache
 from apps.shared.test import BaseTest
+from infrastructure.cache import VersionedCacheService
 from infrastructure.database import rollback
+from infrastructure.utility import RedisCache
 
 
 class TestAnswerActivityItems(BaseTest):
@@ -24,9 +30,11 @@ class TestAnswerActivityItems(BaseTest):
 
     login_url = "/auth/login"
     answer_activity_item_create_url = "/answers"
+    answers_batch_create_url = "/answers/batch"
     public_answer_activity_item_create_url = "/public/answers"
     answered_applet_activities_url = "/answers/applet/{id_}/activities"
     applet_answers_export_url = "/answers/applet/{id}/data"
+    applet_answers_export_stream_url = "/answers/applet/{id}/data/stream"
     applet_submit_dates_url = "/answers/applet/{id_}/dates"
     activity_answers_url = (
         "/answers/applet/{id_}/answers/{answer_id}/activities/{activity_id}"
@@ -75,6 +83,227 @@ class TestAnswerActivityItems(BaseTest):
 
         assert response.status_code == 201, response.json()
 
+    @rollback
+    async def test_answer_create_caches_item_versions(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        id_version = "a18d3409-2c96-4a5e-a1f3-1c1c14be0011_1.0.0"
+        assert await ActivityItemHistoriesCache().get_many([id_version]) == {}
+
+        create_data = dict(
+            applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            version="1.0.0",
+            user_public_key="user key",
+            created_at=1681216969,
+            answers=[
+                dict(
+                    activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                    answer=json.dumps(
+                        dict(
+                            value="2ba4bb83-ed1c-4140-a225-c2c9b4db66d2",
+                            additional_text=None,
+                        )
+                    ),
+                    events=json.dumps(dict(events=["event1", "event2"])),
+                    item_ids=[
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0011",
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0014",
+                    ],
+                )
+            ],
+        )
+
+        for _ in range(2):
+            response = await self.client.post(
+                self.answer_activity_item_create_url, data=create_data
+            )
+            assert response.status_code == 201, response.json()
+
+        cached = await ActivityItemHistoriesCache().get_many([id_version])
+        assert cached[id_version].id_version == id_version
+
+    @rollback
+    async def test_answer_create_when_redis_is_unavailable(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        id_version = "a18d3409-2c96-4a5e-a1f3-1c1c14be0011_1.0.0"
+
+        create_data = dict(
+            applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            version="1.0.0",
+            user_public_key="user key",
+            created_at=1681216969,
+            answers=[
+                dict(
+                    activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                    answer=json.dumps(
+                        dict(
+                            value="2ba4bb83-ed1c-4140-a225-c2c9b4db66d2",
+                            additional_text=None,
+                        )
+                    ),
+                    events=json.dumps(dict(events=["event1", "event2"])),
+                    item_ids=[
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0011",
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0014",
+                    ],
+                )
+            ],
+        )
+
+        redis = RedisCache()._cache
+        error = aioredis.RedisError("Connection refused")
+        with mock.patch.object(
+            redis, "mget", side_effect=error
+        ), mock.patch.object(redis, "pipeline", side_effect=error):
+            for _ in range(2):
+                VersionedCacheService.clear_local()
+                response = await self.client.post(
+                    self.answer_activity_item_create_url, data=create_data
+                )
+                assert response.status_code == 201, response.json()
+
+        assert await redis.mget(
+            [f"ActivityItemHistoriesCache:{id_version}"]
+        ) == [None]
+
+    @rollback
+    async def test_answers_batch_create_for_respondent(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+
+        def applet_answer(applet_id, item_id, created_at):
+            return dict(
+                applet_id=applet_id,
+                version="1.0.0",
+                user_public_key="user key",
+                created_at=created_at,
+                answers=[
+                    dict(
+                        activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                        answer=json.dumps(
+                            dict(
+                                value="2ba4bb83-ed1c-4140-a225-c2c9b4db66d2",
+                                additional_text=None,
+                            )
+                        ),
+                        events=json.dumps(dict(events=["event1", "event2"])),
+                        item_ids=[item_id],
+                    )
+                ],
+            )
+
+        applet_id = "92917a56-d586-4613-b7aa-991f2c4b15b1"
+        response = await self.client.post(
+            self.answers_batch_create_url,
+            data=dict(
+                answers=[
+                    applet_answer(
+                        applet_id,
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0011",
+                        1681216969,
+                    ),
+                    applet_answer(
+                        applet_id,
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0099",
+                        1681216970,
+                    ),
+                    applet_answer(
+                        "00000000-0000-0000-0000-000000000000",
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0011",
+                        1681216971,
+                    ),
+                    applet_answer(
+                        applet_id,
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0014",
+                        1681216972,
+                    ),
+                ]
+            ),
+        )
+
+        assert response.status_code == 200, response.json()
+        assert response.json()["count"] == 4
+        results = response.json()["result"]
+        assert [result["status"] for result in results] == [
+            "created",
+            "failed",
+            "failed",
+            "created",
+        ]
+        assert results[1]["error"]
+        assert results[2]["answerId"] is None
+
+        response = await self.client.get(
+            self.activity_answers_url.format(
+                id_=applet_id,
+                answer_id=results[3]["answerId"],
+                activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+            )
+        )
+        assert response.status_code == 200, response.json()
+        assert response.json()["result"]["itemIds"] == [
+            "a18d3409-2c96-4a5e-a1f3-1c1c14be0014"
+        ]
+
+    @rollback
+    async def test_answers_batch_create_for_any_applet_role(self):
+        # NOTE: Like the single answer, the editor and the coordinator
+        #       of the applet can answer it without the respondent role
+        await self.client.login(self.login_url, "mike@gmail.com", "Test1234")
+
+        response = await self.client.post(
+            self.answers_batch_create_url,
+            data=dict(
+                answers=[
+                    dict(
+                        applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+                        version="1.0.0",
+                        user_public_key="user key",
+                        created_at=1681216969,
+                        answers=[
+                            dict(
+                                activity_id=(
+                                    "09e3dbf0-aefb-4d0e-9177-bdb321bf3611"
+                                ),
+                                answer=json.dumps(
+                                    dict(
+                                        value=(
+                                            "2ba4bb83-ed1c-4140-"
+                                            "a225-c2c9b4db66d2"
+                                        ),
+                                        additional_text=None,
+                                    )
+                                ),
+                                events=json.dumps(dict(events=["event1"])),
+                                item_ids=[
+                                    "a18d3409-2c96-4a5e-a1f3-1c1c14be0011"
+                                ],
+                            )
+                        ],
+                    ),
+                    dict(
+                        applet_id="92917a56-d586-4613-b7aa-991f2c4b15b3",
+                        version="1.0.0",
+                        user_public_key="user key",
+                        created_at=1681216970,
+                        answers=[],
+                    ),
+                ]
+            ),
+        )
+
+        assert response.status_code == 200, response.json()
+        results = response.json()["result"]
+        assert [result["status"] for result in results] == [
+            "created",
+            "failed",
+        ]
+        assert results[1]["error"] == "User does not have permission."
+
     @rollback
     async def test_public_answer_activity_items_create_for_respondent(self):
         create_data = dict(
@@ -867,3 +1096,65 @@ class TestAnswerActivityItems(BaseTest):
         assert response.status_code == 200, response.json()
         data = response.json()["result"]
         assert set(data.keys()) == {"answers", "activities"}
+
+    @rollback
+    async def test_answers_export_stream(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+
+        create_data = dict(
+            applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            version="1.0.0",
+            user_public_key="user key",
+            answers=[
+                dict(
+                    activity_id="09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+                    answer=json.dumps(
+                        dict(
+                            value="2ba4bb83-ed1c-4140-a225-c2c9b4db66d2",
+                            additional_text=None,
+                        )
+                    ),
+                    item_ids=[
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0011",
+                        "a18d3409-2c96-4a5e-a1f3-1c1c14be0014",
+                    ],
+                )
+            ],
+        )
+
+        response = await self.client.post(
+            self.answer_activity_item_create_url, data=create_data
+        )
+
+        assert response.status_code == 201, response.json()
+
+        response = await self.client.get(
+            self.applet_answers_export_stream_url.format(
+                id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            )
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(
+            "application/x-ndjson"
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["type"] for line in lines] == ["activity", "answer"]
+        assert lines[1]["data"]["activityHistoryId"] == (
+            lines[0]["data"]["idVersion"]
+        )
+
+        response = await self.client.get(
+            self.applet_answers_export_stream_url.format(
+                id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            ),
+            dict(format="csv"),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = response.text.splitlines()
+        assert len(rows) == 2
+        assert "respondentSecretId" in rows[0].split(",")
@@ -33,12 +33,12 @@ from apps.applets.service.applet_history import (
 )
 from apps.authentication.deps import get_current_user
 from apps.mailing.domain import MessageSchema
-from apps.mailing.services import MailingService
+from apps.mailing.services import MailingService, MailOutboxService
 from apps.shared.domain.response import Response, ResponseMulti
 from apps.shared.query_params import QueryParams, parse_query_params
 from apps.users.domain import User
 from apps.workspaces.service.check_access import CheckAccessService
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 from infrastructure.http import get_language
 
@@ -69,12 +69,15 @@ async def applet_list(
     session=Depends(get_session),
 ) -> ResponseMulti[AppletSingleLanguageInfoPublic]:
     async with atomic(session):
-        applets = await AppletService(
-            session, user.id
-        ).get_list_by_single_language(language, deepcopy(query_params))
-        count = await AppletService(
-            session, user.id
-        ).get_list_by_single_language_count(deepcopy(query_params))
+        applets, count = await gather_reads(
+            session,
+            lambda s: AppletService(s, user.id).get_list_by_single_language(
+                language, deepcopy(query_params)
+            ),
+            lambda s: AppletService(
+                s, user.id
+            ).get_list_by_single_language_count(deepcopy(query_params)),
+        )
     return ResponseMulti(
         result=[
             AppletSingleLanguageInfoPublic.from_orm(applet)
@@ -133,24 +136,26 @@ async def applet_create(
                 schema, user.id
             )
         except Exception:
+            # NOTE: The transaction is rolled back,
+            #       so the email is not written to the outbox
             await mail_service.send(
                 MessageSchema(
                     recipients=[user.email],
                     subject="Applet upload failed!",
                     body=mail_service.get_template(
-                        path="applet_create_success_en",
+                        path="applet_create_success",
                         first_name=user.first_name,
                         applet_name=schema.display_name,
                     ),
                 )
             )
             raise
-        await mail_service.send(
+        await MailOutboxService(session).send(
             MessageSchema(
                 recipients=[user.email],
                 subject="Applet upload success!",
                 body=mail_service.get_template(
-                    path="applet_create_success_en",
+                    path="applet_create_success",
                     first_name=user.first_name,
                     applet_name=applet.display_name,
                 ),
@@ -178,7 +183,7 @@ async def applet_update(
         #         recipients=[user.email],
         #         subject="Applet edit success!",
         #         body=mail_service.get_template(
-        #             path="applet_edit_success_en",
+        #             path="applet_edit_success",
         #             first_name=user.first_name,
         #             applet_name=applet.display_name,
         #         ),
@@ -222,12 +227,12 @@ async def applet_duplicate(
             applet_for_duplicate, schema.display_name, schema.encryption
         )
 
-        await mail_service.send(
+        await MailOutboxService(session).send(
             MessageSchema(
                 recipients=[user.email],
                 subject="Applet duplicate success!",
                 body=mail_service.get_template(
-                    path="applet_duplicate_success_en",
+                    path="applet_duplicate_success",
                     first_name=user.first_name,
                     applet_name=applet.display_name,
                 ),
@@ -26,6 +26,14 @@ class AppletHistoriesCRUD(BaseCRUD[AppletHistorySchema]):
         schema = await self._get("id_version", id_version)
         return schema
 
+    async def get_by_id_versions(
+        self, id_versions: list[str]
+    ) -> list[AppletHistorySchema]:
+        query: Query = select(AppletHistorySchema)
+        query = query.where(AppletHistorySchema.id_version.in_(id_versions))
+        result = await self._execute(query)
+        return result.scalars().all()
+
     async def retrieve_versions_by_applet_id(
         self, applet_id: uuid.UUID
     ) -> list[tuple[str, datetime.datetime, UserSchema]]:
@@ -1,5 +1,3 @@
-from gettext import gettext as _
-
 __all__ = [
     "AppletsError",
     "AppletAlreadyExist",
@@ -16,6 +14,7 @@ from apps.shared.exception import (
     NotFoundError,
     ValidationError,
 )
+from infrastructure.i18n import gettext as _
 
 
 class AppletNotFoundError(NotFoundError):
@@ -146,10 +146,6 @@ class AppletService:
     async def update(
         self, applet_id: uuid.UUID, update_data: AppletUpdate
     ) -> AppletFull:
-        await FlowService(self.session).remove_applet_flows(applet_id)
-        await ActivityService(
-            self.session, self.user_id
-        ).remove_applet_activities(applet_id)
         applet = await self._update(applet_id, update_data)
 
         applet.activities = await ActivityService(
@@ -161,6 +157,13 @@ class AppletService:
         applet.activity_flows = await FlowService(self.session).update_create(
             applet_id, update_data.activity_flows, activity_key_id_map
         )
+        # NOTE: The deleted activities can be referenced by the deleted
+        #       flow items, so they are removed after the flows update
+        await ActivityService(
+            self.session, self.user_id
+        ).remove_deleted_activities(
+            applet_id, [activity.id for activity in applet.activities]
+        )
 
         await AppletHistoryService(
             self.session, applet.id, applet.version
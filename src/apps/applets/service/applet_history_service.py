@@ -10,6 +10,7 @@ __all__ = ["AppletHistoryService"]
 
 from apps.applets.domain.applet_full import AppletFull
 from apps.applets.errors import InvalidVersionError, NotValidAppletHistory
+from apps.applets.service.cache import AppletHistoriesCache
 from apps.shared.changes_generator import ChangeTextGenerator
 from apps.shared.version import get_prev_version
 
@@ -100,9 +101,18 @@ class AppletHistoryService:
         return changes
 
     async def get(self) -> AppletHistory:
-        schema = await AppletHistoriesCRUD(self.session).get_by_id_version(
-            self._id_version
+        histories = await AppletHistoriesCache().get_or_load_many(
+            [self._id_version], self._load
         )
-        if not schema:
+        if not (history := histories.get(self._id_version)):
             raise NotValidAppletHistory()
-        return AppletHistory.from_orm(schema)
+        return history
+
+    async def _load(self, id_versions: list[str]) -> dict[str, AppletHistory]:
+        schemas = await AppletHistoriesCRUD(self.session).get_by_id_versions(
+            id_versions
+        )
+        return {
+            schema.id_version: AppletHistory.from_orm(schema)
+            for schema in schemas
+        }
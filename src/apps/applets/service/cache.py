@@ -0,0 +1,10 @@
+from apps.applets.domain import AppletHistory
+from infrastructure.cache import VersionedCacheService
+
+__all__ = ["AppletHistoriesCache"]
+
+
+class AppletHistoriesCache(VersionedCacheService[AppletHistory]):
+    """Applet versions by the applet id_version."""
+
+    model = AppletHistory
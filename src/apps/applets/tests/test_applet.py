@@ -2,8 +2,9 @@ import asyncio
 import uuid
 
 from apps.mailing.services import TestMail
+from apps.mailing.worker import mail_outbox_worker
 from apps.shared.test import BaseTest
-from infrastructure.database import rollback
+from infrastructure.database import rollback, session_manager
 
 
 class TestApplet(BaseTest):
@@ -253,6 +254,8 @@ class TestApplet(BaseTest):
             self.applet_detail_url.format(pk=response.json()["result"]["id"])
         )
         assert response.status_code == 200
+        assert len(TestMail.mails) == 0
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].subject == "Applet upload success!"
 
@@ -934,6 +937,7 @@ class TestApplet(BaseTest):
         )
         assert response.status_code == 201, response.json()
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].subject == "Applet duplicate success!"
 
@@ -1,4 +1,3 @@
-from contextlib import suppress
 from datetime import datetime
 
 from fastapi import Depends
@@ -9,11 +8,14 @@ from pydantic import EmailStr, ValidationError
 from apps.authentication.domain.login import UserLoginRequest
 from apps.authentication.domain.token import InternalToken, TokenPayload
 from apps.authentication.errors import AuthenticationError
-from apps.authentication.services import AuthenticationService
+from apps.authentication.services import (
+    AuthenticationService,
+    verified_tokens_cache,
+)
 from apps.users.cruds.user import UsersCRUD
 from apps.users.domain import User
+from apps.users.services.last_seen import last_seen_tracker
 from config import settings
-from infrastructure.cache import CacheNotFound
 from infrastructure.database import atomic
 from infrastructure.database.deps import get_session
 
@@ -22,36 +24,45 @@ oauth2_oauth = OAuth2PasswordBearer(
 )
 
 
+def _decode_access_token(token: str) -> TokenPayload:
+    if token_payload := verified_tokens_cache.get_payload(token):
+        return token_payload
+
+    try:
+        payload = jwt.decode(
+            token,
+            settings.authentication.access_token.secret_key,
+            algorithms=[settings.authentication.algorithm],
+        )
+
+        token_payload = TokenPayload(**payload)
+
+        if datetime.fromtimestamp(token_payload.exp) < datetime.now():
+            raise AuthenticationError
+    except (JWTError, ValidationError):
+        raise AuthenticationError
+
+    verified_tokens_cache.set_payload(token, token_payload)
+
+    return token_payload
+
+
 async def get_current_user(
     token: str = Depends(oauth2_oauth),
     session=Depends(get_session),
 ) -> User:
     async with atomic(session):
-        try:
-            payload = jwt.decode(
-                token,
-                settings.authentication.access_token.secret_key,
-                algorithms=[settings.authentication.algorithm],
-            )
-            token_data = TokenPayload(**payload)
-
-            if datetime.fromtimestamp(token_data.exp) < datetime.now():
-                raise AuthenticationError
-        except (JWTError, ValidationError):
-            raise AuthenticationError
-
-        user = await UsersCRUD(session).get_by_id(id_=token_data.sub)
-        await UsersCRUD(session).update_last_seen_by_id(token_data.sub)
+        token_data = _decode_access_token(token)
 
         # Check if the token is in the blacklist
-        with suppress(CacheNotFound):
-            cache_entries = await AuthenticationService(
-                session
-            ).fetch_all_tokens(user.email)
+        if await AuthenticationService(session).is_token_blacklisted(token):
+            raise AuthenticationError
+
+        if not (user := verified_tokens_cache.get_user(token)):
+            user = await UsersCRUD(session).get_by_id(id_=token_data.sub)
+            verified_tokens_cache.set_user(token, user)
 
-            for entry in cache_entries:
-                if entry.raw_token == token:
-                    raise AuthenticationError
+        last_seen_tracker.track(token_data.sub)
 
     return user
 
@@ -59,19 +70,7 @@ async def get_current_user(
 async def get_current_token(
     token: str = Depends(oauth2_oauth),
 ) -> InternalToken:
-    try:
-        payload = jwt.decode(
-            token,
-            settings.authentication.access_token.secret_key,
-            algorithms=[settings.authentication.algorithm],
-        )
-
-        token_payload = TokenPayload(**payload)
-
-        if datetime.fromtimestamp(token_payload.exp) < datetime.now():
-            raise AuthenticationError
-    except (JWTError, ValidationError):
-        raise AuthenticationError
+    token_payload = _decode_access_token(token)
 
     return InternalToken(payload=token_payload, raw_token=token)
 
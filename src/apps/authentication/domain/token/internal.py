@@ -33,6 +33,6 @@ class TokenInfo(InternalModel):
     """
 
     email: EmailStr
-    user_id: int
+    user_id: uuid.UUID
     token_purpose: str
     raw_token: str
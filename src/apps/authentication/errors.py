@@ -1,8 +1,7 @@
-from gettext import gettext as _
-
 from starlette import status
 
 from apps.shared.exception import AccessDeniedError, BaseError, ValidationError
+from infrastructure.i18n import gettext as _
 
 
 class BadCredentials(ValidationError):
@@ -1,3 +1,4 @@
 from apps.authentication.services.cache import *  # noqa: F401, F403
 from apps.authentication.services.core import *  # noqa: F401, F403
 from apps.authentication.services.security import *  # noqa: F401, F403
+from apps.authentication.services.token_cache import *  # noqa: F401, F403
@@ -1,64 +1,81 @@
-import json
+import hashlib
+import time
 
-from apps.authentication.domain.token import TokenInfo, TokenPurpose
+from apps.authentication.domain.token import TokenInfo
+from config import settings
 from infrastructure.cache import BaseCacheService
 from infrastructure.cache.domain import CacheEntry
-from infrastructure.cache.errors import CacheNotFound
 
 __all__ = ["TokensBlacklistCache"]
 
 
 class TokensBlacklistCache(BaseCacheService[TokenInfo]):
     """The concrete class that realized tokens cache engine.
-    In order to be able to save multiple tokens for a single user
-    the specific key builder is used.
+    Each blacklisted token is saved under the key that is built
+    from the SHA-256 hash of the token body, so checking the token
+    is a single key lookup.
 
     The example of a key:
-        __class__.__name__:john@email.com:access:eyJhbGciOiJIUzI1NiIs...
-        __class__.__name__:john@email.com:refresh:UyQpbGcpsiJIUzI1NiIs...
+        __class__.__name__:9b5ad1f2d8c1a37e0e6f4f1bb7c6a1d2b8e0f3a4...
 
-    This strategy is taken in order to create unique pairs
-    that consist of a namespace, user's email,
-    purpose of the token - for example "access_token"
-    and token body.
+    The tokens that are known to be not blacklisted are remembered
+    in the process memory for a few seconds in order to skip
+    the cache lookup on the subsequent requests with the same token.
     """
 
-    def build_key(
-        self, email: str, token_purpose: TokenPurpose, raw_token: str
-    ) -> str:
+    # NOTE: The key hash -> expiration (monotonic) time of the record.
+    #       It is shared by all instances within the process.
+    _not_blacklisted: dict[str, float] = {}
+    _not_blacklisted_max_size: int = 10_000
+
+    def build_key(self, raw_token: str) -> str:
         """Returns a key with the additional namespace for this cache."""
 
-        return f"{email}:{token_purpose}:{raw_token}"
+        return hashlib.sha256(raw_token.encode()).hexdigest()
+
+    async def get(self, raw_token: str) -> CacheEntry[TokenInfo]:
+        cache_record: dict = await self._get(self.build_key(raw_token))
+
+        return CacheEntry[TokenInfo](**cache_record)
 
-    async def get(
+    async def set(
         self,
-        email: str,
-        token_purpose: TokenPurpose,
-        raw_token: str,
+        key: str,
+        instance: TokenInfo,
+        ttl: int | None = None,
     ) -> CacheEntry[TokenInfo]:
-        cache_record: dict = await self._get(
-            self.build_key(email, token_purpose, raw_token)
-        )
+        self._not_blacklisted.pop(key, None)
+        return await super().set(key, instance, ttl)
 
-        return CacheEntry[TokenInfo](**cache_record)
+    async def is_blacklisted(self, raw_token: str) -> bool:
+        key = self.build_key(raw_token)
+        now = time.monotonic()
+
+        if self._not_blacklisted.get(key, 0) > now:
+            return False
+
+        if await self.redis_client.exists(self._build_key(key)):
+            return True
+
+        self._remember_not_blacklisted(key, now)
 
-    async def all(self, email: str) -> list[CacheEntry[TokenInfo]]:
-        # Create a key to fetch all records for
-        # the specific email prefix in a cache key
-        key = f"{email}:*"
+        return False
 
-        # Fetch keys for retrieving
-        if not (keys := await self.redis_client.keys(self._build_key(key))):
-            raise CacheNotFound()
+    def _remember_not_blacklisted(self, key: str, now: float) -> None:
+        ttl = settings.authentication.blacklist_local_cache_ttl
+        if ttl <= 0:
+            return
 
-        results: list[bytes] = await self.redis_client.mget(keys)
+        if len(self._not_blacklisted) >= self._not_blacklisted_max_size:
+            expired = [
+                key_
+                for key_, expire_at in self._not_blacklisted.items()
+                if expire_at <= now
+            ]
+            for key_ in expired:
+                del self._not_blacklisted[key_]
 
-        return [
-            CacheEntry[TokenInfo](**json.loads(result)) for result in results
-        ]
+            if len(self._not_blacklisted) >= self._not_blacklisted_max_size:
+                self._not_blacklisted.clear()
 
-    # TODO: Clarify how to deal with
-    #       removing token / adding token to the blacklist
-    # async def delete(self, email: str, key: uuid.UUID | str) -> None:
-    #     _key = self.build_key(email, key)
-    #     await self._delete(_key)
+        self._not_blacklisted[key] = now + ttl
@@ -6,6 +6,7 @@ from apps.authentication.domain.token import (
     TokenPurpose,
 )
 from apps.authentication.services.cache import TokensBlacklistCache
+from apps.authentication.services.token_cache import verified_tokens_cache
 from apps.users.cruds.user import UsersCRUD
 from apps.users.domain import User
 from infrastructure.cache.domain import CacheEntry
@@ -18,16 +19,14 @@ class TokensService:
         self._cache: TokensBlacklistCache = TokensBlacklistCache()
         self.session = session
 
-    async def fetch_all(self, email: str) -> list[TokenInfo]:
-        cache_entries: list[CacheEntry[TokenInfo]] = await self._cache.all(
-            email=email
-        )
-
-        return [entry.instance for entry in cache_entries]
+    async def is_blacklisted(self, raw_token: str) -> bool:
+        return await self._cache.is_blacklisted(raw_token)
 
     async def add_access_token_to_blacklist(
         self, schema: InternalToken
     ) -> None:
+        verified_tokens_cache.invalidate_token(schema.raw_token)
+
         now = datetime.datetime.now()
         ttl = schema.payload.exp - int(now.timestamp())
 
@@ -44,9 +43,7 @@ class TokensService:
             )
 
             # Build the cache key
-            key: str = self._cache.build_key(
-                user.email, TokenPurpose.ACCESS, schema.raw_token
-            )
+            key: str = self._cache.build_key(schema.raw_token)
 
             # Save token to the cache blacklist
             _: CacheEntry[TokenInfo] = await self._cache.set(
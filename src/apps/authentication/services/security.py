@@ -86,6 +86,6 @@ class AuthenticationService:
         """Add access token to blacklist in Redis."""
         await TokensService(self.session).add_access_token_to_blacklist(token)
 
-    async def fetch_all_tokens(self, email: str):
-        """Finds all records for the specified Email."""
-        return await TokensService(self.session).fetch_all(email)
+    async def is_token_blacklisted(self, raw_token: str) -> bool:
+        """Checks if the token was added to the blacklist in Redis."""
+        return await TokensService(self.session).is_blacklisted(raw_token)
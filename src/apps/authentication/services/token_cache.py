@@ -0,0 +1,101 @@
+import time
+import uuid
+from collections import OrderedDict
+
+from apps.authentication.domain.token import TokenPayload
+from apps.users.domain import User
+from config import settings
+
+__all__ = ["VerifiedTokensCache", "verified_tokens_cache"]
+
+
+class _Entry:
+    __slots__ = ("payload", "user", "expire_at")
+
+    def __init__(self, payload: TokenPayload, expire_at: float):
+        self.payload = payload
+        self.user: User | None = None
+        self.expire_at = expire_at
+
+
+class VerifiedTokensCache:
+    """The in-process LRU cache of the verified access tokens.
+
+    It stores the decoded token payload and the snapshot of the token
+    owner, so the request with the same token skips the signature
+    verification and the user lookup.
+
+    The record lives until the token expiration but not longer than
+    `ttl` seconds, so the changes that are made by another process
+    are picked up after that time at the latest.
+    The changes made by this process are applied immediately
+    via invalidate_token and invalidate_user.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._user_tokens: dict[uuid.UUID, set[str]] = {}
+
+    def get_payload(self, raw_token: str) -> TokenPayload | None:
+        if entry := self._get(raw_token):
+            return entry.payload
+        return None
+
+    def get_user(self, raw_token: str) -> User | None:
+        if entry := self._get(raw_token):
+            return entry.user
+        return None
+
+    def set_payload(self, raw_token: str, payload: TokenPayload) -> None:
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        self.invalidate_token(raw_token)
+        self._entries[raw_token] = _Entry(
+            payload, min(payload.exp, time.time() + self.ttl)
+        )
+        self._user_tokens.setdefault(payload.sub, set()).add(raw_token)
+
+        while len(self._entries) > self.max_size:
+            self.invalidate_token(next(iter(self._entries)))
+
+    def set_user(self, raw_token: str, user: User) -> None:
+        if entry := self._get(raw_token):
+            entry.user = user
+
+    def invalidate_token(self, raw_token: str) -> None:
+        if not (entry := self._entries.pop(raw_token, None)):
+            return
+
+        tokens = self._user_tokens.get(entry.payload.sub)
+        if tokens is not None:
+            tokens.discard(raw_token)
+            if not tokens:
+                del self._user_tokens[entry.payload.sub]
+
+    def invalidate_user(self, user_id: uuid.UUID) -> None:
+        for raw_token in self._user_tokens.pop(user_id, set()):
+            self._entries.pop(raw_token, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._user_tokens.clear()
+
+    def _get(self, raw_token: str) -> _Entry | None:
+        if not (entry := self._entries.get(raw_token)):
+            return None
+
+        if entry.expire_at <= time.time():
+            self.invalidate_token(raw_token)
+            return None
+
+        self._entries.move_to_end(raw_token)
+        return entry
+
+
+verified_tokens_cache = VerifiedTokensCache(
+    max_size=settings.authentication.token_cache_max_size,
+    ttl=settings.authentication.token_cache_ttl,
+)
@@ -14,6 +14,7 @@ from infrastructure.database import rollback, session_manager
 
 class TestAuthentication(BaseTest):
     user_create_url = user_router.url_path_for("user_create")
+    user_retrieve_url = user_router.url_path_for("user_retrieve")
     get_token_url = auth_router.url_path_for("get_token")
     delete_token_url = auth_router.url_path_for("delete_access_token")
     refresh_access_token_url = auth_router.url_path_for("refresh_access_token")
@@ -80,6 +81,28 @@ class TestAuthentication(BaseTest):
 
         assert response.status_code == 200
 
+    @rollback
+    async def test_deleted_access_token_is_rejected(self):
+        await self.client.post(
+            self.user_create_url, data=self.create_request_user.dict()
+        )
+        login_request_user = UserLoginRequest(
+            **self.create_request_user.dict()
+        )
+        await self.client.login(
+            url=self.get_token_url,
+            **login_request_user.dict(),
+        )
+
+        response = await self.client.get(self.user_retrieve_url)
+        assert response.status_code == 200
+
+        response = await self.client.post(url=self.delete_token_url)
+        assert response.status_code == 200
+
+        response = await self.client.get(self.user_retrieve_url)
+        assert response.status_code == 401
+
     @rollback
     async def test_refresh_access_token(self):
         # Creating new user
@@ -1,15 +1,40 @@
+import re
+
 from botocore.exceptions import ClientError  # type: ignore
-from fastapi import Body, Depends, File, UploadFile
+from fastapi import Body, Depends, File, Header, UploadFile
 from fastapi.responses import StreamingResponse
+from starlette import status
 
 from apps.authentication.deps import get_current_user
 from apps.file.domain import FileDownloadRequest, UploadedFile
-from apps.file.errors import FileNotFoundError
+from apps.file.errors import FileNotFoundError, FileRangeNotSatisfiableError
 from apps.shared.domain.response import Response
 from apps.users.domain import User
 from config import settings
 from infrastructure.utility.cdn_client import CDNClient
 
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(value: str, size: int) -> tuple[int, int]:
+    """Returns the inclusive byte range by the single range
+    of the Range header, e.g. "bytes=0-99", "bytes=100-" or "bytes=-100".
+    """
+    match = RANGE_PATTERN.match(value.strip())
+    if not match or match.groups() == ("", ""):
+        raise FileRangeNotSatisfiableError()
+
+    first, last = match.groups()
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start > end or start >= size:
+        raise FileRangeNotSatisfiableError()
+    return start, end
+
 
 async def upload(
     file: UploadFile = File(...),
@@ -19,7 +44,7 @@ async def upload(
 
     key = CDNClient.generate_key(hash(user.id), file.filename)
 
-    cdn_client.upload(key, file.file)
+    await cdn_client.upload(key, file.file)
 
     result = UploadedFile(key=key, url=settings.cdn.url.format(key=key))
     return Response(result=result)
@@ -28,18 +53,37 @@ async def upload(
 async def download(
     request: FileDownloadRequest = Body(...),
     user: User = Depends(get_current_user),
+    range_: str | None = Header(None, alias="Range"),
 ) -> StreamingResponse:
 
     # download file by given key
     cdn_client = CDNClient(settings.cdn, env=settings.env)
 
+    # NOTE: The object is checked before the streaming is started,
+    #       so the missing file is still reported with 404
     try:
-        file, media_type = cdn_client.download(request.key)
-
+        info = await cdn_client.head(request.key)
     except ClientError as e:
-        if e.response["Error"]["Code"] == "404":
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
             raise FileNotFoundError
         else:
             raise e
 
-    return StreamingResponse(file, media_type=media_type)
+    headers = {"Accept-Ranges": "bytes"}
+    if not range_:
+        headers["Content-Length"] = str(info.size)
+        return StreamingResponse(
+            cdn_client.stream(request.key),
+            media_type=info.media_type,
+            headers=headers,
+        )
+
+    start, end = _parse_range(range_, info.size)
+    headers["Content-Range"] = f"bytes {start}-{end}/{info.size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        cdn_client.stream(request.key, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=info.media_type,
+        headers=headers,
+    )
@@ -1,7 +1,13 @@
-from gettext import gettext as _
+from starlette import status
 
-from apps.shared.exception import NotFoundError
+from apps.shared.exception import NotFoundError, ValidationError
+from infrastructure.i18n import gettext as _
 
 
 class FileNotFoundError(NotFoundError):
     message = _("File not found.")
+
+
+class FileRangeNotSatisfiableError(ValidationError):
+    message = _("Requested range is not satisfiable.")
+    status_code = status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
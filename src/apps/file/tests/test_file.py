@@ -0,0 +1,88 @@
+from unittest import mock
+
+from apps.shared.test import BaseTest
+from infrastructure.database import rollback
+from infrastructure.utility.cdn_client import _LocalS3Client
+
+
+class TestFile(BaseTest):
+    fixtures = ["users/fixtures/users.json"]
+
+    login_url = "/auth/login"
+    upload_url = "/file/upload"
+    download_url = "/file/download"
+
+    content = b"0123456789" * 100
+
+    @rollback
+    async def test_upload_and_download(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        response = await self.client.post(
+            self.upload_url,
+            files={"file": ("answer.txt", self.content, "text/plain")},
+        )
+        assert response.status_code == 200, response.json()
+        key = response.json()["result"]["key"]
+
+        with mock.patch.object(
+            _LocalS3Client,
+            "get_object",
+            autospec=True,
+            side_effect=_LocalS3Client.get_object,
+        ) as get_object:
+            response = await self.client.post(
+                self.download_url, data={"key": key}
+            )
+        assert response.status_code == 200
+        # NOTE: The whole object is requested without the range
+        assert "Range" not in get_object.call_args.kwargs
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.content == self.content
+
+    @rollback
+    async def test_download_range(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        response = await self.client.post(
+            self.upload_url,
+            files={"file": ("answer.txt", self.content, "text/plain")},
+        )
+        key = response.json()["result"]["key"]
+
+        response = await self.client.post(
+            self.download_url,
+            data={"key": key},
+            headers={"Range": "bytes=10-19"},
+        )
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 10-19/1000"
+        assert response.content == self.content[10:20]
+
+        response = await self.client.post(
+            self.download_url,
+            data={"key": key},
+            headers={"Range": "bytes=-5"},
+        )
+        assert response.status_code == 206
+        assert response.content == self.content[-5:]
+
+        response = await self.client.post(
+            self.download_url,
+            data={"key": key},
+            headers={"Range": "bytes=1000-"},
+        )
+        assert response.status_code == 416
+
+    @rollback
+    async def test_download_not_found(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        response = await self.client.post(
+            self.download_url, data={"key": "mindlogger/missing.txt"}
+        )
+        assert response.status_code == 404
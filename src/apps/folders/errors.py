@@ -6,9 +6,8 @@ __all__ = [
     "AppletNotInFolder",
 ]
 
-from gettext import gettext as _
-
 from apps.shared.exception import AccessDeniedError, ValidationError
+from infrastructure.i18n import gettext as _
 
 
 class FolderAccessDenied(AccessDeniedError):
@@ -1,5 +1,9 @@
 from fastapi.responses import Response
 
+from apps.healthcheck.domain import PublicDatabasePoolStatus
+from apps.shared.domain import Response as ResponseModel
+from infrastructure.database import get_pool_status
+
 
 def readiness():
     return Response("Readiness - OK!")
@@ -7,3 +11,13 @@ def readiness():
 
 def liveness():
     return Response("Liveness - OK!")
+
+
+def database_pool() -> ResponseModel[PublicDatabasePoolStatus]:
+    status = get_pool_status()
+    return ResponseModel(
+        result=PublicDatabasePoolStatus(
+            primary=status["primary"].dict(),
+            replica=status["replica"].dict() if "replica" in status else None,
+        )
+    )
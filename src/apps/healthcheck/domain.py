@@ -0,0 +1,23 @@
+from apps.shared.domain import PublicModel
+
+
+class PublicPoolStatus(PublicModel):
+    pooled: bool
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    connects: int
+    checkouts: int
+    checkins: int
+    overflow_checkouts: int
+    waits: int
+    timeouts: int
+    wait_time: float
+    max_wait_time: float
+
+
+class PublicDatabasePoolStatus(PublicModel):
+    primary: PublicPoolStatus
+    replica: PublicPoolStatus | None = None
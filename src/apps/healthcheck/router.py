@@ -1,9 +1,16 @@
 from fastapi import status
 from fastapi.routing import APIRouter
 
-from apps.healthcheck.api import liveness, readiness
+from apps.healthcheck.api import database_pool, liveness, readiness
+from apps.healthcheck.domain import PublicDatabasePoolStatus
+from apps.shared.domain import Response
 
 router = APIRouter(tags=["Health check"])
 
 router.get("/readiness", status_code=status.HTTP_200_OK)(readiness)
 router.get("/liveness", status_code=status.HTTP_200_OK)(liveness)
+router.get(
+    "/readiness/database-pool",
+    status_code=status.HTTP_200_OK,
+    response_model=Response[PublicDatabasePoolStatus],
+)(database_pool)
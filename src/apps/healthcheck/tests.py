@@ -11,3 +11,11 @@ class TestHealthcheck(BaseTest):
         response = await self.client.get("liveness")
         assert response.status_code == 200
         assert response.content == b"Liveness - OK!"
+
+    async def test_database_pool(self):
+        response = await self.client.get("readiness/database-pool")
+        assert response.status_code == 200
+        primary = response.json()["result"]["primary"]
+        assert primary["pooled"] is True
+        assert primary["checkouts"] >= primary["checkins"]
+        assert primary["maxOverflow"] == 10
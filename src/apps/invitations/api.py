@@ -1,10 +1,15 @@
 import uuid
 from copy import deepcopy
 
-from fastapi import Body, Depends
+from fastapi import BackgroundTasks, Body, Depends, File, UploadFile
 
 from apps.applets.service import AppletService
 from apps.authentication.deps import get_current_user
+from apps.invitations.bulk import (
+    RespondentInvitationsBulkService,
+    parse_respondents_file,
+    run_respondents_bulk_job,
+)
 from apps.invitations.domain import (
     InvitationDetailForReviewer,
     InvitationManagersRequest,
@@ -15,17 +20,18 @@ from apps.invitations.domain import (
     InvitationReviewerRequest,
     InvitationReviewerResponse,
     PrivateInvitationResponse,
+    PublicInvitationsBulkJob,
 )
 from apps.invitations.filters import InvitationQueryParams
 from apps.invitations.services import (
     InvitationsService,
     PrivateInvitationService,
 )
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import Response, ResponseMulti, ResponseMultiCursor
 from apps.shared.query_params import QueryParams, parse_query_params
 from apps.users.domain import User
 from apps.workspaces.service.check_access import CheckAccessService
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 
 
@@ -35,7 +41,7 @@ async def invitation_list(
         parse_query_params(InvitationQueryParams)
     ),
     session=Depends(get_session),
-) -> ResponseMulti[InvitationResponse]:
+) -> ResponseMultiCursor[InvitationResponse]:
     """Fetch all invitations whose status is pending
     for the specific user who is invitor.
     """
@@ -44,19 +50,27 @@ async def invitation_list(
             await CheckAccessService(
                 session, user.id
             ).check_applet_invite_access(query_params.filters["applet_id"])
-        invitations = await InvitationsService(session, user).fetch_all(
-            deepcopy(query_params)
-        )
-        count = await InvitationsService(session, user).fetch_all_count(
-            deepcopy(query_params)
+        (invitations, cursor), count = await gather_reads(
+            session,
+            lambda s: InvitationsService(s, user).fetch_all(
+                deepcopy(query_params)
+            ),
+            (
+                lambda s: InvitationsService(s, user).fetch_all_count(
+                    deepcopy(query_params)
+                )
+            )
+            if query_params.with_count
+            else None,
         )
 
-    return ResponseMulti[InvitationResponse](
+    return ResponseMultiCursor[InvitationResponse](
         result=[
             InvitationResponse(**invitation.dict())
             for invitation in invitations
         ],
         count=count,
+        cursor=cursor,
     )
 
 
@@ -73,13 +87,15 @@ async def invitation_list_for_invited(
             await CheckAccessService(
                 session, user.id
             ).check_applet_invite_access(query_params.filters["applet_id"])
-        invitations = await InvitationsService(
-            session, user
-        ).fetch_all_for_invited(deepcopy(query_params))
-
-        count = await InvitationsService(
-            session, user
-        ).fetch_all_for_invited_count(deepcopy(query_params))
+        invitations, count = await gather_reads(
+            session,
+            lambda s: InvitationsService(s, user).fetch_all_for_invited(
+                deepcopy(query_params)
+            ),
+            lambda s: InvitationsService(s, user).fetch_all_for_invited_count(
+                deepcopy(query_params)
+            ),
+        )
 
     return ResponseMulti[InvitationResponse](
         result=[
@@ -139,6 +155,55 @@ async def invitation_respondent_send(
     )
 
 
+async def invitation_respondent_bulk_send(
+    applet_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user),
+    file: UploadFile = File(...),
+    session=Depends(get_session),
+) -> Response[PublicInvitationsBulkJob]:
+    """
+    Sends the invitations to the respondents from the CSV or JSON file
+    in the background. Returns the job which progress can be requested.
+    """
+    rows = parse_respondents_file(file.filename, await file.read())
+
+    async with atomic(session):
+        await AppletService(session, user.id).exist_by_id(applet_id)
+        await CheckAccessService(session, user.id).check_applet_invite_access(
+            applet_id
+        )
+        job, requests = await RespondentInvitationsBulkService(
+            session, user
+        ).create_job(applet_id, rows)
+
+    background_tasks.add_task(run_respondents_bulk_job, user, job, requests)
+
+    return Response[PublicInvitationsBulkJob](
+        result=PublicInvitationsBulkJob(**job.dict())
+    )
+
+
+async def invitation_respondent_bulk_retrieve(
+    applet_id: uuid.UUID,
+    job_id: uuid.UUID,
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+) -> Response[PublicInvitationsBulkJob]:
+    """Returns the progress of the bulk respondents invitation."""
+    async with atomic(session):
+        await CheckAccessService(session, user.id).check_applet_invite_access(
+            applet_id
+        )
+        job = await RespondentInvitationsBulkService(session, user).get_job(
+            applet_id, job_id
+        )
+
+    return Response[PublicInvitationsBulkJob](
+        result=PublicInvitationsBulkJob(**job.dict())
+    )
+
+
 async def invitation_reviewer_send(
     applet_id: uuid.UUID,
     user: User = Depends(get_current_user),
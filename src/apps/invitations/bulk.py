@@ -0,0 +1,317 @@
+import csv
+import io
+import json
+import logging
+import uuid
+from collections import defaultdict
+
+from pydantic import ValidationError as PydanticValidationError
+
+from apps.applets.crud import AppletsCRUD, UserAppletAccessCRUD
+from apps.applets.domain import Role
+from apps.invitations.constants import InvitationStatus
+from apps.invitations.crud import InvitationCRUD
+from apps.invitations.domain import (
+    InvitationRespondentRequest,
+    InvitationsBulkError,
+    InvitationsBulkJob,
+    InvitationsBulkJobStatus,
+    RespondentMeta,
+)
+from apps.invitations.errors import (
+    InvitationAlreadyProcesses,
+    InvitationsBulkJobDoesNotExist,
+    InvitationsFileInvalid,
+    NonUniqueValue,
+)
+from apps.invitations.services import InvitationsService
+from apps.mailing.domain import MessageSchema
+from apps.mailing.services import MailingService, MailOutboxService
+from apps.users import UsersCRUD
+from apps.users.domain import User
+from infrastructure.cache import BaseCacheService, CacheNotFound
+from infrastructure.cache.domain import CacheEntry
+from infrastructure.database import atomic
+from infrastructure.database.deps import get_session
+
+__all__ = [
+    "InvitationsBulkJobCache",
+    "RespondentInvitationsBulkService",
+    "parse_respondents_file",
+    "run_respondents_bulk_job",
+]
+
+logger = logging.getLogger("mindlogger_backend")
+
+# NOTE: The max count of the respondents that are invited at once
+INVITATIONS_BULK_MAX_SIZE = 10000
+# The count of the respondents that are validated and saved in one
+# transaction, the job progress is reported after each chunk
+INVITATIONS_BULK_CHUNK_SIZE = 500
+# Set in seconds. The job progress is kept for a day
+INVITATIONS_BULK_JOB_TTL = 24 * 60 * 60
+
+
+def parse_respondents_file(filename: str | None, content: bytes) -> list:
+    """Returns the rows of the CSV file with the header
+    or of the JSON file with the array of objects.
+    The columns and keys are the same as in the single invitation request.
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise InvitationsFileInvalid(reason="the file is not UTF-8 encoded")
+
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        rows: list = [
+            {key: value for key, value in row.items() if value}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    elif extension == "json":
+        try:
+            rows = json.loads(text)
+        except ValueError:
+            raise InvitationsFileInvalid(reason="the file is not valid JSON")
+        if not isinstance(rows, list):
+            raise InvitationsFileInvalid(
+                reason="the JSON file must contain an array"
+            )
+    else:
+        raise InvitationsFileInvalid(
+            reason="only .csv and .json files are supported"
+        )
+
+    if not rows:
+        raise InvitationsFileInvalid(reason="the file has no respondents")
+    if len(rows) > INVITATIONS_BULK_MAX_SIZE:
+        raise InvitationsFileInvalid(
+            reason=f"the file has more than {INVITATIONS_BULK_MAX_SIZE} "
+            f"respondents"
+        )
+    return rows
+
+
+class InvitationsBulkJobCache(BaseCacheService[InvitationsBulkJob]):
+    """The progress of the bulk respondents invitations.
+
+    The example of a key:
+        InvitationsBulkJobCache:fe46c05a-1790-4b...
+    """
+
+    async def get(self, job_id: uuid.UUID) -> CacheEntry[InvitationsBulkJob]:
+        cache_record: dict = await self._get(str(job_id))
+
+        return CacheEntry[InvitationsBulkJob](**cache_record)
+
+    async def save(self, job: InvitationsBulkJob):
+        await self.set(str(job.id), job, ttl=INVITATIONS_BULK_JOB_TTL)
+
+
+class RespondentInvitationsBulkService(InvitationsService):
+    """Invites the respondents from the file.
+
+    Every chunk of the respondents is validated with the set-based
+    queries and saved with the multi-row INSERT, the emails are written
+    to the outbox. An invalid row does not reject the rest of the file.
+    """
+
+    async def create_job(
+        self, applet_id: uuid.UUID, rows: list
+    ) -> tuple[
+        InvitationsBulkJob, list[tuple[int, InvitationRespondentRequest]]
+    ]:
+        requests = []
+        errors = []
+        for index, row in enumerate(rows):
+            try:
+                requests.append(
+                    (index, InvitationRespondentRequest.parse_obj(row))
+                )
+            except PydanticValidationError as e:
+                email = row.get("email") if isinstance(row, dict) else None
+                errors.append(
+                    InvitationsBulkError(
+                        index=index,
+                        email=email,
+                        error=self._get_validation_error_text(e),
+                    )
+                )
+
+        if requests:
+            await self._is_validated_role_for_invitation(
+                applet_id, Role.RESPONDENT, requests[0][1]
+            )
+
+        job = InvitationsBulkJob(
+            id=uuid.uuid4(),
+            applet_id=applet_id,
+            total=len(rows),
+            processed=len(errors),
+            failed=len(errors),
+            errors=errors,
+        )
+        await InvitationsBulkJobCache().save(job)
+        return job, requests
+
+    async def get_job(
+        self, applet_id: uuid.UUID, job_id: uuid.UUID
+    ) -> InvitationsBulkJob:
+        try:
+            cache_entry = await InvitationsBulkJobCache().get(job_id)
+        except CacheNotFound:
+            raise InvitationsBulkJobDoesNotExist()
+        if cache_entry.instance.applet_id != applet_id:
+            raise InvitationsBulkJobDoesNotExist()
+        return cache_entry.instance
+
+    async def send_invitations(
+        self,
+        applet_id: uuid.UUID,
+        requests: list[tuple[int, InvitationRespondentRequest]],
+    ) -> tuple[int, list[InvitationsBulkError]]:
+        """Sends the invitations and returns the count of the sent ones
+        and the errors of the rejected ones.
+        """
+        secret_user_ids = [schema.secret_user_id for _, schema in requests]
+        emails = [schema.email for _, schema in requests]
+
+        # The secret user id is unique in the applet accesses
+        # and in the pending invitations of the applet
+        taken_secret_user_ids = set(
+            await UserAppletAccessCRUD(
+                self.session
+            ).get_secret_user_ids_for_applet(applet_id, secret_user_ids)
+        )
+        approved = set()
+        for invitation in await InvitationCRUD(
+            self.session
+        ).get_respondents_by_secret_user_ids(applet_id, secret_user_ids):
+            secret_user_id = invitation.meta["secret_user_id"]
+            if invitation.status == InvitationStatus.PENDING:
+                taken_secret_user_ids.add(secret_user_id)
+            elif invitation.status == InvitationStatus.APPROVED:
+                approved.add((invitation.email, secret_user_id))
+
+        registered_emails = set(
+            await UsersCRUD(self.session).get_existing_emails(emails)
+        )
+        applet = await AppletsCRUD(self.session).get_by_id(applet_id)
+
+        values = []
+        recipients: dict[tuple[str, str], list[dict]] = defaultdict(list)
+        errors = []
+        for index, schema in requests:
+            if schema.secret_user_id in taken_secret_user_ids:
+                errors.append(
+                    InvitationsBulkError(
+                        index=index,
+                        email=schema.email,
+                        error=f"secretUserId: {NonUniqueValue().error}",
+                    )
+                )
+                continue
+            if (schema.email, schema.secret_user_id) in approved:
+                errors.append(
+                    InvitationsBulkError(
+                        index=index,
+                        email=schema.email,
+                        error=InvitationAlreadyProcesses().error,
+                    )
+                )
+                continue
+            # The secret user id can be repeated in the file
+            taken_secret_user_ids.add(schema.secret_user_id)
+
+            key = uuid.uuid3(uuid.uuid4(), schema.email)
+            meta = RespondentMeta(
+                secret_user_id=schema.secret_user_id,
+                nickname=schema.nickname or "",
+            )
+            values.append(
+                dict(
+                    email=schema.email,
+                    applet_id=applet_id,
+                    role=Role.RESPONDENT,
+                    key=key,
+                    invitor_id=self._user.id,
+                    status=InvitationStatus.PENDING,
+                    first_name=schema.first_name,
+                    last_name=schema.last_name,
+                    meta=meta.dict(),
+                )
+            )
+            if schema.email in registered_emails:
+                path = "invitation_registered_user"
+            else:
+                path = "invitation_new_user"
+            recipients[(path, schema.language)].append(
+                dict(email=schema.email, first_name=schema.first_name, key=key)
+            )
+
+        # Every template is rendered for all its recipients at once
+        service = MailingService()
+        subject = self._get_invitation_subject(applet)
+        messages = []
+        for (path, language), contexts in recipients.items():
+            bodies = service.get_templates(
+                path,
+                contexts,
+                language,
+                applet_name=applet.display_name,
+                role=Role.RESPONDENT.value,
+                link=self._get_invitation_url_by_role(Role.RESPONDENT),
+            )
+            for context, body in zip(contexts, bodies):
+                messages.append(
+                    MessageSchema(
+                        recipients=[context["email"]],
+                        subject=subject,
+                        body=body,
+                    )
+                )
+
+        if values:
+            await InvitationCRUD(self.session).insert_many(values)
+            await MailOutboxService(self.session).send_many(messages)
+
+        return len(values), errors
+
+    @staticmethod
+    def _get_validation_error_text(error: PydanticValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(map(str, e['loc']))}: {e['msg']}"
+            for e in error.errors()
+        )
+
+
+async def run_respondents_bulk_job(
+    user: User,
+    job: InvitationsBulkJob,
+    requests: list[tuple[int, InvitationRespondentRequest]],
+):
+    """Sends the invitations of the job chunk by chunk in the background,
+    every chunk is committed separately and the progress is saved.
+    """
+    cache = InvitationsBulkJobCache()
+    job.status = InvitationsBulkJobStatus.IN_PROGRESS
+    await cache.save(job)
+    try:
+        for start in range(0, len(requests), INVITATIONS_BULK_CHUNK_SIZE):
+            chunk = requests[start : start + INVITATIONS_BULK_CHUNK_SIZE]
+            async for session in get_session():
+                async with atomic(session):
+                    created, errors = await RespondentInvitationsBulkService(
+                        session, user
+                    ).send_invitations(job.applet_id, chunk)
+            job.processed += len(chunk)
+            job.created += created
+            job.failed += len(errors)
+            job.errors += errors
+            await cache.save(job)
+    except Exception as e:
+        logger.exception(e)
+        job.status = InvitationsBulkJobStatus.FAILED
+    else:
+        job.status = InvitationsBulkJobStatus.DONE
+    await cache.save(job)
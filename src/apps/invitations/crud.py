@@ -22,7 +22,7 @@ from apps.invitations.domain import (
 )
 from apps.shared.filtering import FilterField, Filtering
 from apps.shared.ordering import Ordering
-from apps.shared.paging import paging
+from apps.shared.paging import Keyset, paging
 from apps.shared.query_params import QueryParams
 from apps.shared.searching import Searching
 from apps.workspaces.db.schemas import UserAppletAccessSchema
@@ -39,7 +39,12 @@ class _InvitationFiltering(Filtering):
 
 
 class _InvitationSearching(Searching):
-    search_fields = [InvitationSchema.applet_id]
+    search_fields = [
+        InvitationSchema.applet_id,
+        InvitationSchema.email,
+        InvitationSchema.first_name,
+        InvitationSchema.last_name,
+    ]
 
 
 class _InvitationOrdering(Ordering):
@@ -129,7 +134,7 @@ class InvitationCRUD(BaseCRUD[InvitationSchema]):
 
     async def get_pending_by_invitor_id(
         self, user_id: uuid.UUID, query_params: QueryParams
-    ) -> list[InvitationDetail]:
+    ) -> tuple[list[InvitationDetail], str | None]:
         """Return the list of pending invitations
         for the user who is invitor.
         """
@@ -168,15 +173,18 @@ class InvitationCRUD(BaseCRUD[InvitationSchema]):
             query = query.where(
                 _InvitationSearching().get_clauses(query_params.search)
             )
-        if query_params.ordering:
-            query = query.order_by(
-                *_InvitationOrdering().get_clauses(*query_params.ordering)
-            )
-        query = paging(query, query_params.page, query_params.limit)
+        keyset = Keyset(
+            _InvitationOrdering().get_keyset(
+                *query_params.ordering, unique=InvitationSchema.id
+            ),
+            query_params,
+        )
+        query = keyset.paginate(query)
 
         db_result = await self._execute(query)
+        rows = db_result.all()
         results = []
-        for invitation, applet_name in db_result.all():
+        for invitation, applet_name, *_ in rows:
             results.append(
                 InvitationDetail(
                     id=invitation.id,
@@ -193,7 +201,7 @@ class InvitationCRUD(BaseCRUD[InvitationSchema]):
                     created_at=invitation.created_at,
                 )
             )
-        return results
+        return results, keyset.get_next_cursor(rows)
 
     async def get_pending_by_invitor_id_count(
         self, user_id: uuid.UUID, query_params: QueryParams
@@ -344,6 +352,22 @@ class InvitationCRUD(BaseCRUD[InvitationSchema]):
         query = query.where(InvitationSchema.applet_id == applet_id)
         await self._execute(query)
 
+    async def insert_many(self, values: list[dict]) -> list[uuid.UUID]:
+        return await self._insert_many(values)
+
+    async def get_respondents_by_secret_user_ids(
+        self, applet_id: uuid.UUID, secret_user_ids: list[str]
+    ) -> list[InvitationSchema]:
+        schema = self.schema_class
+        query: Query = select(schema).where(
+            schema.applet_id == applet_id,
+            schema.role == Role.RESPONDENT,
+            schema.meta[text("'secret_user_id'")].astext.in_(secret_user_ids),
+        )
+        db_result = await self._execute(query)
+
+        return db_result.scalars().all()
+
     async def get_for_respondent(
         self,
         applet_id: uuid.UUID,
@@ -333,6 +333,69 @@ class PrivateInvitationResponse(PublicModel):
     status: str
 
 
+class InvitationsBulkJobStatus(str, Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class InvitationsBulkError(InternalModel):
+    """The error of the specific row of the invitations file."""
+
+    index: int
+    email: str | None = None
+    error: str
+
+
+class InvitationsBulkJob(InternalModel):
+    """This model is used to track the progress
+    of the bulk respondents invitation.
+    """
+
+    id: uuid.UUID
+    applet_id: uuid.UUID
+    status: InvitationsBulkJobStatus = InvitationsBulkJobStatus.PENDING
+    total: int
+    processed: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[InvitationsBulkError] = Field(default_factory=list)
+
+
+class PublicInvitationsBulkError(PublicModel):
+    index: int = Field(
+        description="This field represents the row index in the file",
+    )
+    email: str | None = None
+    error: str
+
+
+class PublicInvitationsBulkJob(PublicModel):
+    """This model is returned to the user on the bulk respondents
+    invitation request and on the request of its progress.
+    """
+
+    id: uuid.UUID = Field(
+        description="This field represents the bulk invitation job id",
+    )
+    applet_id: uuid.UUID
+    status: InvitationsBulkJobStatus
+    total: int = Field(
+        description="This field represents the count of rows in the file",
+    )
+    processed: int = Field(
+        description="This field represents the count of processed rows",
+    )
+    created: int = Field(
+        description="This field represents the count of sent invitations",
+    )
+    failed: int = Field(
+        description="This field represents the count of failed rows",
+    )
+    errors: list[PublicInvitationsBulkError]
+
+
 InvitationDetailGeneric = (
     InvitationDetailReviewer | InvitationDetailRespondent | InvitationDetail
 )
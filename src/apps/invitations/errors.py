@@ -1,6 +1,5 @@
-from gettext import gettext as _
-
 from apps.shared.exception import NotFoundError, ValidationError
+from infrastructure.i18n import gettext as _
 
 
 class InvitationDoesNotExist(NotFoundError):
@@ -29,3 +28,11 @@ class RespondentDoesNotExist(ValidationError):
 
 class RespondentsNotSet(ValidationError):
     message = _("Respondents are not set for the reviewer")
+
+
+class InvitationsFileInvalid(ValidationError):
+    message = _("Invitations file is invalid: {reason}")
+
+
+class InvitationsBulkJobDoesNotExist(NotFoundError):
+    message = _("Bulk invitation job does not exist.")
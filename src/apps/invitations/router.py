@@ -7,6 +7,8 @@ from apps.invitations.api import (
     invitation_list,
     invitation_list_for_invited,
     invitation_managers_send,
+    invitation_respondent_bulk_retrieve,
+    invitation_respondent_bulk_send,
     invitation_respondent_send,
     invitation_retrieve,
     invitation_reviewer_send,
@@ -19,11 +21,13 @@ from apps.invitations.domain import (
     InvitationResponse,
     InvitationReviewerResponse,
     PrivateInvitationResponse,
+    PublicInvitationsBulkJob,
 )
 from apps.shared.domain.response import (
     DEFAULT_OPENAPI_RESPONSE,
     Response,
     ResponseMulti,
+    ResponseMultiCursor,
 )
 
 router = APIRouter(prefix="/invitations", tags=["Invitations"])
@@ -34,9 +38,9 @@ router.get(
     description="""Fetch all invitations whose status is pending
                 for the specific user who is invitor.""",
     response_model_by_alias=True,
-    response_model=ResponseMulti[InvitationResponse],
+    response_model=ResponseMultiCursor[InvitationResponse],
     responses={
-        status.HTTP_200_OK: {"model": ResponseMulti[InvitationResponse]},
+        status.HTTP_200_OK: {"model": ResponseMultiCursor[InvitationResponse]},
         **DEFAULT_OPENAPI_RESPONSE,
     },
 )(invitation_list)
@@ -93,6 +97,37 @@ router.post(
     },
 )(invitation_respondent_send)
 
+# Invitations send for Role respondent from the CSV or JSON file
+router.post(
+    "/{applet_id}/respondent/bulk",
+    description="""Sends the invitations to the respondents from the CSV or
+                JSON file in the background. The file rows have the same
+                fields as the request of the single respondent invitation.
+                Returns the job which progress can be requested.""",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model_by_alias=True,
+    response_model=Response[PublicInvitationsBulkJob],
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": Response[PublicInvitationsBulkJob]
+        },
+        **DEFAULT_OPENAPI_RESPONSE,
+    },
+)(invitation_respondent_bulk_send)
+
+# Progress of the respondents invitations from the file
+router.get(
+    "/{applet_id}/respondent/bulk/{job_id}",
+    description="""Returns the progress of the bulk respondents
+                invitation.""",
+    response_model_by_alias=True,
+    response_model=Response[PublicInvitationsBulkJob],
+    responses={
+        status.HTTP_200_OK: {"model": Response[PublicInvitationsBulkJob]},
+        **DEFAULT_OPENAPI_RESPONSE,
+    },
+)(invitation_respondent_bulk_retrieve)
+
 # Invitation send for Role reviewer
 router.post(
     "/{applet_id}/reviewer",
@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 
 from fastapi.exceptions import RequestValidationError
@@ -39,12 +38,13 @@ from apps.invitations.errors import (
     RespondentDoesNotExist,
 )
 from apps.mailing.domain import MessageSchema
-from apps.mailing.services import MailingService
+from apps.mailing.services import MailingService, MailOutboxService
 from apps.shared.query_params import QueryParams
 from apps.users import UserNotFound, UsersCRUD
 from apps.users.domain import User
 from apps.workspaces.service.workspace import WorkspaceService
 from config import settings
+from infrastructure.database import gather_reads
 
 
 class InvitationsService:
@@ -55,7 +55,7 @@ class InvitationsService:
 
     async def fetch_all(
         self, query_params: QueryParams
-    ) -> list[InvitationDetail]:
+    ) -> tuple[list[InvitationDetail], str | None]:
         return await self.invitations_crud.get_pending_by_invitor_id(
             self._user.id, query_params
         )
@@ -177,9 +177,9 @@ class InvitationsService:
         try:
             await UsersCRUD(self.session).get_by_email(schema.email)
         except UserNotFound:
-            path = "invitation_new_user_en"
+            path = "invitation_new_user"
         else:
-            path = "invitation_registered_user_en"
+            path = "invitation_registered_user"
 
         # Send email to the user
         service = MailingService()
@@ -198,7 +198,7 @@ class InvitationsService:
                 language=schema.language,
             ),
         )
-        await service.send(message)
+        await MailOutboxService(self.session).send(message)
 
         return InvitationDetailForRespondent(
             id=invitation_internal.id,
@@ -285,9 +285,9 @@ class InvitationsService:
         try:
             await UsersCRUD(self.session).get_by_email(schema.email)
         except UserNotFound:
-            path = "invitation_new_user_en"
+            path = "invitation_new_user"
         else:
-            path = "invitation_registered_user_en"
+            path = "invitation_registered_user"
 
         # Send email to the user
         service = MailingService()
@@ -307,7 +307,7 @@ class InvitationsService:
             ),
         )
 
-        await service.send(message)
+        await MailOutboxService(self.session).send(message)
 
         await WorkspaceService(
             self.session, self._user.id
@@ -387,9 +387,9 @@ class InvitationsService:
         try:
             await UsersCRUD(self.session).get_by_email(schema.email)
         except UserNotFound:
-            path = "invitation_new_user_en"
+            path = "invitation_new_user"
         else:
-            path = "invitation_registered_user_en"
+            path = "invitation_registered_user"
 
         # Send email to the user
         service = MailingService()
@@ -409,7 +409,7 @@ class InvitationsService:
             ),
         )
 
-        await service.send(message)
+        await MailOutboxService(self.session).send(message)
 
         await WorkspaceService(
             self.session, self._user.id
@@ -521,13 +521,15 @@ class InvitationsService:
         applet_id: uuid.UUID,
         secret_user_id: str,
     ):
-        access_coro = UserAppletAccessCRUD(
-            self.session
-        ).get_by_secret_user_id_for_applet(applet_id, secret_user_id)
-        invitation_coro = InvitationCRUD(self.session).get_for_respondent(
-            applet_id, secret_user_id, InvitationStatus.PENDING
+        access, invitation = await gather_reads(
+            self.session,
+            lambda s: UserAppletAccessCRUD(s).get_by_secret_user_id_for_applet(
+                applet_id, secret_user_id
+            ),
+            lambda s: InvitationCRUD(s).get_for_respondent(
+                applet_id, secret_user_id, InvitationStatus.PENDING
+            ),
         )
-        access, invitation = await asyncio.gather(access_coro, invitation_coro)
         if access or invitation:
             raise NonUniqueValue(
                 message=f"In applet with id {applet_id} "
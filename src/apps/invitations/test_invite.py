@@ -1,8 +1,11 @@
 import uuid
+from unittest import mock
 
 from apps.applets.crud import UserAppletAccessCRUD
 from apps.applets.domain import Role
-from apps.mailing.services import TestMail
+from apps.mailing.crud import MailOutboxCRUD
+from apps.mailing.services import MailingService, TestMail
+from apps.mailing.worker import mail_outbox_worker
 from apps.shared.test import BaseTest
 from infrastructure.database import rollback, session_manager
 
@@ -27,6 +30,10 @@ class TestInvite(BaseTest):
     invite_manager_url = f"{invitation_list}/{{applet_id}}/managers"
     invite_reviewer_url = f"{invitation_list}/{{applet_id}}/reviewer"
     invite_respondent_url = f"{invitation_list}/{{applet_id}}/respondent"
+    invite_respondent_bulk_url = f"{invite_respondent_url}/bulk"
+    invite_respondent_bulk_detail_url = (
+        f"{invite_respondent_bulk_url}/{{job_id}}"
+    )
 
     @rollback
     async def test_invitation_list(self):
@@ -107,6 +114,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
         assert TestMail.mails[0].subject == "Applet 1 invitation"
@@ -131,6 +139,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -154,6 +163,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -178,6 +188,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200, response.json()
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
         assert TestMail.mails[0].subject == "Applet 1 invitation"
@@ -204,10 +215,103 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
         assert TestMail.mails[0].subject == "Applet 1 invitation"
 
+    @rollback
+    async def test_invitation_email_is_retried_when_sending_failed(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        request_data = dict(
+            email="patric@gmail.com",
+            first_name="Patric",
+            last_name="Daniel",
+            role=Role.RESPONDENT,
+            language="en",
+            secret_user_id=str(uuid.uuid4()),
+            nickname=str(uuid.uuid4()),
+        )
+        response = await self.client.post(
+            self.invite_respondent_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+            ),
+            request_data,
+        )
+        assert response.status_code == 200
+
+        session = session_manager.get_session()
+        with mock.patch.object(
+            MailingService, "send", side_effect=Exception("SMTP is down")
+        ):
+            assert await mail_outbox_worker.drain(session) == 0
+
+        # The failed email is postponed
+        assert await mail_outbox_worker.drain(session) == 0
+        assert len(TestMail.mails) == 0
+        outbox = await MailOutboxCRUD(session)._all()
+        assert len(outbox) == 1
+        assert outbox[0].attempts == 1
+        assert outbox[0].last_error == "SMTP is down"
+
+    @rollback
+    async def test_admin_invite_respondents_bulk(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        content = (
+            "email,firstName,lastName,language,secretUserId,nickname\n"
+            "patric@gmail.com,Patric,Daniel,en,secret-1,patric\n"
+            "mike@gmail.com,Mike,Samuel,en,secret-2,\n"
+            "john@gmail.com,John,Doe,en,secret-2,john\n"
+            "not-an-email,Bad,Email,en,secret-3,\n"
+        )
+        response = await self.client.post(
+            self.invite_respondent_bulk_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+            ),
+            files={"file": ("respondents.csv", content, "text/csv")},
+        )
+        assert response.status_code == 202, response.json()
+        job = response.json()["result"]
+        assert job["total"] == 4
+
+        response = await self.client.get(
+            self.invite_respondent_bulk_detail_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+                job_id=job["id"],
+            )
+        )
+        assert response.status_code == 200
+        job = response.json()["result"]
+        assert job["status"] == "done"
+        assert job["processed"] == 4
+        assert job["created"] == 2
+        assert job["failed"] == 2
+        assert sorted(error["index"] for error in job["errors"]) == [2, 3]
+
+        await mail_outbox_worker.drain(session_manager.get_session())
+        assert len(TestMail.mails) == 2
+        assert sorted(mail.recipients[0] for mail in TestMail.mails) == [
+            "mike@gmail.com",
+            "patric@gmail.com",
+        ]
+
+    @rollback
+    async def test_admin_invite_respondents_bulk_unsupported_file(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        response = await self.client.post(
+            self.invite_respondent_bulk_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+            ),
+            files={"file": ("respondents.txt", "patric", "text/plain")},
+        )
+        assert response.status_code == 400
+
     @rollback
     async def test_admin_invite_respondent_duplicate_pending_secret_id(self):
         await self.client.login(
@@ -257,6 +361,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
         assert TestMail.mails[0].subject == "Applet 1 invitation"
@@ -279,6 +384,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -300,6 +406,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -322,6 +429,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -345,6 +453,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -368,6 +477,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
@@ -390,6 +500,7 @@ class TestInvite(BaseTest):
         )
         assert response.status_code == 200
 
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [request_data["email"]]
 
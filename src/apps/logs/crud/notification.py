@@ -1,9 +1,13 @@
-import json
+import datetime
 
-from sqlalchemy import select
-from sqlalchemy.orm import Query
+from sqlalchemy import bindparam, delete, exists, func, or_, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Query, aliased
 
-from apps.logs.db.schemas import NotificationLogSchema
+from apps.logs.db.schemas import (
+    NotificationLogBlobSchema,
+    NotificationLogSchema,
+)
 from apps.logs.domain import (
     NotificationLogCreate,
     NotificationLogQuery,
@@ -14,80 +18,204 @@ from infrastructure.database.crud import BaseCRUD
 
 __all__ = ["NotificationLogCRUD"]
 
+# NOTE: The fields of the log which contents are stored in the blobs
+_BLOB_FIELDS = (
+    "notification_descriptions",
+    "notification_in_queue",
+    "scheduled_notifications",
+)
+
+# NOTE: The contents are hashed by the database, so the hash of the same
+#       jsonb does not depend on the keys order and the whitespaces.
+#       The existing content is touched, so the compaction does not remove
+#       it as unused before the log that refers it is saved
+_SAVE_BLOBS = text(
+    """
+    WITH blobs AS (
+        SELECT
+            encode(sha256(convert_to(c.content::text, 'UTF8')), 'hex')
+                AS hash,
+            c.content,
+            c.position
+        FROM jsonb_array_elements(:contents)
+            WITH ORDINALITY AS c(content, position)
+    ), saved AS (
+        INSERT INTO notification_log_blobs (hash, content)
+        SELECT DISTINCT ON (hash) hash, content FROM blobs
+        ON CONFLICT (hash) DO UPDATE
+        SET updated_at = timezone('utc', now())
+    )
+    SELECT hash FROM blobs ORDER BY position
+    """
+).bindparams(bindparam("contents", type_=JSONB()))
+
 
 class NotificationLogCRUD(BaseCRUD[NotificationLogSchema]):
     schema_class = NotificationLogSchema
 
+    def _get_logs_query(self, user_id: str, device_id: str) -> Query:
+        """Returns the query of the logs of the device with the contents."""
+        blobs = {
+            field: aliased(NotificationLogBlobSchema) for field in _BLOB_FIELDS
+        }
+        query: Query = select(
+            self.schema_class,
+            *(blob.content.label(field) for field, blob in blobs.items()),
+        )
+        for field, blob in blobs.items():
+            query = query.outerjoin(
+                blob, blob.hash == getattr(self.schema_class, f"{field}_hash")
+            )
+        query = query.where(
+            self.schema_class.user_id == user_id,
+            self.schema_class.device_id == device_id,
+        )
+        query = query.order_by(self.schema_class.created_at.desc())
+        return query
+
     async def filter(
         self, query_set: NotificationLogQuery
     ) -> list[PublicNotificationLog]:
         """Return all NotificationLogs where the user and device exists."""
-        query: Query = (
-            select(self.schema_class)
-            .where(
-                self.schema_class.user_id == query_set.user_id
-                and self.schema_class.device_id == query_set.device_id
-            )
-            .order_by(self.schema_class.created_at.desc())
-            .limit(query_set.limit)
-        )
+        query = self._get_logs_query(query_set.user_id, query_set.device_id)
+        query = query.limit(query_set.limit)
 
         result = await self._execute(query)
-        logs = result.scalars().all()
 
-        return [PublicNotificationLog.from_orm(log) for log in logs]
+        return [
+            PublicNotificationLog(
+                id=row.NotificationLogSchema.id,
+                user_id=row.NotificationLogSchema.user_id,
+                device_id=row.NotificationLogSchema.device_id,
+                action_type=row.NotificationLogSchema.action_type,
+                **{field: getattr(row, field) for field in _BLOB_FIELDS},
+            )
+            for row in result.all()
+        ]
 
     async def save(
         self, schema: NotificationLogCreate
     ) -> PublicNotificationLog:
-        """Return NotificationLog instance."""
-
-        notif_desc_upd = True
-        notif_in_queue_upd = True
-        sched_notif_upd = True
-
-        logs = await self.filter(
-            NotificationLogQuery(
-                user_id=schema.user_id,
-                device_id=schema.device_id,
-                limit=1,
-            )
-        )
-
-        previous = dict()
-        if logs:
-            previous = logs[0].dict()
-
-        if not schema.notification_descriptions:
-            schema.notification_descriptions = previous.get(
-                "notification_descriptions", json.dumps(None)
-            )
-            notif_desc_upd = False
-
-        if not schema.notification_in_queue:
-            schema.notification_in_queue = previous.get(
-                "notifications_in_queue", json.dumps(None)
-            )
-            notif_in_queue_upd = False
-
-        if not schema.scheduled_notifications:
-            schema.scheduled_notifications = previous.get(
-                "scheduled_notifications", json.dumps(None)
-            )
-            sched_notif_upd = False
+        """Return NotificationLog instance.
+        The fields that are not sent refer the contents of the previous log
+        of the device, the contents are not copied.
+        """
+        query = self._get_logs_query(schema.user_id, schema.device_id)
+        db_result = await self._execute(query.limit(1))
+        previous = db_result.first()
+
+        contents = {
+            field: getattr(schema, field)
+            for field in _BLOB_FIELDS
+            if getattr(schema, field)
+        }
+        hashes = dict(zip(contents, await self._save_blobs(contents)))
+
+        values = dict()
+        for field in _BLOB_FIELDS:
+            if field in hashes:
+                values[f"{field}_hash"] = hashes[field]
+            elif previous:
+                values[f"{field}_hash"] = getattr(
+                    previous.NotificationLogSchema, f"{field}_hash"
+                )
+                contents[field] = getattr(previous, field)
 
         # Save NotificationLogs into the database
         try:
             instance: NotificationLogSchema = await self._create(
                 NotificationLogSchema(
-                    **schema.dict(),
-                    notification_descriptions_updated=notif_desc_upd,
-                    notifications_in_queue_updated=notif_in_queue_upd,
-                    scheduled_notifications_updated=sched_notif_upd,
+                    user_id=schema.user_id,
+                    device_id=schema.device_id,
+                    action_type=schema.action_type,
+                    notification_descriptions_updated=(
+                        "notification_descriptions" in hashes
+                    ),
+                    notifications_in_queue_updated=(
+                        "notification_in_queue" in hashes
+                    ),
+                    scheduled_notifications_updated=(
+                        "scheduled_notifications" in hashes
+                    ),
+                    **values,
                 )
             )
-            notification_log = PublicNotificationLog.from_orm(instance)
+            notification_log = PublicNotificationLog(
+                id=instance.id,
+                user_id=instance.user_id,
+                device_id=instance.device_id,
+                action_type=instance.action_type,
+                **contents,
+            )
 
             return notification_log
         except Exception:
             raise NotificationLogError()
+
+    async def _save_blobs(self, contents: dict) -> list[str]:
+        """Stores the contents that are not stored yet
+        and returns the hashes of all the contents.
+        """
+        if not contents:
+            return []
+        db_result = await self._execute(
+            _SAVE_BLOBS.bindparams(contents=list(contents.values()))
+        )
+        return db_result.scalars().all()
+
+    async def delete_old(self, keep: int, batch_size: int) -> int:
+        """Deletes the logs of every device except the last `keep` ones
+        and returns the count of the deleted logs.
+        The last logs refer the contents of the deleted ones,
+        so no content is lost.
+        """
+        position = func.row_number().over(
+            partition_by=(
+                self.schema_class.user_id,
+                self.schema_class.device_id,
+            ),
+            order_by=(
+                self.schema_class.created_at.desc(),
+                self.schema_class.id.desc(),
+            ),
+        )
+        positions = select(
+            self.schema_class.id, position.label("position")
+        ).subquery()
+        ids_query: Query = select(positions.c.id)
+        ids_query = ids_query.where(positions.c.position > keep)
+        ids_query = ids_query.limit(batch_size)
+
+        query: Query = delete(self.schema_class)
+        query = query.where(self.schema_class.id.in_(ids_query))
+        query = query.returning(self.schema_class.id)
+        db_result = await self._execute(query)
+        return len(db_result.scalars().all())
+
+    async def delete_unused_blobs(
+        self, saved_before: datetime.datetime, batch_size: int
+    ) -> int:
+        """Deletes the contents that are not referred by the logs
+        and are not saved since `saved_before`, returns their count.
+        """
+        is_used = exists().where(
+            or_(
+                *(
+                    getattr(self.schema_class, f"{field}_hash")
+                    == NotificationLogBlobSchema.hash
+                    for field in _BLOB_FIELDS
+                )
+            )
+        )
+        ids_query: Query = select(NotificationLogBlobSchema.id)
+        ids_query = ids_query.where(
+            NotificationLogBlobSchema.updated_at < saved_before,
+            ~is_used,
+        )
+        ids_query = ids_query.limit(batch_size)
+
+        query: Query = delete(NotificationLogBlobSchema)
+        query = query.where(NotificationLogBlobSchema.id.in_(ids_query))
+        query = query.returning(NotificationLogBlobSchema.id)
+        db_result = await self._execute(query)
+        return len(db_result.scalars().all())
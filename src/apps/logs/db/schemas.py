@@ -1,18 +1,64 @@
-from sqlalchemy import Boolean, Column, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 
 from infrastructure.database.base import Base
 
 
+class NotificationLogBlobSchema(Base):
+    """The content of the notification log fields.
+
+    Every content is stored once and is referenced by its hash, the SHA-256
+    of the jsonb text, so the same notifications are not copied to every
+    log of the device. The updated_at is the last time the content is saved.
+    """
+
+    __tablename__ = "notification_log_blobs"
+
+    hash = Column(String(length=64), nullable=False, unique=True)
+    content = Column(JSONB(), nullable=False)
+
+
 class NotificationLogSchema(Base):
     __tablename__ = "notification_logs"
+    __table_args__ = (
+        Index(
+            "ix_notification_logs_user_id_device_id_created_at",
+            "user_id",
+            "device_id",
+            "created_at",
+        ),
+    )
 
     user_id = Column(String(), nullable=False)
     device_id = Column(String(), nullable=False)
     action_type = Column(String(), nullable=False)
-    notification_descriptions = Column(JSONB(), nullable=True)
-    notification_in_queue = Column(JSONB(), nullable=True)
-    scheduled_notifications = Column(JSONB(), nullable=True)
+    notification_descriptions_hash = Column(
+        ForeignKey(
+            "notification_log_blobs.hash",
+            ondelete="RESTRICT",
+            name="fk_notification_logs_descriptions_hash",
+        ),
+        nullable=True,
+        index=True,
+    )
+    notification_in_queue_hash = Column(
+        ForeignKey(
+            "notification_log_blobs.hash",
+            ondelete="RESTRICT",
+            name="fk_notification_logs_in_queue_hash",
+        ),
+        nullable=True,
+        index=True,
+    )
+    scheduled_notifications_hash = Column(
+        ForeignKey(
+            "notification_log_blobs.hash",
+            ondelete="RESTRICT",
+            name="fk_notification_logs_scheduled_hash",
+        ),
+        nullable=True,
+        index=True,
+    )
     notification_descriptions_updated = Column(Boolean(), nullable=False)
     notifications_in_queue_updated = Column(Boolean(), nullable=False)
     scheduled_notifications_updated = Column(Boolean(), nullable=False)
@@ -63,9 +63,9 @@ class PublicNotificationLog(_NotificationLogBase, PublicModel):
     """Public NotificationLog model."""
 
     id: uuid.UUID
-    notification_descriptions: list
-    notification_in_queue: list
-    scheduled_notifications: list
+    notification_descriptions: list | None
+    notification_in_queue: list | None
+    scheduled_notifications: list | None
 
     @validator(
         "notification_descriptions",
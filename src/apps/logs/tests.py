@@ -1,5 +1,6 @@
+from apps.logs.worker import NotificationLogCompactor
 from apps.shared.test import BaseTest
-from infrastructure.database import rollback
+from infrastructure.database import rollback, session_manager
 
 
 class TestNotificationLogs(BaseTest):
@@ -50,3 +51,72 @@ class TestNotificationLogs(BaseTest):
 
         assert response.status_code == 200, response.json()
         assert len(response.json()["result"]) == 1
+
+    @rollback
+    async def test_log_refers_previous_contents(self):
+        create_data = dict(
+            user_id="test@test.com",
+            device_id="test_device_id",
+            action_type="test",
+            notification_descriptions='[{"sample":"json"}]',
+            notification_in_queue='[{"sample":"json"}]',
+            scheduled_notifications='[{"sample":"json"}]',
+        )
+        response = await self.client.post(self.logs_url, data=create_data)
+        assert response.status_code == 201, response.json()
+
+        create_data = dict(
+            user_id="test@test.com",
+            device_id="test_device_id",
+            action_type="test",
+            notification_in_queue='[{"sample":"updated"}]',
+        )
+        response = await self.client.post(self.logs_url, data=create_data)
+        assert response.status_code == 201, response.json()
+        result = response.json()["result"]
+        assert result["notificationDescriptions"] == [{"sample": "json"}]
+        assert result["notificationInQueue"] == [{"sample": "updated"}]
+        assert result["scheduledNotifications"] == [{"sample": "json"}]
+
+        query = dict(
+            user_id="test@test.com", device_id="test_device_id", limit=10
+        )
+        response = await self.client.get(self.logs_url, query=query)
+        assert response.status_code == 200, response.json()
+        logs = response.json()["result"]
+        assert len(logs) == 2
+        assert logs[0]["notificationInQueue"] == [{"sample": "updated"}]
+        assert logs[1]["notificationInQueue"] == [{"sample": "json"}]
+
+    @rollback
+    async def test_compact_logs(self):
+        for sample in ("first", "second", "third"):
+            create_data = dict(
+                user_id="test@test.com",
+                device_id="test_device_id",
+                action_type="test",
+                notification_in_queue=f'[{{"sample":"{sample}"}}]',
+            )
+            response = await self.client.post(self.logs_url, data=create_data)
+            assert response.status_code == 201, response.json()
+
+        compactor = NotificationLogCompactor(
+            keep_last=1,
+            compaction_interval=0,
+            batch_size=1,
+            unused_contents_ttl=-60,
+        )
+        deleted_logs, deleted_contents = await compactor.compact(
+            session_manager.get_session()
+        )
+        assert deleted_logs == 2
+        assert deleted_contents == 2
+
+        query = dict(
+            user_id="test@test.com", device_id="test_device_id", limit=10
+        )
+        response = await self.client.get(self.logs_url, query=query)
+        assert response.status_code == 200, response.json()
+        logs = response.json()["result"]
+        assert len(logs) == 1
+        assert logs[0]["notificationInQueue"] == [{"sample": "third"}]
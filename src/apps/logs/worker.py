@@ -0,0 +1,91 @@
+import asyncio
+import datetime
+import logging
+
+from apps.logs.crud.notification import NotificationLogCRUD
+from config import settings
+from infrastructure.database import atomic, session_manager
+
+__all__ = ["NotificationLogCompactor", "notification_log_compactor"]
+
+logger = logging.getLogger("mindlogger_backend")
+
+
+class NotificationLogCompactor:
+    """Keeps only the last `keep_last` notification logs of every device
+    and deletes the contents that are not referred by the logs anymore.
+
+    The rows are deleted by batches of `batch_size`, every batch
+    in its own transaction.
+    """
+
+    def __init__(
+        self,
+        keep_last: int,
+        compaction_interval: int,
+        batch_size: int,
+        unused_contents_ttl: int,
+    ):
+        self.keep_last = keep_last
+        self.compaction_interval = compaction_interval
+        self.batch_size = batch_size
+        self.unused_contents_ttl = unused_contents_ttl
+        self._task: asyncio.Task | None = None
+
+    async def compact(self, session=None) -> tuple[int, int]:
+        """Returns the count of the deleted logs and contents."""
+        deleted_logs = await self._delete_by_batches(
+            lambda crud: crud.delete_old(self.keep_last, self.batch_size),
+            session,
+        )
+        saved_before = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=self.unused_contents_ttl
+        )
+        deleted_contents = await self._delete_by_batches(
+            lambda crud: crud.delete_unused_blobs(
+                saved_before, self.batch_size
+            ),
+            session,
+        )
+        return deleted_logs, deleted_contents
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.compaction_interval)
+            try:
+                await self.compact()
+            except Exception as e:
+                logger.exception(e)
+
+    async def _delete_by_batches(self, delete_batch, session=None) -> int:
+        total = 0
+        while True:
+            if session is None:
+                session_maker = session_manager.get_session()
+                async with session_maker() as batch_session:
+                    async with atomic(batch_session):
+                        deleted = await delete_batch(
+                            NotificationLogCRUD(batch_session)
+                        )
+            else:
+                deleted = await delete_batch(NotificationLogCRUD(session))
+            total += deleted
+            if deleted < self.batch_size:
+                return total
+
+
+notification_log_compactor = NotificationLogCompactor(
+    keep_last=settings.notification_logs.keep_last,
+    compaction_interval=settings.notification_logs.compaction_interval,
+    batch_size=settings.notification_logs.batch_size,
+    unused_contents_ttl=settings.notification_logs.unused_contents_ttl,
+)
@@ -0,0 +1,77 @@
+import datetime
+import uuid
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query
+
+from apps.mailing.db import MailOutboxSchema
+from infrastructure.database import BaseCRUD
+
+__all__ = ["MailOutboxCRUD"]
+
+
+class MailOutboxCRUD(BaseCRUD[MailOutboxSchema]):
+    schema_class = MailOutboxSchema
+
+    async def create(self, schema: MailOutboxSchema) -> MailOutboxSchema:
+        return await self._create(schema)
+
+    async def insert_many(self, values: list[dict]) -> list[uuid.UUID]:
+        return await self._insert_many(values)
+
+    async def claim_due(
+        self,
+        max_attempts: int,
+        limit: int,
+        claimed_until: datetime.datetime,
+    ) -> list[Row]:
+        """Claims the emails that are due to be sent and returns them.
+
+        The claimed emails are not due until `claimed_until`, so the other
+        workers skip them after the transaction is committed as well, and
+        the emails of the crashed worker are sent again after that time.
+        The attempt is counted by the claim.
+        """
+        due_query: Query = select(MailOutboxSchema.id)
+        due_query = due_query.where(
+            MailOutboxSchema.next_attempt_at <= datetime.datetime.utcnow()
+        )
+        due_query = due_query.where(MailOutboxSchema.attempts < max_attempts)
+        due_query = due_query.order_by(MailOutboxSchema.next_attempt_at.asc())
+        due_query = due_query.limit(limit)
+        due_query = due_query.with_for_update(skip_locked=True)
+
+        query = update(MailOutboxSchema)
+        query = query.where(MailOutboxSchema.id.in_(due_query))
+        query = query.values(
+            attempts=MailOutboxSchema.attempts + 1,
+            next_attempt_at=claimed_until,
+        )
+        query = query.returning(
+            MailOutboxSchema.id,
+            MailOutboxSchema.recipients,
+            MailOutboxSchema.subject,
+            MailOutboxSchema.body,
+            MailOutboxSchema.subtype,
+            MailOutboxSchema.attempts,
+        )
+        query = query.execution_options(synchronize_session=False)
+        db_result = await self._execute(query)
+        return db_result.all()
+
+    async def delete_by_ids(self, ids: list[uuid.UUID]):
+        query = delete(MailOutboxSchema).where(MailOutboxSchema.id.in_(ids))
+        await self._execute(query)
+
+    async def postpone(
+        self,
+        id_: uuid.UUID,
+        next_attempt_at: datetime.datetime,
+        error: str,
+    ):
+        query = update(MailOutboxSchema)
+        query = query.where(MailOutboxSchema.id == id_)
+        query = query.values(next_attempt_at=next_attempt_at, last_error=error)
+        query = query.execution_options(synchronize_session=False)
+        await self._execute(query)
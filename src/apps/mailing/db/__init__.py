@@ -0,0 +1 @@
+from apps.mailing.db.schemas import MailOutboxSchema  # noqa: F401, F403
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from infrastructure.database.base import Base
+
+__all__ = ["MailOutboxSchema"]
+
+
+class MailOutboxSchema(Base):
+    """The emails that are written in the same transaction
+    with the data they are about and sent by the outbox worker.
+    """
+
+    __tablename__ = "mail_outbox"
+
+    recipients = Column(JSONB(), nullable=False)
+    subject = Column(Text(), nullable=False)
+    body = Column(Text(), nullable=False)
+    subtype = Column(String(), nullable=False)
+    attempts = Column(Integer(), nullable=False, default=0)
+    next_attempt_at = Column(
+        DateTime(),
+        nullable=False,
+        index=True,
+        server_default=text("timezone('utc', now())"),
+    )
+    last_error = Column(Text(), nullable=True)
@@ -1,9 +1,19 @@
-from fastapi_mail import ConnectionConfig, FastMail
-from jinja2 import Environment, PackageLoader, select_autoescape
+import asyncio
+import time
+from email.message import EmailMessage
+from email.utils import formataddr
 
+import aiosmtplib
+from fastapi_mail import MessageType
+
+from apps.mailing.crud import MailOutboxCRUD
+from apps.mailing.db import MailOutboxSchema
 from apps.mailing.domain import MessageSchema
+from apps.mailing.templates import template_registry
 from config import settings
 
+__all__ = ["MailingService", "MailOutboxService", "TestMail", "TestSMTP"]
+
 
 class TestMail:
     """
@@ -12,17 +22,60 @@ class TestMail:
 
     mails: list[MessageSchema] = []
 
-    def __init__(self, connection):
-        self.connection = connection
-
-    async def send_message(self, message: MessageSchema):
-        self.mails.insert(0, message)
-
     @classmethod
     def clear_mails(cls):
         cls.mails = []
 
 
+class TestSMTP:
+    """The stand-in of the SMTP connection for tests, so the emails go
+    through the same path as with SMTP. The sent emails are parsed back
+    into the TestMail.mails.
+    """
+
+    # NOTE: The connections of the previous generations
+    #       are closed by the server, see `drop_connections`
+    _generation = 0
+
+    def __init__(self, **kwargs):
+        self.is_connected = False
+        self._generation = TestSMTP._generation
+
+    @classmethod
+    def drop_connections(cls):
+        """Closes the open connections on the server side,
+        like the server does with the idle ones.
+        """
+        cls._generation += 1
+
+    async def connect(self):
+        self.is_connected = True
+        self._generation = TestSMTP._generation
+
+    async def login(self, username: str, password: str):
+        pass
+
+    async def send_message(self, email: EmailMessage):
+        if not self.is_connected or self._generation != TestSMTP._generation:
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+        TestMail.mails.insert(
+            0,
+            MessageSchema(
+                recipients=email["To"].split(", "),
+                subject=email["Subject"],
+                body=email.get_content(),
+                subtype=email.get_content_subtype(),
+            ),
+        )
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
 class MailingService:
     """A singleton realization of a Mailing service."""
 
@@ -38,32 +91,131 @@ class MailingService:
         if self._initialized is True:
             return
 
-        self._connection = ConnectionConfig(
-            MAIL_USERNAME=settings.mailing.mail.username,
-            MAIL_PASSWORD=settings.mailing.mail.password,
-            MAIL_SERVER=settings.mailing.mail.server,
-            MAIL_PORT=settings.mailing.mail.port,
-            MAIL_STARTTLS=settings.mailing.mail.starttls,
-            MAIL_SSL_TLS=settings.mailing.mail.ssl_tls,
-            MAIL_FROM=settings.mailing.mail.from_email,
-            MAIL_FROM_NAME=settings.mailing.mail.from_name,
-        )
-        self.env = Environment(
-            loader=PackageLoader("apps.mailing", "static/templates"),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self._smtp: aiosmtplib.SMTP | TestSMTP | None = None
+        self._smtp_used_at = 0.0
+        self._smtp_lock = asyncio.Lock()
 
         self._initialized = True
 
     async def send(self, message: MessageSchema) -> None:
-        mailing_class = FastMail
+        """Sends the message right away over the reused SMTP connection.
+
+        NOTE: Use the MailOutboxService to send the emails
+              that are related to the data changes.
+        """
+        async with self._smtp_lock:
+            try:
+                smtp = await self._get_smtp()
+                await smtp.send_message(self._build_message(message))
+            except aiosmtplib.SMTPServerDisconnected:
+                # The server closed the idle connection, reconnect once
+                await self._close_smtp()
+                smtp = await self._get_smtp()
+                await smtp.send_message(self._build_message(message))
+            self._smtp_used_at = time.monotonic()
+
+    async def close_idle(self, idle_timeout: int) -> None:
+        """Closes the SMTP connection if it is not used for a while."""
+        async with self._smtp_lock:
+            if time.monotonic() - self._smtp_used_at >= idle_timeout:
+                await self._close_smtp()
+
+    async def close(self) -> None:
+        async with self._smtp_lock:
+            await self._close_smtp()
+
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        if self._smtp is not None and self._smtp.is_connected:
+            return self._smtp
+
+        mail = settings.mailing.mail
+        smtp_class = aiosmtplib.SMTP
         if settings.env == "testing":
-            mailing_class = TestMail
-        fm = mailing_class(self._connection)
-        await fm.send_message(message)
+            smtp_class = TestSMTP
+        self._smtp = smtp_class(
+            hostname=mail.server,
+            port=mail.port,
+            use_tls=mail.ssl_tls,
+            start_tls=mail.starttls,
+        )
+        await self._smtp.connect()
+        if mail.username and mail.password:
+            await self._smtp.login(mail.username, mail.password)
+        return self._smtp
+
+    async def _close_smtp(self) -> None:
+        if self._smtp is None:
+            return
+        smtp, self._smtp = self._smtp, None
+        if not smtp.is_connected:
+            return
+        try:
+            await smtp.quit()
+        except aiosmtplib.SMTPException:
+            smtp.close()
+
+    @staticmethod
+    def _build_message(message: MessageSchema) -> EmailMessage:
+        mail = settings.mailing.mail
+        email = EmailMessage()
+        email["From"] = formataddr((mail.from_name, mail.from_email))
+        email["To"] = ", ".join(message.recipients)
+        email["Subject"] = message.subject
+        email.set_content(
+            message.body, subtype=MessageType(message.subtype).value
+        )
+        return email
+
+    def get_template(
+        self, path: str, language: str | None = None, **kwargs
+    ) -> str:
+        """Renders the language variant of the template,
+        the language is passed to the template as well.
+        """
+        return template_registry.render(path, language, **kwargs)
+
+    def get_templates(
+        self,
+        path: str,
+        contexts: list[dict],
+        language: str | None = None,
+        **kwargs,
+    ) -> list[str]:
+        """Renders the language variant of the template
+        for the many recipients with the specific contexts.
+        """
+        return template_registry.render_many(
+            path, contexts, language, **kwargs
+        )
+
+
+class MailOutboxService:
+    """Writes the emails to the outbox in the current transaction,
+    so they are sent by the outbox worker only if it is committed.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    async def send(self, message: MessageSchema) -> None:
+        await MailOutboxCRUD(self.session).create(
+            MailOutboxSchema(**self._to_values(message))
+        )
 
-    def get_template(self, path: str, **kwargs):
-        template = self.env.get_template(f"{path}.html")
-        html = template.render(**kwargs)
+    async def send_many(self, messages: list[MessageSchema]) -> None:
+        """Writes the messages with the multi-row INSERT."""
+        if not messages:
+            return
+        await MailOutboxCRUD(self.session).insert_many(
+            [self._to_values(message) for message in messages]
+        )
 
-        return html
+    @staticmethod
+    def _to_values(message: MessageSchema) -> dict:
+        return dict(
+            recipients=list(message.recipients),
+            subject=message.subject,
+            body=message.body,
+            subtype=MessageType(message.subtype).value,
+            attempts=0,
+        )
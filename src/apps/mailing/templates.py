@@ -0,0 +1,129 @@
+import os
+import tempfile
+from typing import Iterable
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    TemplateNotFound,
+    select_autoescape,
+)
+
+from config import settings
+
+__all__ = ["TemplateRegistry", "template_registry"]
+
+
+class TemplateRegistry:
+    """Compiles the email templates once and keeps them in memory.
+
+    The compiled bytecode is also cached on disk, so the next processes
+    do not parse the templates again.
+
+    The language variant of the template is named with the language
+    suffix: `reset_password_en.html`. The variant is looked up with
+    the fallback chain, e.g. for `fr-CA`:
+        reset_password_fr-CA, reset_password_fr,
+        reset_password_en (default language), reset_password
+    """
+
+    extension = "html"
+
+    def __init__(
+        self,
+        package_name: str,
+        package_path: str,
+        default_language: str,
+        cache_dir: str | None = None,
+    ):
+        self.default_language = default_language
+        bytecode_cache = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        self.env = Environment(
+            loader=PackageLoader(package_name, package_path),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=bytecode_cache,
+            # NOTE: The included templates, e.g. header.html, are looked up
+            #       on every render, so all the templates are kept
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self._templates: dict[str, Template] = {}
+        self._resolved: dict[tuple[str, str | None], Template] = {}
+
+    def load(self) -> None:
+        """Compiles all the templates, it is called at the startup."""
+        for name in self.env.list_templates(extensions=[self.extension]):
+            self._templates[name] = self.env.get_template(name)
+
+    def get(self, name: str, language: str | None = None) -> Template:
+        key = (name, language)
+        if template := self._resolved.get(key):
+            return template
+
+        for variant in self._get_fallback_chain(name, language):
+            file_name = f"{variant}.{self.extension}"
+            if file_name not in self._templates:
+                try:
+                    self._templates[file_name] = self.env.get_template(
+                        file_name
+                    )
+                except TemplateNotFound:
+                    continue
+            template = self._resolved[key] = self._templates[file_name]
+            return template
+
+        raise TemplateNotFound(name)
+
+    def render(self, name: str, language: str | None = None, **kwargs) -> str:
+        """Renders the language variant of the template,
+        the language is passed to the template as well.
+        """
+        if language is not None:
+            kwargs["language"] = language
+        return self.get(name, language).render(**kwargs)
+
+    def render_many(
+        self,
+        name: str,
+        contexts: Iterable[dict],
+        language: str | None = None,
+        **kwargs,
+    ) -> list[str]:
+        """Renders the template for many recipients.
+        The template is looked up once, the kwargs are shared by all
+        the renders and the contexts are specific for every recipient.
+        """
+        if language is not None:
+            kwargs["language"] = language
+        template = self.get(name, language)
+        return [template.render(kwargs | context) for context in contexts]
+
+    def _get_fallback_chain(
+        self, name: str, language: str | None
+    ) -> list[str]:
+        languages = []
+        if language:
+            languages.append(language)
+            base_language = language.replace("_", "-").split("-")[0]
+            if base_language != language:
+                languages.append(base_language)
+        if self.default_language not in languages:
+            languages.append(self.default_language)
+
+        chain = [f"{name}_{variant}" for variant in languages]
+        chain.append(name)
+        return chain
+
+
+template_registry = TemplateRegistry(
+    package_name="apps.mailing",
+    package_path="static/templates",
+    default_language=settings.mailing.templates_default_language,
+    cache_dir=settings.mailing.templates_cache_dir
+    or os.path.join(tempfile.gettempdir(), "mindlogger-mail-templates"),
+)
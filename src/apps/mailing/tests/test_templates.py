@@ -0,0 +1,52 @@
+import pytest
+from jinja2 import TemplateNotFound
+
+from apps.mailing.templates import TemplateRegistry
+
+
+class TestTemplateRegistry:
+    @pytest.fixture
+    def registry(self, tmp_path) -> TemplateRegistry:
+        registry = TemplateRegistry(
+            package_name="apps.mailing",
+            package_path="static/templates",
+            default_language="en",
+            cache_dir=str(tmp_path),
+        )
+        registry.load()
+        return registry
+
+    def test_load_compiles_templates_to_bytecode_cache(
+        self, registry, tmp_path
+    ):
+        assert "reset_password_en.html" in registry._templates
+        assert any(tmp_path.iterdir())
+
+    @pytest.mark.parametrize("language", [None, "en", "fr", "fr-CA"])
+    def test_language_falls_back_to_default(self, registry, language):
+        template = registry.get("reset_password", language)
+
+        assert template.name == "reset_password_en.html"
+
+    def test_missing_template(self, registry):
+        with pytest.raises(TemplateNotFound):
+            registry.get("missing_template", "en")
+
+    def test_render_many(self, registry):
+        contexts = [
+            dict(first_name="Patric", key="key-1"),
+            dict(first_name="Mike", key="key-2"),
+        ]
+        bodies = registry.render_many(
+            "invitation_new_user",
+            contexts,
+            "en",
+            applet_name="Applet 1",
+            role="respondent",
+            link="https://example.com/invite",
+        )
+
+        assert len(bodies) == 2
+        assert "Patric" in bodies[0] and "key-1" in bodies[0]
+        assert "Mike" in bodies[1] and "key-2" in bodies[1]
+        assert all("Applet 1" in body for body in bodies)
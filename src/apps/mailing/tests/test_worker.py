@@ -0,0 +1,73 @@
+import datetime
+
+from fastapi_mail import MessageType
+
+from apps.mailing.crud import MailOutboxCRUD
+from apps.mailing.domain import MessageSchema
+from apps.mailing.services import MailOutboxService, TestMail, TestSMTP
+from apps.mailing.worker import mail_outbox_worker
+from apps.shared.test import BaseTest
+from infrastructure.database import rollback, session_manager
+
+
+class TestMailOutboxWorker(BaseTest):
+    @staticmethod
+    def message(email: str) -> MessageSchema:
+        return MessageSchema(
+            recipients=[email],
+            subject="Invitation",
+            body=f"<p>Hello, {email}</p>",
+        )
+
+    @rollback
+    async def test_emails_are_sent_over_smtp(self):
+        session = session_manager.get_session()
+        await MailOutboxService(session).send_many(
+            [self.message("tom@mindlogger.com")]
+        )
+
+        assert await mail_outbox_worker.drain(session) == 1
+
+        assert len(TestMail.mails) == 1
+        assert TestMail.mails[0].recipients == ["tom@mindlogger.com"]
+        assert TestMail.mails[0].subject == "Invitation"
+        assert TestMail.mails[0].body.strip() == (
+            "<p>Hello, tom@mindlogger.com</p>"
+        )
+        assert TestMail.mails[0].subtype == MessageType.html
+        assert await MailOutboxCRUD(session)._all() == []
+
+    @rollback
+    async def test_email_is_sent_after_the_server_closed_connection(self):
+        session = session_manager.get_session()
+        await MailOutboxService(session).send(
+            self.message("tom@mindlogger.com")
+        )
+        assert await mail_outbox_worker.drain(session) == 1
+
+        TestSMTP.drop_connections()
+        await MailOutboxService(session).send(self.message("lucy@gmail.com"))
+
+        assert await mail_outbox_worker.drain(session) == 1
+        assert [mail.recipients for mail in TestMail.mails] == [
+            ["lucy@gmail.com"],
+            ["tom@mindlogger.com"],
+        ]
+
+    @rollback
+    async def test_claimed_emails_are_skipped_until_the_claim_expires(self):
+        session = session_manager.get_session()
+        await MailOutboxService(session).send(
+            self.message("tom@mindlogger.com")
+        )
+        crud = MailOutboxCRUD(session)
+        claimed_until = datetime.datetime.utcnow() + datetime.timedelta(
+            minutes=5
+        )
+
+        emails = await crud.claim_due(5, 10, claimed_until)
+        assert [email.attempts for email in emails] == [1]
+        assert await crud.claim_due(5, 10, claimed_until) == []
+        # The worker claims the emails with the same timeout
+        assert await mail_outbox_worker.drain(session) == 0
+        assert TestMail.mails == []
@@ -0,0 +1,162 @@
+import asyncio
+import datetime
+import functools
+import logging
+import time
+import uuid
+
+from apps.mailing.crud import MailOutboxCRUD
+from apps.mailing.domain import MessageSchema
+from apps.mailing.services import MailingService
+from config import settings
+from infrastructure.database import atomic, session_manager
+
+__all__ = ["MailOutboxWorker", "mail_outbox_worker"]
+
+logger = logging.getLogger("mindlogger_backend")
+
+
+class MailOutboxWorker:
+    """Sends the emails from the outbox in the background.
+
+    The due emails are claimed with FOR UPDATE SKIP LOCKED for
+    `claim_timeout` and the claim is committed before they are sent, so
+    the workers of the several processes do not send the same email and
+    the rows are not locked while SMTP is slow. The failed email is retried
+    with the doubled delay until `max_attempts` is reached. The emails are
+    sent over the reused SMTP connection of the MailingService, not faster
+    than `rate_limit` emails per second.
+    """
+
+    def __init__(
+        self,
+        poll_interval: int,
+        batch_size: int,
+        max_attempts: int,
+        retry_delay: int,
+        rate_limit: float,
+        connection_idle_timeout: int,
+        claim_timeout: int,
+    ):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.send_interval = 1 / rate_limit if rate_limit else 0
+        self.connection_idle_timeout = connection_idle_timeout
+        self.claim_timeout = claim_timeout
+        self._sent_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def drain(self, session=None) -> int:
+        """Sends the due emails and returns the count of the sent ones."""
+        total = 0
+        while True:
+            emails = await self._run_in_session(session, self._claim)
+            sent_ids, failures = await self._send(emails)
+            await self._run_in_session(
+                session,
+                functools.partial(
+                    self._save_results, sent_ids=sent_ids, failures=failures
+                ),
+            )
+            total += len(sent_ids)
+            if len(emails) < self.batch_size:
+                return total
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await MailingService().close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.drain()
+                await MailingService().close_idle(self.connection_idle_timeout)
+            except Exception as e:
+                logger.exception(e)
+            await asyncio.sleep(self.poll_interval)
+
+    async def _run_in_session(self, session, func):
+        if session is None:
+            session_maker = session_manager.get_session()
+            async with session_maker() as batch_session:
+                async with atomic(batch_session):
+                    return await func(batch_session)
+        return await func(session)
+
+    async def _claim(self, session) -> list:
+        return await MailOutboxCRUD(session).claim_due(
+            self.max_attempts,
+            self.batch_size,
+            datetime.datetime.utcnow()
+            + datetime.timedelta(seconds=self.claim_timeout),
+        )
+
+    async def _send(
+        self, emails: list
+    ) -> tuple[list[uuid.UUID], list[tuple[uuid.UUID, int, str]]]:
+        """Sends the claimed emails, returns the ids of the sent ones
+        and the ids, the attempts and the errors of the failed ones.
+        """
+        sent_ids = []
+        failures = []
+        for email in emails:
+            await self._wait_rate_limit()
+            try:
+                await MailingService().send(self._to_message(email))
+            except Exception as e:
+                logger.warning(f"Sending of the email {email.id} failed: {e}")
+                failures.append((email.id, email.attempts, str(e)))
+            else:
+                sent_ids.append(email.id)
+        return sent_ids, failures
+
+    async def _save_results(
+        self,
+        session,
+        sent_ids: list[uuid.UUID],
+        failures: list[tuple[uuid.UUID, int, str]],
+    ) -> None:
+        crud = MailOutboxCRUD(session)
+        if sent_ids:
+            await crud.delete_by_ids(sent_ids)
+        for id_, attempts, error in failures:
+            delay = self.retry_delay * 2 ** (attempts - 1)
+            await crud.postpone(
+                id_,
+                datetime.datetime.utcnow() + datetime.timedelta(seconds=delay),
+                error,
+            )
+
+    async def _wait_rate_limit(self) -> None:
+        delay = self._sent_at + self.send_interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._sent_at = time.monotonic()
+
+    @staticmethod
+    def _to_message(email) -> MessageSchema:
+        return MessageSchema(
+            recipients=email.recipients,
+            subject=email.subject,
+            body=email.body,
+            subtype=email.subtype,
+        )
+
+
+mail_outbox_worker = MailOutboxWorker(
+    poll_interval=settings.mailing.outbox.poll_interval,
+    batch_size=settings.mailing.outbox.batch_size,
+    max_attempts=settings.mailing.outbox.max_attempts,
+    retry_delay=settings.mailing.outbox.retry_delay,
+    rate_limit=settings.mailing.outbox.rate_limit,
+    connection_idle_timeout=settings.mailing.outbox.connection_idle_timeout,
+    claim_timeout=settings.mailing.outbox.claim_timeout,
+)
@@ -0,0 +1,53 @@
+"""Migrates the legacy MongoDB data, run from the src directory:
+
+    python -m apps.migrate [--steps applets activities] [--reset]
+"""
+import argparse
+import asyncio
+import logging
+
+from pymongo import MongoClient
+
+from apps.migrate.pipeline import STEPS, MongoMigrationPipeline
+from config import settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.migrate",
+        description="Migrate the legacy MongoDB data",
+    )
+    parser.add_argument(
+        "--steps",
+        nargs="+",
+        choices=[step.name for step in STEPS],
+        help="The steps to run, all of them by default",
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Start the steps over instead of resuming them",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    client = MongoClient(settings.legacy_migration.mongo_uri)
+    pipeline = MongoMigrationPipeline(
+        mongo_db=client[settings.legacy_migration.mongo_db],
+        batch_size=settings.legacy_migration.batch_size,
+        workers=settings.legacy_migration.workers,
+    )
+    try:
+        reports = asyncio.run(pipeline.run(names=args.steps, reset=args.reset))
+    finally:
+        client.close()
+    for report in reports:
+        print(
+            f"{report.name}: documents={report.documents} "
+            f"rows={report.rows} inserted={report.inserted} "
+            f"rate={report.rate}/s duration={report.duration}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query
+
+from apps.migrate.db.schemas import MigrationCheckpointSchema
+from infrastructure.database import BaseCRUD
+
+__all__ = ["MigrationCheckpointCRUD"]
+
+
+class MigrationCheckpointCRUD(BaseCRUD[MigrationCheckpointSchema]):
+    schema_class = MigrationCheckpointSchema
+
+    async def get_by_name(self, name: str) -> MigrationCheckpointSchema | None:
+        query: Query = select(MigrationCheckpointSchema)
+        query = query.where(MigrationCheckpointSchema.name == name)
+        db_result = await self._execute(query)
+        return db_result.scalars().first()
+
+    async def save(self, name: str, last_id: str, count: int) -> None:
+        query = insert(MigrationCheckpointSchema).values(
+            name=name, last_id=last_id, count=count
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[MigrationCheckpointSchema.name],
+            set_=dict(
+                last_id=query.excluded.last_id,
+                count=query.excluded.count,
+                updated_at=query.excluded.updated_at,
+            ),
+        )
+        await self._execute(query)
+
+    async def delete_by_names(self, names: list[str]) -> None:
+        query: Query = delete(MigrationCheckpointSchema)
+        query = query.where(MigrationCheckpointSchema.name.in_(names))
+        await self._execute(query)
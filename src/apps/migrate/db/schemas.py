@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String
+
+from infrastructure.database.base import Base
+
+__all__ = ["MigrationCheckpointSchema"]
+
+
+class MigrationCheckpointSchema(Base):
+    """The progress of the migration of the legacy Mongo collection.
+
+    The documents are migrated in the `_id` order, the last_id is the id
+    of the last migrated document, so the migration is resumed after it.
+    """
+
+    __tablename__ = "mongo_migration_checkpoints"
+
+    name = Column(String(length=100), nullable=False, unique=True)
+    last_id = Column(String(length=24), nullable=True)
+    count = Column(Integer(), nullable=False, default=0)
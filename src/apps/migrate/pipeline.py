@@ -0,0 +1,458 @@
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from bson import ObjectId
+from pydantic import BaseModel
+from sqlalchemy import text
+
+from apps.migrate import transforms
+from apps.migrate.crud.checkpoints import MigrationCheckpointCRUD
+from infrastructure.database import atomic, session_manager
+
+__all__ = [
+    "MigrationReport",
+    "MigrationStep",
+    "MigrationTable",
+    "MongoMigrationPipeline",
+    "STEPS",
+]
+
+logger = logging.getLogger("mindlogger_backend")
+
+
+class MigrationTable(BaseModel):
+    """The table that the rows are copied into.
+
+    The rows are copied into the temporary staging table first, then only
+    the rows that match `where` are inserted into the table. The staging
+    table is aliased as `s`, the staging tables of the other tables of the
+    step are named `staging_<table>`.
+    """
+
+    name: str
+    columns: list[str]
+    where: str | None = None
+
+    @property
+    def staging_name(self) -> str:
+        return f"staging_{self.name}"
+
+
+class MigrationStep(BaseModel):
+    """The migration of the Mongo collection.
+
+    `get_context` is called in the main process with the database and
+    the batch, it reads the documents that the transformation needs, e.g.
+    the applets of the activities. `transform` is called in the worker
+    process with the batch and the context, it returns the rows by table.
+    """
+
+    name: str
+    collection: str
+    filter: dict = {}
+    tables: list[MigrationTable]
+    transform: Callable[[list[dict], dict], dict]
+    get_context: Callable | None = None
+
+
+class MigrationReport(BaseModel):
+    """The metrics of the migration of the step."""
+
+    name: str
+    documents: int = 0
+    rows: int = 0
+    inserted: int = 0
+    # Set in seconds
+    duration: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """The documents per second"""
+        if not self.duration:
+            return 0.0
+        return round(self.documents / self.duration, 1)
+
+
+def _get_applets_by_protocol(mongo_db, documents: list[dict]) -> dict:
+    protocol_ids = {
+        str(document["meta"]["protocolId"])
+        for document in documents
+        if document.get("meta", {}).get("protocolId")
+    }
+    applets = mongo_db["folder"].find(
+        {
+            "meta.applet": {"$exists": True},
+            "meta.protocol._id": {
+                "$in": [f"protocol/{id_}" for id_ in protocol_ids]
+            },
+        },
+        {"meta.protocol._id": 1},
+    )
+    return {
+        applet["meta"]["protocol"]["_id"].split("/")[-1]: str(applet["_id"])
+        for applet in applets
+    }
+
+
+def _get_users_by_profile(mongo_db, documents: list[dict]) -> dict:
+    profile_ids = [
+        profile_id
+        for document in documents
+        for profile_id in document.get("data", {}).get("users") or []
+    ]
+    if not profile_ids:
+        return dict()
+    profiles = mongo_db["appletProfile"].find(
+        {"_id": {"$in": profile_ids}}, {"userId": 1}
+    )
+    return {
+        str(profile["_id"]): str(profile["userId"])
+        for profile in profiles
+        if profile.get("userId")
+    }
+
+
+_EXISTS_APPLET = "EXISTS (SELECT 1 FROM applets a WHERE a.id = s.applet_id)"
+_EXISTS_EVENT = "EXISTS (SELECT 1 FROM events e WHERE e.id = s.event_id)"
+_EXISTS_USER = "EXISTS (SELECT 1 FROM users u WHERE u.id = s.{column})"
+
+# NOTE: The steps are run in the order of the foreign keys, the rows
+#       whose parents are not migrated are skipped.
+STEPS = [
+    MigrationStep(
+        name="applets",
+        collection="folder",
+        filter={"meta.applet": {"$exists": True}},
+        tables=[
+            MigrationTable(
+                name="applets",
+                columns=[
+                    "id",
+                    "display_name",
+                    "description",
+                    "encryption",
+                    "version",
+                    "retention_period",
+                    "retention_type",
+                    "created_at",
+                    "updated_at",
+                    "is_deleted",
+                ],
+            )
+        ],
+        transform=transforms.transform_applets,
+    ),
+    MigrationStep(
+        name="activities",
+        collection="folder",
+        filter={"meta.activity": {"$exists": True}},
+        tables=[
+            MigrationTable(
+                name="activities",
+                columns=[
+                    "id",
+                    "applet_id",
+                    "name",
+                    "description",
+                    "created_at",
+                    "updated_at",
+                    "is_deleted",
+                ],
+                where=_EXISTS_APPLET,
+            )
+        ],
+        transform=transforms.transform_activities,
+        get_context=_get_applets_by_protocol,
+    ),
+    MigrationStep(
+        name="events",
+        collection="events",
+        tables=[
+            MigrationTable(
+                name="periodicity",
+                columns=[
+                    "id",
+                    "type",
+                    "start_date",
+                    "end_date",
+                    "selected_date",
+                ],
+                where=(
+                    "EXISTS ("
+                    "SELECT 1 FROM staging_events se "
+                    "JOIN applets a ON a.id = se.applet_id "
+                    "WHERE se.periodicity_id = s.id"
+                    ")"
+                ),
+            ),
+            MigrationTable(
+                name="events",
+                columns=[
+                    "id",
+                    "periodicity_id",
+                    "start_time",
+                    "end_time",
+                    "access_before_schedule",
+                    "one_time_completion",
+                    "timer",
+                    "timer_type",
+                    "applet_id",
+                ],
+                where=_EXISTS_APPLET,
+            ),
+            MigrationTable(
+                name="activity_events",
+                columns=["id", "activity_id", "event_id"],
+                where=_EXISTS_EVENT,
+            ),
+            MigrationTable(
+                name="flow_events",
+                columns=["id", "flow_id", "event_id"],
+                where=_EXISTS_EVENT,
+            ),
+            MigrationTable(
+                name="user_events",
+                columns=["id", "user_id", "event_id"],
+                where=(
+                    f"{_EXISTS_EVENT} "
+                    f"AND {_EXISTS_USER.format(column='user_id')}"
+                ),
+            ),
+        ],
+        transform=transforms.transform_events,
+        get_context=_get_users_by_profile,
+    ),
+    MigrationStep(
+        name="answers",
+        collection="item",
+        filter={
+            "meta.applet.@id": {"$exists": True},
+            "meta.activity.@id": {"$exists": True},
+        },
+        tables=[
+            MigrationTable(
+                name="answers",
+                columns=[
+                    "id",
+                    "applet_id",
+                    "version",
+                    "respondent_id",
+                    "user_public_key",
+                    "created_at",
+                    "updated_at",
+                ],
+                where=(
+                    f"{_EXISTS_APPLET} AND (s.respondent_id IS NULL "
+                    f"OR {_EXISTS_USER.format(column='respondent_id')})"
+                ),
+            )
+        ],
+        transform=transforms.transform_answers,
+    ),
+]
+
+
+class MongoMigrationPipeline:
+    """Migrates the legacy MongoDB collections into the database.
+
+    The documents of the step are read in the `_id` order in the batches
+    of `batch_size`, the batch is read after the last `_id` of the
+    previous one, so it is a range scan of the `_id` index whatever the
+    offset is. While the batch is transformed by one of the `workers`
+    processes and copied, the next batch is read.
+
+    The rows are copied with COPY into the temporary staging tables and
+    inserted with ON CONFLICT DO NOTHING, so the rows that are migrated
+    already are skipped. The last `_id` of the batch is saved as the
+    checkpoint of the step in the same transaction as the rows, so the
+    migration is resumed after the last copied batch.
+    """
+
+    def __init__(
+        self,
+        mongo_db,
+        batch_size: int,
+        workers: int,
+        steps: list[MigrationStep] | None = None,
+    ):
+        self.mongo_db = mongo_db
+        self.batch_size = batch_size
+        self.workers = workers
+        self.steps = STEPS if steps is None else steps
+
+    async def run(
+        self,
+        session=None,
+        names: list[str] | None = None,
+        reset: bool = False,
+    ) -> list[MigrationReport]:
+        """Runs the steps with the given names or all of them, the steps
+        are started over if `reset` is set.
+        """
+        steps = [
+            step for step in self.steps if names is None or step.name in names
+        ]
+        if reset:
+            await self._run_in_session(
+                session,
+                lambda s: MigrationCheckpointCRUD(s).delete_by_names(
+                    [step.name for step in steps]
+                ),
+            )
+
+        executor = None
+        if self.workers > 0:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            return [
+                await self._run_step(session, step, executor) for step in steps
+            ]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    async def _run_in_session(self, session, func):
+        if session is None:
+            session_maker = session_manager.get_session()
+            async with session_maker() as step_session:
+                async with atomic(step_session):
+                    return await func(step_session)
+        return await func(session)
+
+    async def _run_step(
+        self, session, step: MigrationStep, executor
+    ) -> MigrationReport:
+        report = MigrationReport(name=step.name)
+        checkpoint = await self._run_in_session(
+            session,
+            lambda s: MigrationCheckpointCRUD(s).get_by_name(step.name),
+        )
+        last_id = checkpoint.last_id if checkpoint else None
+        count = checkpoint.count if checkpoint else 0
+        logger.info(f"Migration {step.name}: started after {last_id}")
+
+        started_at = time.perf_counter()
+        batch = await self._read_batch(step, last_id)
+        while batch:
+            batch_started_at = time.perf_counter()
+            rows = await self._transform(step, batch, executor)
+            # NOTE: The next batch is read while the rows are copied
+            next_batch_task = asyncio.create_task(
+                self._read_batch(step, batch[-1]["_id"])
+            )
+            last_id = str(batch[-1]["_id"])
+            count += len(batch)
+            try:
+                inserted = await self._run_in_session(
+                    session,
+                    functools.partial(
+                        self._load,
+                        step=step,
+                        rows=rows,
+                        last_id=last_id,
+                        count=count,
+                    ),
+                )
+            except Exception:
+                next_batch_task.cancel()
+                raise
+
+            batch_rows = sum(len(table_rows) for table_rows in rows.values())
+            duration = time.perf_counter() - batch_started_at
+            report.documents += len(batch)
+            report.rows += batch_rows
+            report.inserted += inserted
+            logger.info(
+                f"Migration {step.name}: documents={len(batch)} "
+                f"rows={batch_rows} inserted={inserted} "
+                f"skipped={batch_rows - inserted} "
+                f"rate={round(len(batch) / max(duration, 1e-6), 1)}/s "
+                f"total={count} last_id={last_id}"
+            )
+            batch = await next_batch_task
+
+        report.duration = round(time.perf_counter() - started_at, 6)
+        logger.info(
+            f"Migration {step.name}: finished documents={report.documents} "
+            f"rows={report.rows} inserted={report.inserted} "
+            f"rate={report.rate}/s duration={report.duration}"
+        )
+        return report
+
+    async def _read_batch(self, step: MigrationStep, last_id) -> list[dict]:
+        query = dict(step.filter)
+        if last_id is not None:
+            query["_id"] = {"$gt": ObjectId(str(last_id))}
+
+        def read():
+            cursor = self.mongo_db[step.collection].find(query)
+            return list(cursor.sort("_id", 1).limit(self.batch_size))
+
+        return await asyncio.to_thread(read)
+
+    async def _transform(
+        self, step: MigrationStep, batch: list[dict], executor
+    ) -> dict:
+        context = dict()
+        if step.get_context is not None:
+            context = await asyncio.to_thread(
+                step.get_context, self.mongo_db, batch
+            )
+        if executor is None:
+            return step.transform(batch, context)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, step.transform, batch, context
+        )
+
+    async def _load(
+        self,
+        session,
+        step: MigrationStep,
+        rows: dict,
+        last_id: str,
+        count: int,
+    ) -> int:
+        """Copies the rows and saves the checkpoint, returns the count of
+        the inserted rows.
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        for table in step.tables:
+            await session.execute(
+                text(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {table.staging_name} "
+                    f"(LIKE {table.name} INCLUDING DEFAULTS)"
+                )
+            )
+            if rows.get(table.name):
+                await driver_connection.copy_records_to_table(
+                    table.staging_name,
+                    records=rows[table.name],
+                    columns=table.columns,
+                )
+
+        inserted = 0
+        for table in step.tables:
+            columns = ", ".join(table.columns)
+            query = (
+                f"INSERT INTO {table.name} ({columns}) "
+                f"SELECT {columns} FROM {table.staging_name} s"
+            )
+            if table.where:
+                query = f"{query} WHERE {table.where}"
+            db_result = await session.execute(
+                text(f"{query} ON CONFLICT DO NOTHING")
+            )
+            inserted += db_result.rowcount
+
+        for table in step.tables:
+            await session.execute(text(f"TRUNCATE {table.staging_name}"))
+        await MigrationCheckpointCRUD(session).save(step.name, last_id, count)
+        return inserted
@@ -0,0 +1,126 @@
+import datetime
+
+import mongomock
+from bson import ObjectId
+from sqlalchemy import select
+
+from apps.activities.db.schemas import ActivitySchema
+from apps.applets.db.schemas import AppletSchema
+from apps.migrate.crud.checkpoints import MigrationCheckpointCRUD
+from apps.migrate.pipeline import MongoMigrationPipeline
+from apps.migrate.transforms import get_id
+from apps.schedule.db.schemas import ActivityEventsSchema, EventSchema
+from apps.shared.test import BaseTest
+from infrastructure.database import rollback, session_manager
+
+PREF_LABEL = "http://www.w3.org/2004/02/skos/core#prefLabel"
+
+
+class TestMongoMigration(BaseTest):
+    def _get_mongo_db(self):
+        mongo_db = mongomock.MongoClient()["mindlogger"]
+        self.applet_id = ObjectId()
+        self.activity_id = ObjectId()
+        self.orphan_activity_id = ObjectId()
+        self.event_id = ObjectId()
+        protocol_id = ObjectId()
+        now = datetime.datetime(2022, 1, 1)
+        mongo_db["folder"].insert_many(
+            [
+                {
+                    "_id": self.applet_id,
+                    "name": "Applet (0)",
+                    "created": now,
+                    "updated": now,
+                    "meta": {
+                        "applet": {"displayName": "Legacy applet"},
+                        "protocol": {"_id": f"protocol/{protocol_id}"},
+                        "retentionSettings": {
+                            "retention": "days",
+                            "period": 30,
+                        },
+                    },
+                },
+                {
+                    "_id": self.activity_id,
+                    "name": "activity",
+                    "created": now,
+                    "updated": now,
+                    "meta": {
+                        "protocolId": protocol_id,
+                        "activity": {
+                            PREF_LABEL: [{"@value": "Legacy activity"}]
+                        },
+                    },
+                },
+                # The activity of the unknown applet is skipped
+                {
+                    "_id": self.orphan_activity_id,
+                    "name": "orphan",
+                    "meta": {"protocolId": ObjectId(), "activity": {}},
+                },
+            ]
+        )
+        mongo_db["events"].insert_one(
+            {
+                "_id": self.event_id,
+                "applet_id": self.applet_id,
+                "individualized": False,
+                "data": {
+                    "eventType": "Daily",
+                    "activity_id": self.activity_id,
+                },
+                "schedule": {"times": ["08:30"], "start": 1640995200000},
+            }
+        )
+        return mongo_db
+
+    @rollback
+    async def test_migrate(self):
+        session = session_manager.get_session()
+        pipeline = MongoMigrationPipeline(
+            mongo_db=self._get_mongo_db(), batch_size=1, workers=0
+        )
+
+        reports = await pipeline.run(session)
+        inserted = {report.name: report.inserted for report in reports}
+        assert inserted == dict(applets=1, activities=1, events=3, answers=0)
+
+        applet = await session.get(AppletSchema, get_id(self.applet_id))
+        assert applet.display_name == "Legacy applet"
+        assert applet.retention_type == "days"
+        assert applet.retention_period == 30
+        activity = await session.get(ActivitySchema, get_id(self.activity_id))
+        assert activity.name == "Legacy activity"
+        assert activity.applet_id == applet.id
+        event = await session.get(EventSchema, get_id(self.event_id))
+        assert event.start_time == datetime.time(8, 30)
+        db_result = await session.execute(
+            select(ActivityEventsSchema.activity_id).where(
+                ActivityEventsSchema.event_id == event.id
+            )
+        )
+        assert db_result.scalars().all() == [activity.id]
+
+        checkpoint = await MigrationCheckpointCRUD(session).get_by_name(
+            "activities"
+        )
+        assert checkpoint.count == 2
+        assert checkpoint.last_id == str(self.orphan_activity_id)
+
+    @rollback
+    async def test_migrate_is_resumed(self):
+        session = session_manager.get_session()
+        pipeline = MongoMigrationPipeline(
+            mongo_db=self._get_mongo_db(), batch_size=100, workers=0
+        )
+        await pipeline.run(session)
+
+        # The migrated documents are not read again
+        reports = await pipeline.run(session)
+        assert sum(report.documents for report in reports) == 0
+
+        # The migrated rows are skipped when it is started over
+        reports = await pipeline.run(session, names=["applets"], reset=True)
+        assert reports[0].documents == 1
+        assert reports[0].inserted == 0
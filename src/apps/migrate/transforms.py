@@ -0,0 +1,278 @@
+"""The transformation of the legacy MongoDB documents into the rows.
+
+The functions are run in the worker processes, so they are pure and
+picklable: the documents and the context in, the rows by table out.
+The ids of the rows are derived from the ObjectIds, so the migration
+of the same document gives the same rows.
+"""
+import datetime
+import json
+import uuid
+
+__all__ = [
+    "get_id",
+    "transform_applets",
+    "transform_activities",
+    "transform_events",
+    "transform_answers",
+]
+
+# NOTE: The namespace of the ids of the rows that are derived from
+#       the document, e.g. the periodicity of the event
+MIGRATION_NAMESPACE = uuid.UUID("1f4c2b8e-6d3a-4e7f-9a51-8c0d2e6b7f34")
+
+RETENTION_TYPES = {"days", "weeks", "months", "years"}
+DEFAULT_START_TIME = datetime.time(0, 0)
+DEFAULT_END_TIME = datetime.time(23, 59)
+
+
+def get_id(object_id) -> uuid.UUID:
+    """Returns the uuid of the ObjectId, the 12 bytes of the ObjectId
+    are the lower bytes of the uuid.
+    """
+    return uuid.UUID(int=int(str(object_id), 16))
+
+
+def _get_derived_id(kind: str, object_id) -> uuid.UUID:
+    return uuid.uuid5(MIGRATION_NAMESPACE, f"{kind}:{object_id}")
+
+
+def _get_value(value, default=None):
+    """Returns the value of the expanded JSON-LD property,
+    e.g. [{"@value": "Name", "@language": "en"}].
+    """
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("@value")
+    return default if value is None else value
+
+
+def _get_text(value) -> str | None:
+    text = _get_value(value)
+    return str(text) if text is not None else None
+
+
+def _get_json(value) -> str | None:
+    return json.dumps(value) if value is not None else None
+
+
+def _get_key(value) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _get_time(value, default: datetime.time) -> datetime.time:
+    if not value:
+        return default
+    hours, _, minutes = str(value).partition(":")
+    try:
+        return datetime.time(int(hours), int(minutes or 0))
+    except ValueError:
+        return default
+
+
+def _get_date(timestamp) -> datetime.date | None:
+    if not timestamp:
+        return None
+    return datetime.datetime.utcfromtimestamp(timestamp / 1000).date()
+
+
+def transform_applets(documents: list[dict], context: dict) -> dict:
+    """Transforms the applet folders into the applets."""
+    applets = []
+    for document in documents:
+        meta = document.get("meta", {})
+        applet = meta.get("applet", {})
+        retention = meta.get("retentionSettings", {})
+        retention_type = retention.get("retention", "indefinitely")
+        retention_period = retention.get("period")
+        if retention_type not in RETENTION_TYPES:
+            retention_type, retention_period = "indefinitely", None
+        name = applet.get("displayName") or document.get("name", "")
+        description = _get_text(applet.get("description"))
+        applets.append(
+            (
+                get_id(document["_id"]),
+                name[:100],
+                _get_json(dict(en=description) if description else None),
+                _get_json(meta.get("encryption")),
+                applet.get("version"),
+                retention_period,
+                retention_type,
+                document.get("created"),
+                document.get("updated"),
+                bool(applet.get("deleted")),
+            )
+        )
+    return dict(applets=applets)
+
+
+def transform_activities(documents: list[dict], context: dict) -> dict:
+    """Transforms the activity folders into the activities, the context
+    is the applet id by the protocol id.
+    """
+    activities = []
+    for document in documents:
+        meta = document.get("meta", {})
+        applet_id = context.get(str(meta.get("protocolId")))
+        if applet_id is None:
+            continue
+        activity = meta.get("activity", {})
+        name = _get_text(
+            activity.get("http://www.w3.org/2004/02/skos/core#prefLabel")
+            or activity.get("prefLabel")
+        ) or document.get("name", "")
+        description = _get_text(
+            activity.get("schema:description") or activity.get("description")
+        )
+        activities.append(
+            (
+                get_id(document["_id"]),
+                get_id(applet_id),
+                name[:100],
+                _get_json(dict(en=description) if description else None),
+                document.get("created"),
+                document.get("updated"),
+                False,
+            )
+        )
+    return dict(activities=activities)
+
+
+def _get_periodicity(event: dict) -> tuple:
+    data = event.get("data", {})
+    schedule = event.get("schedule", {})
+    event_type = data.get("eventType") or "onetime"
+    if event_type == "onetime":
+        selected_date = None
+        try:
+            selected_date = datetime.date(
+                schedule["year"][0],
+                schedule["month"][0] + 1,
+                schedule["dayOfMonth"][0],
+            )
+        except (KeyError, IndexError, TypeError, ValueError):
+            pass
+        return "ONCE", None, None, selected_date
+    periodicity_type = {
+        "Daily": "DAILY",
+        "Weekly": "WEEKLY",
+        "Monthly": "MONTHLY",
+    }.get(event_type, "ALWAYS")
+    return (
+        periodicity_type,
+        _get_date(schedule.get("start")),
+        _get_date(schedule.get("end")),
+        None,
+    )
+
+
+def transform_events(documents: list[dict], context: dict) -> dict:
+    """Transforms the events into the events with the periodicity and
+    the activity, the flow and the user links, the context is the user id
+    by the profile id.
+    """
+    rows: dict = dict(
+        periodicity=[],
+        events=[],
+        activity_events=[],
+        flow_events=[],
+        user_events=[],
+    )
+    for event in documents:
+        data = event.get("data", {})
+        schedule = event.get("schedule", {})
+        event_id = get_id(event["_id"])
+        periodicity_id = _get_derived_id("periodicity", event["_id"])
+        (
+            periodicity_type,
+            start_date,
+            end_date,
+            selected_date,
+        ) = _get_periodicity(event)
+        rows["periodicity"].append(
+            (
+                periodicity_id,
+                periodicity_type,
+                start_date,
+                end_date,
+                selected_date,
+            )
+        )
+        times = schedule.get("times") or []
+        start_time = _get_time(times[0] if times else None, DEFAULT_START_TIME)
+        timer = datetime.timedelta()
+        timeout = data.get("timeout") or {}
+        if timeout.get("allow"):
+            timer = datetime.timedelta(
+                days=timeout.get("day", 0),
+                hours=timeout.get("hour", 0),
+                minutes=timeout.get("minute", 0),
+            )
+        rows["events"].append(
+            (
+                event_id,
+                periodicity_id,
+                start_time,
+                DEFAULT_END_TIME,
+                bool(data.get("availability")),
+                bool(data.get("completion")),
+                timer,
+                "TIMER" if timer else "NOT_SET",
+                get_id(event["applet_id"]),
+            )
+        )
+        if data.get("activity_id"):
+            rows["activity_events"].append(
+                (
+                    _get_derived_id("activity_event", event["_id"]),
+                    get_id(data["activity_id"]),
+                    event_id,
+                )
+            )
+        if data.get("activity_flow_id"):
+            rows["flow_events"].append(
+                (
+                    _get_derived_id("flow_event", event["_id"]),
+                    get_id(data["activity_flow_id"]),
+                    event_id,
+                )
+            )
+        if event.get("individualized"):
+            for profile_id in data.get("users") or []:
+                user_id = context.get(str(profile_id))
+                if user_id is None:
+                    continue
+                rows["user_events"].append(
+                    (
+                        _get_derived_id(
+                            "user_event", f"{event['_id']}:{user_id}"
+                        ),
+                        get_id(user_id),
+                        event_id,
+                    )
+                )
+    return rows
+
+
+def transform_answers(documents: list[dict], context: dict) -> dict:
+    """Transforms the response items into the answers."""
+    answers = []
+    for document in documents:
+        meta = document.get("meta", {})
+        applet = meta.get("applet", {})
+        creator_id = document.get("creatorId")
+        answers.append(
+            (
+                get_id(document["_id"]),
+                get_id(applet["@id"]),
+                applet.get("version"),
+                get_id(creator_id) if creator_id else None,
+                _get_key(meta.get("userPublicKey")),
+                document.get("created"),
+                document.get("updated"),
+            )
+        )
+    return dict(answers=answers)
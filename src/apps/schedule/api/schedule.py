@@ -1,15 +1,23 @@
 import uuid
 from copy import deepcopy
 
-from fastapi import Body, Depends
+from fastapi import Body, Depends, Header
+from starlette import status
+from starlette.responses import Response as HTTPResponse
 
 from apps.applets.service import AppletService
 from apps.authentication.deps import get_current_user
-from apps.schedule.domain.schedule.filters import EventQueryParams
+from apps.schedule.domain.schedule.filters import (
+    EventChangesQueryParams,
+    EventOccurrenceQueryParams,
+    EventQueryParams,
+)
 from apps.schedule.domain.schedule.public import (
     PublicEvent,
     PublicEventByUser,
+    PublicEventChanges,
     PublicEventCount,
+    PublicEventOccurrence,
 )
 from apps.schedule.domain.schedule.requests import (
     EventRequest,
@@ -20,7 +28,7 @@ from apps.shared.domain import Response, ResponseMulti
 from apps.shared.query_params import QueryParams, parse_query_params
 from apps.users.domain import User
 from apps.workspaces.service.check_access import CheckAccessService
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 
 
@@ -171,35 +179,102 @@ async def schedule_delete_by_user(
         )
 
 
+def _is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    etags = {
+        value.strip().removeprefix("W/") for value in if_none_match.split(",")
+    }
+    return "*" in etags or etag in etags
+
+
 async def schedule_get_all_by_user(
+    response: HTTPResponse,
     user: User = Depends(get_current_user),
     session=Depends(get_session),
-) -> ResponseMulti[PublicEventByUser]:
-    """Get all schedules for a user."""
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+) -> ResponseMulti[PublicEventByUser] | HTTPResponse:
+    """Get all schedules for a user.
+    Returns 304 if the schedules are not changed since the ETag.
+    """
     async with atomic(session):
-        schedules = await ScheduleService(session).get_events_by_user(
+        # NOTE: The ETag is taken before the events, so the events that
+        #       are changed in between are returned again next time
+        etag = await ScheduleService(session).get_events_etag_by_user(
             user_id=user.id
         )
-        count = await ScheduleService(session).count_events_by_user(
-            user_id=user.id
+        if _is_not_modified(if_none_match, etag):
+            return HTTPResponse(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag},
+            )
+        schedules, count = await gather_reads(
+            session,
+            lambda s: ScheduleService(s).get_events_by_user(user_id=user.id),
+            lambda s: ScheduleService(s).count_events_by_user(user_id=user.id),
         )
+    response.headers["ETag"] = etag
     return ResponseMulti(result=schedules, count=count)
 
 
 async def schedule_get_by_user(
     applet_id: uuid.UUID,
+    response: HTTPResponse,
     user: User = Depends(get_current_user),
     session=Depends(get_session),
-) -> Response[PublicEventByUser]:
-    """Get all schedules for a respondent per applet id."""
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+) -> Response[PublicEventByUser] | HTTPResponse:
+    """Get all schedules for a respondent per applet id.
+    Returns 304 if the schedules are not changed since the ETag.
+    """
     async with atomic(session):
         await AppletService(session, user.id).exist_by_id(applet_id)
+        etag = await ScheduleService(session).get_events_etag_by_user(
+            user_id=user.id, applet_id=applet_id
+        )
+        if _is_not_modified(if_none_match, etag):
+            return HTTPResponse(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag},
+            )
         schedules = await ScheduleService(
             session
         ).get_events_by_user_and_applet(user_id=user.id, applet_id=applet_id)
+    response.headers["ETag"] = etag
     return Response(result=schedules)
 
 
+async def schedule_get_changes_by_user(
+    query_params: EventChangesQueryParams = Depends(EventChangesQueryParams),
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+) -> Response[PublicEventChanges]:
+    """Get the events of a user that are changed since the cursor."""
+    async with atomic(session):
+        changes = await ScheduleService(session).get_event_changes_by_user(
+            user_id=user.id, since=query_params.since
+        )
+    return Response(result=changes)
+
+
+async def schedule_get_occurrences_by_user(
+    query_params: EventOccurrenceQueryParams = Depends(
+        EventOccurrenceQueryParams
+    ),
+    user: User = Depends(get_current_user),
+    session=Depends(get_session),
+) -> ResponseMulti[PublicEventOccurrence]:
+    """Get the windows of the events of a user between the dates."""
+    async with atomic(session):
+        occurrences = await ScheduleService(session).get_occurrences_by_user(
+            user_id=user.id,
+            from_date=query_params.from_date,
+            to_date=query_params.to_date,
+            applet_id=query_params.applet_id,
+        )
+    return ResponseMulti(result=occurrences, count=len(occurrences))
+
+
 async def schedule_remove_individual_calendar(
     applet_id: uuid.UUID,
     respondent_id: uuid.UUID,
@@ -0,0 +1,89 @@
+import uuid
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.orm import Query
+
+from apps.schedule.db.schemas import ScheduleChangeSchema
+from apps.schedule.domain.schedule.internal import ScheduleChange
+from infrastructure.database import BaseCRUD
+
+__all__ = ["ScheduleChangeCRUD"]
+
+# NOTE: The changes of the transactions that are in progress have the xid
+#       which is not less than xmin of the snapshot, so they are not missed
+#       if the changes are read since xmin.
+_SNAPSHOT_XMIN = text(
+    "SELECT CAST("
+    "CAST(pg_snapshot_xmin(pg_current_snapshot()) AS text) AS bigint"
+    ")"
+)
+
+
+class ScheduleChangeCRUD(BaseCRUD[ScheduleChangeSchema]):
+    schema_class = ScheduleChangeSchema
+
+    @staticmethod
+    def _get_user_scope(user_id: uuid.UUID, applet_ids: list[uuid.UUID]):
+        return (
+            ScheduleChangeSchema.applet_id.in_(applet_ids),
+            or_(
+                ScheduleChangeSchema.user_id.is_(None),
+                ScheduleChangeSchema.user_id == user_id,
+            ),
+        )
+
+    async def get_versions(
+        self, user_id: uuid.UUID, applet_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[int, int]]:
+        """Return the latest version and the count of the changes of the
+        general events, the individual events and the access of the user
+        by applet id.
+        """
+        if not applet_ids:
+            return dict()
+        query: Query = select(
+            ScheduleChangeSchema.applet_id,
+            func.max(ScheduleChangeSchema.version),
+            func.count(ScheduleChangeSchema.id),
+        )
+        query = query.where(*self._get_user_scope(user_id, applet_ids))
+        query = query.group_by(ScheduleChangeSchema.applet_id)
+        db_result = await self._execute(query)
+        return {
+            applet_id: (version, count)
+            for applet_id, version, count in db_result.all()
+        }
+
+    async def get_cursor(self) -> int:
+        """Return the cursor to read the changes that are committed after
+        the current snapshot.
+        """
+        db_result = await self._execute(_SNAPSHOT_XMIN)
+        return db_result.scalar()
+
+    async def get_changes(
+        self, user_id: uuid.UUID, applet_ids: list[uuid.UUID], since: int
+    ) -> list[ScheduleChange]:
+        """Return the changes of the schedule of the user since the cursor.
+        Some changes before the cursor can be returned again.
+        """
+        if not applet_ids:
+            return []
+        query: Query = select(
+            ScheduleChangeSchema.applet_id,
+            ScheduleChangeSchema.user_id,
+            ScheduleChangeSchema.event_id,
+            ScheduleChangeSchema.is_deleted,
+        )
+        query = query.where(*self._get_user_scope(user_id, applet_ids))
+        query = query.where(ScheduleChangeSchema.xid >= since)
+        db_result = await self._execute(query)
+        return [
+            ScheduleChange(
+                applet_id=row.applet_id,
+                user_id=row.user_id,
+                event_id=row.event_id,
+                is_deleted=bool(row.is_deleted),
+            )
+            for row in db_result.all()
+        ]
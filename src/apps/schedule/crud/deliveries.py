@@ -0,0 +1,166 @@
+import datetime
+import uuid
+
+from sqlalchemy import and_, case, delete, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query
+
+from apps.activities.db.schemas import ActivityHistorySchema, ActivitySchema
+from apps.activity_flows.db.schemas import (
+    ActivityFlowHistoriesSchema,
+    ActivityFlowSchema,
+)
+from apps.answers.db.schemas import AnswerItemSchema, AnswerSchema
+from apps.applets.db.schemas import AppletSchema
+from apps.schedule.db.schemas import NotificationDeliverySchema
+from apps.schedule.domain.constants import DeliveryStatus
+from infrastructure.database.crud import INSERT_MANY_CHUNK_SIZE, BaseCRUD
+
+__all__ = ["NotificationDeliveryCRUD"]
+
+
+class NotificationDeliveryCRUD(BaseCRUD[NotificationDeliverySchema]):
+    schema_class = NotificationDeliverySchema
+
+    async def plan_many(self, values: list[dict]) -> int:
+        """Inserts the deliveries that are not planned yet
+        and returns their count.
+        """
+        count = 0
+        for start in range(0, len(values), INSERT_MANY_CHUNK_SIZE):
+            end = start + INSERT_MANY_CHUNK_SIZE
+            query = insert(NotificationDeliverySchema).values(
+                values[start:end]
+            )
+            query = query.on_conflict_do_nothing(
+                constraint="_unique_notification_deliveries"
+            )
+            query = query.returning(NotificationDeliverySchema.id)
+            db_result = await self._execute(query)
+            count += len(db_result.scalars().all())
+        return count
+
+    async def get_due_for_update(
+        self, now: datetime.datetime, limit: int
+    ) -> list:
+        """Returns the deliveries that are due to be sent and locks them.
+        The deliveries that are locked by the other workers are skipped.
+
+        Every row has the names of the applet, the activity and the flow
+        and whether the activity or the flow of the reminder is completed
+        after the start of the occurrence.
+        """
+        is_completed = exists().where(
+            AnswerSchema.respondent_id == NotificationDeliverySchema.user_id,
+            AnswerSchema.created_at
+            >= NotificationDeliverySchema.occurrence_start_at,
+            AnswerItemSchema.answer_id == AnswerSchema.id,
+            or_(
+                exists().where(
+                    ActivityHistorySchema.id_version
+                    == AnswerItemSchema.activity_history_id,
+                    ActivityHistorySchema.id
+                    == NotificationDeliverySchema.activity_id,
+                ),
+                exists().where(
+                    ActivityFlowHistoriesSchema.id_version
+                    == AnswerItemSchema.flow_history_id,
+                    ActivityFlowHistoriesSchema.id
+                    == NotificationDeliverySchema.flow_id,
+                ),
+            ),
+        )
+        query: Query = select(
+            NotificationDeliverySchema,
+            AppletSchema.display_name.label("applet_name"),
+            ActivitySchema.name.label("activity_name"),
+            ActivityFlowSchema.name.label("flow_name"),
+            and_(NotificationDeliverySchema.is_reminder, is_completed).label(
+                "is_completed"
+            ),
+        )
+        query = query.join(
+            AppletSchema,
+            AppletSchema.id == NotificationDeliverySchema.applet_id,
+        )
+        query = query.outerjoin(
+            ActivitySchema,
+            ActivitySchema.id == NotificationDeliverySchema.activity_id,
+        )
+        query = query.outerjoin(
+            ActivityFlowSchema,
+            ActivityFlowSchema.id == NotificationDeliverySchema.flow_id,
+        )
+        query = query.where(
+            NotificationDeliverySchema.status == DeliveryStatus.PENDING,
+            NotificationDeliverySchema.next_attempt_at <= now,
+        )
+        query = query.order_by(NotificationDeliverySchema.next_attempt_at)
+        query = query.limit(limit)
+        query = query.with_for_update(
+            of=NotificationDeliverySchema, skip_locked=True
+        )
+        db_result = await self._execute(query)
+        return db_result.all()
+
+    async def get_next_attempt_at(self) -> datetime.datetime | None:
+        """Returns the time of the first pending delivery."""
+        query: Query = select(
+            func.min(NotificationDeliverySchema.next_attempt_at)
+        )
+        query = query.where(
+            NotificationDeliverySchema.status == DeliveryStatus.PENDING
+        )
+        db_result = await self._execute(query)
+        return db_result.scalar()
+
+    async def set_status(
+        self, ids: list[uuid.UUID], status: DeliveryStatus
+    ) -> None:
+        if not ids:
+            return
+        query: Query = update(NotificationDeliverySchema)
+        query = query.where(NotificationDeliverySchema.id.in_(ids))
+        query = query.values(status=status)
+        await self._execute(query)
+
+    async def postpone(
+        self,
+        ids: list[uuid.UUID],
+        next_attempt_at: datetime.datetime,
+        max_attempts: int,
+        error: str,
+    ) -> None:
+        """Postpones the failed deliveries, the deliveries that have
+        reached `max_attempts` are failed.
+        """
+        attempts = NotificationDeliverySchema.attempts + 1
+        query: Query = update(NotificationDeliverySchema)
+        query = query.where(NotificationDeliverySchema.id.in_(ids))
+        query = query.values(
+            attempts=attempts,
+            next_attempt_at=next_attempt_at,
+            last_error=error,
+            status=case(
+                (attempts >= max_attempts, DeliveryStatus.FAILED.value),
+                else_=DeliveryStatus.PENDING.value,
+            ),
+        )
+        await self._execute(query)
+
+    async def expire(self, scheduled_before: datetime.datetime) -> None:
+        """Skips the pending deliveries that are too late to be sent."""
+        query: Query = update(NotificationDeliverySchema)
+        query = query.where(
+            NotificationDeliverySchema.status == DeliveryStatus.PENDING,
+            NotificationDeliverySchema.scheduled_at < scheduled_before,
+        )
+        query = query.values(status=DeliveryStatus.SKIPPED)
+        await self._execute(query)
+
+    async def delete_old(self, scheduled_before: datetime.datetime) -> None:
+        query: Query = delete(NotificationDeliverySchema)
+        query = query.where(
+            NotificationDeliverySchema.scheduled_at < scheduled_before
+        )
+        await self._execute(query)
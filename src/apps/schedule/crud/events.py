@@ -111,24 +111,6 @@ class EventCRUD(BaseCRUD[EventSchema]):
         result = await self._execute(query)
         return result.scalars().all()
 
-    async def get_public_by_applet_id(
-        self, applet_id: uuid.UUID
-    ) -> list[EventSchema]:
-        """Return event instance."""
-        query: Query = select(EventSchema)
-        query = query.join(
-            UserEventsSchema,
-            UserEventsSchema.event_id == EventSchema.id,
-            isouter=True,
-        )
-        query = query.where(EventSchema.applet_id == applet_id)
-        query = query.distinct(EventSchema.id)
-        query = query.where(UserEventsSchema.user_id == None)  # noqa: E711
-        query = query.where(EventSchema.is_deleted == False)  # noqa: E712
-
-        result = await self._execute(query)
-        return result.scalars().all()
-
     async def delete_by_applet_id(self, applet_id: uuid.UUID) -> None:
         """Delete all events by applet id."""
         query: Query = delete(EventSchema)
@@ -155,7 +137,53 @@ class EventCRUD(BaseCRUD[EventSchema]):
         self, applet_id: uuid.UUID, user_id: uuid.UUID
     ) -> list[EventFull]:
         """Get events by applet_id and user_id"""
+        events = await self.get_all_by_applets_and_user(
+            applet_ids=[applet_id], user_id=user_id
+        )
+        return events.get(applet_id, [])
+
+    async def get_all_by_applets_and_user(
+        self, applet_ids: list[uuid.UUID], user_id: uuid.UUID
+    ) -> dict[uuid.UUID, list[EventFull]]:
+        """Get individual events of the user grouped by applet_id"""
+
+        query: Query = self._full_events_query()
+        query = query.join(
+            UserEventsSchema,
+            and_(
+                EventSchema.id == UserEventsSchema.event_id,
+                UserEventsSchema.user_id == user_id,
+            ),
+        )
+        query = query.where(EventSchema.applet_id.in_(applet_ids))
+        query = query.where(EventSchema.is_deleted == False)  # noqa: E712
 
+        db_result = await self._execute(query)
+        return self._group_by_applet(db_result, user_id)
+
+    async def get_all_full_by_applet_id_with_filter(
+        self, applet_id: uuid.UUID, respondent_id: uuid.UUID | None = None
+    ) -> list[EventFull]:
+        """Get general or individual events of the applet
+        with periodicity, activity and flow in a single query.
+        """
+        query: Query = self._full_events_query()
+        query = query.join(
+            UserEventsSchema,
+            UserEventsSchema.event_id == EventSchema.id,
+            isouter=True,
+        )
+        query = query.where(EventSchema.applet_id == applet_id)
+        query = query.where(EventSchema.is_deleted == False)  # noqa: E712
+        query = query.where(UserEventsSchema.user_id == respondent_id)
+
+        db_result = await self._execute(query)
+        return self._group_by_applet(db_result, respondent_id).get(
+            applet_id, []
+        )
+
+    @staticmethod
+    def _full_events_query() -> Query:
         query: Query = select(
             EventSchema,
             PeriodicitySchema.start_date,
@@ -165,19 +193,10 @@ class EventCRUD(BaseCRUD[EventSchema]):
             ActivityEventsSchema.activity_id,
             FlowEventsSchema.flow_id,
         )
-        query = query.join(
-            UserEventsSchema,
-            and_(
-                EventSchema.id == UserEventsSchema.event_id,
-                UserEventsSchema.user_id == user_id,
-            ),
-        )
-
         query = query.join(
             PeriodicitySchema,
             PeriodicitySchema.id == EventSchema.periodicity_id,
         )
-
         query = query.join(
             FlowEventsSchema,
             FlowEventsSchema.event_id == EventSchema.id,
@@ -188,15 +207,20 @@ class EventCRUD(BaseCRUD[EventSchema]):
             ActivityEventsSchema.event_id == EventSchema.id,
             isouter=True,
         )
+        return query
 
-        query = query.where(EventSchema.applet_id == applet_id)
-        query = query.where(EventSchema.is_deleted == False)  # noqa: E712
-
-        db_result = await self._execute(query)
-
-        events = []
+    @staticmethod
+    def _group_by_applet(
+        db_result, user_id: uuid.UUID | None
+    ) -> dict[uuid.UUID, list[EventFull]]:
+        events: dict[uuid.UUID, list[EventFull]] = dict()
+        event_ids: set[uuid.UUID] = set()
         for row in db_result:
-            events.append(
+            # NOTE: Skip duplicates produced by the outer joins
+            if row.EventSchema.id in event_ids:
+                continue
+            event_ids.add(row.EventSchema.id)
+            events.setdefault(row.EventSchema.applet_id, []).append(
                 EventFull(
                     id=row.EventSchema.id,
                     start_time=row.EventSchema.start_time,
@@ -304,10 +328,12 @@ class EventCRUD(BaseCRUD[EventSchema]):
         result = await self._execute(query)
         return result.scalars().all()
 
-    async def get_general_events_by_user(
-        self, applet_id: uuid.UUID, user_id: uuid.UUID
-    ) -> list[EventFull]:
-        """Get general events by applet_id and user_id"""
+    async def get_general_events_by_applets_and_user(
+        self, applet_ids: list[uuid.UUID], user_id: uuid.UUID
+    ) -> dict[uuid.UUID, list[EventFull]]:
+        """Get general events of the applets grouped by applet_id
+        excluding activities and flows with individual events of the user.
+        """
         # select flow_ids to exclude
         flow_ids = (
             select(distinct(FlowEventsSchema.flow_id))
@@ -321,7 +347,7 @@ class EventCRUD(BaseCRUD[EventSchema]):
                 EventSchema.id == FlowEventsSchema.event_id,
             )
             .where(UserEventsSchema.user_id == user_id)
-            .where(EventSchema.applet_id == applet_id)
+            .where(EventSchema.applet_id.in_(applet_ids))
         )
         activity_ids = (
             select(distinct(ActivityEventsSchema.activity_id))
@@ -335,40 +361,17 @@ class EventCRUD(BaseCRUD[EventSchema]):
                 EventSchema.id == ActivityEventsSchema.event_id,
             )
             .where(UserEventsSchema.user_id == user_id)
-            .where(EventSchema.applet_id == applet_id)
+            .where(EventSchema.applet_id.in_(applet_ids))
         )
 
-        query: Query = select(
-            EventSchema,
-            PeriodicitySchema.start_date,
-            PeriodicitySchema.end_date,
-            PeriodicitySchema.selected_date,
-            PeriodicitySchema.type,
-            ActivityEventsSchema.activity_id,
-            FlowEventsSchema.flow_id,
-        )
-        query = query.join(
-            PeriodicitySchema,
-            PeriodicitySchema.id == EventSchema.periodicity_id,
-        )
-
-        query = query.join(
-            FlowEventsSchema,
-            FlowEventsSchema.event_id == EventSchema.id,
-            isouter=True,
-        )
-        query = query.join(
-            ActivityEventsSchema,
-            ActivityEventsSchema.event_id == EventSchema.id,
-            isouter=True,
-        )
+        query: Query = self._full_events_query()
         query = query.join(
             UserEventsSchema,
             UserEventsSchema.event_id == EventSchema.id,
             isouter=True,
         )
 
-        query = query.where(EventSchema.applet_id == applet_id)
+        query = query.where(EventSchema.applet_id.in_(applet_ids))
         query = query.where(EventSchema.is_deleted == False)  # noqa: E712
         query = query.where(
             or_(
@@ -385,31 +388,7 @@ class EventCRUD(BaseCRUD[EventSchema]):
         query = query.where(UserEventsSchema.user_id == None)  # noqa: E711
 
         db_result = await self._execute(query)
-
-        events = []
-        for row in db_result:
-            events.append(
-                EventFull(
-                    id=row.EventSchema.id,
-                    start_time=row.EventSchema.start_time,
-                    end_time=row.EventSchema.end_time,
-                    access_before_schedule=row.EventSchema.access_before_schedule,  # noqa: E501
-                    one_time_completion=row.EventSchema.one_time_completion,
-                    timer=row.EventSchema.timer,
-                    timer_type=row.EventSchema.timer_type,
-                    user_id=user_id,
-                    periodicity=Periodicity(
-                        id=row.EventSchema.periodicity_id,
-                        type=row.type,
-                        start_date=row.start_date,
-                        end_date=row.end_date,
-                        selected_date=row.selected_date,
-                    ),
-                    activity_id=row.activity_id,
-                    flow_id=row.flow_id,
-                )
-            )
-        return events
+        return self._group_by_applet(db_result, user_id)
 
     async def count_general_events_by_user(
         self, applet_id: uuid.UUID, user_id: uuid.UUID
@@ -1,7 +1,7 @@
 import uuid
 
 from sqlalchemy.orm import Query
-from sqlalchemy.sql import delete, select, update
+from sqlalchemy.sql import delete, func, select, update
 
 from apps.schedule.db.schemas import NotificationSchema, ReminderSchema
 from apps.schedule.domain.schedule.internal import (
@@ -46,6 +46,25 @@ class NotificationCRUD(BaseCRUD[NotificationSchema]):
             for notification in result
         ]
 
+    async def get_all_by_event_ids(
+        self, event_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[NotificationSetting]]:
+        """Return all notifications grouped by event id."""
+        notifications: dict[uuid.UUID, list[NotificationSetting]] = dict()
+        if not event_ids:
+            return notifications
+
+        query: Query = select(NotificationSchema)
+        query = query.where(NotificationSchema.event_id.in_(event_ids))
+        query = query.order_by(NotificationSchema.order.asc())
+        db_result = await self._execute(query)
+
+        for notification in db_result.scalars().all():
+            notifications.setdefault(notification.event_id, []).append(
+                NotificationSetting.from_orm(notification)
+            )
+        return notifications
+
     async def delete_by_event_ids(self, event_ids: list[uuid.UUID]):
         """Delete all notifications by event id."""
         query: Query = delete(NotificationSchema)
@@ -72,6 +91,32 @@ class ReminderCRUD(BaseCRUD[ReminderSchema]):
 
         return db_result.scalars().first()
 
+    async def get_by_event_ids(
+        self, event_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, ReminderSetting]:
+        """Return the first reminder of each event by event ids."""
+        reminders: dict[uuid.UUID, ReminderSetting] = dict()
+        if not event_ids:
+            return reminders
+
+        query: Query = select(ReminderSchema)
+        query = query.where(ReminderSchema.event_id.in_(event_ids))
+        query = query.order_by(ReminderSchema.id.asc())
+        db_result = await self._execute(query)
+
+        for reminder in db_result.scalars().all():
+            if reminder.event_id not in reminders:
+                reminders[reminder.event_id] = ReminderSetting.from_orm(
+                    reminder
+                )
+        return reminders
+
+    async def get_max_activity_incomplete(self) -> int:
+        """Return the most days of the incomplete activity of reminders."""
+        query: Query = select(func.max(ReminderSchema.activity_incomplete))
+        db_result = await self._execute(query)
+        return db_result.scalar() or 0
+
     async def delete_by_event_ids(self, event_ids: list[uuid.UUID]):
         """Delete all reminders by event id."""
         query: Query = delete(ReminderSchema)
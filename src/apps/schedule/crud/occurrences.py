@@ -0,0 +1,224 @@
+import datetime
+import uuid
+
+from sqlalchemy import text
+
+from apps.schedule.db.schemas import EventSchema
+from apps.schedule.domain.schedule.internal import EventOccurrence
+from apps.workspaces.domain.constants import Role
+from infrastructure.database import BaseCRUD
+
+__all__ = ["EventOccurrenceCRUD"]
+
+# NOTE: The events of the users are the individual events of the user
+#       and the general events of the applet except the activities and
+#       the flows which have the individual events of the user, the same
+#       as EventCRUD.get_all_by_applets_and_user and
+#       EventCRUD.get_general_events_by_applets_and_user return.
+#
+#       Every event is expanded to the days from first_day to last_day
+#       with the step of the periodicity, so only the days of the
+#       occurrences are generated:
+#         ONCE      - the selected date, the start and the end dates
+#                     are not checked
+#         DAILY     - every day, ALWAYS is expanded as DAILY
+#         WEEKDAYS  - every day except the weekends
+#         WEEKLY    - every 7 days from the selected date
+#         MONTHLY   - every month from the selected date, the day is
+#                     moved to the last day of the shorter months
+#       The window ends the next day if the end time is not after
+#       the start time.
+_EVENT_OCCURRENCES = text(
+    """
+    WITH accesses AS (
+        SELECT DISTINCT uaa.user_id, uaa.applet_id
+        FROM user_applet_accesses uaa
+        JOIN applets ap ON ap.id = uaa.applet_id
+        WHERE NOT uaa.is_deleted
+            AND NOT ap.is_deleted
+            AND uaa.role = ANY(CAST(:roles AS text[]))
+            AND (
+                CAST(:user_ids AS uuid[]) IS NULL
+                OR uaa.user_id = ANY(CAST(:user_ids AS uuid[]))
+            )
+            AND (
+                CAST(:applet_ids AS uuid[]) IS NULL
+                OR uaa.applet_id = ANY(CAST(:applet_ids AS uuid[]))
+            )
+    ), user_event_ids AS (
+        SELECT a.user_id, a.applet_id, e.id AS event_id
+        FROM accesses a
+        JOIN user_events ue ON ue.user_id = a.user_id
+        JOIN events e ON e.id = ue.event_id AND e.applet_id = a.applet_id
+        WHERE NOT e.is_deleted
+        UNION ALL
+        SELECT a.user_id, a.applet_id, e.id AS event_id
+        FROM accesses a
+        JOIN events e ON e.applet_id = a.applet_id
+        LEFT JOIN activity_events ae ON ae.event_id = e.id
+        LEFT JOIN flow_events fe ON fe.event_id = e.id
+        WHERE NOT e.is_deleted
+            AND NOT EXISTS (
+                SELECT 1 FROM user_events ue WHERE ue.event_id = e.id
+            )
+            AND NOT EXISTS (
+                SELECT 1
+                FROM user_events ue
+                LEFT JOIN activity_events uae ON uae.event_id = ue.event_id
+                LEFT JOIN flow_events ufe ON ufe.event_id = ue.event_id
+                WHERE ue.user_id = a.user_id
+                    AND (
+                        uae.activity_id = ae.activity_id
+                        OR ufe.flow_id = fe.flow_id
+                    )
+            )
+    ), days AS (
+        SELECT
+            ue.user_id,
+            ue.applet_id,
+            ue.event_id,
+            p.type,
+            coalesce(e.start_time, time '00:00') AS start_time,
+            coalesce(e.end_time, time '00:00') AS end_time,
+            r.first_day,
+            r.last_day,
+            CASE p.type
+                WHEN 'MONTHLY'
+                THEN CAST(
+                    p.selected_date + s.step * interval '1 month' AS date
+                )
+                ELSE r.first_day + s.step
+            END AS day
+        FROM user_event_ids ue
+        JOIN events e ON e.id = ue.event_id
+        JOIN periodicity p ON p.id = e.periodicity_id
+        CROSS JOIN LATERAL (
+            SELECT
+                greatest(CAST(:from_date AS date), p.start_date) AS from_date,
+                least(CAST(:to_date AS date), p.end_date) AS to_date
+        ) b
+        CROSS JOIN LATERAL (
+            SELECT
+                CASE p.type
+                    WHEN 'ONCE'
+                    THEN greatest(CAST(:from_date AS date), p.selected_date)
+                    WHEN 'WEEKLY'
+                    THEN b.from_date
+                        + ((p.selected_date - b.from_date) % 7 + 7) % 7
+                    ELSE b.from_date
+                END AS first_day,
+                CASE p.type
+                    WHEN 'ONCE'
+                    THEN CASE
+                        WHEN p.selected_date <= CAST(:to_date AS date)
+                        THEN p.selected_date
+                    END
+                    ELSE b.to_date
+                END AS last_day
+        ) r
+        CROSS JOIN LATERAL generate_series(
+            CASE p.type
+                WHEN 'MONTHLY'
+                THEN CAST(
+                    (extract(year FROM r.first_day) * 12
+                        + extract(month FROM r.first_day))
+                    - (extract(year FROM p.selected_date) * 12
+                        + extract(month FROM p.selected_date))
+                    AS integer
+                )
+                ELSE 0
+            END,
+            CASE p.type
+                WHEN 'MONTHLY'
+                THEN CAST(
+                    (extract(year FROM r.last_day) * 12
+                        + extract(month FROM r.last_day))
+                    - (extract(year FROM p.selected_date) * 12
+                        + extract(month FROM p.selected_date))
+                    AS integer
+                )
+                ELSE r.last_day - r.first_day
+            END,
+            CASE p.type WHEN 'WEEKLY' THEN 7 ELSE 1 END
+        ) AS s(step)
+    ), windows AS (
+        SELECT
+            d.user_id,
+            d.applet_id,
+            d.event_id,
+            d.type,
+            d.day + d.start_time AS start_at,
+            d.day + d.end_time
+                + CASE
+                    WHEN d.end_time <= d.start_time THEN interval '1 day'
+                    ELSE interval '0'
+                END AS end_at
+        FROM days d
+        WHERE d.day BETWEEN d.first_day AND d.last_day
+            AND (d.type <> 'WEEKDAYS' OR extract(isodow FROM d.day) < 6)
+    )
+    SELECT
+        w.user_id,
+        w.applet_id,
+        w.event_id,
+        ae.activity_id,
+        fe.flow_id,
+        w.type,
+        w.start_at,
+        w.end_at
+    FROM windows w
+    LEFT JOIN activity_events ae ON ae.event_id = w.event_id
+    LEFT JOIN flow_events fe ON fe.event_id = w.event_id
+    WHERE w.end_at > CAST(:starts_at AS timestamp)
+        AND w.start_at < CAST(:ends_at AS timestamp)
+    ORDER BY w.start_at, w.user_id, w.event_id
+    """
+)
+
+
+class EventOccurrenceCRUD(BaseCRUD[EventSchema]):
+    schema_class = EventSchema
+
+    async def get_occurrences(
+        self,
+        from_date: datetime.date,
+        to_date: datetime.date,
+        user_ids: list[uuid.UUID] | None = None,
+        applet_ids: list[uuid.UUID] | None = None,
+        roles: list[Role] | None = None,
+    ) -> list[EventOccurrence]:
+        """Return the windows of the events of the users which intersect
+        the days from `from_date` to `to_date` inclusive.
+
+        The events of all the users and the applets are expanded at once
+        by the database, `user_ids` and `applet_ids` limit them.
+        The times are local to the user, as they are set in the event.
+        """
+        if roles is None:
+            roles = Role.as_list()
+        # NOTE: The window of the previous day can end in the range
+        query = _EVENT_OCCURRENCES.bindparams(
+            roles=[role.value for role in roles],
+            user_ids=user_ids,
+            applet_ids=applet_ids,
+            from_date=from_date - datetime.timedelta(days=1),
+            to_date=to_date,
+            starts_at=datetime.datetime.combine(from_date, datetime.time()),
+            ends_at=datetime.datetime.combine(
+                to_date + datetime.timedelta(days=1), datetime.time()
+            ),
+        )
+        db_result = await self._execute(query)
+        return [
+            EventOccurrence(
+                user_id=row.user_id,
+                applet_id=row.applet_id,
+                event_id=row.event_id,
+                activity_id=row.activity_id,
+                flow_id=row.flow_id,
+                periodicity_type=row.type,
+                start_at=row.start_at,
+                end_at=row.end_at,
+            )
+            for row in db_result.all()
+        ]
@@ -1,13 +1,18 @@
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     Date,
+    DateTime,
     ForeignKey,
+    Index,
     Integer,
     Interval,
     String,
+    Text,
     Time,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -120,3 +125,100 @@ class ReminderSchema(Base):
 
     activity_incomplete = Column(Integer(), nullable=False)
     reminder_time = Column(Time, nullable=False)
+
+
+class NotificationDeliverySchema(Base):
+    """The push notification or the reminder of the event occurrence
+    that is due to be sent to the user.
+
+    The unique constraint makes the planning idempotent, the same trigger
+    is not planned twice for the same user and time.
+    """
+
+    __tablename__ = "notification_deliveries"
+
+    user_id = Column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    applet_id = Column(
+        ForeignKey("applets.id", ondelete="CASCADE"), nullable=False
+    )
+    event_id = Column(
+        ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+    )
+    activity_id = Column(UUID(as_uuid=True), nullable=True)
+    flow_id = Column(UUID(as_uuid=True), nullable=True)
+    # The notification or the reminder id
+    trigger_id = Column(UUID(as_uuid=True), nullable=False)
+    is_reminder = Column(Boolean(), nullable=False, default=False)
+    occurrence_start_at = Column(DateTime(), nullable=False)
+    scheduled_at = Column(DateTime(), nullable=False)
+    status = Column(
+        String(10), nullable=False, default="PENDING"
+    )  # PENDING, SENT, SKIPPED, FAILED
+    attempts = Column(Integer(), nullable=False, default=0)
+    next_attempt_at = Column(
+        DateTime(),
+        nullable=False,
+        server_default=text("timezone('utc', now())"),
+    )
+    last_error = Column(Text(), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "trigger_id",
+            "scheduled_at",
+            name="_unique_notification_deliveries",
+        ),
+        Index(
+            "ix_notification_deliveries_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        Index("ix_notification_deliveries_scheduled_at", "scheduled_at"),
+    )
+
+
+class ScheduleChangeSchema(Base):
+    """The version stamp of the event or of the applet access of the user.
+
+    There is a row for every event, the row is marked as deleted when
+    the event is deleted, and a row without the event for every applet
+    access of the user. The rows are touched by the triggers of the
+    schedule tables and `user_applet_accesses`.
+
+    The version is taken from the sequence, so every touch changes it.
+    The xid is the id of the transaction of the touch, the changes of
+    the transactions that are not committed yet have the xid which is not
+    less than the xmin of the current snapshot.
+    """
+
+    __tablename__ = "schedule_changes"
+
+    applet_id = Column(
+        ForeignKey("applets.id", ondelete="CASCADE"), nullable=False
+    )
+    # The user of the individual event or of the applet access
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    # NOTE: The events are deleted, so it is not the foreign key
+    event_id = Column(UUID(as_uuid=True), nullable=True)
+    version = Column(BigInteger(), nullable=False)
+    xid = Column(BigInteger(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_schedule_changes_event_id",
+            "event_id",
+            unique=True,
+            postgresql_where=text("event_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_schedule_changes_applet_id_user_id",
+            "applet_id",
+            "user_id",
+            unique=True,
+            postgresql_where=text("event_id IS NULL"),
+        ),
+        Index("ix_schedule_changes_applet_id_xid", "applet_id", "xid"),
+    )
@@ -9,6 +9,7 @@ __all__ = [
     "TimerType",
     "DefaultEvent",
     "AvailabilityType",
+    "DeliveryStatus",
 ]
 
 
@@ -53,3 +54,10 @@ class AvailabilityType(str, Enum):
 class NotificationTriggerType(str, Enum):
     FIXED = "FIXED"
     RANDOM = "RANDOM"
+
+
+class DeliveryStatus(str, Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    SKIPPED = "SKIPPED"
+    FAILED = "FAILED"
@@ -1,11 +1,26 @@
 import uuid
+from datetime import date
+
+from pydantic import NonNegativeInt
 
 from apps.shared.domain import InternalModel
 
 __all__ = [
     "EventQueryParams",
+    "EventOccurrenceQueryParams",
+    "EventChangesQueryParams",
 ]
 
 
 class EventQueryParams(InternalModel):
     respondent_id: uuid.UUID | None
+
+
+class EventOccurrenceQueryParams(InternalModel):
+    from_date: date
+    to_date: date
+    applet_id: uuid.UUID | None
+
+
+class EventChangesQueryParams(InternalModel):
+    since: NonNegativeInt | None
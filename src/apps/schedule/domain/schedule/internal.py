@@ -1,5 +1,7 @@
+import datetime
 import uuid
 
+from apps.schedule.domain.constants import PeriodicityType
 from apps.schedule.domain.schedule.base import (
     BaseEvent,
     BaseNotificationSetting,
@@ -24,6 +26,8 @@ __all__ = [
     "NotificationSetting",
     "ReminderSettingCreate",
     "ReminderSetting",
+    "EventOccurrence",
+    "ScheduleChange",
     # "Notification",
 ]
 
@@ -105,3 +109,25 @@ class EventFull(InternalModel, BaseEvent):
     user_id: uuid.UUID | None = None
     activity_id: uuid.UUID | None = None
     flow_id: uuid.UUID | None = None
+
+
+class EventOccurrence(InternalModel):
+    """The window when the event of the user is available."""
+
+    user_id: uuid.UUID
+    applet_id: uuid.UUID
+    event_id: uuid.UUID
+    activity_id: uuid.UUID | None = None
+    flow_id: uuid.UUID | None = None
+    periodicity_type: PeriodicityType
+    start_at: datetime.datetime
+    end_at: datetime.datetime
+
+
+class ScheduleChange(InternalModel):
+    """The change of the event or of the applet access of the user."""
+
+    applet_id: uuid.UUID
+    user_id: uuid.UUID | None = None
+    event_id: uuid.UUID | None = None
+    is_deleted: bool = False
@@ -1,5 +1,5 @@
 import uuid
-from datetime import date
+from datetime import date, datetime
 
 from pydantic import NonNegativeInt, validator
 
@@ -28,6 +28,9 @@ __all__ = [
     "TimerDto",
     "EventAvailabilityDto",
     "ScheduleEventDto",
+    "PublicEventOccurrence",
+    "PublicEventChangesByUser",
+    "PublicEventChanges",
 ]
 
 
@@ -136,3 +139,28 @@ class ScheduleEventDto(PublicModel):
 class PublicEventByUser(PublicModel):
     applet_id: uuid.UUID
     events: list[ScheduleEventDto] | None = None
+
+
+class PublicEventOccurrence(PublicModel):
+    applet_id: uuid.UUID
+    event_id: uuid.UUID
+    entity_id: uuid.UUID | None = None
+    periodicity_type: PeriodicityType
+    start_at: datetime
+    end_at: datetime
+
+
+class PublicEventChangesByUser(PublicModel):
+    applet_id: uuid.UUID
+    # The events replace all the events of the applet
+    is_full: bool = False
+    events: list[ScheduleEventDto] = []
+    deleted_event_ids: list[uuid.UUID] = []
+
+
+class PublicEventChanges(PublicModel):
+    # Pass as `since` to get the next changes
+    cursor: int
+    # The applets of the user, the other applets are removed
+    applet_ids: list[uuid.UUID]
+    applets: list[PublicEventChangesByUser]
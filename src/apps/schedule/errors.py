@@ -1,5 +1,3 @@
-from gettext import gettext as _
-
 from apps.shared.exception import (
     AccessDeniedError,
     FieldError,
@@ -7,6 +5,7 @@ from apps.shared.exception import (
     NotFoundError,
     ValidationError,
 )
+from infrastructure.i18n import gettext as _
 
 
 class EventNotFoundError(NotFoundError):
@@ -84,3 +83,10 @@ class StartEndTimeAccessBeforeScheduleCaseError(FieldError):
 
 class UnavailableActivityOrFlowError(FieldError):
     message = _("Activity/flow is unavailable at this time.")
+
+
+class EventOccurrencesRangeError(ValidationError):
+    message = _(
+        "The end date must not be before the start date and the range "
+        "must not be longer than {max_days} days."
+    )
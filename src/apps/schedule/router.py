@@ -13,6 +13,8 @@ from apps.schedule.api.schedule import (
     schedule_get_all_by_user,
     schedule_get_by_id,
     schedule_get_by_user,
+    schedule_get_changes_by_user,
+    schedule_get_occurrences_by_user,
     schedule_import,
     schedule_remove_individual_calendar,
     schedule_update,
@@ -20,7 +22,9 @@ from apps.schedule.api.schedule import (
 from apps.schedule.domain.schedule.public import (
     PublicEvent,
     PublicEventByUser,
+    PublicEventChanges,
     PublicEventCount,
+    PublicEventOccurrence,
 )
 from apps.shared.domain.response import (
     AUTHENTICATION_ERROR_RESPONSES,
@@ -190,18 +194,50 @@ user_router.get(
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {"model": ResponseMulti[PublicEventByUser]},
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The events are not changed since the ETag"
+        },
         **AUTHENTICATION_ERROR_RESPONSES,
         **DEFAULT_OPENAPI_RESPONSE,
         **NO_CONTENT_ERROR_RESPONSES,
     },
 )(schedule_get_all_by_user)
 
+# Get the windows of the events of the user between the dates
+user_router.get(
+    "/me/events/occurrences",
+    response_model=ResponseMulti[PublicEventOccurrence],
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": ResponseMulti[PublicEventOccurrence]},
+        **AUTHENTICATION_ERROR_RESPONSES,
+        **DEFAULT_OPENAPI_RESPONSE,
+        **NO_CONTENT_ERROR_RESPONSES,
+    },
+)(schedule_get_occurrences_by_user)
+
+# Get the events of the user that are changed since the cursor
+user_router.get(
+    "/me/events/changes",
+    response_model=Response[PublicEventChanges],
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": Response[PublicEventChanges]},
+        **AUTHENTICATION_ERROR_RESPONSES,
+        **DEFAULT_OPENAPI_RESPONSE,
+        **NO_CONTENT_ERROR_RESPONSES,
+    },
+)(schedule_get_changes_by_user)
+
 user_router.get(
     "/me/events/{applet_id}",
     response_model=Response[PublicEventByUser],
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {"model": Response[PublicEventByUser]},
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The events are not changed since the ETag"
+        },
         **AUTHENTICATION_ERROR_RESPONSES,
         **DEFAULT_OPENAPI_RESPONSE,
         **NO_CONTENT_ERROR_RESPONSES,
@@ -1,9 +1,12 @@
+import hashlib
 import uuid
+from datetime import date
 
 from apps.activities.crud import ActivitiesCRUD
 from apps.activity_flows.crud import FlowsCRUD
 from apps.applets.crud import AppletsCRUD, UserAppletAccessCRUD
 from apps.applets.errors import AppletNotFoundError
+from apps.schedule.crud.changes import ScheduleChangeCRUD
 from apps.schedule.crud.events import (
     ActivityEventsCRUD,
     EventCRUD,
@@ -11,6 +14,7 @@ from apps.schedule.crud.events import (
     UserEventsCRUD,
 )
 from apps.schedule.crud.notification import NotificationCRUD, ReminderCRUD
+from apps.schedule.crud.occurrences import EventOccurrenceCRUD
 from apps.schedule.crud.periodicity import PeriodicityCRUD
 from apps.schedule.db.schemas import EventSchema, NotificationSchema
 from apps.schedule.domain.constants import (
@@ -19,7 +23,6 @@ from apps.schedule.domain.constants import (
     PeriodicityType,
     TimerType,
 )
-from apps.schedule.domain.schedule import BaseEvent
 from apps.schedule.domain.schedule.internal import (
     ActivityEventCreate,
     Event,
@@ -40,7 +43,10 @@ from apps.schedule.domain.schedule.public import (
     NotificationSettingDTO,
     PublicEvent,
     PublicEventByUser,
+    PublicEventChanges,
+    PublicEventChangesByUser,
     PublicEventCount,
+    PublicEventOccurrence,
     PublicNotification,
     PublicNotificationSetting,
     PublicPeriodicity,
@@ -58,6 +64,7 @@ from apps.schedule.errors import (
     ActivityOrFlowNotFoundError,
     AppletScheduleNotFoundError,
     EventAlwaysAvailableExistsError,
+    EventOccurrencesRangeError,
     ScheduleNotFoundError,
 )
 from apps.shared.query_params import QueryParams
@@ -67,6 +74,9 @@ from apps.workspaces.domain.constants import Role
 
 __all__ = ["ScheduleService"]
 
+# The longest range of the days of the event occurrences
+OCCURRENCES_MAX_DAYS = 92
+
 
 class ScheduleService:
     def __init__(self, session):
@@ -241,40 +251,28 @@ class ScheduleService:
         # Check if applet exists
         await self._validate_applet(applet_id=applet_id)
 
-        event_schemas: list[EventSchema] = await EventCRUD(
+        full_events: list[EventFull] = await EventCRUD(
             self.session
-        ).get_all_by_applet_id_with_filter(applet_id, respondent_id)
-        events: list[PublicEvent] = []
-
-        for event_schema in event_schemas:
-            event: Event = Event.from_orm(event_schema)
-
-            periodicity: Periodicity = await PeriodicityCRUD(
-                self.session
-            ).get_by_id(event.periodicity_id)
-            user_id = await UserEventsCRUD(self.session).get_by_event_id(
-                event_id=event.id
-            )
-            activity_id = await ActivityEventsCRUD(
-                self.session
-            ).get_by_event_id(event_id=event.id)
-            flow_id = await FlowEventsCRUD(self.session).get_by_event_id(
-                event_id=event.id
-            )
-            notification = await self._get_notifications_and_reminder(event.id)
+        ).get_all_full_by_applet_id_with_filter(applet_id, respondent_id)
+        event_ids = [event.id for event in full_events]
+        notifications = await NotificationCRUD(
+            self.session
+        ).get_all_by_event_ids(event_ids)
+        reminders = await ReminderCRUD(self.session).get_by_event_ids(
+            event_ids
+        )
 
-            events.append(
-                PublicEvent(
-                    **event.dict(),
-                    periodicity=PublicPeriodicity(**periodicity.dict()),
-                    respondent_id=user_id,
-                    activity_id=activity_id,
-                    flow_id=flow_id,
-                    notification=notification,
-                )
+        return [
+            PublicEvent(
+                **event.dict(exclude={"periodicity", "user_id"}),
+                periodicity=PublicPeriodicity(**event.periodicity.dict()),
+                respondent_id=event.user_id,
+                notification=self._build_notification(
+                    notifications.get(event.id), reminders.get(event.id)
+                ),
             )
-
-        return events
+            for event in full_events
+        ]
 
     async def get_public_all_schedules(
         self, key: uuid.UUID
@@ -282,51 +280,15 @@ class ScheduleService:
         # Check if applet exists by link key
         applet_id = await self._validate_public_applet(key)
 
-        event_schemas: list[EventSchema] = await EventCRUD(
+        full_events: list[EventFull] = await EventCRUD(
             self.session
-        ).get_public_by_applet_id(applet_id)
-
-        full_events: list[EventFull] = []
-        for event_schema in event_schemas:
-            event: Event = Event.from_orm(event_schema)
-            periodicity: Periodicity = await PeriodicityCRUD(
-                self.session
-            ).get_by_id(event.periodicity_id)
-            activity_id = await ActivityEventsCRUD(
-                self.session
-            ).get_by_event_id(event_id=event.id)
-            flow_id = await FlowEventsCRUD(self.session).get_by_event_id(
-                event_id=event.id
-            )
-            base_event = BaseEvent(**event.dict())
+        ).get_all_full_by_applet_id_with_filter(applet_id, None)
 
-            full_events.append(
-                EventFull(
-                    id=event.id,
-                    **base_event.dict(),
-                    periodicity=periodicity,
-                    activity_id=activity_id,
-                    flow_id=flow_id,
-                )
+        return (
+            await self._convert_to_dto_by_applets(
+                {applet_id: full_events}, [applet_id]
             )
-
-        events = PublicEventByUser(
-            applet_id=applet_id,
-            events=[
-                self._convert_to_dto(
-                    event=full_event,
-                    notifications=await NotificationCRUD(
-                        self.session
-                    ).get_all_by_event_id(full_event.id),
-                    reminder=await ReminderCRUD(self.session).get_by_event_id(
-                        full_event.id
-                    ),
-                )
-                for full_event in full_events
-            ],
-        )
-
-        return events
+        )[0]
 
     async def delete_all_schedules(self, applet_id: uuid.UUID):
         """Delete all default events"""
@@ -775,44 +737,182 @@ class ScheduleService:
         self, user_id: uuid.UUID
     ) -> list[PublicEventByUser]:
         """Get all events for user in applets that user is respondent."""
+        applet_ids = await self._get_user_applet_ids(user_id)
+        if not applet_ids:
+            return []
+
+        events = await self._get_user_events_by_applets(
+            user_id=user_id, applet_ids=applet_ids
+        )
+        return await self._convert_to_dto_by_applets(events, applet_ids)
+
+    async def get_events_etag_by_user(
+        self, user_id: uuid.UUID, applet_id: uuid.UUID | None = None
+    ) -> str:
+        """Get the strong ETag of the events of the user in the applet
+        or in all the applets of the user. The ETag is computed from the
+        version stamps of the schedule, so the events are not loaded.
+        """
+        if applet_id:
+            await self._validate_user_applet(user_id, applet_id)
+            applet_ids = [applet_id]
+        else:
+            applet_ids = await self._get_user_applet_ids(user_id)
+
+        versions = await ScheduleChangeCRUD(self.session).get_versions(
+            user_id, applet_ids
+        )
+        digest = hashlib.sha256(str(user_id).encode())
+        for id_ in applet_ids:
+            version, count = versions.get(id_, (0, 0))
+            digest.update(f";{id_}:{version}:{count}".encode())
+        return f'"{digest.hexdigest()[:32]}"'
+
+    async def get_event_changes_by_user(
+        self, user_id: uuid.UUID, since: int | None = None
+    ) -> PublicEventChanges:
+        """Get the events of the user that are created, updated or deleted
+        since the cursor, all the events if the cursor is not set.
+
+        The events of the applet are returned in full if the access
+        or the individual events of the user are changed, because they
+        hide or show the general events.
+        """
+        crud = ScheduleChangeCRUD(self.session)
+        # NOTE: The cursor is taken before the changes are read
+        cursor = await crud.get_cursor()
+        applet_ids = await self._get_user_applet_ids(user_id)
+
+        if since is None:
+            changes = []
+            full_applet_ids = set(applet_ids)
+        else:
+            changes = await crud.get_changes(user_id, applet_ids, since)
+            full_applet_ids = {
+                change.applet_id
+                for change in changes
+                if change.user_id == user_id
+            }
+        changed_applet_ids = full_applet_ids | {
+            change.applet_id for change in changes
+        }
+        changed_applet_ids_ordered = [
+            applet_id
+            for applet_id in applet_ids
+            if applet_id in changed_applet_ids
+        ]
+        if not changed_applet_ids_ordered:
+            return PublicEventChanges(
+                cursor=cursor, applet_ids=applet_ids, applets=[]
+            )
+
+        events = await self._get_user_events_by_applets(
+            user_id=user_id, applet_ids=changed_applet_ids_ordered
+        )
+        changed_event_ids = {
+            change.event_id for change in changes if change.event_id
+        }
+        deleted_event_ids: dict[uuid.UUID, list[uuid.UUID]] = dict()
+        for applet_id in changed_applet_ids_ordered:
+            if applet_id in full_applet_ids:
+                continue
+            event_ids = {event.id for event in events[applet_id]}
+            events[applet_id] = [
+                event
+                for event in events[applet_id]
+                if event.id in changed_event_ids
+            ]
+            deleted_event_ids[applet_id] = [
+                change.event_id
+                for change in changes
+                if change.applet_id == applet_id
+                and change.event_id
+                and change.event_id not in event_ids
+            ]
+
+        applet_events = await self._convert_to_dto_by_applets(
+            events, changed_applet_ids_ordered
+        )
+        return PublicEventChanges(
+            cursor=cursor,
+            applet_ids=applet_ids,
+            applets=[
+                PublicEventChangesByUser(
+                    applet_id=applet.applet_id,
+                    is_full=applet.applet_id in full_applet_ids,
+                    events=applet.events or [],
+                    deleted_event_ids=deleted_event_ids.get(
+                        applet.applet_id, []
+                    ),
+                )
+                for applet in applet_events
+            ],
+        )
+
+    async def _get_user_applet_ids(
+        self, user_id: uuid.UUID
+    ) -> list[uuid.UUID]:
         applets = await AppletsCRUD(self.session).get_applets_by_roles(
             user_id=user_id,
             roles=Role.as_list(),
             query_params=QueryParams(),
         )
-        applet_ids = [applet.id for applet in applets]
-        events = []
+        return [applet.id for applet in applets]
+
+    async def _get_user_events_by_applets(
+        self, user_id: uuid.UUID, applet_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[EventFull]]:
+        """Get individual and general events of the user grouped by applet.
+        Individual events go first as before.
+        """
+        user_events = await EventCRUD(
+            self.session
+        ).get_all_by_applets_and_user(applet_ids=applet_ids, user_id=user_id)
+        general_events = await EventCRUD(
+            self.session
+        ).get_general_events_by_applets_and_user(
+            applet_ids=applet_ids, user_id=user_id
+        )
+        return {
+            applet_id: user_events.get(applet_id, [])
+            + general_events.get(applet_id, [])
+            for applet_id in applet_ids
+        }
 
-        for applet_id in applet_ids:
-            user_events: list = await EventCRUD(
-                self.session
-            ).get_all_by_applet_and_user(
+    async def _convert_to_dto_by_applets(
+        self,
+        events: dict[uuid.UUID, list[EventFull]],
+        applet_ids: list[uuid.UUID],
+    ) -> list[PublicEventByUser]:
+        """Load notifications and reminders of all events at once
+        and convert the events to dto keeping the order of applets.
+        """
+        event_ids = [
+            event.id
+            for applet_events in events.values()
+            for event in applet_events
+        ]
+        notifications = await NotificationCRUD(
+            self.session
+        ).get_all_by_event_ids(event_ids)
+        reminders = await ReminderCRUD(self.session).get_by_event_ids(
+            event_ids
+        )
+
+        return [
+            PublicEventByUser(
                 applet_id=applet_id,
-                user_id=user_id,
-            )
-            general_events: list = await EventCRUD(
-                self.session
-            ).get_general_events_by_user(applet_id=applet_id, user_id=user_id)
-            all_events = user_events + general_events
-            events.append(
-                PublicEventByUser(
-                    applet_id=applet_id,
-                    events=[
-                        self._convert_to_dto(
-                            event=event,
-                            notifications=await NotificationCRUD(
-                                self.session
-                            ).get_all_by_event_id(event.id),
-                            reminder=await ReminderCRUD(
-                                self.session
-                            ).get_by_event_id(event.id),
-                        )
-                        for event in all_events
-                    ],
-                )
+                events=[
+                    self._convert_to_dto(
+                        event=event,
+                        notifications=notifications.get(event.id),
+                        reminder=reminders.get(event.id),
+                    )
+                    for event in events.get(applet_id, [])
+                ],
             )
-
-        return events
+            for applet_id in applet_ids
+        ]
 
     def _convert_to_dto(
         self,
@@ -913,45 +1013,43 @@ class ScheduleService:
         self, user_id: uuid.UUID, applet_id: uuid.UUID
     ) -> PublicEventByUser:
         """Get all events for user in applet."""
+        await self._validate_user_applet(user_id, applet_id)
 
-        # Check if applet exists
-        await self._validate_applet(applet_id=applet_id)
-
-        if not (
-            await AppletsCRUD(self.session).get_applet_by_roles(
-                user_id=user_id,
-                applet_id=applet_id,
-                roles=Role.as_list(),
-            )
-        ):
-            raise AccessDeniedToApplet()
-
-        user_events = await EventCRUD(self.session).get_all_by_applet_and_user(
-            applet_id=applet_id,
-            user_id=user_id,
+        events = await self._get_user_events_by_applets(
+            user_id=user_id, applet_ids=[applet_id]
         )
+        return (await self._convert_to_dto_by_applets(events, [applet_id]))[0]
 
-        general_events = await EventCRUD(
-            self.session
-        ).get_general_events_by_user(applet_id=applet_id, user_id=user_id)
-
-        events = PublicEventByUser(
-            applet_id=applet_id,
-            events=[
-                self._convert_to_dto(
-                    event=event,
-                    notifications=await NotificationCRUD(
-                        self.session
-                    ).get_all_by_event_id(event.id),
-                    reminder=await ReminderCRUD(self.session).get_by_event_id(
-                        event.id
-                    ),
-                )
-                for event in (user_events + general_events)
-            ],
+    async def get_occurrences_by_user(
+        self,
+        user_id: uuid.UUID,
+        from_date: date,
+        to_date: date,
+        applet_id: uuid.UUID | None = None,
+    ) -> list[PublicEventOccurrence]:
+        """Get the windows of the events of the user between the dates."""
+        if not 0 <= (to_date - from_date).days < OCCURRENCES_MAX_DAYS:
+            raise EventOccurrencesRangeError(max_days=OCCURRENCES_MAX_DAYS)
+        if applet_id:
+            await self._validate_applet(applet_id=applet_id)
+
+        occurrences = await EventOccurrenceCRUD(self.session).get_occurrences(
+            from_date=from_date,
+            to_date=to_date,
+            user_ids=[user_id],
+            applet_ids=[applet_id] if applet_id else None,
         )
-
-        return events
+        return [
+            PublicEventOccurrence(
+                applet_id=occurrence.applet_id,
+                event_id=occurrence.event_id,
+                entity_id=occurrence.activity_id or occurrence.flow_id,
+                periodicity_type=occurrence.periodicity_type,
+                start_at=occurrence.start_at,
+                end_at=occurrence.end_at,
+            )
+            for occurrence in occurrences
+        ]
 
     async def count_events_by_user(self, user_id: uuid.UUID) -> int:
         """Count all events for user in applets that user is respondent."""
@@ -992,6 +1090,13 @@ class ScheduleService:
             event_id=event_id
         )
 
+        return self._build_notification(notifications, reminder)
+
+    @staticmethod
+    def _build_notification(
+        notifications: list[NotificationSetting] | None,
+        reminder: ReminderSetting | None,
+    ) -> PublicNotification | None:
         return (
             PublicNotification(
                 notifications=[
@@ -1018,6 +1123,21 @@ class ScheduleService:
         if not applet_exist:
             raise AppletNotFoundError(key="id", value=str(applet_id))
 
+    async def _validate_user_applet(
+        self, user_id: uuid.UUID, applet_id: uuid.UUID
+    ):
+        # Check if applet exists
+        await self._validate_applet(applet_id=applet_id)
+
+        if not (
+            await AppletsCRUD(self.session).get_applet_by_roles(
+                user_id=user_id,
+                applet_id=applet_id,
+                roles=Role.as_list(),
+            )
+        ):
+            raise AccessDeniedToApplet()
+
     async def _validate_public_applet(self, key: uuid.UUID) -> uuid.UUID:
         # Check if applet exists
         applet = await AppletsCRUD(self.session).get_by_key(key)
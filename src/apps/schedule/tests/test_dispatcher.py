@@ -0,0 +1,179 @@
+import datetime
+import uuid
+
+from apps.schedule.worker import NotificationDispatcher
+from apps.shared.test import BaseTest
+from apps.users.cruds.user_device import UserDevicesCRUD
+from infrastructure.database import rollback, session_manager
+from infrastructure.utility import NotificationResult
+
+
+class FCMStandIn:
+    """Records the messages instead of sending them to FCM.
+    The devices with the "invalid" prefix are not registered.
+    """
+
+    def __init__(self):
+        self.messages: list[dict] = []
+
+    async def notify(self, devices, message_title, message_body, **kwargs):
+        self.messages.append(
+            dict(
+                devices=devices,
+                title=message_title,
+                body=message_body,
+                data=kwargs.get("data_message"),
+            )
+        )
+        invalid_devices = [
+            device for device in devices if device.startswith("invalid")
+        ]
+        return NotificationResult(
+            devices=len(devices),
+            sent=len(devices) - len(invalid_devices),
+            invalid_devices=invalid_devices,
+        )
+
+
+class TestNotificationDispatcher(BaseTest):
+    fixtures = [
+        "users/fixtures/users.json",
+        "folders/fixtures/folders.json",
+        "applets/fixtures/applets.json",
+        "applets/fixtures/applet_user_accesses.json",
+        "activities/fixtures/activities.json",
+        "activities/fixtures/activity_items.json",
+        "activity_flows/fixtures/activity_flows.json",
+        "activity_flows/fixtures/activity_flow_items.json",
+        "schedule/fixtures/periodicity.json",
+        "schedule/fixtures/events.json",
+        "schedule/fixtures/activity_events.json",
+        "schedule/fixtures/flow_events.json",
+        "schedule/fixtures/user_events.json",
+        "schedule/fixtures/notifications.json",
+        "schedule/fixtures/reminders.json",
+    ]
+
+    login_url = "/auth/login"
+    schedule_url = "applets/{applet_id}/events"
+
+    def _get_dispatcher(self, sender) -> NotificationDispatcher:
+        return NotificationDispatcher(
+            enabled=True,
+            plan_interval=300,
+            plan_horizon=3600,
+            poll_interval=5,
+            batch_size=100,
+            multicast_size=1000,
+            concurrency=2,
+            max_attempts=3,
+            retry_delay=60,
+            expire_after=3600,
+            retention=86400,
+            sender=sender,
+        )
+
+    async def _create_event(self, notifications: list[dict]) -> str:
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        create_data = {
+            "start_time": "08:00:00",
+            "end_time": "10:00:00",
+            "access_before_schedule": False,
+            "one_time_completion": False,
+            "timer": "00:00:00",
+            "timer_type": "NOT_SET",
+            "periodicity": {
+                "type": "ONCE",
+                "start_date": None,
+                "end_date": None,
+                "selected_date": "2023-09-01",
+            },
+            "respondent_id": "7484f34a-3acc-4ee6-8a94-fd7299502fa1",
+            "activity_id": "09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+            "flow_id": None,
+            "notification": {"notifications": notifications},
+        }
+        response = await self.client.post(
+            self.schedule_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+            ),
+            data=create_data,
+        )
+        assert response.status_code == 201, response.json()
+        return response.json()["result"]["id"]
+
+    @rollback
+    async def test_send_notification_once(self):
+        event_id = await self._create_event(
+            [{"trigger_type": "FIXED", "at_time": "08:30:00"}]
+        )
+        session = session_manager.get_session()
+        await UserDevicesCRUD(session).add_device(
+            uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1"), "tom-device"
+        )
+        sender = FCMStandIn()
+        dispatcher = self._get_dispatcher(sender)
+
+        now = datetime.datetime(2023, 9, 1, 8)
+        assert await dispatcher.plan(session, now) > 0
+        # The planning is idempotent
+        assert await dispatcher.plan(session, now) == 0
+
+        # The notification is not due yet
+        await dispatcher.drain(session, now)
+        assert not [
+            message
+            for message in sender.messages
+            if message["data"]["event_id"] == event_id
+        ]
+
+        now = datetime.datetime(2023, 9, 1, 8, 31)
+        await dispatcher.drain(session, now)
+        await dispatcher.drain(session, now)
+        messages = [
+            message
+            for message in sender.messages
+            if message["data"]["event_id"] == event_id
+        ]
+        assert len(messages) == 1
+        assert messages[0]["devices"] == ["tom-device"]
+        assert messages[0]["data"]["type"] == "notification"
+
+    @rollback
+    async def test_random_notification_time_is_stable(self):
+        await self._create_event(
+            [
+                {
+                    "trigger_type": "RANDOM",
+                    "from_time": "08:00:00",
+                    "to_time": "08:20:00",
+                }
+            ]
+        )
+        session = session_manager.get_session()
+        dispatcher = self._get_dispatcher(FCMStandIn())
+
+        now = datetime.datetime(2023, 9, 1, 8)
+        assert await dispatcher.plan(session, now) > 0
+        # The random time of the same user and day is the same
+        assert await dispatcher.plan(session, now) == 0
+
+    @rollback
+    async def test_invalid_devices_are_removed(self):
+        await self._create_event(
+            [{"trigger_type": "FIXED", "at_time": "08:30:00"}]
+        )
+        session = session_manager.get_session()
+        user_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1")
+        crud = UserDevicesCRUD(session)
+        await crud.add_device(user_id, "tom-device")
+        await crud.add_device(user_id, "invalid-device")
+        dispatcher = self._get_dispatcher(FCMStandIn())
+
+        await dispatcher.plan(session, datetime.datetime(2023, 9, 1, 8))
+        await dispatcher.drain(session, datetime.datetime(2023, 9, 1, 8, 31))
+
+        devices = await crud.get_by_user_ids([user_id])
+        assert devices[user_id] == ["tom-device"]
@@ -26,6 +26,8 @@ class TestSchedule(BaseTest):
 
     schedule_user_url = "users/me/events"
     schedule_detail_user_url = f"{schedule_user_url}/{{applet_id}}"
+    schedule_occurrences_user_url = f"{schedule_user_url}/occurrences"
+    schedule_changes_user_url = f"{schedule_user_url}/changes"
 
     schedule_url = f"{applet_detail_url}/events"
     schedule_import_url = f"{applet_detail_url}/events/import"
@@ -579,6 +581,29 @@ class TestSchedule(BaseTest):
         assert response.status_code == 200
         assert response.json()["count"] == 6
 
+    @rollback
+    async def test_schedules_get_user_all_with_notifications(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+
+        response = await self.client.get(self.schedule_user_url)
+
+        assert response.status_code == 200
+        applets = {
+            applet["appletId"]: applet["events"]
+            for applet in response.json()["result"]
+        }
+        events = {
+            event["id"]: event
+            for event in applets["92917a56-d586-4613-b7aa-991f2c4b15b4"]
+        }
+        settings = events["04c93c4a-2cd4-45ce-9aec-b1912f330587"][
+            "notificationSettings"
+        ]
+        assert len(settings["notifications"]) == 2
+        assert settings["reminder"]["activityIncomplete"] == 1
+
     @rollback
     async def test_schedule_get_user_by_applet(self):
         await self.client.login(
@@ -592,6 +617,173 @@ class TestSchedule(BaseTest):
         )
         assert response.status_code == 200
 
+    @rollback
+    async def test_schedule_get_user_occurrences(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        create_data = {
+            "start_time": "08:00:00",
+            "end_time": "09:00:00",
+            "access_before_schedule": False,
+            "one_time_completion": False,
+            "timer": "00:00:00",
+            "timer_type": "NOT_SET",
+            "periodicity": {
+                "type": "WEEKLY",
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+                "selected_date": "2023-01-02",
+            },
+            "respondent_id": "7484f34a-3acc-4ee6-8a94-fd7299502fa1",
+            "activity_id": "09e3dbf0-aefb-4d0e-9177-bdb321bf3611",
+            "flow_id": None,
+        }
+        response = await self.client.post(
+            self.schedule_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+            ),
+            data=create_data,
+        )
+        assert response.status_code == 201, response.json()
+        event_id = response.json()["result"]["id"]
+
+        response = await self.client.get(
+            self.schedule_occurrences_user_url,
+            dict(
+                from_date="2023-01-01",
+                to_date="2023-01-31",
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            ),
+        )
+        assert response.status_code == 200, response.json()
+        occurrences = [
+            occurrence
+            for occurrence in response.json()["result"]
+            if occurrence["eventId"] == event_id
+        ]
+        assert [occurrence["startAt"] for occurrence in occurrences] == [
+            f"2023-01-{day:02}T08:00:00" for day in (2, 9, 16, 23, 30)
+        ]
+        assert occurrences[0]["endAt"] == "2023-01-02T09:00:00"
+        assert occurrences[0]["entityId"] == create_data["activity_id"]
+
+        response = await self.client.get(
+            self.schedule_occurrences_user_url,
+            dict(from_date="2023-01-31", to_date="2023-01-01"),
+        )
+        assert response.status_code == 400, response.json()
+
+    async def _create_general_flow_event(self) -> str:
+        create_data = {
+            "start_time": "08:00:00",
+            "end_time": "09:00:00",
+            "access_before_schedule": False,
+            "one_time_completion": False,
+            "timer": "00:00:00",
+            "timer_type": "NOT_SET",
+            "periodicity": {
+                "type": "ONCE",
+                "start_date": None,
+                "end_date": None,
+                "selected_date": "2023-09-01",
+            },
+            "respondent_id": None,
+            "activity_id": None,
+            "flow_id": "3013dfb1-9202-4577-80f2-ba7450fb5831",
+        }
+        response = await self.client.post(
+            self.schedule_url.format(
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+            ),
+            data=create_data,
+        )
+        assert response.status_code == 201, response.json()
+        return response.json()["result"]["id"]
+
+    @rollback
+    async def test_schedules_get_user_all_not_modified(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+
+        response = await self.client.get(self.schedule_user_url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = await self.client.get(
+            self.schedule_user_url, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+        url = self.schedule_detail_user_url.format(
+            applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1"
+        )
+        response = await self.client.get(url)
+        assert response.status_code == 200
+        applet_etag = response.headers["ETag"]
+
+        await self._create_general_flow_event()
+
+        response = await self.client.get(
+            self.schedule_user_url, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        response = await self.client.get(
+            url, headers={"If-None-Match": applet_etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != applet_etag
+
+    @rollback
+    async def test_schedules_get_user_changes(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        applet_id = "92917a56-d586-4613-b7aa-991f2c4b15b1"
+
+        response = await self.client.get(self.schedule_changes_user_url)
+        assert response.status_code == 200, response.json()
+        result = response.json()["result"]
+        assert applet_id in result["appletIds"]
+        assert all(applet["isFull"] for applet in result["applets"])
+
+        event_id = await self._create_general_flow_event()
+
+        response = await self.client.get(
+            self.schedule_changes_user_url, dict(since=result["cursor"])
+        )
+        assert response.status_code == 200, response.json()
+        result = response.json()["result"]
+        applets = {applet["appletId"]: applet for applet in result["applets"]}
+        assert not applets[applet_id]["isFull"]
+        assert event_id in [
+            event["id"] for event in applets[applet_id]["events"]
+        ]
+
+        response = await self.client.delete(
+            self.schedule_detail_url.format(
+                applet_id=applet_id, event_id=event_id
+            )
+        )
+        assert response.status_code == 204
+
+        response = await self.client.get(
+            self.schedule_changes_user_url, dict(since=result["cursor"])
+        )
+        assert response.status_code == 200, response.json()
+        applets = {
+            applet["appletId"]: applet
+            for applet in response.json()["result"]["applets"]
+        }
+        assert event_id in applets[applet_id]["deletedEventIds"]
+        assert event_id not in [
+            event["id"] for event in applets[applet_id]["events"]
+        ]
+
     @rollback
     async def test_schedule_remove_individual(self):
         await self.client.login(
@@ -0,0 +1,386 @@
+import asyncio
+import datetime
+import hashlib
+import logging
+import uuid
+
+from apps.schedule.crud.deliveries import NotificationDeliveryCRUD
+from apps.schedule.crud.notification import NotificationCRUD, ReminderCRUD
+from apps.schedule.crud.occurrences import EventOccurrenceCRUD
+from apps.schedule.domain.constants import (
+    DeliveryStatus,
+    NotificationTriggerType,
+)
+from apps.schedule.domain.schedule.internal import (
+    EventOccurrence,
+    NotificationSetting,
+)
+from apps.users.cruds.user_device import UserDevicesCRUD
+from apps.workspaces.domain.constants import Role
+from config import settings
+from infrastructure.database import atomic, session_manager
+from infrastructure.utility import Notification, NotificationResult
+
+__all__ = ["NotificationDispatcher", "notification_dispatcher"]
+
+logger = logging.getLogger("mindlogger_backend")
+
+
+class NotificationDispatcher:
+    """Sends the notifications and the reminders of the schedule events.
+
+    Every `plan_interval` the notifications of the event occurrences of
+    the next `plan_horizon` are planned into notification_deliveries.
+    A delivery is unique per user, notification and time, so the
+    planning is idempotent and the several processes can plan at once.
+    The time of the RANDOM notification is derived from the hash of the
+    user, the notification and the day, so every planning gets the same
+    time.
+
+    The pending deliveries are the priority queue ordered by the next
+    attempt time. The worker sleeps until the first of them is due, but
+    not longer than `poll_interval`, so the deliveries planned by the
+    other processes are noticed. The due deliveries are locked with
+    FOR UPDATE SKIP LOCKED and the deliveries with the same message are
+    sent as one multicast of up to `multicast_size` devices,
+    `concurrency` multicasts at once. The reminder is skipped if the
+    activity or the flow is completed after the start of the occurrence.
+
+    The sender is the FCM client, any object with the same async
+    `notify` method can be used instead, e.g. in the tests. The devices
+    that FCM does not know are removed.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        plan_interval: int,
+        plan_horizon: int,
+        poll_interval: int,
+        batch_size: int,
+        multicast_size: int,
+        concurrency: int,
+        max_attempts: int,
+        retry_delay: int,
+        expire_after: int,
+        retention: int,
+        sender=None,
+    ):
+        self.enabled = enabled
+        self.plan_interval = plan_interval
+        self.plan_horizon = plan_horizon
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.multicast_size = multicast_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.expire_after = expire_after
+        self.retention = retention
+        self.sender = sender
+        self._planned_at: datetime.datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    async def plan(
+        self, session=None, now: datetime.datetime | None = None
+    ) -> int:
+        """Plans the notifications of the next `plan_horizon`
+        and returns the count of the new deliveries.
+        """
+        now = now or datetime.datetime.utcnow()
+        if session is None:
+            session_maker = session_manager.get_session()
+            async with session_maker() as plan_session:
+                async with atomic(plan_session):
+                    return await self._plan(plan_session, now)
+        return await self._plan(session, now)
+
+    async def drain(
+        self, session=None, now: datetime.datetime | None = None
+    ) -> int:
+        """Sends the due notifications and returns the count of the sent
+        ones.
+        """
+        now = now or datetime.datetime.utcnow()
+        total = 0
+        while True:
+            if session is None:
+                session_maker = session_manager.get_session()
+                async with session_maker() as batch_session:
+                    async with atomic(batch_session):
+                        sent, processed = await self._send_batch(
+                            batch_session, now
+                        )
+            else:
+                sent, processed = await self._send_batch(session, now)
+            total += sent
+            if processed < self.batch_size:
+                return total
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        if self.sender is None:
+            self.sender = Notification()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if isinstance(self.sender, Notification):
+            await self.sender.close()
+
+    async def _run(self) -> None:
+        while True:
+            delay = self.poll_interval
+            try:
+                now = datetime.datetime.utcnow()
+                if (
+                    self._planned_at is None
+                    or (now - self._planned_at).total_seconds()
+                    >= self.plan_interval
+                ):
+                    await self.plan(now=now)
+                    await self._clean(now)
+                    self._planned_at = now
+                await self.drain()
+                delay = await self._get_delay()
+            except Exception as e:
+                logger.exception(e)
+            await asyncio.sleep(delay)
+
+    async def _get_delay(self) -> float:
+        session_maker = session_manager.get_session()
+        async with session_maker() as session:
+            next_attempt_at = await NotificationDeliveryCRUD(
+                session
+            ).get_next_attempt_at()
+        if next_attempt_at is None:
+            return self.poll_interval
+        delay = (next_attempt_at - datetime.datetime.utcnow()).total_seconds()
+        return min(max(delay, 0), self.poll_interval)
+
+    async def _clean(self, now: datetime.datetime) -> None:
+        session_maker = session_manager.get_session()
+        async with session_maker() as session:
+            async with atomic(session):
+                crud = NotificationDeliveryCRUD(session)
+                await crud.expire(
+                    now - datetime.timedelta(seconds=self.expire_after)
+                )
+                await crud.delete_old(
+                    now - datetime.timedelta(seconds=self.retention)
+                )
+
+    async def _plan(self, session, now: datetime.datetime) -> int:
+        # NOTE: The notifications that are missed while the dispatcher
+        #       is stopped are planned too, if they are not expired
+        starts_at = now - datetime.timedelta(seconds=self.expire_after)
+        ends_at = now + datetime.timedelta(seconds=self.plan_horizon)
+        # NOTE: The reminder is sent the days after the occurrence
+        reminder_days = await ReminderCRUD(
+            session
+        ).get_max_activity_incomplete()
+        occurrences = await EventOccurrenceCRUD(session).get_occurrences(
+            from_date=starts_at.date()
+            - datetime.timedelta(days=reminder_days),
+            to_date=ends_at.date(),
+            roles=[Role.RESPONDENT],
+        )
+        event_ids = list({occurrence.event_id for occurrence in occurrences})
+        notifications = await NotificationCRUD(session).get_all_by_event_ids(
+            event_ids
+        )
+        reminders = await ReminderCRUD(session).get_by_event_ids(event_ids)
+
+        values = []
+        for occurrence in occurrences:
+            day = occurrence.start_at.date()
+            triggers = [
+                (
+                    notification.id,
+                    False,
+                    self._get_time(occurrence, notification),
+                )
+                for notification in notifications.get(occurrence.event_id, [])
+            ]
+            reminder = reminders.get(occurrence.event_id)
+            if reminder:
+                triggers.append(
+                    (
+                        reminder.id,
+                        True,
+                        datetime.datetime.combine(
+                            day
+                            + datetime.timedelta(
+                                days=reminder.activity_incomplete
+                            ),
+                            reminder.reminder_time,
+                        ),
+                    )
+                )
+            for trigger_id, is_reminder, scheduled_at in triggers:
+                if not starts_at <= scheduled_at < ends_at:
+                    continue
+                values.append(
+                    dict(
+                        user_id=occurrence.user_id,
+                        applet_id=occurrence.applet_id,
+                        event_id=occurrence.event_id,
+                        activity_id=occurrence.activity_id,
+                        flow_id=occurrence.flow_id,
+                        trigger_id=trigger_id,
+                        is_reminder=is_reminder,
+                        occurrence_start_at=occurrence.start_at,
+                        scheduled_at=scheduled_at,
+                        next_attempt_at=scheduled_at,
+                        status=DeliveryStatus.PENDING,
+                        attempts=0,
+                    )
+                )
+        return await NotificationDeliveryCRUD(session).plan_many(values)
+
+    @staticmethod
+    def _get_time(
+        occurrence: EventOccurrence, notification: NotificationSetting
+    ) -> datetime.datetime:
+        """Returns the time of the notification of the occurrence."""
+        day = occurrence.start_at.date()
+        if notification.trigger_type == NotificationTriggerType.FIXED:
+            return datetime.datetime.combine(day, notification.at_time)
+
+        from_at = datetime.datetime.combine(day, notification.from_time)
+        to_at = datetime.datetime.combine(day, notification.to_time)
+        seconds = int((to_at - from_at).total_seconds())
+        if seconds <= 0:
+            return from_at
+        key = f"{occurrence.user_id}:{notification.id}:{day.isoformat()}"
+        digest = hashlib.sha256(key.encode()).digest()
+        offset = int.from_bytes(digest[:8], "big") % (seconds + 1)
+        return from_at + datetime.timedelta(seconds=offset)
+
+    async def _send_batch(
+        self, session, now: datetime.datetime
+    ) -> tuple[int, int]:
+        crud = NotificationDeliveryCRUD(session)
+        rows = await crud.get_due_for_update(now, self.batch_size)
+        if not rows:
+            return 0, 0
+        devices = await UserDevicesCRUD(session).get_by_user_ids(
+            list({row.NotificationDeliverySchema.user_id for row in rows})
+        )
+
+        skipped_ids = []
+        messages: dict[tuple, list] = dict()
+        for row in rows:
+            delivery = row.NotificationDeliverySchema
+            if row.is_completed or not devices.get(delivery.user_id):
+                skipped_ids.append(delivery.id)
+                continue
+            message = (
+                row.applet_name,
+                row.activity_name or row.flow_name,
+                delivery.applet_id,
+                delivery.event_id,
+                delivery.activity_id or delivery.flow_id,
+                delivery.is_reminder,
+            )
+            messages.setdefault(message, []).append(delivery)
+        await crud.set_status(skipped_ids, DeliveryStatus.SKIPPED)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(
+                self._send_chunk(semaphore, message, chunk, devices)
+                for message, deliveries in messages.items()
+                for chunk in self._get_chunks(deliveries, devices)
+            )
+        )
+
+        sent_ids = []
+        invalid_devices = []
+        for chunk, error, result in results:
+            ids = [delivery.id for delivery in chunk]
+            if result is not None:
+                invalid_devices.extend(result.invalid_devices)
+            if error is None:
+                sent_ids.extend(ids)
+                continue
+            attempts = max(delivery.attempts for delivery in chunk)
+            delay = self.retry_delay * 2**attempts
+            await crud.postpone(
+                ids,
+                now + datetime.timedelta(seconds=delay),
+                self.max_attempts,
+                error,
+            )
+        await crud.set_status(sent_ids, DeliveryStatus.SENT)
+        await UserDevicesCRUD(session).delete_by_device_ids(invalid_devices)
+        return len(sent_ids), len(rows)
+
+    def _get_chunks(
+        self, deliveries: list, devices: dict[uuid.UUID, list[str]]
+    ) -> list[list]:
+        """Splits the deliveries of the message to the chunks
+        of up to `multicast_size` devices.
+        """
+        chunks: list[list] = [[]]
+        count = 0
+        for delivery in deliveries:
+            user_devices = devices[delivery.user_id]
+            if chunks[-1] and count + len(user_devices) > self.multicast_size:
+                chunks.append([])
+                count = 0
+            chunks[-1].append(delivery)
+            count += len(user_devices)
+        return chunks
+
+    async def _send_chunk(
+        self,
+        semaphore: asyncio.Semaphore,
+        message: tuple,
+        chunk: list,
+        devices: dict[uuid.UUID, list[str]],
+    ) -> tuple[list, str | None, NotificationResult | None]:
+        """Sends the message to the devices of the users of the chunk,
+        returns the chunk, the error and the result of the sending.
+        """
+        title, body, applet_id, event_id, entity_id, is_reminder = message
+        try:
+            async with semaphore:
+                result = await self.sender.notify(
+                    devices=[
+                        device_id
+                        for delivery in chunk
+                        for device_id in devices[delivery.user_id]
+                    ],
+                    message_title=title,
+                    message_body=body,
+                    data_message=dict(
+                        type="reminder" if is_reminder else "notification",
+                        applet_id=str(applet_id),
+                        event_id=str(event_id),
+                        entity_id=str(entity_id),
+                    ),
+                )
+        except Exception as e:
+            logger.warning(f"Sending of the event {event_id} failed: {e}")
+            return chunk, str(e), None
+        return chunk, None, result
+
+
+notification_dispatcher = NotificationDispatcher(
+    enabled=settings.notification.dispatch.enabled,
+    plan_interval=settings.notification.dispatch.plan_interval,
+    plan_horizon=settings.notification.dispatch.plan_horizon,
+    poll_interval=settings.notification.dispatch.poll_interval,
+    batch_size=settings.notification.dispatch.batch_size,
+    multicast_size=settings.notification.dispatch.multicast_size,
+    concurrency=settings.notification.dispatch.concurrency,
+    max_attempts=settings.notification.dispatch.max_attempts,
+    retry_delay=settings.notification.dispatch.retry_delay,
+    expire_after=settings.notification.dispatch.expire_after,
+    retention=settings.notification.dispatch.retention,
+)
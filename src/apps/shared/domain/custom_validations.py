@@ -1,8 +1,9 @@
 import mimetypes
-from gettext import gettext as _
 
 from pydantic.color import Color
 
+from infrastructure.i18n import gettext as _
+
 __all__ = [
     "validate_image",
     "validate_color",
@@ -13,6 +13,16 @@ class ResponseMulti(PublicModel, GenericModel, Generic[_BaseModel]):
     count: int = 0
 
 
+class ResponseMultiCursor(ResponseMulti[_BaseModel], Generic[_BaseModel]):
+    """Generic response model of the list with the keyset pagination.
+    The cursor is passed to get the next page, it is null on the last page.
+    The count is null if it is not requested.
+    """
+
+    count: int | None = 0  # type: ignore[assignment]
+    cursor: str | None = None
+
+
 class Response(PublicModel, GenericModel, Generic[_BaseModel]):
     """Generic response model that consist only one result."""
 
@@ -1,9 +1,9 @@
 from enum import Enum
-from gettext import gettext as _
 
 from starlette import status
 
 from apps.shared.enums import Language
+from infrastructure.i18n import gettext as _
 
 
 class ExceptionTypes(str, Enum):
@@ -1,3 +1,5 @@
+from typing import Any
+
 from sqlalchemy import asc, desc
 
 __all__ = ["Ordering"]
@@ -16,6 +18,10 @@ class Ordering:
         ExampleOrdering().get_clauses('-id', 'name')
         will give result as sql:
         select * from schema order by id desc, first_name asc
+
+    The fields that depend on the query, e.g. the correlated subqueries,
+    can be passed to the constructor:
+        ExampleOrdering(is_pinned=is_pinned_subquery)
     """
 
     class Clause:
@@ -31,7 +37,7 @@ class Ordering:
         "-": desc,
     }
 
-    def __init__(self):
+    def __init__(self, **fields):
         self.fields = dict()
         for key, val in self.__class__.__dict__.items():
             _val = None
@@ -41,6 +47,7 @@ class Ordering:
                 _val = val.clause
             if _val is not None:
                 self.fields[key] = _val
+        self.fields.update(fields)
 
     def get_clauses(self, *args):
         sorting_fields = []
@@ -50,6 +57,25 @@ class Ordering:
                 sorting_fields.append(ordering_field)
         return sorting_fields
 
+    def get_keyset(self, *args, unique) -> list[tuple[Any, bool]]:
+        """
+        Returns the ordering fields with their directions
+        for the keyset pagination, see `apps.shared.paging.Keyset`.
+        The unique field is added as the last key to make the order total.
+        """
+        keys = []
+        for value in args:
+            if not value:
+                continue
+            descending = value[0] == "-"
+            field = value[1:] if value[0] in self.actions else value
+            if field in self.fields:
+                keys.append((self.fields[field], descending))
+        if not any(expression is unique for expression, _ in keys):
+            descending = keys[-1][1] if keys else False
+            keys.append((unique, descending))
+        return keys
+
     def _prepare_ordered_field(self, value: str):
         if not value:
             return None
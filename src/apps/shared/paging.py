@@ -1,7 +1,147 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from pydantic import ValidationError as PydanticValidationError
+from pydantic import parse_obj_as
+from pydantic.json import pydantic_encoder
+from sqlalchemy import and_, asc, desc, false, literal, or_
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Query
 
+from apps.shared.exception import ValidationError
+from apps.shared.query_params import QueryParams
+from infrastructure.i18n import gettext as _
+
+__all__ = ["paging", "Keyset", "InvalidCursorError"]
+
 
 def paging(query: Query, page=1, limit=10) -> Query:
     query = query.limit(limit)
     query = query.offset((page - 1) * limit)
     return query
+
+
+class InvalidCursorError(ValidationError):
+    message = _("Invalid cursor.")
+
+
+class Keyset:
+    """
+    Paginates the query by the ordering keys instead of the offset
+    Example:
+        keys = _ExampleOrdering().get_keyset(*ordering, unique=Schema.id)
+        keyset = Keyset(keys, query_params)
+        query = keyset.paginate(query)
+        rows = (await self._execute(query)).all()
+        next_cursor = keyset.get_next_cursor(rows)
+
+    The first page is fetched with the offset of the `page` param. Every
+    page returns the opaque cursor with the keys of its last row, the next
+    page is fetched with `where (keys) > (cursor)`, so the deep pages do
+    not scan and discard the previous ones. The last key must be unique.
+
+    The values of the keys are selected with the `cursor_key_<n>` labels.
+    """
+
+    label = "cursor_key_{}"
+
+    def __init__(
+        self, keys: list[tuple[Any, bool]], query_params: QueryParams
+    ):
+        self.keys = keys
+        self.cursor = query_params.cursor
+        self.page = query_params.page
+        self.limit = query_params.limit
+
+    def paginate(self, query: Query, having: bool = False) -> Query:
+        """Adds the ordering, the keys and the page to the query.
+        The condition of the cursor is added to HAVING if the keys are
+        aggregated.
+        """
+        query = query.add_columns(
+            *(
+                expression.label(self.label.format(index))
+                for index, (expression, descending) in enumerate(self.keys)
+            )
+        )
+        query = query.order_by(
+            *(
+                desc(expression) if descending else asc(expression)
+                for expression, descending in self.keys
+            )
+        )
+        if self.cursor:
+            clause = self._get_clause(self._decode(self.cursor))
+            query = query.having(clause) if having else query.where(clause)
+        else:
+            query = query.offset((self.page - 1) * self.limit)
+        return query.limit(self.limit)
+
+    def get_next_cursor(self, rows: list[Row]) -> str | None:
+        if len(rows) < self.limit:
+            return None
+        last = rows[-1]._mapping
+        values = [last[self.label.format(i)] for i in range(len(self.keys))]
+        return self._encode(values)
+
+    def _get_clause(self, values: list):
+        """Builds the condition of the rows after the cursor:
+        (a > :a) or (a = :a and b > :b) or ...
+        It supports the mixed directions of the ordering.
+        """
+        # NOTE: SQLAlchemy compares only with `=` to the bare booleans,
+        #       e.g. of the untyped `is_pinned` key
+        values = [
+            literal(value) if isinstance(value, bool) else value
+            for value in values
+        ]
+        clauses = []
+        for index, (expression, descending) in enumerate(self.keys):
+            equals = [
+                self.keys[i][0].is_(None)
+                if values[i] is None
+                else self.keys[i][0] == values[i]
+                for i in range(index)
+            ]
+            is_after = self._is_after(expression, values[index], descending)
+            clauses.append(and_(*equals, is_after))
+        return or_(*clauses)
+
+    @staticmethod
+    def _is_after(expression, value, descending: bool):
+        # NOTE: Postgres sorts NULL as the greatest value
+        if value is None:
+            return expression.isnot(None) if descending else false()
+        if descending:
+            return expression < value
+        return or_(expression > value, expression.is_(None))
+
+    @staticmethod
+    def _encode(values: list) -> str:
+        data = json.dumps(values, default=pydantic_encoder)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def _decode(self, cursor: str) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError):
+            raise InvalidCursorError()
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise InvalidCursorError()
+
+        decoded = []
+        for (expression, descending), value in zip(self.keys, values):
+            try:
+                python_type = expression.type.python_type
+            except NotImplementedError:
+                python_type = None
+            if value is None or python_type is None:
+                decoded.append(value)
+                continue
+            try:
+                decoded.append(parse_obj_as(python_type, value))
+            except PydanticValidationError:
+                raise InvalidCursorError()
+        return decoded
@@ -16,6 +16,8 @@ class BaseQueryParams(InternalModel):
     page: int = Field(gt=0, default=1)
     limit: int = Field(gt=0, default=10)
     ordering: str | None
+    cursor: str | None
+    with_count: bool = True
 
 
 class QueryParams(InternalModel):
@@ -28,6 +30,8 @@ class QueryParams(InternalModel):
     page: int = Field(gt=0, default=1)
     limit: int = Field(gt=0, default=10)
     ordering: list[str] = Field(default_factory=list)
+    cursor: str | None
+    with_count: bool = True
 
 
 def parse_query_params(query_param_class):
@@ -39,6 +43,9 @@ def parse_query_params(query_param_class):
         params: QueryParams = query_params
         grouped_query_params = QueryParams()
         for key, val in params.dict().items():
+            if key == "with_count":
+                grouped_query_params.with_count = val
+                continue
             if not val:
                 continue
             if key == "search":
@@ -47,6 +54,8 @@ def parse_query_params(query_param_class):
                 grouped_query_params.page = val
             elif key == "limit":
                 grouped_query_params.limit = val
+            elif key == "cursor":
+                grouped_query_params.cursor = val
             elif key == "ordering":
                 grouped_query_params.ordering = list(
                     map(_camelcase_to_snakecase, val.split(","))
@@ -1,9 +1,14 @@
+import re
+import uuid
 from functools import reduce
 
-from sqlalchemy import Unicode, or_
+from sqlalchemy import String, Unicode, and_, false, or_
+from sqlalchemy.dialects.postgresql import UUID
 
 __all__ = ["Searching"]
 
+_HEX_PREFIX = re.compile(r"^[0-9a-f]+$")
+
 
 class Searching:
     """
@@ -14,9 +19,14 @@ class Searching:
 
         SchemaSearch().get_clauses('To')
         will generate where clause like below:
-        select * from schema where first_name::text ilike '%To%'
-
+        select * from schema where first_name ilike '%To%'
 
+    The text fields are compared without the cast, so the `pg_trgm`
+    GIN indexes of the fields are used. The UUID fields are compared
+    by the equality for the full UUID and by the range for the prefix,
+    so their B-tree indexes are used, e.g. for 'fe46c05a':
+        id >= 'fe46c05a-0000-...' and id <= 'fe46c05a-ffff-...'
+    The other fields are casted to text.
     """
 
     search_fields: list = []
@@ -26,7 +36,30 @@ class Searching:
         if not search_term or not self.search_fields:
             return None
         for search_field in self.search_fields:
-            clauses.append(
-                search_field.cast(Unicode()).ilike(f"%{search_term}%")
-            )
+            if isinstance(search_field.type, UUID):
+                clause = self._get_uuid_clause(search_field, search_term)
+            elif isinstance(search_field.type, String):
+                clause = self._get_text_clause(search_field, search_term)
+            else:
+                clause = self._get_text_clause(
+                    search_field.cast(Unicode()), search_term
+                )
+            clauses.append(clause)
         return reduce(or_, clauses)
+
+    @staticmethod
+    def _get_text_clause(field, search_term: str):
+        escaped = re.sub(r"([\\%_])", r"\\\1", search_term)
+        return field.ilike(f"%{escaped}%", escape="\\")
+
+    @staticmethod
+    def _get_uuid_clause(field, search_term: str):
+        hex_term = search_term.strip().lower().replace("-", "")
+        if not _HEX_PREFIX.match(hex_term) or len(hex_term) > 32:
+            return false()
+        if len(hex_term) == 32:
+            return field == uuid.UUID(hex_term)
+        return and_(
+            field >= uuid.UUID(hex_term.ljust(32, "0")),
+            field <= uuid.UUID(hex_term.ljust(32, "f")),
+        )
@@ -8,7 +8,9 @@ from apps.mailing.services import TestMail
 from apps.shared.test.client import TestClient
 from apps.shared.test.utils import truncate_tables, update_sequence
 from config import settings
+from infrastructure.cache import VersionedCacheService
 from infrastructure.database import session_manager
+from infrastructure.utility import RedisCache
 
 
 class BaseTest:
@@ -28,6 +30,13 @@ class BaseTest:
     async def clear_mails(self):
         TestMail.clear_mails()
 
+    @pytest.fixture(autouse=True)
+    async def clear_cache(self):
+        # NOTE: The database is rolled back after each test,
+        #       so the cached records have to be dropped as well
+        VersionedCacheService.clear_local()
+        await RedisCache()._cache.flushdb()
+
     async def populate_db(self):
         for fixture in self.fixtures:
             await self.load_data(fixture)
@@ -34,9 +34,14 @@ class TestClient:
         data: dict | None = None,
         query: dict | None = None,
         headers: dict | None = None,
+        files: dict | None = None,
     ) -> Response:
         if query:
             url = self._prepare_url(url, query)
+        if files:
+            return await self.client.post(
+                url, files=files, headers=self._get_updated_headers(headers)
+            )
         response = await self.client.post(
             url,
             content=self._get_body(data),
@@ -1,10 +1,9 @@
-from gettext import gettext as _
-
 from apps.shared.exception import (
     InternalServerError,
     NotFoundError,
     ValidationError,
 )
+from infrastructure.i18n import gettext as _
 
 
 class TransferNotFoundError(NotFoundError):
@@ -7,7 +7,7 @@ from apps.applets.domain import Role
 from apps.authentication.errors import PermissionsError
 from apps.invitations.services import InvitationsService
 from apps.mailing.domain import MessageSchema
-from apps.mailing.services import MailingService
+from apps.mailing.services import MailingService, MailOutboxService
 from apps.transfer_ownership.crud import TransferCRUD
 from apps.transfer_ownership.domain import InitiateTransfer, Transfer
 from apps.transfer_ownership.errors import TransferEmailError
@@ -49,10 +49,10 @@ class TransferService:
                 raise TransferEmailError()
             receiver_name = f"{receiver.first_name} {receiver.last_name}"
         except UserNotFound:
-            path = "transfer_ownership_unregistered_user_en"
+            path = "transfer_ownership_unregistered_user"
             receiver_name = transfer.email
         else:
-            path = "transfer_ownership_registered_user_en"
+            path = "transfer_ownership_registered_user"
 
         url = self._generate_transfer_url()
 
@@ -75,7 +75,7 @@ class TransferService:
             ),
         )
 
-        await service.send(message)
+        await MailOutboxService(self.session).send(message)
 
     async def accept_transfer(self, applet_id: uuid.UUID, key: uuid.UUID):
         """Respond to a transfer of ownership of an applet."""
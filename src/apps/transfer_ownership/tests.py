@@ -1,6 +1,7 @@
 from apps.mailing.services import TestMail
+from apps.mailing.worker import mail_outbox_worker
 from apps.shared.test import BaseTest
-from infrastructure.database import rollback
+from infrastructure.database import rollback, session_manager
 
 
 class TestTransfer(BaseTest):
@@ -31,6 +32,7 @@ class TestTransfer(BaseTest):
         )
 
         assert response.status_code == 200
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert TestMail.mails[0].recipients == [data["email"]]
         assert TestMail.mails[0].subject == "Transfer ownership of an applet"
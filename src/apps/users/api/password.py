@@ -5,7 +5,10 @@ from fastapi import Body, Depends, Query
 from pydantic import Required
 
 from apps.authentication.deps import get_current_user
-from apps.authentication.services import AuthenticationService
+from apps.authentication.services import (
+    AuthenticationService,
+    verified_tokens_cache,
+)
 from apps.shared.domain.response import Response
 from apps.users.cruds.user import UsersCRUD
 from apps.users.domain import (
@@ -49,6 +52,7 @@ async def password_update(
 
         # Create public representation of the internal user
         public_user = PublicUser(**updated_user.dict())
+    verified_tokens_cache.invalidate_user(user.id)
 
     return Response[PublicUser](result=public_user)
 
@@ -1,7 +1,10 @@
 from fastapi import Body, Depends
 
 from apps.authentication.deps import get_current_user
-from apps.authentication.services import AuthenticationService
+from apps.authentication.services import (
+    AuthenticationService,
+    verified_tokens_cache,
+)
 from apps.shared.domain.response import Response
 from apps.users import UserSchema
 from apps.users.cruds.user import UsersCRUD
@@ -65,6 +68,7 @@ async def user_update(
         updated_user: User = await UsersCRUD(session).update(
             user, user_update_schema
         )
+    verified_tokens_cache.invalidate_user(user.id)
 
     # Create public representation of the internal user
     public_user = PublicUser(**updated_user.dict())
@@ -78,3 +82,4 @@ async def user_delete(
 ) -> None:
     async with atomic(session):
         await UsersCRUD(session).delete(user)
+    verified_tokens_cache.invalidate_user(user.id)
@@ -2,7 +2,8 @@ import datetime
 import uuid
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import DateTime, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Query
 
@@ -44,6 +45,15 @@ class UsersCRUD(BaseCRUD[UserSchema]):
     async def get_by_email(self, email: str) -> User:
         return await self._fetch(key="email", value=email)
 
+    async def get_existing_emails(self, emails: list[str]) -> list[str]:
+        """Returns the emails of the registered users."""
+        query: Query = select(UserSchema.email)
+        query = query.where(UserSchema.email.in_(emails))
+        query = query.where(UserSchema.is_deleted == False)  # noqa: E712
+        db_result = await self._execute(query)
+
+        return db_result.scalars().all()
+
     async def save(self, schema: UserSchema) -> UserSchema:
         # Save user into the database
         try:
@@ -107,6 +117,21 @@ class UsersCRUD(BaseCRUD[UserSchema]):
         query = query.values(last_seen_at=datetime.datetime.now())
         await self._execute(query)
 
+    async def update_last_seen_by_ids(
+        self, last_seen: dict[uuid.UUID, datetime.datetime]
+    ):
+        """Updates the last seen time of many users with one query."""
+        data = values(
+            column("id", UUID(as_uuid=True)),
+            column("last_seen_at", DateTime()),
+            name="last_seen",
+        ).data(list(last_seen.items()))
+
+        query = update(UserSchema)
+        query = query.where(UserSchema.id == data.c.id)
+        query = query.values(last_seen_at=data.c.last_seen_at)
+        await self._execute(query)
+
     async def exist_by_id(self, id_: uuid.UUID) -> bool:
         query = select(UserSchema)
         query = query.where(UserSchema.id == id_)
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Query
 
@@ -29,3 +29,29 @@ class UserDevicesCRUD(BaseCRUD[UserDeviceSchema]):
             await self._delete("device_id", device_id)
         except NoResultFound:
             raise UserDeviceNotFound()
+
+    async def get_by_user_ids(
+        self, user_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[str]]:
+        """Return the device ids grouped by user id."""
+        devices: dict[uuid.UUID, list[str]] = dict()
+        if not user_ids:
+            return devices
+
+        query: Query = select(
+            UserDeviceSchema.user_id, UserDeviceSchema.device_id
+        )
+        query = query.where(UserDeviceSchema.user_id.in_(user_ids))
+        db_result = await self._execute(query)
+
+        for user_id, device_id in db_result.all():
+            devices.setdefault(user_id, []).append(device_id)
+        return devices
+
+    async def delete_by_device_ids(self, device_ids: list[str]) -> None:
+        """Remove the devices that are not registered in FCM anymore."""
+        if not device_ids:
+            return
+        query: Query = delete(UserDeviceSchema)
+        query = query.where(UserDeviceSchema.device_id.in_(device_ids))
+        await self._execute(query)
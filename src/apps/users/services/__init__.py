@@ -1,2 +1,3 @@
 from apps.users.services.cache import *  # noqa: F401, F403
 from apps.users.services.core import *  # noqa: F401, F403
+from apps.users.services.last_seen import *  # noqa: F401, F403
@@ -1,9 +1,12 @@
 import urllib.parse
 import uuid
 
-from apps.authentication.services import AuthenticationService
+from apps.authentication.services import (
+    AuthenticationService,
+    verified_tokens_cache,
+)
 from apps.mailing.domain import MessageSchema
-from apps.mailing.services import MailingService
+from apps.mailing.services import MailingService, MailOutboxService
 from apps.users.cruds.user import UsersCRUD
 from apps.users.domain import (
     PasswordRecoveryApproveRequest,
@@ -72,7 +75,7 @@ class PasswordRecoveryService:
             subject="Girder for MindLogger (development instance): "
             "Temporary access",
             body=service.get_template(
-                path="reset_password_en",
+                path="reset_password",
                 email=user.email,
                 expiration_minutes=exp,
                 url=(
@@ -83,7 +86,7 @@ class PasswordRecoveryService:
                 ),
             ),
         )
-        await service.send(message)
+        await MailOutboxService(self.session).send(message)
 
         public_user = PublicUser(**user.dict())
 
@@ -114,6 +117,7 @@ class PasswordRecoveryService:
         user = await UsersCRUD(self.session).change_password(
             user, user_change_password_schema
         )
+        verified_tokens_cache.invalidate_user(user.id)
 
         public_user = PublicUser(**user.dict())
 
@@ -0,0 +1,104 @@
+import asyncio
+import contextlib
+import datetime
+import logging
+import time
+import uuid
+
+from apps.users.cruds.user import UsersCRUD
+from config import settings
+from infrastructure.database import atomic, session_manager
+
+__all__ = ["LastSeenTracker", "last_seen_tracker"]
+
+logger = logging.getLogger("mindlogger_backend")
+
+
+class LastSeenTracker:
+    """Coalesces the users last seen updates in the process memory
+    and writes them to the database in bulk.
+
+    The user is recorded at most once per `granularity` seconds,
+    the recorded values are written every `flush_interval` seconds
+    by the background task that is started with the application.
+    """
+
+    def __init__(self, granularity: int, flush_interval: int):
+        self.granularity = granularity
+        self.flush_interval = flush_interval
+        self._pending: dict[uuid.UUID, datetime.datetime] = {}
+        self._recorded_at: dict[uuid.UUID, float] = {}
+        self._task: asyncio.Task | None = None
+
+    def track(self, user_id: uuid.UUID) -> None:
+        now = time.monotonic()
+        recorded_at = self._recorded_at.get(user_id)
+        if recorded_at is not None and now - recorded_at < self.granularity:
+            return
+
+        self._recorded_at[user_id] = now
+        self._pending[user_id] = datetime.datetime.now()
+
+    async def flush(self, session=None) -> int:
+        """Writes the recorded values and returns the count of users."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        try:
+            if session is None:
+                session_maker = session_manager.get_session()
+                async with session_maker() as session:
+                    async with atomic(session):
+                        await UsersCRUD(session).update_last_seen_by_ids(
+                            pending
+                        )
+            else:
+                await UsersCRUD(session).update_last_seen_by_ids(pending)
+        except BaseException:
+            # Keep the values for the next flush unless they were
+            # recorded again in the meantime, the flush is also
+            # cancelled when the task is stopped
+            self._pending = pending | self._pending
+            raise
+
+        self._forget_recorded()
+
+        return len(pending)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, session=None) -> None:
+        """Stops the task and writes the values that are left,
+        including the values of the cancelled flush.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush(session)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(e)
+
+    def _forget_recorded(self) -> None:
+        threshold = time.monotonic() - self.granularity
+        self._recorded_at = {
+            user_id: recorded_at
+            for user_id, recorded_at in self._recorded_at.items()
+            if recorded_at > threshold
+        }
+
+
+last_seen_tracker = LastSeenTracker(
+    granularity=settings.last_seen.granularity,
+    flush_interval=settings.last_seen.flush_interval,
+)
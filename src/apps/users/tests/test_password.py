@@ -7,6 +7,7 @@ from starlette import status
 from apps.authentication.domain.login import UserLoginRequest
 from apps.authentication.router import router as auth_router
 from apps.mailing.services import TestMail
+from apps.mailing.worker import mail_outbox_worker
 from apps.shared.domain import Response
 from apps.shared.test import BaseTest
 from apps.users.domain import PasswordRecoveryRequest, PublicUser
@@ -18,7 +19,7 @@ from apps.users.tests.factories import (
     UserCreateRequestFactory,
 )
 from config import settings
-from infrastructure.database import rollback
+from infrastructure.database import rollback, session_manager
 from infrastructure.utility import RedisCache
 
 
@@ -108,6 +109,7 @@ class TestPassword(BaseTest):
         keys = await cache.keys()
         assert len(keys) == 1
         assert password_recovery_request.email in keys[0]
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 1
         assert (
             TestMail.mails[0].recipients[0] == password_recovery_request.email
@@ -128,6 +130,7 @@ class TestPassword(BaseTest):
         new_keys = await cache.keys()
         assert len(keys) == 1
         assert keys[0] != new_keys[0]
+        await mail_outbox_worker.drain(session_manager.get_session())
         assert len(TestMail.mails) == 2
         assert (
             TestMail.mails[0].recipients[0] == password_recovery_request.email
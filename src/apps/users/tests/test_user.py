@@ -1,3 +1,7 @@
+import asyncio
+import datetime
+from unittest import mock
+
 import pytest
 from starlette import status
 
@@ -7,6 +11,7 @@ from apps.shared.test import BaseTest
 from apps.users import UsersCRUD
 from apps.users.errors import UserIsDeletedError
 from apps.users.router import router as user_router
+from apps.users.services.last_seen import LastSeenTracker
 from apps.users.tests.factories import (
     UserCreateRequestFactory,
     UserUpdateRequestFactory,
@@ -90,6 +95,34 @@ class TestUser(BaseTest):
 
         assert response.status_code == status.HTTP_200_OK
 
+    @rollback
+    async def test_user_retrieve_after_update(self):
+        await self.client.post(
+            self.user_create_url, data=self.create_request_user.dict()
+        )
+        login_request_user: UserLoginRequest = UserLoginRequest(
+            **self.create_request_user.dict()
+        )
+        await self.client.login(
+            url=self.get_token_url,
+            **login_request_user.dict(),
+        )
+
+        # The user is cached by the token here
+        response = await self.client.get(self.user_retrieve_url)
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await self.client.put(
+            self.user_update_url, data=self.user_update_request.dict()
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await self.client.get(self.user_retrieve_url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["result"]["firstName"] == (
+            self.user_update_request.first_name
+        )
+
     @rollback
     async def test_user_delete(self):
         """UsersCRUD.get_by_email should raise an error
@@ -120,3 +153,63 @@ class TestUser(BaseTest):
             )
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    @rollback
+    async def test_user_last_seen_is_written_in_bulk(self):
+        await self.client.post(
+            self.user_create_url, data=self.create_request_user.dict()
+        )
+        session = session_manager.get_session()
+        crud = UsersCRUD(session)
+        user = await crud.get_by_email(self.create_request_user.email)
+        tracker = LastSeenTracker(granularity=60, flush_interval=30)
+
+        tracked_at = datetime.datetime.now()
+        tracker.track(user.id)
+        tracker.track(user.id)
+
+        assert await tracker.flush(session) == 1
+        assert await tracker.flush(session) == 0
+        instance = await crud._get("id", user.id)
+        await session.refresh(instance)
+        last_seen = instance.last_seen_at
+        assert last_seen >= tracked_at
+
+        # The user is not recorded again within the granularity period
+        tracker.track(user.id)
+        assert await tracker.flush(session) == 0
+        await session.refresh(instance)
+        assert instance.last_seen_at == last_seen
+
+    @rollback
+    async def test_user_last_seen_is_written_when_flush_is_cancelled(self):
+        await self.client.post(
+            self.user_create_url, data=self.create_request_user.dict()
+        )
+        session = session_manager.get_session()
+        crud = UsersCRUD(session)
+        user = await crud.get_by_email(self.create_request_user.email)
+        tracker = LastSeenTracker(granularity=60, flush_interval=30)
+        tracked_at = datetime.datetime.now()
+        tracker.track(user.id)
+
+        started = asyncio.Event()
+
+        async def update_last_seen_by_ids(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(60)
+
+        with mock.patch.object(
+            UsersCRUD, "update_last_seen_by_ids", update_last_seen_by_ids
+        ):
+            flush = asyncio.create_task(tracker.flush(session))
+            await started.wait()
+            flush.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await flush
+
+        await tracker.stop(session)
+
+        instance = await crud._get("id", user.id)
+        await session.refresh(instance)
+        assert instance.last_seen_at >= tracked_at
@@ -7,7 +7,7 @@ from apps.applets.domain.applet_full import PublicAppletFull
 from apps.applets.filters import AppletQueryParams
 from apps.applets.service import AppletService
 from apps.authentication.deps import get_current_user
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import Response, ResponseMulti, ResponseMultiCursor
 from apps.shared.query_params import (
     BaseQueryParams,
     QueryParams,
@@ -37,7 +37,7 @@ from apps.workspaces.service.check_access import CheckAccessService
 from apps.workspaces.service.user_access import UserAccessService
 from apps.workspaces.service.user_applet_access import UserAppletAccessService
 from apps.workspaces.service.workspace import WorkspaceService
-from infrastructure.database import atomic
+from infrastructure.database import atomic, gather_reads
 from infrastructure.database.deps import get_session
 from infrastructure.http import get_language
 
@@ -140,14 +140,16 @@ async def workspace_applets(
                 owner_id
             )
             await UserAccessService(session, user.id).check_access(owner_id)
-        applets = await service.get_workspace_applets(
-            language, deepcopy(query_params)
+        applets, count = await gather_reads(
+            session,
+            lambda s: WorkspaceService(s, user.id).get_workspace_applets(
+                language, deepcopy(query_params)
+            ),
+            lambda s: UserAccessService(
+                s, user.id
+            ).get_workspace_applets_count(deepcopy(query_params)),
         )
 
-        count = await UserAccessService(
-            session, user.id
-        ).get_workspace_applets_count(deepcopy(query_params))
-
     return ResponseMulti(
         result=[WorkspaceAppletPublic.from_orm(applet) for applet in applets],
         count=count,
@@ -220,7 +222,7 @@ async def workspace_respondents_list(
         parse_query_params(WorkspaceUsersQueryParams)
     ),
     session=Depends(get_session),
-) -> ResponseMulti[PublicWorkspaceRespondent]:
+) -> ResponseMultiCursor[PublicWorkspaceRespondent]:
     service = WorkspaceService(session, user.id)
     await service.exists_by_owner_id(owner_id)
 
@@ -228,11 +230,11 @@ async def workspace_respondents_list(
         session, user.id
     ).check_workspace_respondent_list_access(owner_id)
 
-    data, total = await service.get_workspace_respondents(
+    data, total, cursor = await service.get_workspace_respondents(
         owner_id, None, deepcopy(query_params)
     )
 
-    return ResponseMulti(result=data, count=total)
+    return ResponseMultiCursor(result=data, count=total, cursor=cursor)
 
 
 async def workspace_applet_respondents_list(
@@ -243,7 +245,7 @@ async def workspace_applet_respondents_list(
         parse_query_params(WorkspaceUsersQueryParams)
     ),
     session=Depends(get_session),
-) -> ResponseMulti[PublicWorkspaceRespondent]:
+) -> ResponseMultiCursor[PublicWorkspaceRespondent]:
     service = WorkspaceService(session, user.id)
     await service.exists_by_owner_id(owner_id)
 
@@ -251,11 +253,11 @@ async def workspace_applet_respondents_list(
         session, user.id
     ).check_applet_respondent_list_access(applet_id)
 
-    data, total = await service.get_workspace_respondents(
+    data, total, cursor = await service.get_workspace_respondents(
         owner_id, applet_id, deepcopy(query_params)
     )
 
-    return ResponseMulti(result=data, count=total)
+    return ResponseMultiCursor(result=data, count=total, cursor=cursor)
 
 
 async def workspace_managers_list(
@@ -265,7 +267,7 @@ async def workspace_managers_list(
         parse_query_params(WorkspaceUsersQueryParams)
     ),
     session=Depends(get_session),
-) -> ResponseMulti[PublicWorkspaceManager]:
+) -> ResponseMultiCursor[PublicWorkspaceManager]:
     service = WorkspaceService(session, user.id)
     await service.exists_by_owner_id(owner_id)
 
@@ -273,11 +275,11 @@ async def workspace_managers_list(
         session, user.id
     ).check_workspace_manager_list_access(owner_id)
 
-    data, total = await service.get_workspace_managers(
+    data, total, cursor = await service.get_workspace_managers(
         owner_id, None, deepcopy(query_params)
     )
 
-    return ResponseMulti(result=data, count=total)
+    return ResponseMultiCursor(result=data, count=total, cursor=cursor)
 
 
 async def workspace_applet_managers_list(
@@ -288,7 +290,7 @@ async def workspace_applet_managers_list(
         parse_query_params(WorkspaceUsersQueryParams)
     ),
     session=Depends(get_session),
-) -> ResponseMulti[PublicWorkspaceManager]:
+) -> ResponseMultiCursor[PublicWorkspaceManager]:
     service = WorkspaceService(session, user.id)
     await service.exists_by_owner_id(owner_id)
 
@@ -296,11 +298,11 @@ async def workspace_applet_managers_list(
         session, user.id
     ).check_applet_manager_list_access(applet_id)
 
-    data, total = await service.get_workspace_managers(
+    data, total, cursor = await service.get_workspace_managers(
         owner_id, applet_id, deepcopy(query_params)
     )
 
-    return ResponseMulti(result=data, count=total)
+    return ResponseMultiCursor(result=data, count=total, cursor=cursor)
 
 
 async def workspace_respondent_pin(
@@ -338,12 +340,18 @@ async def workspace_users_applet_access_list(
 ) -> ResponseMulti[PublicRespondentAppletAccess]:
     async with atomic(session):
         await WorkspaceService(session, user.id).exists_by_owner_id(owner_id)
-        service = UserAccessService(session, user.id)
-        accesses = await service.get_respondent_accesses_by_workspace(
-            owner_id, respondent_id, query_params
-        )
-        count = await service.get_respondent_accesses_by_workspace_count(
-            owner_id, respondent_id
+        accesses, count = await gather_reads(
+            session,
+            lambda s: UserAccessService(
+                s, user.id
+            ).get_respondent_accesses_by_workspace(
+                owner_id, respondent_id, query_params
+            ),
+            lambda s: UserAccessService(
+                s, user.id
+            ).get_respondent_accesses_by_workspace_count(
+                owner_id, respondent_id
+            ),
         )
 
     return ResponseMulti(
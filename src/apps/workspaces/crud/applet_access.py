@@ -1,27 +1,125 @@
 import uuid
 
-from sqlalchemy import case, select
+from sqlalchemy import select
 from sqlalchemy.orm import Query
 
 from apps.workspaces.db.schemas import UserAppletAccessSchema
 from apps.workspaces.domain.constants import Role
+from apps.workspaces.domain.user_applet_access import UserAppletAccess
 from infrastructure.database import BaseCRUD
+from infrastructure.request_cache import clear_request_cache, get_request_cache
+
+__all__ = ["AppletAccessCRUD", "reset_applet_access_cache"]
+
+ACCESS_CACHE_NAMESPACE = "applet_accesses"
+
+_ROLES_PRIORITY = [
+    Role.OWNER,
+    Role.MANAGER,
+    Role.COORDINATOR,
+    Role.EDITOR,
+    Role.REVIEWER,
+    Role.RESPONDENT,
+]
+
+
+def reset_applet_access_cache():
+    """Must be called after the accesses are changed."""
+    clear_request_cache(ACCESS_CACHE_NAMESPACE)
+
+
+def _get_priority_role(roles: set[Role]) -> Role | None:
+    for role in _ROLES_PRIORITY:
+        if role in roles:
+            return role
+    return next(iter(roles), None)
 
 
 class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
+    """The permissions of the user.
+
+    The accesses of the user to the applet or to the workspace are loaded
+    once per request, the rest of the checks of the request are answered
+    from the request cache, see `infrastructure.request_cache`.
+    """
+
     schema_class = UserAppletAccessSchema
 
+    async def get_applet_accesses(
+        self, applet_id: uuid.UUID, user_id: uuid.UUID
+    ) -> list[UserAppletAccess]:
+        cache = get_request_cache(ACCESS_CACHE_NAMESPACE)
+        key = ("applet", applet_id, user_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        query: Query = select(UserAppletAccessSchema)
+        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
+        query = query.where(UserAppletAccessSchema.user_id == user_id)
+        db_result = await self._execute(query)
+        accesses = [
+            UserAppletAccess(
+                id=schema.id,
+                user_id=schema.user_id,
+                applet_id=schema.applet_id,
+                role=schema.role,
+                owner_id=schema.owner_id,
+                invitor_id=schema.invitor_id,
+                meta=schema.meta or {},
+                is_pinned=bool(schema.is_pinned),
+            )
+            for schema in db_result.scalars().all()
+        ]
+
+        if cache is not None:
+            cache[key] = accesses
+        return accesses
+
+    async def get_applet_roles(
+        self, applet_id: uuid.UUID, user_id: uuid.UUID
+    ) -> set[Role]:
+        accesses = await self.get_applet_accesses(applet_id, user_id)
+        return {access.role for access in accesses}
+
+    async def get_workspace_roles(
+        self, owner_id: uuid.UUID, user_id: uuid.UUID
+    ) -> set[Role]:
+        cache = get_request_cache(ACCESS_CACHE_NAMESPACE)
+        key = ("workspace", owner_id, user_id)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        query: Query = select(UserAppletAccessSchema.role).distinct()
+        query = query.where(UserAppletAccessSchema.owner_id == owner_id)
+        query = query.where(UserAppletAccessSchema.user_id == user_id)
+        db_result = await self._execute(query)
+        roles = {Role(role) for role in db_result.scalars().all()}
+
+        if cache is not None:
+            cache[key] = roles
+        return roles
+
+    async def _has_any_applet_roles(
+        self, applet_id: uuid.UUID, user_id: uuid.UUID, roles: list[Role]
+    ) -> bool:
+        applet_roles = await self.get_applet_roles(applet_id, user_id)
+        return not applet_roles.isdisjoint(roles)
+
     async def has_role(
         self, applet_id: uuid.UUID, user_id: uuid.UUID, role: Role
     ) -> bool:
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
+        return await self._has_any_applet_roles(applet_id, user_id, [role])
+
+    async def get_applet_ids_with_roles(
+        self, applet_ids: list[uuid.UUID], user_id: uuid.UUID
+    ) -> set[uuid.UUID]:
+        """Returns the ids of the applets that the user has any role in."""
+        query: Query = select(UserAppletAccessSchema.applet_id).distinct()
+        query = query.where(UserAppletAccessSchema.applet_id.in_(applet_ids))
         query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role == role)
-        query = query.exists()
 
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        db_result = await self._execute(query)
+        return set(db_result.scalars().all())
 
     async def has_any_roles_for_applet(
         self,
@@ -31,14 +129,7 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
     ) -> bool:
         if roles is None:
             roles = Role.as_list()
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(roles))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self._has_any_applet_roles(applet_id, user_id, roles)
 
     async def has_any_roles_for_workspace(
         self,
@@ -48,77 +139,34 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
     ) -> bool:
         if roles is None:
             roles = Role.managers()
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.owner_id == owner_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(roles))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        workspace_roles = await self.get_workspace_roles(owner_id, user_id)
+        return not workspace_roles.isdisjoint(roles)
 
     async def get_workspace_priority_role(
         self,
         owner_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> Role | None:
-        query: Query = select(UserAppletAccessSchema.role)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.owner_id == owner_id)
-        query = query.order_by(
-            case(
-                (UserAppletAccessSchema.role == Role.OWNER, 1),
-                (UserAppletAccessSchema.role == Role.MANAGER, 2),
-                (UserAppletAccessSchema.role == Role.COORDINATOR, 3),
-                (UserAppletAccessSchema.role == Role.EDITOR, 4),
-                (UserAppletAccessSchema.role == Role.REVIEWER, 5),
-                (UserAppletAccessSchema.role == Role.RESPONDENT, 6),
-                else_=10,
-            ).asc()
+        return _get_priority_role(
+            await self.get_workspace_roles(owner_id, user_id)
         )
-        query = query.limit(1)
-        db_result = await self._execute(query)
-        result = db_result.scalars().first()
-
-        return Role(result) if result else None
 
     async def get_applets_priority_role(
         self,
         applet_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> Role | None:
-        query: Query = select(UserAppletAccessSchema.role)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.order_by(
-            case(
-                (UserAppletAccessSchema.role == Role.OWNER, 1),
-                (UserAppletAccessSchema.role == Role.MANAGER, 2),
-                (UserAppletAccessSchema.role == Role.COORDINATOR, 3),
-                (UserAppletAccessSchema.role == Role.EDITOR, 4),
-                (UserAppletAccessSchema.role == Role.REVIEWER, 5),
-                (UserAppletAccessSchema.role == Role.RESPONDENT, 6),
-                else_=10,
-            ).asc()
+        return _get_priority_role(
+            await self.get_applet_roles(applet_id, user_id)
         )
-        query = query.limit(1)
-        db_result = await self._execute(query)
-        result = db_result.scalars().first()
-
-        return Role(result) if result else None
 
     async def can_create_applet(self, owner_id: uuid.UUID, user_id: uuid.UUID):
         """
         1. Create an applet
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.owner_id == owner_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(Role.editors()))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self.has_any_roles_for_workspace(
+            owner_id, user_id, Role.editors()
+        )
 
     async def can_edit_applet(self, applet_id: uuid.UUID, user_id: uuid.UUID):
         """
@@ -126,14 +174,9 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         2. Duplicate
         3. Edit, save or delete applet
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(Role.editors()))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self._has_any_applet_roles(
+            applet_id, user_id, Role.editors()
+        )
 
     async def can_set_retention(
         self, applet_id: uuid.UUID, user_id: uuid.UUID
@@ -141,16 +184,9 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         """
         1. Set retention of an applet
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(
-            UserAppletAccessSchema.role.in_([Role.OWNER, Role.MANAGER])
+        return await self._has_any_applet_roles(
+            applet_id, user_id, [Role.OWNER, Role.MANAGER]
         )
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
 
     async def can_invite_anyone(
         self, applet_id: uuid.UUID, user_id: uuid.UUID
@@ -161,14 +197,9 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         2. can view all organizers
         3. change organizers role/permission where lower role
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(Role.inviters()))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self._has_any_applet_roles(
+            applet_id, user_id, Role.inviters()
+        )
 
     async def can_invite(self, applet_id: uuid.UUID, user_id: uuid.UUID):
         """
@@ -177,14 +208,9 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         3. remove access from lower role
         4. invite new reviewer
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(Role.inviters()))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self._has_any_applet_roles(
+            applet_id, user_id, Role.inviters()
+        )
 
     async def can_set_schedule_and_notifications(
         self, applet_id: uuid.UUID, user_id: uuid.UUID
@@ -192,14 +218,9 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         """
         1. set schedule and notifications to respondents
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(Role.schedulers()))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self._has_any_applet_roles(
+            applet_id, user_id, Role.schedulers()
+        )
 
     async def can_see_any_data(self, applet_id: uuid.UUID, user_id: uuid.UUID):
         """
@@ -207,27 +228,15 @@ class AppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         2. delete users data
         2. export any users data
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(
-            UserAppletAccessSchema.role.in_(Role.super_reviewers())
+        return await self._has_any_applet_roles(
+            applet_id, user_id, Role.super_reviewers()
         )
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
 
     async def can_see_data(self, applet_id: uuid.UUID, user_id: uuid.UUID):
         """
         1. view assigned users data
         2. export assigned users data
         """
-        query: Query = select(UserAppletAccessSchema.id)
-        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
-        query = query.where(UserAppletAccessSchema.user_id == user_id)
-        query = query.where(UserAppletAccessSchema.role.in_(Role.reviewers()))
-        query = query.exists()
-
-        db_result = await self._execute(select(query))
-        return db_result.scalars().first()
+        return await self._has_any_applet_roles(
+            applet_id, user_id, Role.reviewers()
+        )
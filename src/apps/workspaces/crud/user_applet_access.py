@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 from typing import Tuple
 
@@ -12,12 +11,11 @@ from sqlalchemy import (
     exists,
     func,
     literal_column,
-    or_,
     select,
     text,
     update,
 )
-from sqlalchemy.dialects.postgresql import UUID, aggregate_order_by
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.engine import Result
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Query
@@ -27,10 +25,11 @@ from apps.applets.db.schemas import AppletSchema
 from apps.schedule.db.schemas import EventSchema, UserEventsSchema
 from apps.shared.filtering import FilterField, Filtering
 from apps.shared.ordering import Ordering
-from apps.shared.paging import paging
+from apps.shared.paging import Keyset, paging
 from apps.shared.query_params import QueryParams
 from apps.shared.searching import Searching
 from apps.users import UserSchema
+from apps.workspaces.crud.applet_access import reset_applet_access_cache
 from apps.workspaces.db.schemas import UserAppletAccessSchema
 from apps.workspaces.db.schemas.user_applet_access import UserPinSchema
 from apps.workspaces.domain.constants import Role, UserPinRole
@@ -38,11 +37,7 @@ from apps.workspaces.domain.user_applet_access import (
     RespondentAppletAccess,
     UserAppletAccess,
 )
-from apps.workspaces.domain.workspace import (
-    AppletRoles,
-    WorkspaceManager,
-    WorkspaceRespondent,
-)
+from apps.workspaces.domain.workspace import AppletRoles, WorkspaceManager
 from apps.workspaces.errors import (
     AppletAccessDenied,
     UserAppletAccessesNotFound,
@@ -73,18 +68,6 @@ class _AppletUsersFilter(Filtering):
     role = FilterField(UserAppletAccessSchema.role)
 
 
-class _WorkspaceRespondentOrdering(Ordering):
-    email = UserSchema.email
-    first_name = UserSchema.first_name
-    is_pinned = Ordering.Clause(literal_column("is_pinned"))
-    secret_ids = Ordering.Clause(literal_column("secret_ids"))
-    nicknames = Ordering.Clause(literal_column("nicknames"))
-    created_at = Ordering.Clause(func.min(UserAppletAccessSchema.created_at))
-    last_seen = Ordering.Clause(
-        func.coalesce(UserSchema.last_seen_at, UserSchema.created_at)
-    )
-
-
 class _AppletRespondentOrdering(Ordering):
     email = UserSchema.email
     first_name = UserSchema.first_name
@@ -97,20 +80,6 @@ class _AppletRespondentOrdering(Ordering):
     )
 
 
-class _WorkspaceRespondentSearch(Searching):
-    search_fields = [
-        func.array_agg(UserAppletAccessSchema.meta["nickname"].astext),
-        func.array_agg(UserAppletAccessSchema.meta["secretUserId"].astext),
-    ]
-
-
-class _AppletRespondentSearch(Searching):
-    search_fields = [
-        UserAppletAccessSchema.meta["nickname"].astext,
-        UserAppletAccessSchema.meta["secretUserId"].astext,
-    ]
-
-
 class _AppletManagersOrdering(Ordering):
     email = UserSchema.email
     first_name = UserSchema.first_name
@@ -316,11 +285,13 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         self, schema: UserAppletAccessSchema
     ) -> UserAppletAccessSchema:
         """Return UserAppletAccess instance and the created information."""
+        reset_applet_access_cache()
         return await self._create(schema)
 
     async def create_many(
         self, schemas: list[UserAppletAccessSchema]
     ) -> list[UserAppletAccessSchema]:
+        reset_applet_access_cache()
         return await self._create_many(schemas)
 
     async def get(
@@ -400,6 +371,18 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
 
         return db_result.scalars().first()
 
+    async def get_secret_user_ids_for_applet(
+        self, applet_id: uuid.UUID, secret_user_ids: list[str]
+    ) -> list[str]:
+        """Returns the secret user ids that are taken in the applet."""
+        secret_user_id = UserAppletAccessSchema.meta.op("->>")("secretUserId")
+        query: Query = select(distinct(secret_user_id))
+        query = query.where(UserAppletAccessSchema.applet_id == applet_id)
+        query = query.where(secret_user_id.in_(secret_user_ids))
+        db_result = await self._execute(query)
+
+        return db_result.scalars().all()
+
     async def get_user_id_applet_and_role(
         self, applet_id: uuid.UUID, role: Role
     ) -> list[str]:
@@ -414,165 +397,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         query: Query = delete(UserAppletAccessSchema)
         query = query.where(UserAppletAccessSchema.applet_id == applet_id)
         await self._execute(query)
-
-    async def get_workspace_respondents(
-        self,
-        user_id: uuid.UUID,
-        owner_id: uuid.UUID,
-        applet_id: uuid.UUID | None,
-        query_params: QueryParams,
-    ) -> Tuple[list[WorkspaceRespondent], int]:
-        schedule_exists = (
-            select(UserEventsSchema)
-            .join(EventSchema, EventSchema.id == UserEventsSchema.event_id)
-            .where(
-                UserEventsSchema.user_id == UserAppletAccessSchema.user_id,
-                EventSchema.applet_id == UserAppletAccessSchema.applet_id,
-            )
-            .exists()
-            .correlate(UserAppletAccessSchema)
-        )
-
-        is_pinned = (
-            exists()
-            .where(
-                UserPinSchema.user_id == user_id,
-                UserPinSchema.pinned_user_id == UserSchema.id,
-                UserPinSchema.owner_id == owner_id,
-                UserPinSchema.role == UserPinRole.respondent,
-            )
-            .correlate(UserSchema)
-        )
-
-        assigned_respondents = select(
-            literal_column("val").cast(UUID)
-        ).select_from(
-            func.jsonb_array_elements_text(
-                case(
-                    (
-                        func.jsonb_typeof(
-                            UserAppletAccessSchema.meta[text("'respondents'")]
-                        )
-                        == text("'array'"),
-                        UserAppletAccessSchema.meta[text("'respondents'")],
-                    ),
-                    else_=text("'[]'::jsonb"),
-                )
-            ).alias("val")
-        )
-
-        has_access = (
-            exists()
-            .where(
-                UserAppletAccessSchema.user_id == user_id,
-                UserAppletAccessSchema.applet_id == AppletSchema.id,
-                or_(
-                    UserAppletAccessSchema.role.in_(
-                        [Role.OWNER, Role.MANAGER, Role.COORDINATOR]
-                    ),
-                    and_(
-                        UserAppletAccessSchema.role == Role.REVIEWER,
-                        UserSchema.id == any_(assigned_respondents),
-                    ),
-                ),
-            )
-            .correlate(AppletSchema, UserSchema)
-        )
-
-        field_nickname = UserAppletAccessSchema.respondent_nickname
-        field_secret_user_id = UserAppletAccessSchema.respondent_secret_id
-
-        query: Query = (
-            select(
-                # fmt: off
-                UserSchema.id,
-                UserSchema.first_name,
-                UserSchema.last_name,
-
-                func.coalesce(
-                    UserSchema.last_seen_at, UserSchema.created_at
-                ).label("last_seen"),
-
-                func.array_agg(
-                    aggregate_order_by(
-                        func.distinct(field_nickname), field_nickname
-                    )
-                ).label("nicknames"),
-
-                func.array_agg(
-                    aggregate_order_by(
-                        func.distinct(field_secret_user_id),
-                        field_secret_user_id,
-                    )
-                ).label("secret_ids"),
-
-                is_pinned.label("is_pinned"),
-
-                func.array_agg(
-                    func.json_build_object(
-                        text("'applet_id'"), AppletSchema.id,
-                        text("'applet_display_name'"), AppletSchema.display_name,  # noqa: E501
-                        text("'applet_image'"), AppletSchema.image,
-                        text("'access_id'"), UserAppletAccessSchema.id,
-                        text("'respondent_nickname'"), field_nickname,
-                        text("'respondent_secret_id'"), field_secret_user_id,
-                        text("'has_individual_schedule'"), schedule_exists,
-                        text("'encryption'"), AppletSchema.encryption,
-                    )
-                ).label("details"),
-            )
-            .select_from(UserAppletAccessSchema)
-            .join(
-                AppletSchema,
-                and_(
-                    AppletSchema.id == UserAppletAccessSchema.applet_id,
-                    AppletSchema.soft_exists(),
-                ),
-            )
-            .join(
-                UserSchema,
-                UserSchema.id == UserAppletAccessSchema.user_id,
-            )
-            .where(
-                UserAppletAccessSchema.owner_id == owner_id,
-                UserAppletAccessSchema.role == Role.RESPONDENT,
-                has_access,
-                UserAppletAccessSchema.applet_id == applet_id
-                if applet_id
-                else True,
-            )
-            .group_by(UserSchema.id)
-        )
-
-        if query_params.filters:
-            query = query.where(
-                *_AppletUsersFilter().get_clauses(**query_params.filters)
-            )
-        if query_params.search:
-            query = query.having(
-                _WorkspaceRespondentSearch().get_clauses(query_params.search)
-            )
-
-        coro_total = self._execute(
-            select(count()).select_from(query.with_only_columns(UserSchema.id))
-        )
-
-        if query_params.ordering:
-            query = query.order_by(
-                *_WorkspaceRespondentOrdering().get_clauses(
-                    *query_params.ordering
-                )
-            )
-        query = paging(query, query_params.page, query_params.limit)
-
-        coro_data = self._execute(query)
-
-        res_data, res_total = await asyncio.gather(coro_data, coro_total)
-
-        data = parse_obj_as(list[WorkspaceRespondent], res_data.all())
-        total = res_total.scalar()
-
-        return data, total
+        reset_applet_access_cache()
 
     async def get_workspace_managers(
         self,
@@ -580,7 +405,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         owner_id: uuid.UUID,
         applet_id: uuid.UUID | None,
         query_params: QueryParams,
-    ) -> Tuple[list[WorkspaceManager], int]:
+    ) -> Tuple[list[WorkspaceManager], int | None, str | None]:
         is_pinned = (
             exists()
             .where(
@@ -602,6 +427,13 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
             .correlate(AppletSchema)
         )
 
+        roles = func.array_agg(
+            aggregate_order_by(
+                func.distinct(UserAppletAccessSchema.role),
+                UserAppletAccessSchema.role,
+            )
+        )
+
         query: Query = (
             select(
                 # fmt: off
@@ -615,13 +447,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
                 ).label("last_seen"),
 
                 is_pinned.label("is_pinned"),
-
-                func.array_agg(
-                    aggregate_order_by(
-                        func.distinct(UserAppletAccessSchema.role),
-                        UserAppletAccessSchema.role
-                    )
-                ).label("roles"),
+                roles.label("roles"),
 
                 func.array_agg(
                     aggregate_order_by(
@@ -669,24 +495,19 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
                 _AppletUsersSearch().get_clauses(query_params.search)
             )
 
-        coro_total = self._execute(
-            select(count()).select_from(query.with_only_columns(UserSchema.id))
+        ordering = _AppletManagersOrdering(is_pinned=is_pinned, roles=roles)
+        keyset = Keyset(
+            ordering.get_keyset(*query_params.ordering, unique=UserSchema.id),
+            query_params,
         )
+        rows, total = await self._get_page_and_total(
+            keyset.paginate(query, having=True),
+            query.with_only_columns(UserSchema.id),
+            query_params.with_count,
+        )
+        data = parse_obj_as(list[WorkspaceManager], rows)
 
-        if query_params.ordering:
-            query = query.order_by(
-                *_AppletManagersOrdering().get_clauses(*query_params.ordering)
-            )
-        query = paging(query, query_params.page, query_params.limit)
-
-        coro_data = self._execute(query)
-
-        res_data, res_total = await asyncio.gather(coro_data, coro_total)
-
-        data = parse_obj_as(list[WorkspaceManager], res_data.all())
-        total = res_total.scalar()
-
-        return data, total
+        return data, total, keyset.get_next_cursor(rows)
 
     async def get_all_by_user_id_and_roles(
         self, user_id_: uuid.UUID, roles: list[Role]
@@ -731,6 +552,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         query = query.where(UserAppletAccessSchema.role.in_(roles))
         query = query.where(UserAppletAccessSchema.applet_id.in_(applet_ids))
         await self._execute(query)
+        reset_applet_access_cache()
 
     async def check_access_by_user_and_owner(
         self,
@@ -902,6 +724,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         query = query.where(UserAppletAccessSchema.applet_id == applet_id)
         query = query.where(UserAppletAccessSchema.role.in_(roles))
         await self._execute(query)
+        reset_applet_access_cache()
 
     async def has_role(
         self, applet_id: uuid.UUID, user_id: uuid.UUID, role: Role
@@ -995,6 +818,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         )
 
         await self._execute(query)
+        reset_applet_access_cache()
 
     async def update_meta_by_access_id(self, access_id: uuid.UUID, meta: dict):
         query: Query = update(UserAppletAccessSchema)
@@ -1002,6 +826,7 @@ class UserAppletAccessCRUD(BaseCRUD[UserAppletAccessSchema]):
         query = query.values(meta=meta)
 
         await self._execute(query)
+        reset_applet_access_cache()
 
     async def get_workspace_applet_roles(
         self,
@@ -0,0 +1,237 @@
+import uuid
+from typing import Tuple
+
+from sqlalchemy import and_, exists, false, func, or_, select
+from sqlalchemy.orm import Query
+
+from apps.applets.db.schemas import AppletSchema
+from apps.shared.ordering import Ordering
+from apps.shared.paging import Keyset
+from apps.shared.query_params import QueryParams
+from apps.shared.searching import Searching
+from apps.users import UserSchema
+from apps.workspaces.db.schemas import (
+    UserAppletAccessSchema,
+    WorkspaceRespondentSchema,
+)
+from apps.workspaces.db.schemas.user_applet_access import UserPinSchema
+from apps.workspaces.domain.constants import Role, UserPinRole
+from apps.workspaces.domain.workspace import WorkspaceRespondent
+from infrastructure.database.crud import BaseCRUD
+
+__all__ = ["WorkspaceRespondentCRUD"]
+
+
+class _WorkspaceRespondentOrdering(Ordering):
+    email = UserSchema.email
+    first_name = UserSchema.first_name
+    nicknames = WorkspaceRespondentSchema.nicknames
+    secret_ids = WorkspaceRespondentSchema.secret_ids
+    created_at = WorkspaceRespondentSchema.created_at
+    last_seen = Ordering.Clause(
+        func.coalesce(UserSchema.last_seen_at, UserSchema.created_at)
+    )
+
+
+class _WorkspaceRespondentSearch(Searching):
+    search_fields = [WorkspaceRespondentSchema.search_text]
+
+
+class WorkspaceRespondentCRUD(BaseCRUD[WorkspaceRespondentSchema]):
+    schema_class = WorkspaceRespondentSchema
+
+    async def get_workspace_respondents(
+        self,
+        user_id: uuid.UUID,
+        owner_id: uuid.UUID,
+        applet_id: uuid.UUID | None,
+        query_params: QueryParams,
+    ) -> Tuple[list[WorkspaceRespondent], int | None, str | None]:
+        """Returns the page of the respondents which are visible to the user.
+
+        The respondents are read from the denormalized table, so the page
+        is fetched without the grouping of the accesses. The visibility
+        depends on the user, so it is applied here: all the respondents
+        of the applets the user manages and the assigned respondents
+        of the applets the user reviews.
+        """
+        role = (query_params.filters or {}).get("role")
+        if role and role != Role.RESPONDENT:
+            return [], 0, None
+
+        applets, full_access_ids, reviewer_respondents = await (
+            self._get_visible_applets(user_id, owner_id, applet_id)
+        )
+        if not full_access_ids and not reviewer_respondents:
+            return [], 0, None
+
+        visibility = []
+        if full_access_ids:
+            visibility.append(
+                WorkspaceRespondentSchema.applet_ids.overlap(
+                    list(full_access_ids)
+                )
+            )
+        for reviewer_applet_id, respondents in reviewer_respondents.items():
+            visibility.append(
+                and_(
+                    WorkspaceRespondentSchema.applet_ids.contains(
+                        [reviewer_applet_id]
+                    ),
+                    WorkspaceRespondentSchema.user_id.in_(respondents)
+                    if respondents
+                    else false(),
+                )
+            )
+
+        is_pinned = (
+            exists()
+            .where(
+                UserPinSchema.user_id == user_id,
+                UserPinSchema.pinned_user_id
+                == WorkspaceRespondentSchema.user_id,
+                UserPinSchema.owner_id == owner_id,
+                UserPinSchema.role == UserPinRole.respondent,
+            )
+            .correlate(WorkspaceRespondentSchema)
+        )
+
+        query: Query = (
+            select(
+                WorkspaceRespondentSchema.user_id.label("id"),
+                func.coalesce(
+                    UserSchema.last_seen_at, UserSchema.created_at
+                ).label("last_seen"),
+                is_pinned.label("is_pinned"),
+                WorkspaceRespondentSchema.details,
+            )
+            .join(
+                UserSchema,
+                UserSchema.id == WorkspaceRespondentSchema.user_id,
+            )
+            .where(
+                WorkspaceRespondentSchema.owner_id == owner_id,
+                or_(*visibility),
+            )
+        )
+        if query_params.search:
+            query = query.where(
+                _WorkspaceRespondentSearch().get_clauses(query_params.search)
+            )
+
+        ordering = _WorkspaceRespondentOrdering(is_pinned=is_pinned)
+        keyset = Keyset(
+            ordering.get_keyset(
+                *query_params.ordering,
+                unique=WorkspaceRespondentSchema.user_id,
+            ),
+            query_params,
+        )
+        rows, total = await self._get_page_and_total(
+            keyset.paginate(query),
+            query.with_only_columns(WorkspaceRespondentSchema.user_id),
+            query_params.with_count,
+        )
+
+        data = []
+        for row in rows:
+            details = []
+            for detail in row.details:
+                detail_applet_id = uuid.UUID(detail["applet_id"])
+                if detail_applet_id not in applets:
+                    continue
+                if (
+                    detail_applet_id not in full_access_ids
+                    and row.id not in reviewer_respondents[detail_applet_id]
+                ):
+                    continue
+                details.append({**detail, **applets[detail_applet_id]})
+            data.append(
+                WorkspaceRespondent(
+                    id=row.id,
+                    last_seen=row.last_seen,
+                    is_pinned=row.is_pinned,
+                    nicknames=self._get_distinct(
+                        details, "respondent_nickname"
+                    ),
+                    secret_ids=self._get_distinct(
+                        details, "respondent_secret_id"
+                    ),
+                    details=details,
+                )
+            )
+
+        return data, total, keyset.get_next_cursor(rows)
+
+    async def _get_visible_applets(
+        self,
+        user_id: uuid.UUID,
+        owner_id: uuid.UUID,
+        applet_id: uuid.UUID | None,
+    ) -> Tuple[dict[uuid.UUID, dict], set[uuid.UUID], dict]:
+        """Returns the applets of the workspace the user has access to:
+        the applet details by the applet id, the ids of the applets
+        with the access to all the respondents and the assigned
+        respondents by the ids of the applets the user reviews.
+        """
+        query: Query = (
+            select(
+                UserAppletAccessSchema.applet_id,
+                UserAppletAccessSchema.role,
+                UserAppletAccessSchema.meta,
+                AppletSchema.display_name,
+                AppletSchema.image,
+                AppletSchema.encryption,
+            )
+            .join(
+                AppletSchema,
+                and_(
+                    AppletSchema.id == UserAppletAccessSchema.applet_id,
+                    AppletSchema.soft_exists(),
+                ),
+            )
+            .where(
+                UserAppletAccessSchema.user_id == user_id,
+                UserAppletAccessSchema.owner_id == owner_id,
+                UserAppletAccessSchema.role.in_(
+                    [
+                        Role.OWNER,
+                        Role.MANAGER,
+                        Role.COORDINATOR,
+                        Role.REVIEWER,
+                    ]
+                ),
+            )
+        )
+        if applet_id:
+            query = query.where(UserAppletAccessSchema.applet_id == applet_id)
+        db_result = await self._execute(query)
+
+        applets: dict[uuid.UUID, dict] = {}
+        full_access_ids: set[uuid.UUID] = set()
+        reviewer_respondents: dict[uuid.UUID, set[uuid.UUID]] = {}
+        for row in db_result.all():
+            applets[row.applet_id] = dict(
+                applet_display_name=row.display_name,
+                applet_image=row.image,
+                encryption=row.encryption,
+            )
+            if row.role != Role.REVIEWER:
+                full_access_ids.add(row.applet_id)
+                continue
+            respondents = (row.meta or {}).get("respondents")
+            if not isinstance(respondents, list):
+                respondents = []
+            reviewer_respondents.setdefault(row.applet_id, set()).update(
+                uuid.UUID(str(respondent)) for respondent in respondents
+            )
+        for full_access_id in full_access_ids:
+            reviewer_respondents.pop(full_access_id, None)
+
+        return applets, full_access_ids, reviewer_respondents
+
+    @staticmethod
+    def _get_distinct(details: list[dict], key: str) -> list[str]:
+        return sorted(
+            {detail[key] for detail in details if detail[key] is not None}
+        )
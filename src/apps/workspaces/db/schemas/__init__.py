@@ -1,2 +1,3 @@
 from apps.workspaces.db.schemas.user_applet_access import *  # noqa: F401, F403
 from apps.workspaces.db.schemas.user_workspace import *  # noqa: F401, F403
+from apps.workspaces.db.schemas.workspace_respondent import *  # noqa: F401, F403
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+
+from infrastructure.database.base import Base
+
+__all__ = ["WorkspaceRespondentSchema"]
+
+
+class WorkspaceRespondentSchema(Base):
+    """The denormalized respondents of the workspace.
+
+    There is a row for every respondent of the workspace with the aggregated
+    respondent accesses. The rows are refreshed by the triggers
+    of the `user_applet_accesses` and `user_events` tables. The created_at
+    is the time of the first access of the respondent in the workspace.
+
+    The details are the list of the respondent accesses:
+        applet_id, access_id, respondent_nickname, respondent_secret_id,
+        has_individual_schedule
+    """
+
+    __tablename__ = "workspace_respondents"
+    __table_args__ = (
+        UniqueConstraint(
+            "owner_id", "user_id", name="workspace_respondents_uq"
+        ),
+    )
+
+    owner_id = Column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id = Column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    applet_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)
+    nicknames = Column(ARRAY(String()))
+    secret_ids = Column(ARRAY(String()))
+    search_text = Column(Text(), nullable=False, server_default="")
+    details = Column(JSONB(), nullable=False)
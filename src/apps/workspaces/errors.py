@@ -1,6 +1,5 @@
-from gettext import gettext as _
-
 from apps.shared.exception import AccessDeniedError, NotFoundError
+from infrastructure.i18n import gettext as _
 
 __all__ = [
     "UserAppletAccessesNotFound",
@@ -6,7 +6,7 @@ from starlette import status
 from apps.applets.api import applet_create
 from apps.applets.domain.applet_full import PublicAppletFull
 from apps.applets.domain.applets import public_detail
-from apps.shared.domain import Response, ResponseMulti
+from apps.shared.domain import Response, ResponseMulti, ResponseMultiCursor
 from apps.shared.domain.response import (
     AUTHENTICATION_ERROR_RESPONSES,
     DEFAULT_OPENAPI_RESPONSE,
@@ -136,10 +136,10 @@ router.post(
 router.get(
     "/{owner_id}/respondents",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[PublicWorkspaceRespondent],
+    response_model=ResponseMultiCursor[PublicWorkspaceRespondent],
     responses={
         status.HTTP_200_OK: {
-            "model": ResponseMulti[PublicWorkspaceRespondent]
+            "model": ResponseMultiCursor[PublicWorkspaceRespondent]
         },
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
@@ -150,10 +150,10 @@ router.get(
 router.get(
     "/{owner_id}/applets/{applet_id}/respondents",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[PublicWorkspaceRespondent],
+    response_model=ResponseMultiCursor[PublicWorkspaceRespondent],
     responses={
         status.HTTP_200_OK: {
-            "model": ResponseMulti[PublicWorkspaceRespondent]
+            "model": ResponseMultiCursor[PublicWorkspaceRespondent]
         },
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
@@ -164,9 +164,11 @@ router.get(
 router.get(
     "/{owner_id}/managers",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[PublicWorkspaceManager],
+    response_model=ResponseMultiCursor[PublicWorkspaceManager],
     responses={
-        status.HTTP_200_OK: {"model": ResponseMulti[PublicWorkspaceManager]},
+        status.HTTP_200_OK: {
+            "model": ResponseMultiCursor[PublicWorkspaceManager]
+        },
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
     },
@@ -175,9 +177,11 @@ router.get(
 router.get(
     "/{owner_id}/applets/{applet_id}/managers",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseMulti[PublicWorkspaceManager],
+    response_model=ResponseMultiCursor[PublicWorkspaceManager],
     responses={
-        status.HTTP_200_OK: {"model": ResponseMulti[PublicWorkspaceManager]},
+        status.HTTP_200_OK: {
+            "model": ResponseMultiCursor[PublicWorkspaceManager]
+        },
         **DEFAULT_OPENAPI_RESPONSE,
         **AUTHENTICATION_ERROR_RESPONSES,
     },
@@ -4,6 +4,7 @@ from apps.applets.crud import UserAppletAccessCRUD
 from apps.applets.domain import Role, UserAppletAccess
 from apps.invitations.domain import InvitationDetailGeneric
 from apps.users import User, UsersCRUD
+from apps.workspaces.crud.applet_access import AppletAccessCRUD
 from apps.workspaces.db.schemas import UserAppletAccessSchema
 
 __all__ = ["UserAppletAccessService"]
@@ -270,10 +271,12 @@ class UserAppletAccessService:
         return getattr(access, "role", None)
 
     async def get_access(self, role: Role) -> UserAppletAccess | None:
-        schema = await UserAppletAccessCRUD(self.session).get(
-            self._user_id, self._applet_id, role
+        accesses = await AppletAccessCRUD(self.session).get_applet_accesses(
+            self._applet_id, self._user_id
         )
-        if not schema:
-            return None
+        for access in accesses:
+            if access.role == role:
+                # The accesses are cached for the request, do not share them
+                return access.copy(deep=True)
 
-        return UserAppletAccess.from_orm(schema)
+        return None
@@ -4,6 +4,7 @@ from typing import Tuple
 from apps.shared.query_params import QueryParams
 from apps.users import User, UsersCRUD
 from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
+from apps.workspaces.crud.workspace_respondents import WorkspaceRespondentCRUD
 from apps.workspaces.crud.workspaces import UserWorkspaceCRUD
 from apps.workspaces.db.schemas import UserWorkspaceSchema
 from apps.workspaces.domain.constants import Role
@@ -93,29 +94,23 @@ class WorkspaceService:
         owner_id: uuid.UUID,
         applet_id: uuid.UUID | None,
         query_params: QueryParams,
-    ) -> Tuple[list[WorkspaceRespondent], int]:
-        users, total = await UserAppletAccessCRUD(
+    ) -> Tuple[list[WorkspaceRespondent], int | None, str | None]:
+        return await WorkspaceRespondentCRUD(
             self.session
         ).get_workspace_respondents(
             self._user_id, owner_id, applet_id, query_params
         )
 
-        return users, total
-
     async def get_workspace_managers(
         self,
         owner_id: uuid.UUID,
         applet_id: uuid.UUID | None,
         query_params: QueryParams,
-    ) -> Tuple[list[WorkspaceManager], int]:
-        users, total = await UserAppletAccessCRUD(
-            self.session
-        ).get_workspace_managers(
+    ) -> Tuple[list[WorkspaceManager], int | None, str | None]:
+        return await UserAppletAccessCRUD(self.session).get_workspace_managers(
             self._user_id, owner_id, applet_id, query_params
         )
 
-        return users, total
-
     async def get_workspace_applets(
         self, language: str, query_params: QueryParams
     ) -> list[WorkspaceApplet]:
@@ -1,9 +1,14 @@
 import uuid
+from unittest import mock
 from uuid import uuid4
 
 from apps.shared.test import BaseTest
+from apps.workspaces.crud.applet_access import AppletAccessCRUD
+from apps.workspaces.crud.user_applet_access import UserAppletAccessCRUD
+from apps.workspaces.db.schemas import UserAppletAccessSchema
 from apps.workspaces.domain.constants import Role
-from infrastructure.database import rollback
+from infrastructure.database import rollback, session_manager
+from infrastructure.request_cache import request_cache_scope
 
 
 class TestWorkspaces(BaseTest):
@@ -293,7 +298,7 @@ class TestWorkspaces(BaseTest):
                 )
                 assert response.status_code == 200
                 data = response.json()
-                assert set(data.keys()) == {"count", "result"}
+                assert set(data.keys()) == {"count", "result", "cursor"}
                 assert data["count"] == 1
                 result = data["result"]
                 assert len(result) == 1
@@ -342,7 +347,7 @@ class TestWorkspaces(BaseTest):
                 )
                 assert response.status_code == 200
                 data = response.json()
-                assert set(data.keys()) == {"count", "result"}
+                assert set(data.keys()) == {"count", "result", "cursor"}
                 assert data["count"] == 1
                 result = data["result"]
                 assert len(result) == 1
@@ -401,12 +406,45 @@ class TestWorkspaces(BaseTest):
 
                 assert response.status_code == 200
                 data = response.json()
-                assert set(data.keys()) == {"count", "result"}
+                assert set(data.keys()) == {"count", "result", "cursor"}
                 assert data["count"] == 1
                 result = data["result"]
                 assert len(result) == 1
                 assert result[0]["id"] == id_
 
+    @rollback
+    async def test_get_workspace_managers_by_cursor(self):
+        await self.client.login(
+            self.login_url, "tom@mindlogger.com", "Test1234!"
+        )
+        url = self.workspace_managers_url.format(
+            owner_id="7484f34a-3acc-4ee6-8a94-fd7299502fa1"
+        )
+
+        ids = []
+        query = dict(limit=2, withCount=False)
+        while True:
+            response = await self.client.get(url, query)
+            assert response.status_code == 200, response.json()
+            data = response.json()
+            assert data["count"] is None
+            ids += [manager["id"] for manager in data["result"]]
+            if not data["cursor"]:
+                break
+            query["cursor"] = data["cursor"]
+
+        assert len(ids) == 5
+        assert len(set(ids)) == 5
+
+        response = await self.client.get(url, dict(limit=2))
+        assert response.json()["count"] == 5
+        assert [manager["id"] for manager in response.json()["result"]] == (
+            ids[:2]
+        )
+
+        response = await self.client.get(url, dict(cursor="invalid"))
+        assert response.status_code == 400, response.json()
+
     @rollback
     async def test_get_workspace_applet_managers(self):
         await self.client.login(
@@ -444,7 +482,7 @@ class TestWorkspaces(BaseTest):
 
                 assert response.status_code == 200
                 data = response.json()
-                assert set(data.keys()) == {"count", "result"}
+                assert set(data.keys()) == {"count", "result", "cursor"}
                 assert data["count"] == 1
                 result = data["result"]
                 assert len(result) == 1
@@ -724,3 +762,44 @@ class TestWorkspaces(BaseTest):
             self.remove_respondent_access, data=data
         )
         assert response.status_code == 200
+
+        response = await self.client.get(
+            self.workspace_applet_respondents_list.format(
+                owner_id="7484f34a-3acc-4ee6-8a94-fd7299502fa1",
+                applet_id="92917a56-d586-4613-b7aa-991f2c4b15b1",
+            ),
+        )
+        assert response.status_code == 200
+        respondent_ids = {
+            respondent["id"] for respondent in response.json()["result"]
+        }
+        assert "7484f34a-3acc-4ee6-8a94-fd7299502fa2" not in respondent_ids
+
+    @rollback
+    async def test_applet_access_cache_is_reset_on_role_change(self):
+        session = session_manager.get_session()
+        crud = AppletAccessCRUD(session)
+        applet_id = uuid.UUID("92917a56-d586-4613-b7aa-991f2c4b15b1")
+        owner_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa1")
+        user_id = uuid.UUID("7484f34a-3acc-4ee6-8a94-fd7299502fa5")
+
+        with request_cache_scope():
+            assert not await crud.has_role(applet_id, user_id, Role.EDITOR)
+            # The next checks of the applet are answered from the cache
+            with mock.patch.object(crud, "_execute") as execute:
+                assert not await crud.can_edit_applet(applet_id, user_id)
+                assert not await crud.can_see_data(applet_id, user_id)
+                execute.assert_not_called()
+
+            await UserAppletAccessCRUD(session).save(
+                UserAppletAccessSchema(
+                    user_id=user_id,
+                    applet_id=applet_id,
+                    role=Role.EDITOR,
+                    owner_id=owner_id,
+                    invitor_id=owner_id,
+                    meta={},
+                )
+            )
+            assert await crud.has_role(applet_id, user_id, Role.EDITOR)
+            assert await crud.can_edit_applet(applet_id, user_id)
@@ -6,7 +6,10 @@ from config.authentication import AuthenticationSettings
 from config.cdn import CDNSettings
 from config.cors import CorsSettings
 from config.database import DatabaseSettings
+from config.last_seen import LastSeenSettings
+from config.logs import NotificationLogsSettings
 from config.mailing import MailingSettings
+from config.migrate import LegacyMigrationSettings
 from config.notification import NotificationSettings
 from config.redis import RedisSettings
 from config.secret import SecretSettings
@@ -58,6 +61,15 @@ class Settings(BaseSettings):
     # FCM Notification configs
     notification: NotificationSettings = NotificationSettings()
 
+    # Users last seen write-behind
+    last_seen: LastSeenSettings = LastSeenSettings()
+
+    # Notification logs compaction
+    notification_logs: NotificationLogsSettings = NotificationLogsSettings()
+
+    # Legacy MongoDB data migration
+    legacy_migration: LegacyMigrationSettings = LegacyMigrationSettings()
+
     # NOTE: This config is used by SQLAlchemy for imports
     migrations_apps: list[str]
 
@@ -90,5 +102,7 @@ settings = Settings(
         "workspaces",
         "transfer_ownership",
         "alerts",
+        "mailing",
+        "migrate",
     ],
 )
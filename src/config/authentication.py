@@ -28,3 +28,11 @@ class AuthenticationSettings(BaseModel):
     algorithm: str = "HS256"
     token_type: str = "Bearer"
     password_recover: PasswordRecoverSettings = PasswordRecoverSettings()
+    # Set in seconds. The time during which the token that is not
+    # in the blacklist is not checked again by the same process.
+    # 0 disables the local cache
+    blacklist_local_cache_ttl: int = 5
+    # The in-process cache of the verified access tokens.
+    # Set in seconds, 0 disables the cache
+    token_cache_ttl: int = 60
+    token_cache_max_size: int = 10_000
@@ -8,6 +8,16 @@ class CDNSettings(BaseModel):
     bucket: str | None
     domain: str = ""
 
+    # The size of the connection pool of the shared S3 client
+    max_pool_connections: int = 10
+    # Set in bytes. The uploads that are larger than the threshold
+    # are sent in the parts of the chunk size concurrently
+    multipart_threshold: int = 8 * 1024 * 1024
+    multipart_chunksize: int = 8 * 1024 * 1024
+    multipart_concurrency: int = 4
+    # Set in bytes. The size of the chunks that are streamed on download
+    download_chunk_size: int = 1024 * 1024
+
     @property
     def url(self):
         return f"https://{self.domain}/{{key}}"
@@ -7,7 +7,22 @@ class DatabaseSettings(BaseModel):
     password: str = "postgres"
     user: str = "postgres"
     db: str = "mindlogger_backend"
+
+    # Connection pool settings.
+    # NOTE: Set DATABASE__USE_POOL=false to open a connection per session
+    use_pool: bool = True
     pool_size: int = 2
+    max_overflow: int = 10
+    # Set in seconds
+    pool_timeout: int = 30
+    # Set in seconds, -1 disables the recycling
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+    # Optional read-replica. If the host is not set
+    # all read sessions are served by the primary database
+    replica_host: str | None = None
+    replica_port: int | None = None
 
     @property
     def url(self) -> str:
@@ -15,3 +30,13 @@ class DatabaseSettings(BaseModel):
             f"postgresql+asyncpg://{self.user}:{self.password}"
             f"@{self.host}:{self.port}/{self.db}"
         )
+
+    @property
+    def replica_url(self) -> str | None:
+        if not self.replica_host:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.user}:{self.password}"
+            f"@{self.replica_host}:{self.replica_port or self.port}"
+            f"/{self.db}"
+        )
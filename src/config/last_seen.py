@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class LastSeenSettings(BaseModel):
+    """Configure the write-behind of the users last seen time"""
+
+    # Set in seconds. The user is recorded at most once per this period
+    granularity: int = 60
+    # Set in seconds. The recorded values are written with this interval
+    flush_interval: int = 30
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class NotificationLogsSettings(BaseModel):
+    """Configure the compaction of the notification logs"""
+
+    # The count of the last logs that are kept for every device
+    keep_last: int = 20
+    # Set in seconds. The logs are compacted with this interval
+    compaction_interval: int = 60 * 60
+    # The count of the rows that are deleted in one transaction
+    batch_size: int = 1000
+    # Set in seconds. The unused contents are kept for this period,
+    # so the content of the log that is being saved is not deleted
+    unused_contents_ttl: int = 60 * 60
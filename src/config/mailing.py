@@ -12,10 +12,36 @@ class MailSettings(BaseModel):
     from_name: str = "Mindlogger"
 
 
+class MailOutboxSettings(BaseModel):
+    """Configure the background sending of the emails outbox"""
+
+    # Set in seconds. The outbox is checked with this interval
+    poll_interval: int = 5
+    # The count of the emails that are locked and sent at once
+    batch_size: int = 50
+    # The email is not retried after this count of failed attempts
+    max_attempts: int = 5
+    # Set in seconds. The retry delay is doubled after each attempt
+    retry_delay: int = 60
+    # The maximum count of the emails that are sent per second
+    rate_limit: float = 10
+    # Set in seconds. The idle SMTP connection is closed after this time
+    connection_idle_timeout: int = 60
+    # Set in seconds. The claimed emails that are not sent by this time,
+    # e.g. because the worker crashed, are claimed again
+    claim_timeout: int = 300
+
+
 class MailingSettings(BaseModel):
     """Configure mailnig settings for the mindlogger"""
 
     mail: MailSettings = MailSettings()
+    outbox: MailOutboxSettings = MailOutboxSettings()
+
+    # The language of the email template if there is no requested one
+    templates_default_language: str = "en"
+    # The compiled templates cache, the temporary directory by default
+    templates_cache_dir: str | None = None
 
     # Currently these settings are not used
     use_credentials: bool = False
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class LegacyMigrationSettings(BaseModel):
+    """Configure the migration of the legacy MongoDB data"""
+
+    mongo_uri: str = "mongodb://localhost:27017"
+    mongo_db: str = "mindlogger"
+    # The count of the documents that are read, transformed
+    # and copied at once
+    batch_size: int = 1000
+    # The count of the processes that transform the documents,
+    # the documents are transformed in the main process if it is 0
+    workers: int = 4
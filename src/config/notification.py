@@ -1,7 +1,46 @@
 from pydantic import BaseModel
 
 
+class NotificationDispatchSettings(BaseModel):
+    """Configure the background sending of the schedule notifications"""
+
+    # The notifications are sent only if the dispatcher is enabled
+    enabled: bool = False
+    # Set in seconds. The notifications are planned with this interval
+    plan_interval: int = 5 * 60
+    # Set in seconds. The notifications are planned this time ahead
+    plan_horizon: int = 60 * 60
+    # Set in seconds. The longest sleep between the sendings
+    poll_interval: int = 5
+    # The count of the notifications that are locked and sent at once
+    batch_size: int = 1000
+    # The count of the devices of one multicast message
+    multicast_size: int = 1000
+    # The count of the messages that are sent concurrently
+    concurrency: int = 10
+    # The notification is not retried after this count of failed attempts
+    max_attempts: int = 3
+    # Set in seconds. The retry delay is doubled after each attempt
+    retry_delay: int = 60
+    # Set in seconds. The notification is not sent later than this time
+    expire_after: int = 60 * 60
+    # Set in seconds. The delivery records are kept for this period
+    retention: int = 2 * 24 * 60 * 60
+
+
 class NotificationSettings(BaseModel):
     """Configure FCM notification settings"""
 
     api_key: str = ""
+    url: str = "https://fcm.googleapis.com/fcm/send"
+    # Set in seconds
+    timeout: int = 10
+    # The count of the kept-alive connections to FCM
+    max_connections: int = 20
+    # The request is not retried after this count of retries
+    max_retries: int = 5
+    # Set in seconds. The backoff delay is doubled after each retry
+    retry_delay: float = 1
+    # Set in seconds. The longest backoff delay
+    max_retry_delay: float = 60
+    dispatch: NotificationDispatchSettings = NotificationDispatchSettings()
@@ -8,6 +8,8 @@ class RedisSettings(BaseModel):
     port: int = 6379
     db: int = 0
     default_ttl: int = 3600
+    # Set in seconds. The time to live of the immutable versioned records
+    versioned_ttl: int = 604800
 
     @property
     def url(self) -> str:
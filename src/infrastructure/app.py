@@ -22,7 +22,12 @@ import apps.transfer_ownership.router as transfer_ownership
 import apps.users.router as users
 import apps.workspaces.router as workspaces
 import middlewares as middlewares_
+from apps.logs.worker import notification_log_compactor
+from apps.mailing.templates import template_registry
+from apps.mailing.worker import mail_outbox_worker
+from apps.schedule.worker import notification_dispatcher
 from apps.shared.exception import BaseError
+from apps.users.services.last_seen import last_seen_tracker
 from config import settings
 from infrastructure.http.execeptions import (
     custom_base_errors_handler,
@@ -59,6 +64,7 @@ routers: Iterable[APIRouter] = (
 # Declare your middlewares here
 middlewares: Iterable[tuple[Type[middlewares_.Middleware], dict]] = (
     (middlewares_.InternalizationMiddleware, {}),
+    (middlewares_.RequestCacheMiddleware, {}),
     (middlewares_.CORSMiddleware, middlewares_.cors_options),
 )
 
@@ -86,4 +92,23 @@ def create_app():
     app.add_exception_handler(BaseError, custom_base_errors_handler)
     app.add_exception_handler(Exception, python_base_error_handler)
 
+    # Write the users last seen time in bulk
+    app.add_event_handler("startup", last_seen_tracker.start)
+    app.add_event_handler("shutdown", last_seen_tracker.stop)
+
+    # Compile the email templates
+    app.add_event_handler("startup", template_registry.load)
+
+    # Send the emails from the outbox
+    app.add_event_handler("startup", mail_outbox_worker.start)
+    app.add_event_handler("shutdown", mail_outbox_worker.stop)
+
+    # Compact the notification logs
+    app.add_event_handler("startup", notification_log_compactor.start)
+    app.add_event_handler("shutdown", notification_log_compactor.stop)
+
+    # Send the schedule notifications and reminders
+    app.add_event_handler("startup", notification_dispatcher.start)
+    app.add_event_handler("shutdown", notification_dispatcher.stop)
+
     return app
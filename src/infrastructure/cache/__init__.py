@@ -1,2 +1,3 @@
 from infrastructure.cache.errors import *  # noqa: F401, F403
 from infrastructure.cache.services import *  # noqa: F401, F403
+from infrastructure.cache.versioned import *  # noqa: F401, F403
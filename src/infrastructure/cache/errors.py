@@ -1,6 +1,5 @@
-from gettext import gettext as _
-
 from apps.shared.exception import NotFoundError
+from infrastructure.i18n import gettext as _
 
 
 class CacheNotFound(NotFoundError):
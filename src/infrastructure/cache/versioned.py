@@ -0,0 +1,129 @@
+import json
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Type
+
+from config import settings
+from infrastructure.cache.domain import CacheEntry
+from infrastructure.cache.errors import CacheNotFound
+from infrastructure.cache.services import BaseCacheService
+from infrastructure.cache.types import _InputObject
+
+__all__ = ["VersionedCacheService"]
+
+
+class VersionedCacheService(BaseCacheService[_InputObject]):
+    """The base cache of the immutable versioned records.
+
+    The records are identified by the id_version ("{id}_{version}")
+    and never change once they are written, so the cache entries
+    are never invalidated.
+
+    There are two tiers:
+        * the LRU dictionary in the process memory
+        * Redis, that is shared by all processes
+
+    Subclasses set the model that is stored:
+
+        class AppletHistoriesCache(VersionedCacheService[AppletHistory]):
+            model = AppletHistory
+    """
+
+    model: Type[_InputObject]
+    local_max_size: int = 1024
+
+    _local: OrderedDict
+    _subclasses: list[Type["VersionedCacheService"]] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._local = OrderedDict()
+        VersionedCacheService._subclasses.append(cls)
+
+    def __init__(self):
+        super().__init__()
+        self.default_ttl = settings.redis.versioned_ttl
+
+    @classmethod
+    def clear_local(cls) -> None:
+        """Clears the process memory tier of all versioned caches."""
+        for subclass in cls._subclasses:
+            subclass._local.clear()
+
+    async def get(self, id_version: str) -> CacheEntry[_InputObject]:
+        instances = await self.get_many([id_version])
+        if id_version not in instances:
+            raise CacheNotFound()
+
+        return CacheEntry[self.model](  # type: ignore[name-defined]
+            instance=instances[id_version], created_at=datetime.now()
+        )
+
+    async def get_many(
+        self, id_versions: list[str]
+    ) -> dict[str, _InputObject]:
+        """Returns the found instances by their id_version.
+        The missing ones are just omitted.
+        """
+        instances: dict[str, _InputObject] = {}
+        missing: list[str] = []
+        for id_version in id_versions:
+            if id_version in self._local:
+                self._local.move_to_end(id_version)
+                instances[id_version] = self._local[id_version]
+            else:
+                missing.append(id_version)
+
+        if not missing:
+            return instances
+
+        results = await self.redis_client.mget(
+            [self._build_key(id_version) for id_version in missing]
+        )
+        for id_version, result in zip(missing, results):
+            if not result:
+                continue
+            instance = self.model(**json.loads(result)["instance"])
+            self._set_local(id_version, instance)
+            instances[id_version] = instance
+
+        return instances
+
+    async def get_or_load_many(
+        self,
+        id_versions: list[str],
+        loader: Callable[[list[str]], Awaitable[dict[str, _InputObject]]],
+    ) -> dict[str, _InputObject]:
+        """Returns the instances from the cache, the missing ones
+        are loaded by the loader and saved into the cache.
+        """
+        instances = await self.get_many(id_versions)
+        if missing := [
+            id_version
+            for id_version in id_versions
+            if id_version not in instances
+        ]:
+            loaded = await loader(missing)
+            await self.set_many(loaded)
+            instances.update(loaded)
+
+        return instances
+
+    async def set_many(self, instances: dict[str, _InputObject]) -> None:
+        """Saves the instances into both tiers, Redis is written in one
+        pipeline and its errors are ignored, since the instances are
+        loaded from the database again.
+        """
+        values = {}
+        for id_version, instance in instances.items():
+            self._set_local(id_version, instance)
+            values[self._build_key(id_version)] = CacheEntry(
+                instance=instance, created_at=datetime.now()
+            ).json()
+        await self.redis_client.set_many(values, ex=self.default_ttl)
+
+    def _set_local(self, id_version: str, instance: _InputObject) -> None:
+        self._local[id_version] = instance
+        self._local.move_to_end(id_version)
+        while len(self._local) > self.local_max_size:
+            self._local.popitem(last=False)
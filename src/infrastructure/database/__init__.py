@@ -1,3 +1,4 @@
 from infrastructure.database.base import *  # noqa: F401, F403
 from infrastructure.database.core import *  # noqa: F401, F403
 from infrastructure.database.crud import *  # noqa: F401, F403
+from infrastructure.database.parallel import *  # noqa: F401, F403
@@ -11,17 +11,48 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from config import settings
+from infrastructure.database.pool import InstrumentedAsyncQueuePool, PoolStatus
+
+__all__ = [
+    "engine",
+    "read_engine",
+    "session_manager",
+    "rollback",
+    "atomic",
+    "get_pool_status",
+]
+
+
+def _create_engine(url: str):
+    options: dict = dict(
+        future=True,
+        pool_pre_ping=settings.database.pool_pre_ping,
+        echo=False,
+        json_serializer=lambda x: json.dumps(x),
+        json_deserializer=lambda x: json.loads(x),
+    )
+    if settings.database.use_pool:
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.database.pool_size,
+            max_overflow=settings.database.max_overflow,
+            pool_timeout=settings.database.pool_timeout,
+            pool_recycle=settings.database.pool_recycle,
+        )
+    else:
+        options.update(poolclass=NullPool)
+
+    return create_async_engine(url, **options)
+
 
-__all__ = ["engine", "session_manager", "rollback", "atomic"]
+engine = _create_engine(settings.database.url)
 
-engine = create_async_engine(
-    settings.database.url,
-    future=True,
-    pool_pre_ping=True,
-    echo=False,
-    poolclass=NullPool,
-    json_serializer=lambda x: json.dumps(x),
-    json_deserializer=lambda x: json.loads(x),
+# NOTE: The read engine is used by the read-only sessions.
+#       It points to the primary database if the replica is not configured
+read_engine = (
+    _create_engine(settings.database.replica_url)
+    if settings.database.replica_url
+    else engine
 )
 
 async_session_factory = sessionmaker(
@@ -32,6 +63,22 @@ async_session_factory = sessionmaker(
     autocommit=False,
 )
 
+async_read_session_factory = sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+
+def get_pool_status() -> dict[str, PoolStatus]:
+    """Returns the connection pools state of the primary and replica."""
+    status = dict(primary=PoolStatus.from_pool(engine.pool))
+    if read_engine is not engine:
+        status["replica"] = PoolStatus.from_pool(read_engine.pool)
+    return status
+
 
 class SessionManager:
     def __init__(self):
@@ -42,6 +89,18 @@ class SessionManager:
             return self._get_test_session()
         return self._get_session()
 
+    def get_read_session(self):
+        """Returns the session for the read-only queries.
+
+        NOTE: The data of the replica may lag behind the primary,
+              use it only for the reads that tolerate that.
+        """
+        if settings.env == "testing":
+            return self._get_test_session()
+        return async_scoped_session(
+            async_read_session_factory, asyncio.current_task
+        )
+
     def _get_test_session(self):
         if self.test_session:
             return self.test_session
@@ -93,5 +152,8 @@ def rollback(func):
             raise
         finally:
             await session.rollback()
+            # NOTE: The test session outlives the test, drop the instances
+            #       so the next test does not get them from the identity map
+            session.expunge_all()
 
     return _wrap
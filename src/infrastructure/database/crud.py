@@ -2,16 +2,21 @@ import typing
 from copy import deepcopy
 from typing import Any, Generic, Type, TypeVar
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.cimmutabledict import immutabledict
 from sqlalchemy.engine import Result
 from sqlalchemy.exc import MultipleResultsFound, NoResultFound
 from sqlalchemy.orm import Query
 
 from infrastructure.database.base import Base
+from infrastructure.database.parallel import gather_reads
 
 ConcreteSchema = TypeVar("ConcreteSchema", bound=Base)
 
+# NOTE: Postgres limits the count of the query parameters,
+#       so the multi-row inserts are split to the chunks
+INSERT_MANY_CHUNK_SIZE = 1000
+
 __all__ = ["BaseCRUD"]
 
 
@@ -28,6 +33,24 @@ class BaseCRUD(Generic[ConcreteSchema]):
             execution_options=immutabledict({"synchronize_session": False}),
         )
 
+    async def _get_page_and_total(
+        self, query: Query, ids_query: Query, with_count: bool
+    ) -> tuple[list, int | None]:
+        """Fetches the page and the total count of the rows concurrently.
+        The total count is skipped if it is not requested.
+        """
+        if not with_count:
+            res_data = await self._execute(query)
+            return res_data.all(), None
+
+        count_query = select(func.count()).select_from(ids_query)
+        res_data, res_total = await gather_reads(
+            self.session,
+            lambda s: type(self)(s)._execute(query),
+            lambda s: type(self)(s)._execute(count_query),
+        )
+        return res_data.all(), res_total.scalar()
+
     async def _update_one(
         self, lookup: str, value: Any, schema: ConcreteSchema
     ) -> ConcreteSchema:
@@ -101,6 +124,49 @@ class BaseCRUD(Generic[ConcreteSchema]):
             await self.session.refresh(schema)
         return deepcopy(schemas)
 
+    async def _insert_many(self, values: list[dict[str, Any]]) -> list[Any]:
+        """Inserts the rows with the multi-row INSERT ... RETURNING
+        and returns their ids.
+        Unlike _create_many the instances are neither added to the session
+        nor refreshed one by one.
+        """
+        ids = []
+        for start in range(0, len(values), INSERT_MANY_CHUNK_SIZE):
+            end = start + INSERT_MANY_CHUNK_SIZE
+            chunk = values[start:end]
+            query = insert(self.schema_class).values(chunk)
+            query = query.returning(self.schema_class.id)
+            db_result = await self._execute(query)
+            ids.extend(db_result.scalars().all())
+        return ids
+
+    async def _sync_many(
+        self,
+        existing: list[ConcreteSchema],
+        values: list[dict[str, Any]],
+    ) -> list[ConcreteSchema]:
+        """Makes the rows match the values by their ids: inserts the new
+        rows and updates only the changed columns of the existing ones.
+        Returns the instances in the order of the values.
+
+        NOTE: The existing rows that are not in the values are kept,
+              the callers delete them, after their dependent rows
+        """
+        existing_map = {schema.id: schema for schema in existing}
+        schemas = []
+        for value in values:
+            schema = existing_map.get(value["id"])
+            if schema is None:
+                schema = self.schema_class(**value)
+                self.session.add(schema)
+            else:
+                for key, val in value.items():
+                    if getattr(schema, key) != val:
+                        setattr(schema, key, val)
+            schemas.append(schema)
+        await self.session.flush()
+        return schemas
+
     async def _all(self) -> list[ConcreteSchema]:
         query = select(self.schema_class)
         results = await self._execute(query=query)
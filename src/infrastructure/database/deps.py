@@ -12,3 +12,13 @@ async def get_session():
     else:
         async with session_maker() as session:
             yield session
+
+
+async def get_read_session():
+    session_maker = session_manager.get_read_session()
+
+    if settings.env == "testing":
+        yield session_maker
+    else:
+        async with session_maker() as session:
+            yield session
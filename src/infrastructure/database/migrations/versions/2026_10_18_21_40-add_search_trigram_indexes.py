@@ -0,0 +1,59 @@
+"""add search trigram indexes
+
+Revision ID: 8c41d2e7f0a3
+Revises: 5b1f3c9a7d2e
+Create Date: 2026-10-18 21:40:12.503114
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8c41d2e7f0a3"
+down_revision = "5b1f3c9a7d2e"
+branch_labels = None
+depends_on = None
+
+# NOTE: The GIN indexes with `gin_trgm_ops` are used by `ilike '%term%'`.
+#       The expressions must be the same as in the queries.
+TRIGRAM_INDEXES = [
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_users_first_name_trgm", "users", "first_name"),
+    ("ix_users_last_name_trgm", "users", "last_name"),
+    ("ix_applets_display_name_trgm", "applets", "display_name"),
+    ("ix_invitations_email_trgm", "invitations", "email"),
+    ("ix_invitations_first_name_trgm", "invitations", "first_name"),
+    ("ix_invitations_last_name_trgm", "invitations", "last_name"),
+    (
+        "ix_alerts_activity_item_histories_id_version_trgm",
+        "alerts",
+        "activity_item_histories_id_version",
+    ),
+    (
+        "ix_user_applet_accesses_nickname_trgm",
+        "user_applet_accesses",
+        "(meta ->> 'nickname')",
+    ),
+    (
+        "ix_user_applet_accesses_secret_user_id_trgm",
+        "user_applet_accesses",
+        "(meta ->> 'secretUserId')",
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table_name, expression in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table_name,
+            [sa.text(f"{expression} gin_trgm_ops")],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for name, table_name, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table_name)
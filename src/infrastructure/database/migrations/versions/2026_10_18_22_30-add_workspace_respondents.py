@@ -0,0 +1,294 @@
+"""add workspace respondents
+
+Revision ID: 3e9a6b1c4d58
+Revises: 8c41d2e7f0a3
+Create Date: 2026-10-18 22:30:47.219034
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "3e9a6b1c4d58"
+down_revision = "8c41d2e7f0a3"
+branch_labels = None
+depends_on = None
+
+# NOTE: Recomputes the rows of the given (owner_id, user_id) pairs
+#       from the respondent accesses and the individual schedules.
+REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_workspace_respondents(
+    p_owner_ids uuid[], p_user_ids uuid[]
+) RETURNS void AS $$
+BEGIN
+    DELETE FROM workspace_respondents wr
+    USING unnest(p_owner_ids, p_user_ids) AS k(owner_id, user_id)
+    WHERE wr.owner_id = k.owner_id AND wr.user_id = k.user_id;
+
+    INSERT INTO workspace_respondents (
+        owner_id, user_id, created_at, updated_at, is_deleted,
+        applet_ids, nicknames, secret_ids, search_text, details
+    )
+    SELECT
+        a.owner_id,
+        a.user_id,
+        min(a.created_at),
+        timezone('utc', now()),
+        false,
+        array_agg(a.applet_id ORDER BY a.applet_id),
+        array_agg(
+            DISTINCT a.meta ->> 'nickname' ORDER BY a.meta ->> 'nickname'
+        ),
+        array_agg(
+            DISTINCT a.meta ->> 'secretUserId'
+            ORDER BY a.meta ->> 'secretUserId'
+        ),
+        coalesce(
+            string_agg(
+                concat_ws(
+                    ' ', a.meta ->> 'nickname', a.meta ->> 'secretUserId'
+                ),
+                ' '
+            ),
+            ''
+        ),
+        jsonb_agg(
+            jsonb_build_object(
+                'applet_id', a.applet_id,
+                'access_id', a.id,
+                'respondent_nickname', a.meta ->> 'nickname',
+                'respondent_secret_id', a.meta ->> 'secretUserId',
+                'has_individual_schedule', EXISTS (
+                    SELECT 1
+                    FROM user_events ue
+                    JOIN events e ON e.id = ue.event_id
+                    WHERE ue.user_id = a.user_id
+                        AND e.applet_id = a.applet_id
+                )
+            )
+            ORDER BY a.applet_id
+        )
+    FROM user_applet_accesses a
+    JOIN (
+        SELECT DISTINCT owner_id, user_id
+        FROM unnest(p_owner_ids, p_user_ids) AS k(owner_id, user_id)
+    ) k ON k.owner_id = a.owner_id AND k.user_id = a.user_id
+    WHERE a.role = 'respondent'
+    GROUP BY a.owner_id, a.user_id;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ACCESSES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION user_applet_accesses_refresh_respondents()
+RETURNS trigger AS $$
+DECLARE
+    owner_ids uuid[];
+    user_ids uuid[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(owner_id), array_agg(user_id)
+        INTO owner_ids, user_ids
+        FROM new_rows WHERE role = 'respondent';
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(owner_id), array_agg(user_id)
+        INTO owner_ids, user_ids
+        FROM old_rows WHERE role = 'respondent';
+    ELSE
+        SELECT array_agg(owner_id), array_agg(user_id)
+        INTO owner_ids, user_ids
+        FROM (
+            SELECT owner_id, user_id, role FROM new_rows
+            UNION
+            SELECT owner_id, user_id, role FROM old_rows
+        ) r
+        WHERE role = 'respondent';
+    END IF;
+    IF owner_ids IS NOT NULL THEN
+        PERFORM refresh_workspace_respondents(owner_ids, user_ids);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+USER_EVENTS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION user_events_refresh_respondents()
+RETURNS trigger AS $$
+DECLARE
+    owner_ids uuid[];
+    user_ids uuid[];
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(a.owner_id), array_agg(a.user_id)
+        INTO owner_ids, user_ids
+        FROM user_applet_accesses a
+        WHERE a.role = 'respondent'
+            AND a.user_id IN (SELECT user_id FROM old_rows);
+    ELSE
+        SELECT array_agg(a.owner_id), array_agg(a.user_id)
+        INTO owner_ids, user_ids
+        FROM user_applet_accesses a
+        WHERE a.role = 'respondent'
+            AND a.user_id IN (SELECT user_id FROM new_rows);
+    END IF;
+    IF owner_ids IS NOT NULL THEN
+        PERFORM refresh_workspace_respondents(owner_ids, user_ids);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = [
+    ("user_applet_accesses", "INSERT", "NEW TABLE AS new_rows"),
+    (
+        "user_applet_accesses",
+        "UPDATE",
+        "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    ),
+    ("user_applet_accesses", "DELETE", "OLD TABLE AS old_rows"),
+    ("user_events", "INSERT", "NEW TABLE AS new_rows"),
+    ("user_events", "DELETE", "OLD TABLE AS old_rows"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workspace_respondents",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True),
+        sa.Column("owner_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "applet_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+        ),
+        sa.Column("nicknames", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column("secret_ids", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column(
+            "search_text", sa.Text(), server_default="", nullable=False
+        ),
+        sa.Column(
+            "details", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["owner_id"],
+            ["users.id"],
+            name=op.f("fk_workspace_respondents_owner_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_workspace_respondents_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_workspace_respondents")),
+        sa.UniqueConstraint(
+            "owner_id", "user_id", name="workspace_respondents_uq"
+        ),
+    )
+    op.create_index(
+        op.f("ix_workspace_respondents_user_id"),
+        "workspace_respondents",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_workspace_respondents_owner_id_created_at",
+        "workspace_respondents",
+        ["owner_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_workspace_respondents_applet_ids",
+        "workspace_respondents",
+        ["applet_ids"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_workspace_respondents_search_text_trgm",
+        "workspace_respondents",
+        [sa.text("search_text gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.execute(REFRESH_FUNCTION)
+    op.execute(ACCESSES_TRIGGER_FUNCTION)
+    op.execute(USER_EVENTS_TRIGGER_FUNCTION)
+    for table_name, event, transition_tables in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {table_name}_{event.lower()}_respondents "
+            f"AFTER {event} ON {table_name} "
+            f"REFERENCING {transition_tables} "
+            f"FOR EACH STATEMENT "
+            f"EXECUTE FUNCTION {table_name}_refresh_respondents()"
+        )
+
+    op.execute(
+        """
+        SELECT refresh_workspace_respondents(
+            array_agg(owner_id), array_agg(user_id)
+        )
+        FROM (
+            SELECT DISTINCT owner_id, user_id
+            FROM user_applet_accesses
+            WHERE role = 'respondent'
+        ) k
+        HAVING count(*) > 0
+        """
+    )
+
+
+def downgrade() -> None:
+    for table_name, event, _ in reversed(TRIGGERS):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table_name}_{event.lower()}_respondents "
+            f"ON {table_name}"
+        )
+    op.execute("DROP FUNCTION IF EXISTS user_events_refresh_respondents()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS user_applet_accesses_refresh_respondents()"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS refresh_workspace_respondents(uuid[], uuid[])"
+    )
+    op.drop_index(
+        "ix_workspace_respondents_search_text_trgm",
+        table_name="workspace_respondents",
+    )
+    op.drop_index(
+        "ix_workspace_respondents_applet_ids",
+        table_name="workspace_respondents",
+    )
+    op.drop_index(
+        "ix_workspace_respondents_owner_id_created_at",
+        table_name="workspace_respondents",
+    )
+    op.drop_index(
+        op.f("ix_workspace_respondents_user_id"),
+        table_name="workspace_respondents",
+    )
+    op.drop_table("workspace_respondents")
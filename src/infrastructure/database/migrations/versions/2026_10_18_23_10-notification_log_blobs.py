@@ -0,0 +1,147 @@
+"""notification log blobs
+
+Revision ID: 5d2f8a7c9e14
+Revises: 3e9a6b1c4d58
+Create Date: 2026-10-18 23:10:12.508917
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "5d2f8a7c9e14"
+down_revision = "3e9a6b1c4d58"
+branch_labels = None
+depends_on = None
+
+# NOTE: (content column, hash column, foreign key name)
+FIELDS = (
+    (
+        "notification_descriptions",
+        "notification_descriptions_hash",
+        "fk_notification_logs_descriptions_hash",
+    ),
+    (
+        "notification_in_queue",
+        "notification_in_queue_hash",
+        "fk_notification_logs_in_queue_hash",
+    ),
+    (
+        "scheduled_notifications",
+        "scheduled_notifications_hash",
+        "fk_notification_logs_scheduled_hash",
+    ),
+)
+
+# NOTE: The same hash is computed by NotificationLogCRUD
+HASH = "encode(sha256(convert_to({}::text, 'UTF8')), 'hex')"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_log_blobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True),
+        sa.Column("hash", sa.String(length=64), nullable=False),
+        sa.Column(
+            "content", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_notification_log_blobs")),
+        sa.UniqueConstraint(
+            "hash", name=op.f("uq_notification_log_blobs_hash")
+        ),
+    )
+
+    for content_column, hash_column, fk_name in FIELDS:
+        op.add_column(
+            "notification_logs",
+            sa.Column(hash_column, sa.String(length=64), nullable=True),
+        )
+        op.execute(
+            f"""
+            INSERT INTO notification_log_blobs (hash, content)
+            SELECT DISTINCT {HASH.format(content_column)}, {content_column}
+            FROM notification_logs
+            WHERE {content_column} IS NOT NULL
+            ON CONFLICT (hash) DO NOTHING
+            """
+        )
+        op.execute(
+            f"""
+            UPDATE notification_logs
+            SET {hash_column} = {HASH.format(content_column)}
+            WHERE {content_column} IS NOT NULL
+            """
+        )
+        op.create_foreign_key(
+            fk_name,
+            "notification_logs",
+            "notification_log_blobs",
+            [hash_column],
+            ["hash"],
+            ondelete="RESTRICT",
+        )
+        op.create_index(
+            op.f(f"ix_notification_logs_{hash_column}"),
+            "notification_logs",
+            [hash_column],
+            unique=False,
+        )
+        op.drop_column("notification_logs", content_column)
+
+    op.create_index(
+        "ix_notification_logs_user_id_device_id_created_at",
+        "notification_logs",
+        ["user_id", "device_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_notification_logs_user_id_device_id_created_at",
+        table_name="notification_logs",
+    )
+    for content_column, hash_column, fk_name in reversed(FIELDS):
+        op.add_column(
+            "notification_logs",
+            sa.Column(
+                content_column,
+                postgresql.JSONB(astext_type=sa.Text()),
+                nullable=True,
+            ),
+        )
+        op.execute(
+            f"""
+            UPDATE notification_logs nl
+            SET {content_column} = b.content
+            FROM notification_log_blobs b
+            WHERE b.hash = nl.{hash_column}
+            """
+        )
+        op.drop_index(
+            op.f(f"ix_notification_logs_{hash_column}"),
+            table_name="notification_logs",
+        )
+        op.drop_constraint(fk_name, "notification_logs", type_="foreignkey")
+        op.drop_column("notification_logs", hash_column)
+
+    op.drop_table("notification_log_blobs")
@@ -0,0 +1,113 @@
+"""add notification deliveries
+
+Revision ID: 9b7e3f1a2c65
+Revises: 5d2f8a7c9e14
+Create Date: 2026-10-18 23:40:36.771204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "9b7e3f1a2c65"
+down_revision = "5d2f8a7c9e14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_deliveries",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("applet_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("activity_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("flow_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            "trigger_id", postgresql.UUID(as_uuid=True), nullable=False
+        ),
+        sa.Column("is_reminder", sa.Boolean(), nullable=False),
+        sa.Column("occurrence_start_at", sa.DateTime(), nullable=False),
+        sa.Column("scheduled_at", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_notification_deliveries_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["applet_id"],
+            ["applets.id"],
+            name=op.f("fk_notification_deliveries_applet_id_applets"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["event_id"],
+            ["events.id"],
+            name=op.f("fk_notification_deliveries_event_id_events"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "id", name=op.f("pk_notification_deliveries")
+        ),
+        sa.UniqueConstraint(
+            "user_id",
+            "trigger_id",
+            "scheduled_at",
+            name="_unique_notification_deliveries",
+        ),
+    )
+    op.create_index(
+        "ix_notification_deliveries_pending_next_attempt_at",
+        "notification_deliveries",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_notification_deliveries_scheduled_at",
+        "notification_deliveries",
+        ["scheduled_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_notification_deliveries_scheduled_at",
+        table_name="notification_deliveries",
+    )
+    op.drop_index(
+        "ix_notification_deliveries_pending_next_attempt_at",
+        table_name="notification_deliveries",
+    )
+    op.drop_table("notification_deliveries")
@@ -0,0 +1,334 @@
+"""add schedule changes
+
+Revision ID: 6c8d4e2b7a91
+Revises: 9b7e3f1a2c65
+Create Date: 2026-10-19 00:10:12.584301
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "6c8d4e2b7a91"
+down_revision = "9b7e3f1a2c65"
+branch_labels = None
+depends_on = None
+
+# NOTE: Stamps the given events with the new version, the user is the
+#       user of the individual event or NULL for the general event.
+TOUCH_EVENTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION touch_schedule_events(p_event_ids uuid[])
+RETURNS void AS $$
+BEGIN
+    INSERT INTO schedule_changes (
+        applet_id, user_id, event_id, is_deleted, version, xid
+    )
+    SELECT
+        e.applet_id,
+        e.user_id,
+        e.id,
+        e.is_deleted,
+        nextval('schedule_changes_version_seq'),
+        CAST(CAST(pg_current_xact_id() AS text) AS bigint)
+    FROM (
+        SELECT DISTINCT ON (e.id)
+            e.id, e.applet_id, ue.user_id, coalesce(e.is_deleted, false)
+        FROM events e
+        LEFT JOIN user_events ue ON ue.event_id = e.id
+        WHERE e.id = ANY(p_event_ids)
+        ORDER BY e.id, ue.user_id
+    ) e(id, applet_id, user_id, is_deleted)
+    ON CONFLICT (event_id) WHERE event_id IS NOT NULL DO UPDATE SET
+        applet_id = EXCLUDED.applet_id,
+        user_id = EXCLUDED.user_id,
+        is_deleted = EXCLUDED.is_deleted,
+        version = EXCLUDED.version,
+        xid = EXCLUDED.xid,
+        updated_at = timezone('utc', now());
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DELETE_EVENTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION delete_schedule_events(p_event_ids uuid[])
+RETURNS void AS $$
+BEGIN
+    UPDATE schedule_changes SET
+        is_deleted = true,
+        version = nextval('schedule_changes_version_seq'),
+        xid = CAST(CAST(pg_current_xact_id() AS text) AS bigint),
+        updated_at = timezone('utc', now())
+    WHERE event_id = ANY(p_event_ids);
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# NOTE: Stamps the applet accesses of the users, the accesses of the
+#       deleted applets are skipped.
+TOUCH_ACCESSES_FUNCTION = """
+CREATE OR REPLACE FUNCTION touch_schedule_accesses(
+    p_applet_ids uuid[], p_user_ids uuid[]
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO schedule_changes (
+        applet_id, user_id, event_id, is_deleted, version, xid
+    )
+    SELECT
+        k.applet_id,
+        k.user_id,
+        NULL,
+        false,
+        nextval('schedule_changes_version_seq'),
+        CAST(CAST(pg_current_xact_id() AS text) AS bigint)
+    FROM (
+        SELECT DISTINCT applet_id, user_id
+        FROM unnest(p_applet_ids, p_user_ids) AS k(applet_id, user_id)
+    ) k
+    JOIN applets ap ON ap.id = k.applet_id
+    ON CONFLICT (applet_id, user_id) WHERE event_id IS NULL DO UPDATE SET
+        version = EXCLUDED.version,
+        xid = EXCLUDED.xid,
+        updated_at = timezone('utc', now());
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+EVENTS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION events_touch_schedule()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM delete_schedule_events(ARRAY(SELECT id FROM old_rows));
+    ELSE
+        PERFORM touch_schedule_events(ARRAY(SELECT id FROM new_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PERIODICITY_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION periodicity_touch_schedule()
+RETURNS trigger AS $$
+BEGIN
+    PERFORM touch_schedule_events(
+        ARRAY(
+            SELECT e.id
+            FROM events e
+            JOIN new_rows p ON p.id = e.periodicity_id
+        )
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# NOTE: The same function is used by all the tables with event_id
+EVENT_ITEMS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION event_items_touch_schedule()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM touch_schedule_events(ARRAY(SELECT event_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM touch_schedule_events(ARRAY(SELECT event_id FROM old_rows));
+    ELSE
+        PERFORM touch_schedule_events(
+            ARRAY(
+                SELECT event_id FROM new_rows
+                UNION
+                SELECT event_id FROM old_rows
+            )
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ACCESSES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION user_applet_accesses_touch_schedule()
+RETURNS trigger AS $$
+DECLARE
+    applet_ids uuid[];
+    user_ids uuid[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(applet_id), array_agg(user_id)
+        INTO applet_ids, user_ids
+        FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(applet_id), array_agg(user_id)
+        INTO applet_ids, user_ids
+        FROM old_rows;
+    ELSE
+        SELECT array_agg(applet_id), array_agg(user_id)
+        INTO applet_ids, user_ids
+        FROM (
+            SELECT applet_id, user_id FROM new_rows
+            UNION
+            SELECT applet_id, user_id FROM old_rows
+        ) r;
+    END IF;
+    IF applet_ids IS NOT NULL THEN
+        PERFORM touch_schedule_accesses(applet_ids, user_ids);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGER_FUNCTIONS = [
+    ("events_touch_schedule", EVENTS_TRIGGER_FUNCTION),
+    ("periodicity_touch_schedule", PERIODICITY_TRIGGER_FUNCTION),
+    ("event_items_touch_schedule", EVENT_ITEMS_TRIGGER_FUNCTION),
+    (
+        "user_applet_accesses_touch_schedule",
+        ACCESSES_TRIGGER_FUNCTION,
+    ),
+]
+
+TRIGGER_EVENTS = [
+    ("INSERT", "NEW TABLE AS new_rows"),
+    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("DELETE", "OLD TABLE AS old_rows"),
+]
+
+TRIGGERS = [
+    ("events", "events_touch_schedule", TRIGGER_EVENTS),
+    ("periodicity", "periodicity_touch_schedule", TRIGGER_EVENTS[1:2]),
+    *(
+        (table_name, "event_items_touch_schedule", TRIGGER_EVENTS)
+        for table_name in (
+            "user_events",
+            "activity_events",
+            "flow_events",
+            "notifications",
+            "reminders",
+        )
+    ),
+    (
+        "user_applet_accesses",
+        "user_applet_accesses_touch_schedule",
+        TRIGGER_EVENTS,
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE schedule_changes_version_seq")
+    op.create_table(
+        "schedule_changes",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True),
+        sa.Column("applet_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("xid", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["applet_id"],
+            ["applets.id"],
+            name=op.f("fk_schedule_changes_applet_id_applets"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_schedule_changes")),
+    )
+    op.create_index(
+        "ix_schedule_changes_event_id",
+        "schedule_changes",
+        ["event_id"],
+        unique=True,
+        postgresql_where=sa.text("event_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_schedule_changes_applet_id_user_id",
+        "schedule_changes",
+        ["applet_id", "user_id"],
+        unique=True,
+        postgresql_where=sa.text("event_id IS NULL"),
+    )
+    op.create_index(
+        "ix_schedule_changes_applet_id_xid",
+        "schedule_changes",
+        ["applet_id", "xid"],
+        unique=False,
+    )
+
+    op.execute(TOUCH_EVENTS_FUNCTION)
+    op.execute(DELETE_EVENTS_FUNCTION)
+    op.execute(TOUCH_ACCESSES_FUNCTION)
+    for _, function in TRIGGER_FUNCTIONS:
+        op.execute(function)
+    for table_name, function_name, events in TRIGGERS:
+        for event, transition_tables in events:
+            op.execute(
+                f"CREATE TRIGGER {table_name}_{event.lower()}_schedule "
+                f"AFTER {event} ON {table_name} "
+                f"REFERENCING {transition_tables} "
+                f"FOR EACH STATEMENT "
+                f"EXECUTE FUNCTION {function_name}()"
+            )
+
+    op.execute(
+        """
+        SELECT touch_schedule_events(array_agg(id))
+        FROM events
+        HAVING count(*) > 0
+        """
+    )
+    op.execute(
+        """
+        SELECT touch_schedule_accesses(
+            array_agg(applet_id), array_agg(user_id)
+        )
+        FROM user_applet_accesses
+        HAVING count(*) > 0
+        """
+    )
+
+
+def downgrade() -> None:
+    for table_name, _, events in reversed(TRIGGERS):
+        for event, _ in reversed(events):
+            op.execute(
+                f"DROP TRIGGER IF EXISTS "
+                f"{table_name}_{event.lower()}_schedule ON {table_name}"
+            )
+    for function_name, _ in reversed(TRIGGER_FUNCTIONS):
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS touch_schedule_accesses(uuid[], uuid[])"
+    )
+    op.execute("DROP FUNCTION IF EXISTS delete_schedule_events(uuid[])")
+    op.execute("DROP FUNCTION IF EXISTS touch_schedule_events(uuid[])")
+    op.drop_index(
+        "ix_schedule_changes_applet_id_xid", table_name="schedule_changes"
+    )
+    op.drop_index(
+        "ix_schedule_changes_applet_id_user_id",
+        table_name="schedule_changes",
+    )
+    op.drop_index(
+        "ix_schedule_changes_event_id", table_name="schedule_changes"
+    )
+    op.drop_table("schedule_changes")
+    op.execute("DROP SEQUENCE IF EXISTS schedule_changes_version_seq")
@@ -0,0 +1,54 @@
+"""add mongo migration checkpoints
+
+Revision ID: 3e9a7c5d1b28
+Revises: 6c8d4e2b7a91
+Create Date: 2026-10-19 00:40:27.318604
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "3e9a7c5d1b28"
+down_revision = "6c8d4e2b7a91"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mongo_migration_checkpoints",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=True,
+        ),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("last_id", sa.String(length=24), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "id", name=op.f("pk_mongo_migration_checkpoints")
+        ),
+        sa.UniqueConstraint(
+            "name", name=op.f("uq_mongo_migration_checkpoints_name")
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("mongo_migration_checkpoints")
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+
+__all__ = ["gather_reads"]
+
+Read = Callable[[AsyncSession], Awaitable[Any]]
+
+
+async def gather_reads(session, *reads: Read | None) -> list[Any]:
+    """Runs the independent reads concurrently and returns their results.
+
+    Every read is a function that gets the session, e.g.
+        data, total = await gather_reads(
+            session,
+            lambda s: SchemaCRUD(s).get_list(query_params),
+            lambda s: SchemaCRUD(s).get_list_count(query_params),
+        )
+    The read can be None, e.g. for the count that is not requested,
+    its result is None.
+
+    The session holds one connection, so the queries of one session are
+    executed one by one. Every read gets its own pooled connection, which
+    imports the snapshot of the session transaction, so all the reads see
+    the same data as the session.
+
+    The reads are executed one by one on the session if the transaction
+    of the session has changed the data, the other connections do not see
+    the changes. The same is done in the tests, the data of the tests is
+    not committed.
+    """
+    if (
+        sum(read is not None for read in reads) < 2
+        or settings.env == "testing"
+    ):
+        return [await _read(session, read) for read in reads]
+
+    if session.new or session.dirty or session.deleted:
+        await session.flush()
+    db_result = await session.execute(
+        text(
+            "SELECT pg_current_xact_id_if_assigned() IS NULL, "
+            "pg_export_snapshot()"
+        )
+    )
+    is_read_only, snapshot_id = db_result.one()
+    if not is_read_only:
+        return [await _read(session, read) for read in reads]
+
+    return list(
+        await asyncio.gather(
+            *(_read_in_snapshot(session.bind, snapshot_id, r) for r in reads)
+        )
+    )
+
+
+async def _read(session, read: Read | None) -> Any:
+    return await read(session) if read is not None else None
+
+
+async def _read_in_snapshot(
+    engine, snapshot_id: str, read: Read | None
+) -> Any:
+    if read is None:
+        return None
+    async with engine.connect() as connection:
+        # NOTE: The snapshot is imported only by the first statement
+        #       of the repeatable read transaction
+        await connection.execution_options(isolation_level="REPEATABLE READ")
+        async with AsyncSession(
+            bind=connection, expire_on_commit=False, autoflush=False
+        ) as session:
+            await session.execute(
+                text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'")
+            )
+            return await read(session)
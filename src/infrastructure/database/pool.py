@@ -0,0 +1,116 @@
+import time
+
+from pydantic import BaseModel
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+__all__ = ["PoolMetrics", "PoolStatus", "InstrumentedAsyncQueuePool"]
+
+
+class PoolMetrics:
+    """Counters that are collected by the instrumented connection pool.
+
+    NOTE: counters are cumulative since the process start
+    """
+
+    def __init__(self):
+        self.connects: int = 0
+        self.checkouts: int = 0
+        self.checkins: int = 0
+        self.overflow_checkouts: int = 0
+        self.waits: int = 0
+        self.timeouts: int = 0
+        self.wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+
+
+class PoolStatus(BaseModel):
+    """The snapshot of the connection pool state."""
+
+    pooled: bool
+    size: int = 0
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    max_overflow: int = 0
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    overflow_checkouts: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @classmethod
+    def from_pool(cls, pool: Pool) -> "PoolStatus":
+        if not isinstance(pool, InstrumentedAsyncQueuePool):
+            return cls(pooled=False)
+
+        metrics = pool.metrics
+        return cls(
+            pooled=True,
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            connects=metrics.connects,
+            checkouts=metrics.checkouts,
+            checkins=metrics.checkins,
+            overflow_checkouts=metrics.overflow_checkouts,
+            waits=metrics.waits,
+            timeouts=metrics.timeouts,
+            wait_time=round(metrics.wait_time, 6),
+            max_wait_time=round(metrics.max_wait_time, 6),
+        )
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """The asyncio queue pool that counts checkouts, waits and overflows."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        # NOTE: The pool is recreated on engine.dispose(),
+        #       the counters are carried over to the new instance
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _create_connection(self):
+        self.metrics.connects += 1
+        return super()._create_connection()
+
+    def _do_get(self):
+        must_wait = (
+            self.checkedin() == 0
+            and self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+        )
+        is_overflow = self.checkedin() == 0 and self._overflow >= 0
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            if must_wait:
+                waited = time.perf_counter() - started_at
+                self.metrics.waits += 1
+                self.metrics.wait_time += waited
+                self.metrics.max_wait_time = max(
+                    self.metrics.max_wait_time, waited
+                )
+
+        self.metrics.checkouts += 1
+        if is_overflow and not must_wait:
+            self.metrics.overflow_checkouts += 1
+        return connection
+
+    def _do_return_conn(self, conn):
+        self.metrics.checkins += 1
+        super()._do_return_conn(conn)
@@ -1,6 +1,7 @@
 from fastapi import Request
 
 from infrastructure.http.domain import MindloggerContentSource
+from infrastructure.i18n import parse_language
 
 
 async def get_mindlogger_content_source(
@@ -17,4 +18,4 @@ async def get_mindlogger_content_source(
 
 
 def get_language(request: Request) -> str:
-    return request.headers.get("Content-Language", "en-US").split("-")[0]
+    return parse_language(request.headers.get("Content-Language"))
@@ -0,0 +1,68 @@
+import gettext as gettext_
+from contextvars import ContextVar
+from pathlib import Path
+
+from config import settings
+
+__all__ = [
+    "DEFAULT_LANGUAGE",
+    "current_language",
+    "gettext",
+    "get_translations",
+    "load_translations",
+    "parse_language",
+]
+
+DEFAULT_LANGUAGE = "en"
+DOMAIN = "messages"
+
+# NOTE: The language of the current request. It is set by the
+#       InternalizationMiddleware and is isolated between the concurrent
+#       requests, unlike the LANG environment variable
+current_language: ContextVar[str] = ContextVar(
+    "current_language", default=DEFAULT_LANGUAGE
+)
+
+_translations: dict[str, gettext_.NullTranslations] = {}
+_null_translations = gettext_.NullTranslations()
+
+
+def parse_language(content_language: str | None) -> str:
+    """Returns the language code of the Content-Language header value,
+    e.g. `fr` for `fr-FR`.
+    """
+    if not content_language:
+        return DEFAULT_LANGUAGE
+    return content_language.replace("_", "-").split("-")[0].lower()
+
+
+def load_translations(
+    locale_dir: Path,
+) -> dict[str, gettext_.NullTranslations]:
+    """Loads the compiled catalogs of all the locales into memory.
+    The catalog of `fr_FR` is available by `fr_FR` and `fr` keys.
+    """
+    translations: dict[str, gettext_.NullTranslations] = {}
+    for mo_file in sorted(locale_dir.glob(f"*/LC_MESSAGES/{DOMAIN}.mo")):
+        locale = mo_file.parent.parent.name
+        with mo_file.open("rb") as fp:
+            catalog = gettext_.GNUTranslations(fp)
+        translations[locale] = catalog
+        translations.setdefault(parse_language(locale), catalog)
+    return translations
+
+
+def get_translations(language: str) -> gettext_.NullTranslations:
+    return (
+        _translations.get(language)
+        or _translations.get(parse_language(language))
+        or _null_translations
+    )
+
+
+def gettext(message: str) -> str:
+    """Translates the message to the language of the current request."""
+    return get_translations(current_language.get()).gettext(message)
+
+
+_translations.update(load_translations(settings.locale_dir))
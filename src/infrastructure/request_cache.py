@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+__all__ = [
+    "clear_request_cache",
+    "get_request_cache",
+    "request_cache_scope",
+]
+
+# NOTE: The values that are cached for the time of the current request.
+#       It is set by the RequestCacheMiddleware, outside of the request
+#       nothing is cached
+_request_cache: ContextVar[dict[str, dict] | None] = ContextVar(
+    "request_cache", default=None
+)
+
+
+@contextmanager
+def request_cache_scope():
+    """Enables the request cache inside the block."""
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def get_request_cache(namespace: str) -> dict | None:
+    """Returns the cache of the namespace or None outside of the request."""
+    cache = _request_cache.get()
+    if cache is None:
+        return None
+    return cache.setdefault(namespace, {})
+
+
+def clear_request_cache(namespace: str):
+    """Drops the cached values of the namespace, e.g. after they are
+    changed in the database.
+    """
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.pop(namespace, None)
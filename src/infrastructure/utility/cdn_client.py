@@ -1,60 +1,184 @@
-import io
+import asyncio
 import mimetypes
+import os
+import shutil
+import tempfile
 import uuid
-from typing import BinaryIO
+from typing import AsyncIterator, BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError  # type: ignore
+from pydantic import BaseModel
 
 from config.cdn import CDNSettings
 
+__all__ = ["CDNClient", "ObjectInfo"]
+
+
+class ObjectInfo(BaseModel):
+    size: int
+    media_type: str
+
+
+class _LocalS3Client:
+    """The S3-compatible stand-in that keeps the objects in the local
+    directory. It is used instead of S3 in the testing environment.
+
+    Only the calls that are made by the CDNClient are supported.
+    The directory is removed when the client is garbage collected
+    or the process exits.
+    """
+
+    def __init__(self):
+        self._directory = tempfile.TemporaryDirectory(prefix="cdn_")
+        self.root = self._directory.name
+
+    def _path(self, bucket: str | None, key: str) -> str:
+        path = os.path.normpath(os.path.join(self.root, bucket or "", key))
+        if not path.startswith(os.path.join(self.root, "")):
+            raise self._not_found("GetObject")
+        return path
+
+    @staticmethod
+    def _not_found(operation: str) -> ClientError:
+        return ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, operation
+        )
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, Config=None):
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            shutil.copyfileobj(Fileobj, file)
+
+    def head_object(self, Bucket, Key) -> dict:
+        path = self._path(Bucket, Key)
+        if not os.path.isfile(path):
+            raise self._not_found("HeadObject")
+        return dict(ContentLength=os.path.getsize(path))
+
+    def get_object(self, Bucket, Key, Range: str | None = None) -> dict:
+        path = self._path(Bucket, Key)
+        if not os.path.isfile(path):
+            raise self._not_found("GetObject")
+        file = open(path, "rb")
+        size = os.path.getsize(path)
+        start, end = 0, size - 1
+        if Range:
+            first, last = Range.removeprefix("bytes=").split("-")
+            start, end = int(first), int(last) if last else size - 1
+        file.seek(start)
+        return dict(
+            Body=_LimitedReader(file, end - start + 1),
+            ContentLength=end - start + 1,
+        )
+
+
+class _LimitedReader:
+    def __init__(self, file: BinaryIO, limit: int):
+        self.file = file
+        self.limit = limit
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.limit:
+            size = self.limit
+        data = self.file.read(size)
+        self.limit -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
 
 class CDNClient:
+    """The asynchronous client of the S3 bucket.
+
+    The blocking boto3 calls are run in the worker threads, so the
+    transfers do not block the event loop. The boto3 client is thread-safe,
+    it is created once per process and shares the connection pool.
+    """
+
+    _clients: dict = {}
+
     def __init__(self, config: CDNSettings, env: str):
-        self.bucket = None
-        self.endpoint = None
+        self.config = config
+        self.bucket = config.bucket
         self.env = env
+        self.client = self._get_client()
+        self.transfer_config = TransferConfig(
+            multipart_threshold=config.multipart_threshold,
+            multipart_chunksize=config.multipart_chunksize,
+            max_concurrency=config.multipart_concurrency,
+        )
 
-        try:
-
-            assert config, "set CDN"
+    def _get_client(self):
+        key = (self.env, self.config.region)
+        if key in self._clients:
+            return self._clients[key]
 
-            self.client = boto3.client(
+        if self.env == "testing":
+            client = _LocalS3Client()
+        else:
+            client = boto3.session.Session().client(
                 "s3",
-                region_name=config.region,
+                region_name=self.config.region,
+                config=Config(
+                    max_pool_connections=self.config.max_pool_connections
+                ),
             )
-            self.bucket = config.bucket
-        except KeyError:
-            print("CDN configuration is not full")
+        self._clients[key] = client
+        return client
 
-    def upload(self, path, body: BinaryIO):
+    @staticmethod
+    def generate_key(unique, filename):
+        return f"mindlogger/{unique}/{uuid.uuid4()}/{filename}"
 
-        if self.env == "testing":
-            # filename = path.split("/")[-1]
-            # with open(filename, "wb") as file:
-            #     file.write(body.getvalue())
-            return
-        self.client.upload_fileobj(
+    @staticmethod
+    def get_media_type(key: str) -> str:
+        return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+    async def upload(self, path, body: BinaryIO):
+        """Uploads the file, the large files are uploaded in parts."""
+        await asyncio.to_thread(
+            self.client.upload_fileobj,
             body,
-            Key=path,
             Bucket=self.bucket,
+            Key=path,
+            Config=self.transfer_config,
         )
 
-    @staticmethod
-    def generate_key(unique, filename):
-        return f"mindlogger/{unique}/{uuid.uuid4()}/{filename}"
-
-    def download(self, key):
-        file = io.BytesIO()
+    async def head(self, key: str) -> ObjectInfo:
+        """Returns the object size and media type.
+        Raises botocore ClientError if the object does not exist.
+        """
+        response = await asyncio.to_thread(
+            self.client.head_object, Bucket=self.bucket, Key=key
+        )
+        return ObjectInfo(
+            size=response["ContentLength"],
+            media_type=self.get_media_type(key),
+        )
 
-        if self.env == "testing":
-            local_file = open(key, "rb")
-            file.write(local_file.read())
-        else:
-            self.client.download_fileobj(self.bucket, key, file)
-        file.seek(0)
-        media_type = (
-            mimetypes.guess_type(key)[0]
-            if mimetypes.guess_type(key)[0]
-            else "application/octet-stream"
+    async def stream(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """Streams the object, or the inclusive range of its bytes,
+        by the chunks without buffering the whole object in memory.
+        """
+        kwargs = dict()
+        # NOTE: The whole object is requested without the Range header
+        if start > 0 or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+        response = await asyncio.to_thread(
+            self.client.get_object, Bucket=self.bucket, Key=key, **kwargs
         )
-        return file, media_type
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(
+                body.read, self.config.download_chunk_size
+            ):
+                yield chunk
+        finally:
+            body.close()
@@ -1,42 +1,62 @@
 import asyncio
-from concurrent.futures.thread import ThreadPoolExecutor
+import datetime
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
 
-from pyfcm import FCMNotification
+import httpx
+from pydantic import BaseModel
 
 from config import settings
 
+__all__ = ["Notification", "NotificationError", "NotificationResult"]
 
-class RetryException(Exception):
-    def __init__(self, timeout):
-        self.timeout = timeout
+logger = logging.getLogger("mindlogger_backend")
 
+# NOTE: FCM accepts up to 1000 registration ids in one request
+FCM_MULTICAST_LIMIT = 1000
+# The devices with these errors are not registered anymore
+FCM_INVALID_DEVICE_ERRORS = {"InvalidRegistration", "NotRegistered"}
+# The sending to the devices with these errors can be retried
+FCM_RETRY_DEVICE_ERRORS = {"Unavailable", "InternalServerError"}
+
+
+class NotificationError(Exception):
+    """The message is not sent to any device."""
 
-class _FirebaseNotification(FCMNotification):
-    def do_request(self, payload, timeout=5):
-        response = self.requests_session.post(
-            self.FCM_END_POINT, data=payload, timeout=timeout
-        )
-        if (
-            "Retry-After" in response.headers
-            and int(response.headers["Retry-After"]) > 0
-        ):
-            raise RetryException(timeout=timeout)
-        return response
 
-    def send_request(self, payloads=None, timeout=None):
+class NotificationResult(BaseModel):
+    """The metrics of the sending of the message."""
 
-        self.send_request_responses = []
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            response = executor.map(self.do_request, payloads)
-            executor.map(self.send_request_responses.append, response)
+    devices: int = 0
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    # Set in seconds
+    duration: float = 0.0
+    invalid_devices: list[str] = []
+
+    def merge(self, result: "NotificationResult") -> None:
+        self.devices += result.devices
+        self.sent += result.sent
+        self.failed += result.failed
+        self.retries += result.retries
+        self.duration = max(self.duration, result.duration)
+        self.invalid_devices.extend(result.invalid_devices)
 
 
 class Notification:
-    """SIngleton FCM Notification client"""
+    """Singleton FCM Notification client
+
+    The devices are split into the batches of up to FCM_MULTICAST_LIMIT,
+    the batches are sent concurrently over the kept-alive connections.
+    The throttled and the failed requests are retried after Retry-After
+    or the exponential backoff with jitter.
+    """
 
     _initialized = False
     _instance = None
-    client: _FirebaseNotification | None = None
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -44,13 +64,17 @@ class Notification:
         return cls._instance
 
     def __init__(self, **kwargs):
-
         if self._initialized:
             return
 
-        self.client = _FirebaseNotification(
-            api_key=settings.notification.api_key
-        )
+        self.url = settings.notification.url
+        self.api_key = settings.notification.api_key
+        self.timeout = settings.notification.timeout
+        self.max_connections = settings.notification.max_connections
+        self.max_retries = settings.notification.max_retries
+        self.retry_delay = settings.notification.retry_delay
+        self.max_retry_delay = settings.notification.max_retry_delay
+        self._client: httpx.AsyncClient | None = None
 
         self._initialized = True
 
@@ -65,36 +89,167 @@ class Notification:
         extra_kwargs: dict | None = None,
         *args,
         **kwargs,
-    ):
-
-        try:
-            if devices and len(devices) > 1:
-                if self.client:
-                    self.client.notify_multiple_devices(
-                        registration_ids=devices,
-                        message_title=message_title,
-                        message_body=message_body,
-                        time_to_live=time_to_live,
-                        data_message=data_message,
-                        badge=badge,
-                        extra_kwargs=extra_kwargs,
-                        *args,
-                        **kwargs,
-                    )
+    ) -> NotificationResult:
+        """Sends the message to the devices. The devices that FCM does
+        not know are returned as `invalid_devices` to be removed.
+        """
+        result = NotificationResult()
+        if not devices:
+            return result
+
+        notification: dict = dict(title=message_title, body=message_body)
+        if badge:
+            notification["badge"] = badge
+        payload: dict = dict(notification=notification, priority="high")
+        if data_message:
+            payload["data"] = data_message
+        if time_to_live is not None:
+            payload["time_to_live"] = time_to_live
+        if extra_kwargs:
+            payload.update(extra_kwargs)
+
+        batches = [
+            devices[start : start + FCM_MULTICAST_LIMIT]
+            for start in range(0, len(devices), FCM_MULTICAST_LIMIT)
+        ]
+        batch_results = await asyncio.gather(
+            *(self._send_batch(payload, batch) for batch in batches),
+            return_exceptions=True,
+        )
+        errors = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, NotificationResult):
+                result.merge(batch_result)
+            elif isinstance(batch_result, Exception):
+                errors.append(batch_result)
+                result.devices += len(batch)
+                result.failed += len(batch)
             else:
-                if self.client:
-                    assert devices
-                    self.client.notify_single_device(
-                        registration_id=devices[0],
-                        message_title=message_title,
-                        message_body=message_body,
-                        time_to_live=time_to_live,
-                        data_message=data_message,
-                        badge=badge,
-                        extra_kwargs=extra_kwargs,
-                        *args,
-                        **kwargs,
+                raise batch_result
+        if len(errors) == len(batches):
+            raise errors[0]
+        return result
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=dict(Authorization=f"key={self.api_key}"),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def _send_batch(
+        self, payload: dict, devices: list[str]
+    ) -> NotificationResult:
+        result = NotificationResult(devices=len(devices))
+        started_at = time.perf_counter()
+        pending = devices
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = await self._get_client().post(
+                    self.url, json=dict(payload, registration_ids=pending)
+                )
+            except httpx.TransportError as e:
+                error = f"FCM request failed: {e!r}"
+            else:
+                status_code = response.status_code
+                if status_code == httpx.codes.OK:
+                    pending = self._read_results(
+                        response.json(), pending, result
+                    )
+                    if not pending:
+                        break
+                    error = f"FCM is unavailable for {len(pending)} devices"
+                elif (
+                    status_code == httpx.codes.TOO_MANY_REQUESTS
+                    or status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+                ):
+                    error = f"FCM responded {status_code}"
+                else:
+                    raise NotificationError(
+                        f"FCM responded {status_code}: {response.text}"
                     )
-        except RetryException as ex:
-            await asyncio.sleep(ex.timeout)
-            await self.notify(devices, *args, **kwargs)
+
+            delay = self._get_delay(response, attempt)
+            if attempt >= self.max_retries or delay is None:
+                if not result.sent and not result.invalid_devices:
+                    raise NotificationError(error)
+                result.failed += len(pending)
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+            result.retries += 1
+
+        result.duration = round(time.perf_counter() - started_at, 6)
+        logger.info(
+            f"FCM batch: devices={result.devices} sent={result.sent} "
+            f"failed={result.failed} "
+            f"invalid={len(result.invalid_devices)} "
+            f"retries={result.retries} duration={result.duration}"
+        )
+        return result
+
+    @staticmethod
+    def _read_results(
+        data: dict, devices: list[str], result: NotificationResult
+    ) -> list[str]:
+        """Counts the results of the devices, returns the devices
+        to retry.
+        """
+        retry_devices = []
+        for device, device_result in zip(devices, data.get("results", [])):
+            error = device_result.get("error")
+            if error is None:
+                result.sent += 1
+            elif error in FCM_INVALID_DEVICE_ERRORS:
+                result.invalid_devices.append(device)
+            elif error in FCM_RETRY_DEVICE_ERRORS:
+                retry_devices.append(device)
+            else:
+                result.failed += 1
+        return retry_devices
+
+    def _get_delay(
+        self, response: httpx.Response | None, attempt: int
+    ) -> float | None:
+        """Returns the delay before the retry, None if Retry-After
+        is longer than `max_retry_delay`.
+        """
+        # NOTE: The jitter spreads the retries of the concurrent batches
+        retry_after = self._get_retry_after(response)
+        if retry_after is not None:
+            if retry_after > self.max_retry_delay:
+                return None
+            return retry_after + random.uniform(0, self.retry_delay)
+        delay = min(self.retry_delay * 2**attempt, self.max_retry_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @staticmethod
+    def _get_retry_after(response: httpx.Response | None) -> float | None:
+        """Returns Retry-After in seconds, it can be set as the date."""
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max((retry_at - now).total_seconds(), 0.0)
@@ -33,6 +33,15 @@ class _Cache:
         self._storage.pop(key)
         return True
 
+    async def exists(self, *keys: str) -> int:
+        now = datetime.datetime.now()
+        count = 0
+        for key in keys:
+            value, expiry = self._storage.get(key, [None, None])
+            if value and not (expiry and now > expiry):
+                count += 1
+        return count
+
     async def keys(self, pattern: str = "*") -> list[str]:
         if pattern == "*":
             pattern = ".+"
@@ -46,11 +55,46 @@ class _Cache:
         return filtered_keys
 
     async def mget(self, keys) -> list[typing.Any]:
+        # NOTE: Like Redis, None is returned for the missing keys
         results = []
         for key in keys:
             result, expire = self._storage.get(key, [None, None])
-            if expire > datetime.datetime.now():
-                results.append(result)
+            if expire and expire < datetime.datetime.now():
+                result = None
+            results.append(result)
+        return results
+
+    async def flushdb(self) -> bool:
+        self._storage.clear()
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "_Pipeline":
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    """The in-memory pipeline, the commands are run on `execute`."""
+
+    def __init__(self, cache: _Cache):
+        self._cache = cache
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "_Pipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self._commands.clear()
+
+    def set(self, *args, **kwargs) -> "_Pipeline":
+        self._commands.append(("set", args, kwargs))
+        return self
+
+    async def execute(self) -> list[typing.Any]:
+        results = [
+            await getattr(self._cache, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+        self._commands.clear()
         return results
 
 
@@ -124,8 +168,25 @@ class RedisCache:
             return False
         if not ex:
             ex = self.expire_duration
-        result = await self._cache.set(key, value, ex=ex)
-        return result
+        try:
+            return await self._cache.set(key, value, ex=ex)
+        except aioredis.RedisError:
+            return False
+
+    async def set_many(self, values: dict[str, EncodableT], ex=None) -> bool:
+        """Sets the values with the same expiration in one round trip."""
+        if not self._cache or not values:
+            return False
+        if not ex:
+            ex = self.expire_duration
+        try:
+            async with self._cache.pipeline(transaction=False) as pipeline:
+                for key, value in values.items():
+                    pipeline.set(key, value, ex=ex)
+                await pipeline.execute()
+        except aioredis.RedisError:
+            return False
+        return True
 
     async def delete(self, key) -> bool:
         if not self._cache:
@@ -133,6 +194,14 @@ class RedisCache:
         await self._cache.delete(key)
         return True
 
+    async def exists(self, *keys: str) -> int:
+        if not self._cache:
+            return 0
+        try:
+            return await self._cache.exists(*keys)
+        except aioredis.RedisError:
+            return 0
+
     async def keys(self, key: str = "*") -> list[str]:
         if not self._cache:
             return []
@@ -141,4 +210,9 @@ class RedisCache:
     async def mget(self, keys: list[str]) -> list[typing.Any]:
         if not self._cache:
             return []
-        return await self._cache.mget(keys)
+        try:
+            return await self._cache.mget(keys)
+        except aioredis.RedisError:
+            # NOTE: The keys are missing, so the values are read from
+            #       the database
+            return [None] * len(keys)
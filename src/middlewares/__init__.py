@@ -1,3 +1,4 @@
 from middlewares.cors import *  # noqa: F401, F403
 from middlewares.domain import *  # noqa: F401, F403
 from middlewares.internalization import *  # noqa: F401, F403
+from middlewares.request_cache import *  # noqa: F401, F403
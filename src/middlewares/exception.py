@@ -1,6 +1,4 @@
-import gettext
 import logging
-import os
 import traceback
 
 from fastapi import Response
@@ -19,11 +17,8 @@ from apps.shared.domain.response.errors import (
     ErrorResponseMulti,
 )
 from apps.shared.exception import BaseError
-from config import settings
-from infrastructure.http import get_language
 
 logger = logging.getLogger("mindlogger_backend")
-gettext.bindtextdomain(gettext.textdomain(), settings.locale_dir)
 
 
 class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
@@ -32,7 +27,6 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
         request: Request,
         call_next: RequestResponseEndpoint,
     ) -> Response:
-        os.environ["LANG"] = get_language(request)
         try:
             return await call_next(request)
         except BaseError as e:
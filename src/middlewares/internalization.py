@@ -1,24 +1,31 @@
-import gettext
-import os
-
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import Response
-
-from config import settings
-from infrastructure.http import get_language
-
-gettext.bindtextdomain(gettext.textdomain(), settings.locale_dir)
-
-
-class InternalizationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        os.environ["LANG"] = get_language(request)
-        return await call_next(request)
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.i18n import current_language, parse_language
+
+__all__ = ["InternalizationMiddleware"]
+
+
+class InternalizationMiddleware:
+    """Sets the language of the request from the Content-Language header.
+
+    The language is stored in the context variable, so the translations
+    of the concurrent requests do not affect each other.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        token = current_language.set(
+            parse_language(headers.get("Content-Language"))
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_language.reset(token)
@@ -0,0 +1,24 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.request_cache import request_cache_scope
+
+__all__ = ["RequestCacheMiddleware"]
+
+
+class RequestCacheMiddleware:
+    """Enables the request cache, see `infrastructure.request_cache`.
+
+    Every request gets its own empty cache, so the cached values are not
+    shared between the requests.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        with request_cache_scope():
+            await self.app(scope, receive, send)